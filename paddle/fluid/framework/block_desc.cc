@@ -14,6 +14,7 @@ limitations under the License. */
 
 #include "paddle/fluid/framework/block_desc.h"
 
+#include <atomic>
 #include <queue>
 #include <unordered_set>
 #include <utility>
@@ -24,12 +25,22 @@ limitations under the License. */
 namespace paddle {
 namespace framework {
 
+static uint64_t NextBlockRevision() {
+  static std::atomic<uint64_t> revision{0};
+  return ++revision;
+}
+
+void BlockDesc::UpdateOpRevision() { op_revision_ = NextBlockRevision(); }
+
+void BlockDesc::UpdateVarRevision() { var_revision_ = NextBlockRevision(); }
+
 VarDesc *BlockDesc::Var(const std::string &name) {
   auto it = vars_.find(name);
   if (it != vars_.end()) {
     return it->second.get();
   }
   need_update_ = true;
+  UpdateVarRevision();
   auto *var = new VarDesc(name);
   vars_[name].reset(var);
   return var;
@@ -53,6 +64,7 @@ VarDesc *BlockDesc::RenameVar(const std::string &old_name,
     return nullptr;
   }
   need_update_ = true;
+  UpdateVarRevision();
   auto *var = this->Var(old_name);
   VarDesc *new_var = new VarDesc(*(var->Proto()));
   new_var->SetName(new_name);
@@ -123,28 +135,33 @@ std::vector<VarDesc *> BlockDesc::AllVars() const {
 
 OpDesc *BlockDesc::AppendOp() {
   need_update_ = true;
+  UpdateOpRevision();
   ops_.emplace_back(new OpDesc(this));
   return ops_.back().get();
 }
 
 void BlockDesc::AppendAllocatedOp(std::unique_ptr<OpDesc> &&op_desc) {
   need_update_ = true;
+  UpdateOpRevision();
   ops_.emplace_back(std::move(op_desc));
 }
 
 OpDesc *BlockDesc::PrependOp() {
   need_update_ = true;
+  UpdateOpRevision();
   ops_.emplace_front(new OpDesc(this));
   return ops_.front().get();
 }
 
 void BlockDesc::PrependAllocatedOp(std::unique_ptr<OpDesc> &&op_desc) {
   need_update_ = true;
+  UpdateOpRevision();
   ops_.emplace_front(std::move(op_desc));
 }
 
 OpDesc *BlockDesc::InsertOp(size_t index) {
   need_update_ = true;
+  UpdateOpRevision();
   auto it = ops_.begin() + index;
   std::unique_ptr<OpDesc> new_op(new OpDesc(this));
   it = ops_.insert(it, std::move(new_op));
@@ -156,6 +173,7 @@ void BlockDesc::RemoveOp(size_t s, size_t e) {
     return;
   }
   need_update_ = true;
+  UpdateOpRevision();
   ops_.erase(ops_.begin() + s, ops_.begin() + e);
 }
 
@@ -163,6 +181,7 @@ void BlockDesc::RemoveOpInternal(const OpDesc *op_desc) {
   // TODO(minqiyang): make this faster
   for (auto it = ops_.begin(); it != ops_.end(); ++it) {
     if (it->get() == op_desc) {
+      UpdateOpRevision();
       ops_.erase(it);
       break;
     }
@@ -206,6 +225,8 @@ proto::BlockDesc *BlockDesc::Proto() {
 
 BlockDesc::BlockDesc(ProgramDesc *prog, proto::BlockDesc *desc)
     : prog_(prog), desc_(desc), need_update_(false) {
+  UpdateOpRevision();
+  UpdateVarRevision();
   for (const proto::VarDesc &var_desc : desc_->vars()) {
     vars_[var_desc.name()].reset(new VarDesc(var_desc));
   }
@@ -218,6 +239,8 @@ BlockDesc::BlockDesc(const BlockDesc &other, proto::BlockDesc *desc,
                      ProgramDesc *prog)
     : prog_(prog), desc_(desc) {
   need_update_ = true;
+  UpdateOpRevision();
+  UpdateVarRevision();
   for (auto &op : other.ops_) {
     ops_.emplace_back(new OpDesc(*op, this));
   }
@@ -97,7 +97,11 @@ class BlockDesc {
 
   void RemoveOpInternal(const OpDesc *op_desc);
 
-  void RemoveVar(const std::string &name) { vars_.erase(name); }
+  void RemoveVar(const std::string &name) {
+    if (vars_.erase(name) > 0) {
+      UpdateVarRevision();
+    }
+  }
 
   std::vector<OpDesc *> AllOps() const;
 
@@ -111,10 +115,26 @@ class BlockDesc {
 
   ProgramDesc *Program() const { return this->prog_; }
 
+  /*
+   * The revisions are changed whenever ops or vars are added into or
+   * removed from this block, so that the python side can skip
+   * synchronizing with an unchanged block. Revisions are unique among
+   * all blocks, hence a new block never has the same revision as others.
+   */
+  uint64_t OpRevision() const { return op_revision_; }
+
+  uint64_t VarRevision() const { return var_revision_; }
+
  private:
+  void UpdateOpRevision();
+
+  void UpdateVarRevision();
+
   ProgramDesc *prog_;       // not_own
   proto::BlockDesc *desc_;  // not_own
   bool need_update_;
+  uint64_t op_revision_;
+  uint64_t var_revision_;
 
   std::deque<std::unique_ptr<OpDesc>> ops_;
   std::unordered_map<std::string, std::unique_ptr<VarDesc>> vars_;
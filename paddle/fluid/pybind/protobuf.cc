@@ -140,6 +140,8 @@ void BindBlockDesc(pybind11::module *m) {
            pybind11::return_value_policy::reference)
       .def("op_size", &pd::BlockDesc::OpSize)
       .def("op", &pd::BlockDesc::Op, pybind11::return_value_policy::reference)
+      .def("_op_revision", &pd::BlockDesc::OpRevision)
+      .def("_var_revision", &pd::BlockDesc::VarRevision)
       .def("serialize_to_string", SerializeMessage<pd::BlockDesc>);
 }
 
@@ -1179,7 +1179,23 @@ All parameter, weight, gradient are variables in Paddle.
            R"DOC(
            Delete all sub-scopes of the current scope.
            )DOC")
-      .def("_kids", &Scope::kids);
+      .def("_kids", &Scope::kids)
+      .def("_drop_kid",
+           [](Scope &self, Scope *kid) {
+             // the kid may have been deleted by drop_kids already
+             auto &kids = self.kids();
+             if (std::find(kids.begin(), kids.end(), kid) != kids.end()) {
+               self.DeleteScope(kid);
+             }
+           },
+           py::arg("kid"),
+           R"DOC(
+           Delete the sub-scope :code:`kid` of the current scope, do nothing
+           if :code:`kid` is not a sub-scope of the current scope.
+
+           Args:
+               kid (core._Scope): the sub-scope created by :code:`new_scope`.
+           )DOC");
 
   m.def("Scope",
         []() -> Scope * {
@@ -1760,7 +1776,8 @@ All parameter, weight, gradient are variables in Paddle.
               cmd, time_out, sleep_inter, redirect_stderr);
         },
         py::arg("cmd"), py::arg("time_out") = 0, py::arg("sleep_inter") = 0,
-        py::arg("redirect_stderr") = false);
+        py::arg("redirect_stderr") = false,
+        py::call_guard<py::gil_scoped_release>());
 
 #ifdef PADDLE_WITH_CUDA
   m.def("is_float16_supported", [](const platform::CUDAPlace &place) -> bool {
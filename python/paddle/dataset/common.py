@@ -25,6 +25,8 @@ import importlib
 import paddle.dataset
 import six.moves.cPickle as pickle
 import glob
+import multiprocessing
+import numpy as np
 
 __all__ = [
     'DATA_HOME',
@@ -212,3 +214,146 @@ def _check_exists_and_download(path, url, md5, module_name, download=True):
     else:
         raise ValueError('{} not exists and auto download disabled'.format(
             path))
+
+
+def _load_array_cache(source_files, cache_name, names, build_fn):
+    """
+    Load the numpy arrays decoded from source_files, memory-mapped from the
+    cache files next to source_files[0], so the processes loading the same
+    dataset share the same pages. If the cache files are missing or older
+    than any of source_files, call build_fn() to decode the arrays and write
+    the cache files.
+
+    Args:
+        source_files(list): the files the arrays are decoded from.
+        cache_name(str): the name to distinguish the caches of different
+            arrays decoded from the same source files.
+        names(list): the names of the arrays returned by build_fn.
+        build_fn(callable): return a dict of numpy arrays keyed by names.
+
+    Returns:
+        dict: the arrays keyed by names, which are read-only numpy.memmap
+            unless the cache files can not be written.
+    """
+    key = hashlib.md5("|".join(
+        os.path.abspath(f) for f in source_files).encode('utf-8')).hexdigest()
+    prefix = "{}.{}.{}".format(source_files[0], cache_name, key[:8])
+    cache_files = dict(
+        (name, "{}.{}.npy".format(prefix, name)) for name in names)
+
+    source_mtime = max(os.path.getmtime(f) for f in source_files)
+    if all(
+            os.path.exists(f) and os.path.getmtime(f) >= source_mtime
+            for f in cache_files.values()):
+        try:
+            return dict((name, np.load(
+                f, mmap_mode='r')) for name, f in cache_files.items())
+        except (IOError, ValueError):
+            pass
+
+    arrays = build_fn()
+    try:
+        for name in names:
+            # write to a temporary file and rename it, so the processes
+            # building the same cache never load a partial file.
+            tmp_file = "{}.{}.tmp".format(cache_files[name], os.getpid())
+            with open(tmp_file, 'wb') as f:
+                np.save(f, np.ascontiguousarray(arrays[name]))
+            os.rename(tmp_file, cache_files[name])
+        return dict((name, np.load(
+            f, mmap_mode='r')) for name, f in cache_files.items())
+    except (IOError, OSError) as e:
+        sys.stderr.write("Failed to write the dataset cache {}: {}\n".format(
+            prefix, e))
+        return arrays
+
+
+def _map_in_pool(fn, items, num_workers=1, chunksize=64):
+    """
+    Map fn over items by a pool of num_workers forked processes, and yield
+    the results lazily in the order of items. fn should be picklable, i.e.
+    defined at the top level of a module. It runs in the current process
+    if num_workers is 1, on windows, or if the current process is a daemon
+    process, such as a DataLoader worker, which is not allowed to have
+    children.
+
+    Args:
+        fn(callable): the function to map.
+        items(iterable): the arguments of fn.
+        num_workers(int, optional): the number of processes, default 1.
+        chunksize(int): the number of items sent to a process at a time.
+    """
+    if num_workers <= 1 or sys.platform == 'win32' or \
+            multiprocessing.current_process().daemon:
+        for item in items:
+            yield fn(item)
+        return
+
+    # the spawned processes re-run the main module of the user, which may
+    # construct the dataset and start a pool again, so always fork them.
+    context = multiprocessing.get_context('fork') if six.PY3 \
+        else multiprocessing
+    pool = context.Pool(num_workers)
+    try:
+        for result in pool.imap(fn, items, chunksize):
+            yield result
+    finally:
+        pool.terminate()
+
+
+class _TokenEncoder(object):
+    """
+    Encode the token lists to int64 arrays in one pass, in which the vocabulary
+    is not known yet: each new token gets the next temporary id. After the
+    pass, the frequency of tokens is counted from the temporary ids, and the
+    temporary ids are mapped to the final ids by the array returned by
+    `id_map`, without tokenizing again.
+    """
+
+    def __init__(self):
+        self._token_ids = {}
+
+    def encode(self, tokens):
+        token_ids = self._token_ids
+        return np.array(
+            [token_ids.setdefault(t, len(token_ids)) for t in tokens],
+            dtype='int64')
+
+    def tokens(self):
+        """
+        The tokens ordered by their temporary ids.
+        """
+        tokens = [None] * len(self._token_ids)
+        for token, idx in six.iteritems(self._token_ids):
+            tokens[idx] = token
+        return tokens
+
+    def count(self, id_arrays):
+        """
+        The frequency of each token in id_arrays, indexed by temporary ids.
+        """
+        ids = np.concatenate(list(id_arrays) + [np.zeros([0], dtype='int64')])
+        return np.bincount(ids, minlength=len(self._token_ids))
+
+    def id_map(self, token_idx, default):
+        """
+        The array mapping the temporary ids to the ids in token_idx, the
+        tokens not in token_idx are mapped to default.
+        """
+        return np.array(
+            [token_idx.get(t, default) for t in self.tokens()], dtype='int64')
+
+
+def _concat_id_arrays(id_arrays, id_map=None):
+    """
+    Concatenate id_arrays to one array, mapped by id_map if it is set, and
+    return it with the offsets of the arrays, i.e. the i-th array is
+    ids[offsets[i]:offsets[i + 1]].
+    """
+    lengths = [len(ids) for ids in id_arrays]
+    offsets = np.zeros([len(lengths) + 1], dtype='int64')
+    np.cumsum(lengths, out=offsets[1:])
+    ids = np.concatenate(list(id_arrays) + [np.zeros([0], dtype='int64')])
+    if id_map is not None:
+        ids = id_map[ids]
+    return ids, offsets
@@ -22,13 +22,45 @@ from paddle.fluid.framework import Program
 from paddle.fluid import debugger
 from google.protobuf import text_format
 import paddle.fluid as fluid
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+import heapq
 from paddle.fluid import core
 import subprocess
 import os
 import numpy as np
 __all__ = ['UtilBase']
 
+FileShardReport = namedtuple('FileShardReport',
+                             ['bytes', 'num_files', 'imbalance'])
+
+
+def _lpt_assign(sizes, num_bins):
+    """
+    Assign the items to `num_bins` bins by the longest processing time
+    first rule: the largest item goes to the bin with the least bytes.
+    Ties are broken by the item index and the bin index, so every trainer
+    gets the same assignment.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i], i))
+    heap = [(0, b) for b in range(num_bins)]
+    assignment = [0] * len(sizes)
+    for i in order:
+        load, b = heapq.heappop(heap)
+        assignment[i] = b
+        heapq.heappush(heap, (load + sizes[i], b))
+    return assignment
+
+
+def _file_shard_report(sizes, assignment, num_bins):
+    bytes_per_bin = [0] * num_bins
+    files_per_bin = [0] * num_bins
+    for size, b in zip(sizes, assignment):
+        bytes_per_bin[b] += size
+        files_per_bin[b] += 1
+    total = sum(bytes_per_bin)
+    imbalance = float(max(bytes_per_bin)) * num_bins / total if total else 1.0
+    return FileShardReport(bytes_per_bin, files_per_bin, imbalance)
+
 
 class UtilFactory(object):
     def _create_util(self, context=None):
@@ -44,6 +76,8 @@ class UtilBase(object):
     def __init__(self):
         self.role_maker = None
         self.dist_strategy = None
+        self.fs_client = None
+        self._file_shard_report = None
 
     def _set_strategy(self, dist_strategy):
         self.dist_strategy = dist_strategy
@@ -203,7 +237,7 @@ class UtilBase(object):
     def _scatter(self):
         pass
 
-    def get_file_shard(self, files):
+    def get_file_shard(self, files, balance_by_size=False, fs_client=None):
         """
         Split files before distributed training, and return filelist assigned to the current trainer.
 
@@ -213,9 +247,19 @@ class UtilBase(object):
                     0 gets [a, b, c] and trainer 1 gets [d, e].
             example 2: files is [a, b], and trainer_num = 3, then trainer 0 gets
                     [a], trainer 1 gets [b],  trainer 2 gets []
+            example 3: balance_by_size is True, files is [a, b, c, d] of sizes
+                    [5, 4, 3, 3] and trainer_num = 2, then the largest file
+                    goes to the trainer with the least bytes one by one,
+                    trainer 0 gets [a, d] and trainer 1 gets [b, c].
 
         Args:
             files(list): File list need to be read.
+            balance_by_size(bool, optional): Whether to balance the bytes
+                instead of the number of files of the trainers, the file
+                sizes are queried by `fs_client`. Default: False.
+            fs_client(FS, optional): The file system of the files, LocalFS or
+                HDFSClient. Default: None, the file system set to fleet.util,
+                or LocalFS if not set.
 
         Returns:
             List: Files belong to this worker.
@@ -246,6 +290,15 @@ class UtilBase(object):
         trainer_id = self.role_maker._worker_index()
         trainers = self.role_maker._worker_num()
 
+        if balance_by_size:
+            sizes = self._get_fs_client(fs_client).file_sizes(files)
+            assignment = _lpt_assign(sizes, trainers)
+            self._file_shard_report = _file_shard_report(sizes, assignment,
+                                                         trainers)
+            return [
+                f for f, b in zip(files, assignment) if b == trainer_id
+            ]
+
         remainder = len(files) % trainers
         blocksize = int(len(files) / trainers)
 
@@ -261,6 +314,95 @@ class UtilBase(object):
 
         return trainer_files[trainer_id]
 
+    def get_file_shard_dynamic(self,
+                               files,
+                               kv_endpoint,
+                               epoch=0,
+                               fs_client=None):
+        """
+        Pull the files to read from a queue shared by all the trainers, so a
+        trainer reading faster reads more files. The files are sorted by
+        size from the largest, and the queue index is a counter in the
+        KVServer at `kv_endpoint`, every trainer must pass the same `files`.
+
+        Args:
+            files(list): File list need to be read.
+            kv_endpoint(str): The endpoint of a running KVServer, e.g. the
+                http server of gloo, "127.0.0.1:8090".
+            epoch(int, optional): Each epoch uses a different queue, so the
+                files can be read again in the next epoch. Default: 0.
+            fs_client(FS, optional): The file system of the files, LocalFS or
+                HDFSClient. Default: None, the file system set to fleet.util,
+                or LocalFS if not set.
+
+        Returns:
+            Generator: Yields the files for this worker, until the queue is
+            empty.
+
+        Examples:
+
+            .. code-block:: python
+
+                import paddle.distributed.fleet as fleet
+                from paddle.distributed.fleet.utils.http_server import KVServer
+
+                server = KVServer(8090)
+                server.start()
+
+                for f in fleet.util.get_file_shard_dynamic(
+                        ["file1", "file2", "file3"], "127.0.0.1:8090"):
+                    print(f)
+
+                server.stop()
+        """
+        if not isinstance(files, list):
+            raise TypeError("files should be a list of file need to be read.")
+
+        from ..utils.http_server import kv_fetch_add
+
+        sizes = self._get_fs_client(fs_client).file_sizes(files)
+        order = sorted(range(len(files)), key=lambda i: (-sizes[i], i))
+        trainer_id = self.role_maker._worker_index()
+        trainers = self.role_maker._worker_num()
+        # only the bytes of this trainer are known
+        bytes_per_trainer = [0] * trainers
+        files_per_trainer = [0] * trainers
+        self._file_shard_report = FileShardReport(bytes_per_trainer,
+                                                  files_per_trainer, None)
+        key = "epoch_{}".format(epoch)
+        while True:
+            index = kv_fetch_add(kv_endpoint, "file_shard", key)
+            if index >= len(order):
+                break
+            i = order[index]
+            bytes_per_trainer[trainer_id] += sizes[i]
+            files_per_trainer[trainer_id] += 1
+            yield files[i]
+
+    def get_file_shard_report(self):
+        """
+        Get the bytes and the number of files assigned to each trainer by the
+        last `get_file_shard` with `balance_by_size=True`, or pulled by this
+        trainer in `get_file_shard_dynamic`.
+
+        Returns:
+            FileShardReport|None: A namedtuple of `bytes` and `num_files`, the
+            lists of each trainer, and `imbalance`, the max bytes of the
+            trainers divided by the mean (None in the dynamic mode). None if
+            no file is sharded by size yet.
+        """
+        return self._file_shard_report
+
+    def _get_fs_client(self, fs_client):
+        if fs_client is None:
+            fs_client = self.fs_client
+        if fs_client is None:
+            fs_client = LocalFS()
+        assert isinstance(
+            fs_client, FS
+        ), "fs_client must be the instance of paddle.distributed.fleet.utils.FS"
+        return fs_client
+
     def print_on_rank(self, message, rank_id):
         """
         Woker of rank `rank_id` print some message. 
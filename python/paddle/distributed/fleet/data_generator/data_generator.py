@@ -12,9 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import multiprocessing
 import os
+import struct
 import sys
 
+import numpy as np
+import six
+
+# the generator used by the worker processes of run_from_stdin, which is
+# set before the processes are forked
+_chunk_generator = None
+
+
+def _read_chunks(f, chunk_size):
+    chunk = []
+    for line in f:
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _process_chunk_in_worker(args):
+    lines, binary = args
+    return _chunk_generator._process_chunk(lines, binary)
+
 
 class DataGenerator(object):
     """
@@ -91,7 +116,7 @@ class DataGenerator(object):
             for sample in batch_iter():
                 sys.stdout.write(self._gen_str(sample))
 
-    def run_from_stdin(self):
+    def run_from_stdin(self, num_workers=1, chunk_size=1024, binary=False):
         '''
         This function reads the data row from stdin, parses it with the
         process function, and further parses the return value of the 
@@ -99,6 +124,19 @@ class DataGenerator(object):
         be wrote to stdout and the corresponding protofile will be
         generated.
 
+        If num_workers is larger than 1 or binary is True, stdin is read
+        in chunks of chunk_size rows, which are processed by num_workers
+        forked processes, and the outputs are written in the order of the
+        rows. The samples are batched within each chunk. num_workers larger
+        than 1 is not supported on windows.
+
+        Args:
+            num_workers(int): the number of processes. Default 1.
+            chunk_size(int): the number of rows processed by a process at a
+                time. Default 1024.
+            binary(bool): whether to write the samples in the binary format
+                of _gen_binary instead of _gen_str. Default False.
+
         Example:
         
             .. code-block:: python
@@ -114,10 +152,72 @@ class DataGenerator(object):
 
                 mydata = MyData()
                 mydata.run_from_stdin()
+                # or process stdin by 4 processes
+                # mydata.run_from_stdin(num_workers=4)
 
         '''
+        if num_workers == 1 and not binary:
+            batch_samples = []
+            for line in sys.stdin:
+                line_iter = self.generate_sample(line)
+                for user_parsed_line in line_iter():
+                    if user_parsed_line == None:
+                        continue
+                    batch_samples.append(user_parsed_line)
+                    if len(batch_samples) == self.batch_size_:
+                        batch_iter = self.generate_batch(batch_samples)
+                        for sample in batch_iter():
+                            sys.stdout.write(self._gen_str(sample))
+                        batch_samples = []
+            if len(batch_samples) > 0:
+                batch_iter = self.generate_batch(batch_samples)
+                for sample in batch_iter():
+                    sys.stdout.write(self._gen_str(sample))
+            return
+
+        if num_workers < 1 or chunk_size < 1:
+            raise ValueError(
+                "num_workers and chunk_size should be positive integers, "
+                "but received %s and %s." % (num_workers, chunk_size))
+        out = sys.stdout
+        if binary:
+            out = getattr(sys.stdout, "buffer", sys.stdout)
+        chunks = _read_chunks(sys.stdin, chunk_size)
+        if num_workers == 1:
+            for lines in chunks:
+                out.write(self._process_chunk(lines, binary))
+            return
+
+        if sys.platform == 'win32':
+            raise NotImplementedError(
+                "The num_workers larger than 1 of run_from_stdin is not "
+                "supported on windows.")
+        global _chunk_generator
+        _chunk_generator = self
+        # the processes should be forked to inherit _chunk_generator
+        context = multiprocessing.get_context('fork') if six.PY3 \
+            else multiprocessing
+        pool = context.Pool(num_workers)
+        try:
+            # imap keeps the order of the chunks
+            for output in pool.imap(_process_chunk_in_worker,
+                                    ((lines, binary) for lines in chunks)):
+                out.write(output)
+            pool.close()
+        finally:
+            pool.terminate()
+            _chunk_generator = None
+
+    def _process_chunk(self, lines, binary=False):
+        """
+        Process a chunk of lines, the samples are batched in the chunk.
+        Returns the output of all the samples joined, which is bytes if
+        binary is True, otherwise str.
+        """
+        gen = self._gen_binary if binary else self._gen_str
+        outputs = []
         batch_samples = []
-        for line in sys.stdin:
+        for line in lines:
             line_iter = self.generate_sample(line)
             for user_parsed_line in line_iter():
                 if user_parsed_line == None:
@@ -126,12 +226,13 @@ class DataGenerator(object):
                 if len(batch_samples) == self.batch_size_:
                     batch_iter = self.generate_batch(batch_samples)
                     for sample in batch_iter():
-                        sys.stdout.write(self._gen_str(sample))
+                        outputs.append(gen(sample))
                     batch_samples = []
         if len(batch_samples) > 0:
             batch_iter = self.generate_batch(batch_samples)
             for sample in batch_iter():
-                sys.stdout.write(self._gen_str(sample))
+                outputs.append(gen(sample))
+        return (six.b("") if binary else "").join(outputs)
 
     def _gen_str(self, line):
         '''
@@ -148,6 +249,18 @@ class DataGenerator(object):
         raise NotImplementedError(
             "pls use MultiSlotDataGenerator or PairWiseDataGenerator")
 
+    def _gen_binary(self, line):
+        '''
+        The binary version of _gen_str.
+
+        Args:
+            line(str): the output of the process() function rewritten by user.
+
+        Returns:
+            Return the bytes of the sample.
+        '''
+        raise NotImplementedError("pls use MultiSlotDataGenerator")
+
     def generate_sample(self, line):
         '''
         This function needs to be overridden by the user to process the 
@@ -275,6 +388,28 @@ class MultiSlotStringDataGenerator(DataGenerator):
         return output + "\n"
 
 
+def _has_float(elements):
+    elem_types = set(map(type, elements))
+    if elem_types.issubset(six.integer_types):
+        return False
+    if elem_types.issubset(six.integer_types + (float, )):
+        return True
+    # the subclasses of int or float, such as bool and numpy.float64
+    has_float = False
+    for elem in elements:
+        if isinstance(elem, float):
+            has_float = True
+        elif not isinstance(elem, six.integer_types):
+            raise ValueError("the type of element%s must be in int or float" %
+                             type(elem))
+    return has_float
+
+
+# the type tags of the slots in the binary format of _gen_binary
+_BINARY_UINT64 = 0
+_BINARY_FLOAT32 = 1
+
+
 class MultiSlotDataGenerator(DataGenerator):
     def _gen_str(self, line):
         '''
@@ -304,68 +439,70 @@ class MultiSlotDataGenerator(DataGenerator):
         Returns:
             Return a string data that can be read directly by the MultiSlotDataFeed.
         '''
+        self._check_line(line)
+        return " ".join("%d %s" % (len(elements), " ".join(map(str, elements)))
+                        for _, elements in line) + "\n"
+
+    def _gen_binary(self, line):
+        '''
+        Further processing the output of the process() function rewritten by
+        user, outputting the bytes of the sample in a length-prefixed binary
+        format, and updating proto_info information.
+
+        The output will be in this format, all in little endian:
+            >>> record_bytes(uint32) [type(uint8) ids_num(uint32) id1 id2 ...] ...
+        where type is 0 if the ids are uint64, or 1 if the ids are float32.
+        The ids of a slot are float32 since a float appears in the slot, as
+        proto_info, so the type is written in every record to decode the
+        records written before and after that, or by different processes.
+
+        Args:
+            line(str): the output of the process() function rewritten by user.
+
+        Returns:
+            Return the bytes of the sample.
+        '''
+        self._check_line(line)
+        record = []
+        for index, item in enumerate(line):
+            _, elements = item
+            if self._proto_info[index][1] == "float":
+                slot_type, dtype = _BINARY_FLOAT32, "<f4"
+            else:
+                slot_type, dtype = _BINARY_UINT64, "<u8"
+            record.append(struct.pack("<BI", slot_type, len(elements)))
+            record.append(np.array(elements, dtype=dtype).tobytes())
+        record = six.b("").join(record)
+        return struct.pack("<I", len(record)) + record
+
+    def _check_line(self, line):
         if not isinstance(line, list) and not isinstance(line, tuple):
             raise ValueError(
                 "the output of process() must be in list or tuple type"
                 "Example: [('words', [1926, 08, 17]), ('label', [1])]")
-        output = ""
 
-        if self._proto_info is None:
+        is_first_line = self._proto_info is None
+        if is_first_line:
             self._proto_info = []
-            for item in line:
-                name, elements = item
-                if not isinstance(name, str):
-                    raise ValueError("name%s must be in str type" % type(name))
-                if not isinstance(elements, list):
-                    raise ValueError("elements%s must be in list type" %
-                                     type(elements))
-                if not elements:
-                    raise ValueError(
-                        "the elements of each field can not be empty, you need padding it in process()."
-                    )
+        elif len(line) != len(self._proto_info):
+            raise ValueError(
+                "the complete field set of two given line are inconsistent.")
+        for index, item in enumerate(line):
+            name, elements = item
+            if not isinstance(name, str):
+                raise ValueError("name%s must be in str type" % type(name))
+            if not isinstance(elements, list):
+                raise ValueError("elements%s must be in list type" %
+                                 type(elements))
+            if not elements:
+                raise ValueError(
+                    "the elements of each field can not be empty, you need padding it in process()."
+                )
+            if is_first_line:
                 self._proto_info.append((name, "uint64"))
-                if output:
-                    output += " "
-                output += str(len(elements))
-                for elem in elements:
-                    if isinstance(elem, float):
-                        self._proto_info[-1] = (name, "float")
-                    elif not isinstance(elem, int) and not isinstance(elem,
-                                                                      long):
-                        raise ValueError(
-                            "the type of element%s must be in int or float" %
-                            type(elem))
-                    output += " " + str(elem)
-        else:
-            if len(line) != len(self._proto_info):
+            elif name != self._proto_info[index][0]:
                 raise ValueError(
-                    "the complete field set of two given line are inconsistent.")
-            for index, item in enumerate(line):
-                name, elements = item
-                if not isinstance(name, str):
-                    raise ValueError("name%s must be in str type" % type(name))
-                if not isinstance(elements, list):
-                    raise ValueError("elements%s must be in list type" %
-                                     type(elements))
-                if not elements:
-                    raise ValueError(
-                        "the elements of each field can not be empty, you need padding it in process()."
-                    )
-                if name != self._proto_info[index][0]:
-                    raise ValueError(
-                        "the field name of two given line are not match: require<%s>, get<%s>."
-                        % (self._proto_info[index][0], name))
-                if output:
-                    output += " "
-                output += str(len(elements))
-                for elem in elements:
-                    if self._proto_info[index][1] != "float":
-                        if isinstance(elem, float):
-                            self._proto_info[index] = (name, "float")
-                        elif not isinstance(elem, int) and not isinstance(elem,
-                                                                          long):
-                            raise ValueError(
-                                "the type of element%s must be in int or float"
-                                % type(elem))
-                    output += " " + str(elem)
-        return output + "\n"
+                    "the field name of two given line are not match: require<%s>, get<%s>."
+                    % (self._proto_info[index][0], name))
+            if self._proto_info[index][1] != "float" and _has_float(elements):
+                self._proto_info[index] = (name, "float")
@@ -23,4 +23,5 @@ __all__ = [
     "rmse",
     "mse",
     "acc",
+    "merge_metrics",
 ]
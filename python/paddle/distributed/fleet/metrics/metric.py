@@ -17,6 +17,7 @@ import paddle.fluid as fluid
 import math
 import numpy as np
 from paddle.fluid.framework import Variable
+from paddle.metric.metrics import _auc_from_stats
 from paddle.fluid.incubate.fleet.parameter_server.distribute_transpiler import fleet
 
 
@@ -175,43 +176,20 @@ def auc(stat_pos, stat_neg, scope=None):
         stat_neg = np.array(scope.find_var(stat_neg.name).get_tensor())
     elif isinstance(stat_neg, str):
         stat_neg = np.array(scope.find_var(stat_neg).get_tensor())
-    # auc pos bucket shape
-    old_pos_shape = np.array(stat_pos.shape)
-    # reshape to one dim
-    stat_pos = stat_pos.reshape(-1)
-    global_pos = np.copy(stat_pos) * 0
-    # mpi allreduce
-    fleet._role_maker._all_reduce(stat_pos, global_pos)
-    # reshape to its original shape
-    global_pos = global_pos.reshape(old_pos_shape)
-
-    # auc neg bucket
-    old_neg_shape = np.array(stat_neg.shape)
-    stat_neg = stat_neg.reshape(-1)
-    global_neg = np.copy(stat_neg) * 0
-    fleet._role_maker._all_reduce(stat_neg, global_neg)
-    global_neg = global_neg.reshape(old_neg_shape)
+    # all reduce the pos and neg buckets in one call
+    stat_pos = np.asarray(stat_pos)
+    stat_neg = np.asarray(stat_neg)
+    stat = np.concatenate([stat_pos.reshape(-1), stat_neg.reshape(-1)])
+    global_stat = np.copy(stat) * 0
+    fleet._role_maker._all_reduce(stat, global_stat)
+    global_pos = global_stat[:stat_pos.size].reshape(stat_pos.shape)
+    global_neg = global_stat[stat_pos.size:].reshape(stat_neg.shape)
 
     # calculate auc
-    num_bucket = len(global_pos[0])
-    area = 0.0
-    pos = 0.0
-    neg = 0.0
-    new_pos = 0.0
-    new_neg = 0.0
-    total_ins_num = 0
-    for i in range(num_bucket):
-        index = num_bucket - 1 - i
-        new_pos = pos + global_pos[0][index]
-        total_ins_num += global_pos[0][index]
-        new_neg = neg + global_neg[0][index]
-        total_ins_num += global_neg[0][index]
-        area += (new_neg - neg) * (pos + new_pos) / 2
-        pos = new_pos
-        neg = new_neg
+    area, pos, neg = _auc_from_stats(global_pos[0], global_neg[0])
 
     auc_value = None
-    if pos * neg == 0 or total_ins_num == 0:
+    if pos * neg == 0:
         auc_value = 0.5
     else:
         auc_value = area / (pos * neg)
@@ -383,3 +361,52 @@ def acc(correct, total, scope=None):
     fleet._role_maker._all_reduce(correct, global_correct_num)
     fleet._role_maker._all_reduce(total, global_total_num)
     return float(global_correct_num[0]) / float(global_total_num[0])
+
+
+def merge_metrics(metrics):
+    """
+    distributed merge of paddle.metric.Metric in fleet, the states of all the
+    metrics are all reduced in one call, then each metric holds the global
+    states of all the workers.
+
+    Args:
+        metrics(list): the metrics to merge, each of them implements
+            `state_dict` and `set_state_dict`, like paddle.metric.Accuracy,
+            paddle.metric.Precision, paddle.metric.Recall and
+            paddle.metric.Auc.
+
+    Returns:
+        metrics(list): the merged metrics, the same objects as the input.
+
+    Example:
+        .. code-block:: python
+
+          # in train.py, after train or infer
+          acc = paddle.metric.Accuracy()
+          auc = paddle.metric.Auc()
+          # update acc and auc with the local batches
+          paddle.distributed.fleet.metrics.merge_metrics([acc, auc])
+          print("accuracy: ", acc.accumulate())
+          print("auc: ", auc.accumulate())
+    """
+    fleet._role_maker._barrier_worker()
+    state_dicts = [metric.state_dict() for metric in metrics]
+    states = [
+        np.asarray(
+            value, dtype='float64').reshape(-1)
+        for state_dict in state_dicts for value in state_dict.values()
+    ]
+    if states:
+        stat = np.concatenate(states)
+        global_stat = np.copy(stat) * 0
+        fleet._role_maker._all_reduce(stat, global_stat)
+        offset = 0
+        for metric, state_dict in zip(metrics, state_dicts):
+            for key, value in state_dict.items():
+                size = np.size(value)
+                state_dict[key] = global_stat[offset:offset + size].reshape(
+                    np.shape(value))
+                offset += size
+            metric.set_state_dict(state_dict)
+    fleet._role_maker._barrier_worker()
+    return metrics
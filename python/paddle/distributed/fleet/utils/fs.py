@@ -28,6 +28,8 @@ import abc
 import paddle.fluid as fluid
 from paddle.fluid import core
 import functools
+import threading
+from multiprocessing.pool import ThreadPool
 
 import shutil
 
@@ -111,6 +113,9 @@ class FS(object):
     def touch(self, fs_path, exist_ok=True):
         raise NotImplementedError
 
+    def file_sizes(self, fs_paths):
+        raise NotImplementedError
+
 
 class LocalFS(FS):
     """
@@ -298,6 +303,33 @@ class LocalFS(FS):
         """
         return os.path.exists(fs_path)
 
+    def file_sizes(self, fs_paths):
+        """
+        Get the sizes of the local files.
+
+        Args:
+            fs_paths(list): The local file paths.
+
+        Returns:
+            List: The sizes in bytes of the files, in the same order as `fs_paths`.
+
+        Examples:
+            .. code-block:: python
+
+                from paddle.distributed.fleet.utils import LocalFS
+
+                client = LocalFS()
+                client.touch("test_file_sizes")
+                print(client.file_sizes(["test_file_sizes"])) # [0]
+                client.delete("test_file_sizes")
+        """
+        sizes = []
+        for fs_path in fs_paths:
+            if not self.is_file(fs_path):
+                raise FSFileNotExistsError("{} is not a file".format(fs_path))
+            sizes.append(os.path.getsize(fs_path))
+        return sizes
+
     def touch(self, fs_path, exist_ok=True):
         """
         Create a local file.
@@ -416,6 +448,14 @@ def _handle_errors(max_time_out=None):
     return decorator
 
 
+def _strip_fs_scheme(fs_path):
+    # hdfs://host:port/a/b, hdfs:/a/b and /a/b are all /a/b
+    m = re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*:(//[^/]*)?', fs_path)
+    if m is not None:
+        fs_path = fs_path[m.end():]
+    return os.path.normpath(fs_path)
+
+
 class HDFSClient(FS):
     """
     A tool of HDFS.
@@ -424,6 +464,14 @@ class HDFSClient(FS):
         hadoop_home(str): Hadoop home. 
         configs(dict): Hadoop config. It is a dictionary and needs to contain the
             keys: "fs.default.name" and "hadoop.job.ugi".
+        time_out(int): Timeout in ms of the retried commands. Default is 300000.
+        sleep_inter(int): Sleep interval in ms between the retries. Default is 1000.
+        cache_ttl(int|float): Seconds to cache the results of `ls_dir` and the
+            existence and type of the paths. The cache entries of a path are
+            dropped when it's changed by this client, changes made by others
+            are visible after `cache_ttl` seconds. Default is 0, no cache.
+        num_workers(int): The number of `hadoop fs` commands run concurrently
+            by `upload_dir` and `download_files`. Default is 1.
 
     Examples:
 
@@ -446,7 +494,9 @@ class HDFSClient(FS):
             hadoop_home,
             configs,
             time_out=5 * 60 * 1000,  # ms
-            sleep_inter=1000):  # ms
+            sleep_inter=1000,  # ms
+            cache_ttl=0,  # s
+            num_workers=1):
         # Raise exception if JAVA_HOME not exists.
         java_home = os.environ["JAVA_HOME"]
 
@@ -467,6 +517,55 @@ class HDFSClient(FS):
         self._bd_err_re = re.compile(
             r'\s?responseErrorMsg\s?\:.*, errorCode\:\s?[0-9]+, path\:')
 
+        if num_workers < 1:
+            raise ValueError("num_workers should be a positive integer, "
+                             "but received %s." % num_workers)
+        self._cache_ttl = cache_ttl
+        self._num_workers = num_workers
+        self._cache_lock = threading.Lock()
+        # normalized path -> (expire time, 'dir' | 'file' | None)
+        self._type_cache = {}
+        # normalized path -> (expire time, (dirs, files))
+        self._ls_cache = {}
+
+    def _cache_get(self, cache, fs_path):
+        if self._cache_ttl <= 0:
+            return False, None
+        with self._cache_lock:
+            entry = cache.get(_strip_fs_scheme(fs_path))
+        if entry is None or entry[0] < time.time():
+            return False, None
+        return True, entry[1]
+
+    def _cache_put(self, cache, fs_path, value):
+        if self._cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            cache[_strip_fs_scheme(fs_path)] = (time.time() + self._cache_ttl,
+                                                value)
+
+    def _invalidate(self, fs_path):
+        """
+        Drop the cache entries of `fs_path`, its children and its parents,
+        after `fs_path` is written by this client.
+        """
+        if self._cache_ttl <= 0:
+            return
+        path = _strip_fs_scheme(fs_path)
+        prefix = path.rstrip('/') + '/'
+        parents = set()
+        parent = path
+        while True:
+            parents.add(parent)
+            parent, child = os.path.split(parent)
+            if not child:
+                break
+        with self._cache_lock:
+            for cache in (self._type_cache, self._ls_cache):
+                for key in list(cache.keys()):
+                    if key in parents or key.startswith(prefix):
+                        del cache[key]
+
     def _run_cmd(self, cmd, redirect_stderr=False):
         exe_cmd = "{} -{}".format(self._base_cmd, cmd)
         ret, output = core.shell_execute_cmd(exe_cmd, 0, 0, redirect_stderr)
@@ -540,6 +639,10 @@ class HDFSClient(FS):
         return self._ls_dir(fs_path)
 
     def _ls_dir(self, fs_path):
+        hit, value = self._cache_get(self._ls_cache, fs_path)
+        if hit:
+            return list(value[0]), list(value[1])
+
         cmd = "ls {}".format(fs_path)
         ret, lines = self._run_cmd(cmd)
 
@@ -559,7 +662,80 @@ class HDFSClient(FS):
             else:
                 files.append(p)
 
-        return dirs, files
+        if self._cache_ttl > 0:
+            self._cache_put(self._ls_cache, fs_path, (dirs, files))
+            self._cache_put(self._type_cache, fs_path, 'dir')
+            for d in dirs:
+                self._cache_put(self._type_cache, os.path.join(fs_path, d),
+                                'dir')
+            for f in files:
+                self._cache_put(self._type_cache, os.path.join(fs_path, f),
+                                'file')
+
+        return list(dirs), list(files)
+
+    @_handle_errors()
+    def path_types(self, fs_paths):
+        """
+        Get the types of the remote HDFS paths, by one `ls -d` command for all
+        the paths not cached.
+
+        Args:
+            fs_paths(list): The HDFS paths.
+
+        Returns:
+            List: 'dir', 'file', or None if the path doesn't exist, in the same
+            order as `fs_paths`.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs, cache_ttl=60)
+                types = client.path_types(["hdfs:/test_hdfs_client", "hdfs:/test_hdfs_client/a"])
+        """
+        types = {}
+        missed = []
+        for fs_path in fs_paths:
+            if fs_path in types:
+                continue
+            hit, value = self._cache_get(self._type_cache, fs_path)
+            if hit:
+                types[fs_path] = value
+            else:
+                # placeholder, avoid querying the same path twice
+                types[fs_path] = None
+                missed.append(fs_path)
+
+        if missed:
+            cmd = "ls -d {}".format(" ".join(missed))
+            ret, lines = self._run_cmd(cmd, redirect_stderr=True)
+            found = {}
+            not_found = False
+            for line in lines:
+                arr = line.split()
+                if len(arr) == 8:
+                    found[_strip_fs_scheme(arr[7])] = 'dir' \
+                        if arr[0][0] == 'd' else 'file'
+                elif "No such file or directory" in line:
+                    not_found = True
+            if ret != 0 and not not_found:
+                raise ExecuteError(cmd)
+
+            for fs_path in missed:
+                value = found.get(_strip_fs_scheme(fs_path))
+                types[fs_path] = value
+                self._cache_put(self._type_cache, fs_path, value)
+
+        return [types[fs_path] for fs_path in fs_paths]
 
     def _test_match(self, lines):
         for l in lines:
@@ -595,6 +771,9 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_file("hdfs:/test_hdfs_client")
         """
+        if self._cache_ttl > 0:
+            return self.path_types([fs_path])[0] == 'dir'
+
         if not self.is_exist(fs_path):
             return False
 
@@ -637,6 +816,9 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_file("hdfs:/test_hdfs_client")
         """
+        if self._cache_ttl > 0:
+            return self.path_types([fs_path])[0] == 'file'
+
         if not self.is_exist(fs_path):
             return False
 
@@ -669,6 +851,9 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_exist("hdfs:/test_hdfs_client")
         """
+        if self._cache_ttl > 0:
+            return self.path_types([fs_path])[0] is not None
+
         cmd = "ls {} ".format(fs_path)
         ret, out = self._run_cmd(cmd, redirect_stderr=True)
         if ret != 0:
@@ -679,6 +864,60 @@ class HDFSClient(FS):
 
         return True
 
+    @_handle_errors()
+    def file_sizes(self, fs_paths):
+        """
+        Get the sizes of the remote HDFS files, by one `du` command.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: The sizes in bytes of the files, in the same order as `fs_paths`.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                sizes = client.file_sizes(["hdfs:/test_hdfs_client"])
+        """
+        if len(fs_paths) == 0:
+            return []
+
+        cmd = "du {}".format(" ".join(fs_paths))
+        ret, lines = self._run_cmd(cmd, redirect_stderr=True)
+        if ret != 0:
+            for l in lines:
+                if "No such file or directory" in l:
+                    raise FSFileNotExistsError(l)
+            raise ExecuteError(cmd)
+
+        # each line is "size [disk_space_consumed] path", the path may be
+        # fully qualified, e.g. hdfs://host:port/path
+        sizes = {}
+        for line in lines:
+            arr = line.split()
+            if len(arr) < 2 or not arr[0].isdigit():
+                continue
+            sizes[_strip_fs_scheme(arr[-1])] = int(arr[0])
+
+        ret = []
+        for fs_path in fs_paths:
+            size = sizes.get(_strip_fs_scheme(fs_path))
+            if size is None:
+                raise FSFileNotExistsError(fs_path)
+            ret.append(size)
+        return ret
+
     # can't retry
     def upload(self, local_path, fs_path):
         """
@@ -721,8 +960,10 @@ class HDFSClient(FS):
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
+            self._invalidate(fs_path)
             self.delete(fs_path)
             raise e
+        self._invalidate(fs_path)
 
     # can't retry
     def download(self, fs_path, local_path):
@@ -796,6 +1037,7 @@ class HDFSClient(FS):
 
         cmd = "mkdir {} ".format(fs_path)
         ret, out = self._run_cmd(cmd, redirect_stderr=True)
+        self._invalidate(fs_path)
         if ret != 0:
             for l in out:
                 if "No such file or directory" in l:
@@ -807,6 +1049,7 @@ class HDFSClient(FS):
         if out_hdfs and not self.is_exist(fs_path):
             cmd = "mkdir -p {}".format(fs_path)
             ret, lines = self._run_cmd(cmd)
+            self._invalidate(fs_path)
             if ret != 0:
                 raise ExecuteError(cmd)
 
@@ -855,6 +1098,8 @@ class HDFSClient(FS):
         ret = 0
         try:
             ret, _ = self._run_cmd(cmd)
+            self._invalidate(fs_src_path)
+            self._invalidate(fs_dst_path)
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
@@ -866,12 +1111,14 @@ class HDFSClient(FS):
     def _rmr(self, fs_path):
         cmd = "rmr {}".format(fs_path)
         ret, _ = self._run_cmd(cmd)
+        self._invalidate(fs_path)
         if ret != 0:
             raise ExecuteError(cmd)
 
     def _rm(self, fs_path):
         cmd = "rm {}".format(fs_path)
         ret, _ = self._run_cmd(cmd)
+        self._invalidate(fs_path)
         if ret != 0:
             raise ExecuteError(cmd)
 
@@ -942,8 +1189,124 @@ class HDFSClient(FS):
     def _touchz(self, fs_path):
         cmd = "touchz {}".format(fs_path)
         ret, _ = self._run_cmd(cmd)
+        self._invalidate(fs_path)
         if ret != 0:
             raise ExecuteError
 
     def need_upload_download(self):
         return True
+
+    def _run_concurrently(self, func, args_list):
+        if self._num_workers == 1 or len(args_list) <= 1:
+            for args in args_list:
+                func(*args)
+            return
+        pool = ThreadPool(min(self._num_workers, len(args_list)))
+        try:
+            # get() re-raises the first exception of the tasks
+            pool.map_async(lambda args: func(*args), args_list).get()
+        finally:
+            pool.close()
+            pool.join()
+
+    def upload_dir(self, local_dir, dest_dir):
+        """
+        Upload the files in local directory `local_dir` into the remote HDFS
+        directory `dest_dir`, the files are uploaded by `num_workers` commands
+        concurrently.
+
+        Args:
+            local_dir(str): The local directory.
+            dest_dir(str): The HDFS directory, it's created if not exists.
+                As `upload`, FSFileExistsError is raised before uploading if
+                any of the remote files exists.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs, num_workers=8)
+                client.upload_dir("test_upload_dir", "hdfs:/test_hdfs_client")
+        """
+        local = LocalFS()
+        if not local.is_dir(local_dir):
+            raise FSFileNotExistsError("{} is not a directory".format(
+                local_dir))
+
+        dirs = [dest_dir]
+        files = []
+        for root, subdirs, filenames in os.walk(local_dir):
+            rel = os.path.relpath(root, local_dir)
+            remote_root = dest_dir if rel == '.' else os.path.join(dest_dir,
+                                                                   rel)
+            dirs.extend(os.path.join(remote_root, d) for d in subdirs)
+            files.extend((os.path.join(root, f), os.path.join(remote_root, f))
+                         for f in filenames)
+
+        fs_paths = [fs_path for _, fs_path in files]
+        for fs_path, t in zip(fs_paths, self.path_types(fs_paths)):
+            if t is not None:
+                raise FSFileExistsError("{} exists".format(fs_path))
+
+        self._mkdirs_p(dirs)
+        self._run_concurrently(self._try_upload, files)
+
+    @_handle_errors()
+    def _mkdirs_p(self, fs_paths):
+        cmd = "mkdir -p {}".format(" ".join(fs_paths))
+        ret, _ = self._run_cmd(cmd)
+        for fs_path in fs_paths:
+            self._invalidate(fs_path)
+        if ret != 0:
+            raise ExecuteError(cmd)
+
+    def download_files(self, fs_paths, local_dir):
+        """
+        Download the remote HDFS paths into the local directory `local_dir`,
+        by `num_workers` commands concurrently.
+
+        Args:
+            fs_paths(list): The HDFS paths.
+            local_dir(str): The local directory, it's created if not exists.
+
+        Returns:
+            List: The local paths of the downloaded files, in the same order
+            as `fs_paths`.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs, num_workers=8)
+                client.download_files(["hdfs:/test_hdfs_client/a", "hdfs:/test_hdfs_client/b"], "./")
+        """
+        for fs_path, t in zip(fs_paths, self.path_types(fs_paths)):
+            if t is None:
+                raise FSFileNotExistsError("{} not exits".format(fs_path))
+
+        if not os.path.exists(local_dir):
+            os.makedirs(local_dir)
+        local_paths = [
+            os.path.join(local_dir, os.path.basename(fs_path.rstrip('/')))
+            for fs_path in fs_paths
+        ]
+        self._run_concurrently(self._try_download,
+                               list(zip(fs_paths, local_paths)))
+        return local_paths
+
@@ -23,6 +23,7 @@ if six.PY2:
 else:
     from http.server import HTTPServer
     import http.server as SimpleHTTPServer
+from six.moves import http_client
 
 import time
 import threading
@@ -99,6 +100,46 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         self.send_status_code(200)
         _http_server_logger.info(log_str)
 
+    def do_POST(self):
+        """
+        post method for kv handler, add the integer in the request body
+        (1 if empty) to the counter of the key atomically, and send back the
+        value before adding, it works as a shared queue index.
+        """
+        log_str = "POST " + self.address_string() + self.path
+        paths = self.path.split('/')
+        if len(paths) < 3:
+            print('len of request path must be 3: ' + self.path)
+            self.send_status_code(400)
+            return
+        _, scope, key = paths
+        content_length = int(self.headers.get('Content-Length', 0))
+        try:
+            step = self.rfile.read(content_length)
+            step = int(step) if step else 1
+        except:
+            print("receive error invalid request")
+            self.send_status_code(404)
+            return
+        with self.server.kv_lock:
+            kv = self.server.kv.setdefault(scope, {})
+            try:
+                value = int(kv.get(key, b'0'))
+            except ValueError:
+                value = None
+            if value is not None:
+                kv[key] = str(value + step).encode()
+        if value is None:
+            log_str += ' , value is not a counter: ' + key
+            self.send_status_code(400)
+        else:
+            value = str(value).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(value)))
+            self.end_headers()
+            self.wfile.write(value)
+        _http_server_logger.info(log_str)
+
     def do_DELETE(self):
         """
         delete method for kv handler, set value according to key.
@@ -194,3 +235,32 @@ class KVServer:
             if s != self.size.get(key, 0):
                 return False
         return True
+
+
+def kv_fetch_add(endpoint, scope, key, step=1, timeout=60):
+    """
+    add `step` to the counter `key` in `scope` of the KVServer at `endpoint`
+    atomically, and return the value before adding.
+
+    Args:
+        endpoint(str): the endpoint of KVServer, e.g. 127.0.0.1:8090
+        scope(str): scope of the counter
+        key(str): name of the counter
+        step(int): the value to add, default 1
+        timeout(int|float): the timeout of the request in seconds
+
+    Returns:
+        ret(int): the value of the counter before adding
+    """
+    ip, port = endpoint.split(":")
+    conn = http_client.HTTPConnection(ip, int(port), timeout=timeout)
+    try:
+        conn.request("POST", "/{}/{}".format(scope, key), body=str(step))
+        resp = conn.getresponse()
+        value = resp.read()
+        if resp.status != 200:
+            raise RuntimeError("fetch_add {}/{} from {} failed, status {}".
+                               format(scope, key, endpoint, resp.status))
+        return int(value)
+    finally:
+        conn.close()
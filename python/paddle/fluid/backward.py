@@ -266,6 +266,37 @@ def _rename_arg_(op_descs, old_name, new_name, begin_idx=None, end_idx=None):
                     op_desc._rename_output(old_name, new_name)
 
 
+def _add_op_desc_to_var_index_(var_to_op_descs, op_desc):
+    """
+    Record op_desc in var_to_op_descs for each of its input/output names.
+    """
+    for name in set(op_desc.input_arg_names() + op_desc.output_arg_names()):
+        var_to_op_descs[name].append(op_desc)
+
+
+def _rename_arg_in_var_index_(var_to_op_descs,
+                              old_name,
+                              new_name,
+                              should_rename=None):
+    """
+    Rename 'old_name' as 'new_name' in the op descs which read/write it
+    according to the index var_to_op_descs, instead of traversing all op
+    descs. The op descs for which should_rename returns False are left as
+    they are. The index is updated accordingly.
+    """
+    op_descs = var_to_op_descs.pop(old_name, [])
+    kept_op_descs = []
+    for op_desc in op_descs:
+        if should_rename is not None and not should_rename(op_desc):
+            kept_op_descs.append(op_desc)
+            continue
+        op_desc._rename_input(old_name, new_name)
+        op_desc._rename_output(old_name, new_name)
+        var_to_op_descs[new_name].append(op_desc)
+    if kept_op_descs:
+        var_to_op_descs[old_name] = kept_op_descs
+
+
 def _create_op_desc_(op_type, inputs, outputs, attrs):
     """
     Create a C++ OpDesc object with specified inputs, outputs and attributes.
@@ -424,17 +455,30 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
     var_rename_count = collections.defaultdict(int)
     renamed_vars = collections.defaultdict(list)
     renamed_var_start_idx = collections.defaultdict(list)
+    # Index from variable name to the visited op descs and the pending sum
+    # op descs which read/write it, so that renaming a variable only touches
+    # the affected op descs rather than traversing all of them.
+    op_desc_idx = dict()
+    var_to_op_descs = collections.defaultdict(list)
+    var_to_pending_op_descs = collections.defaultdict(list)
+
+    def _accumulate_gradients_(var_name, idx):
+        pending_num = len(pending_sum_ops.get(idx, []))
+        if len(renamed_vars[var_name]) > _MAX_ADD_NUM_:
+            _accumulate_gradients_by_sum_op_(var_name, renamed_vars,
+                                             pending_sum_ops, idx)
+        else:
+            _accumulate_gradients_by_add_ops_(var_name, renamed_vars,
+                                              pending_sum_ops, idx)
+        for sum_op_desc in pending_sum_ops[idx][pending_num:]:
+            _add_op_desc_to_var_index_(var_to_pending_op_descs, sum_op_desc)
+
     for idx, op_desc in enumerate(op_descs):
         for var_name in op_desc.input_arg_names():
             if "@GRAD" not in var_name:
                 continue
             if len(renamed_vars[var_name]) > 1:
-                if len(renamed_vars[var_name]) > _MAX_ADD_NUM_:
-                    _accumulate_gradients_by_sum_op_(var_name, renamed_vars,
-                                                     pending_sum_ops, idx)
-                else:
-                    _accumulate_gradients_by_add_ops_(var_name, renamed_vars,
-                                                      pending_sum_ops, idx)
+                _accumulate_gradients_(var_name, idx)
 
         for param_idx, param_name in enumerate(op_desc.output_names()):
             arg_names = op_desc.output(param_name)
@@ -462,9 +506,12 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
                         #                             new_name, 0, idx)
                         # rename arg from idx of the first appearance
                         # in backward, not always from 0
-                        _rename_arg_(op_descs, var_name, new_name,
-                                     renamed_var_start_idx[var_name], idx)
-                        _rename_arg_(pending_sum_ops, var_name, new_name)
+                        start_idx = renamed_var_start_idx[var_name]
+                        _rename_arg_in_var_index_(
+                            var_to_op_descs, var_name, new_name,
+                            lambda op: op_desc_idx[id(op)] >= start_idx)
+                        _rename_arg_in_var_index_(var_to_pending_op_descs,
+                                                  var_name, new_name)
 
                         for p in op_desc.output_names()[:param_idx]:
                             p_arg_names = op_desc.output(p)
@@ -486,6 +533,9 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
                     op_desc.set_output(param_name, arg_names)
                     renamed_vars[var_name].append(new_name)
 
+        op_desc_idx[id(op_desc)] = idx
+        _add_op_desc_to_var_index_(var_to_op_descs, op_desc)
+
     for var_name, inputs in six.iteritems(renamed_vars):
         if len(renamed_vars[var_name]) > 1:
             if len(renamed_vars[var_name]) > _MAX_ADD_NUM_:
@@ -496,19 +546,15 @@ def _addup_repetitive_outputs_(op_descs, block_idx):
                                                   pending_sum_ops,
                                                   len(op_descs))
 
-    # sum_op descs are sorted according to their insert position
-    for key, value in collections.OrderedDict(
-            reversed(list(pending_sum_ops.items()))).items():
-
-        # NOTE(zhiqiu): Since reversed, the idx of op_descs to be inserted will remains correct.
-        # For example, [0, 1, 2], and we want to insert 'a' at idx 1, 'b' at idx 2, and the expected result is [0, 1, 'a', 2, 'b'].
-        # If reversed, we first insert 'b' at idx 2, it becomes [0, 1, 2, 'b'], and then insert 'a' at idx 1, it becomes [0, 1, 'a', 2, 'b'].
-        # If not reverse, we first insert 'a' at idx 1, it becomes [0, 1, 'a', 2], and then insert 'b' at idx 2, it becomes [0, 1, 'a', 'b', 2].
-        idx = key
-        for i, op in enumerate(value):
-            op_descs.insert(idx + i, op)
+    # sum_op descs are inserted before the op desc of their insert position,
+    # merge them in one pass rather than inserting into the list one by one.
+    result_op_descs = []
+    for idx, op_desc in enumerate(op_descs):
+        result_op_descs.extend(pending_sum_ops.get(idx, []))
+        result_op_descs.append(op_desc)
+    result_op_descs.extend(pending_sum_ops.get(len(op_descs), []))
 
-    return op_descs
+    return result_op_descs
 
 
 def _remove_no_grad_branch_(op_descs, no_grad_set):
@@ -548,9 +594,20 @@ def _remove_no_grad_branch_(op_descs, no_grad_set):
                 to_insert.append((_create_op_desc_(
                     "fill_zeros_like", {"X": [x_in]}, {"Out": [arg]}, {}), idx))
 
-    list([op_descs.insert(p[1], p[0]) for p in reversed(to_insert)])
+    if not to_insert:
+        return op_descs
+
+    # merge the fill_zeros_like ops in one pass, each of them is placed
+    # right before the op desc which reads its output.
+    result_op_descs = []
+    insert_idx = 0
+    for idx, op_desc in enumerate(op_descs):
+        while insert_idx < len(to_insert) and to_insert[insert_idx][1] == idx:
+            result_op_descs.append(to_insert[insert_idx][0])
+            insert_idx += 1
+        result_op_descs.append(op_desc)
 
-    return op_descs
+    return result_op_descs
 
 
 def _find_not_need_ops(grad_op_descs, forward_ops, input_grad_names_set):
@@ -603,14 +660,14 @@ def _find_not_need_ops(grad_op_descs, forward_ops, input_grad_names_set):
     var_versions = dict()
 
     def _create_node(name):
-        if name not in var_versions.keys():
+        if name not in var_versions:
             var_versions[name] = [Var(name)]
         else:
             var_versions[name].append(Var(name))
         return var_versions[name][-1]
 
     def _create_or_get_last_version_node(name):
-        if name not in var_versions.keys():
+        if name not in var_versions:
             var_versions[name] = [Var(name)]
         return var_versions[name][-1]
 
@@ -655,9 +712,9 @@ def _find_not_need_ops(grad_op_descs, forward_ops, input_grad_names_set):
         op_list = [special_op_node]
         ready_vars = set(special_op_node.inputs)
         remove_ops = True
-        candidate_ops = [special_op_node]
+        candidate_ops = collections.deque([special_op_node])
         while len(candidate_ops) > 0:
-            op_node = candidate_ops.pop(0)
+            op_node = candidate_ops.popleft()
             if _all_in_set_(op_node.inputs, ready_vars):
                 for out_var in op_node.outputs:
                     candidate_ops.extend(out_var.pendding_ops)
@@ -11,10 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import math
 import os
 import re
 import logging
+import multiprocessing
 import numpy as np
 from .... import io
 from .... import core
@@ -117,6 +119,153 @@ def _apply_pass(scope,
     return graph
 
 
+# The streaming histogram has more bins than the histogram searched for the
+# KL threshold, so that rebinning it to the range of the abs max value stays
+# close to the histogram computed with that range directly.
+_HISTOGRAM_OVERSAMPLING = 16
+
+
+def _update_abs_histogram(histogram, var_tensor_abs, bins):
+    '''
+    Accumulate the abs values of a tensor into a streaming histogram
+    [hist, upper_bound, abs_max], whose range is [0, upper_bound]. If the
+    abs max value exceeds the range, the range is doubled until it covers
+    the value, and every 2**k adjacent bins are merged into one bin, so the
+    histogram stays exact without going through the calibrate data again.
+    As the range can be up to twice the abs max value, the abs max value is
+    also kept to rebin the histogram. The bins must be a power of 2. Return
+    the updated histogram.
+    '''
+    abs_max_value = float(np.max(var_tensor_abs)) if var_tensor_abs.size else 0.
+    if histogram is None:
+        upper_bound = abs_max_value if abs_max_value > 0 else 1e-8
+        histogram = [np.zeros(bins, dtype='int64'), upper_bound, 0.]
+    hist, upper_bound, abs_max = histogram
+    if abs_max_value > upper_bound:
+        k = int(math.ceil(math.log(abs_max_value / upper_bound, 2)))
+        while upper_bound * 2**k < abs_max_value:
+            k += 1
+        merged_bins = 2**k
+        if merged_bins >= bins:
+            hist = np.array([np.sum(hist)] + [0] * (bins - 1), dtype='int64')
+        else:
+            hist = np.concatenate([
+                hist.reshape(-1, merged_bins).sum(axis=1),
+                np.zeros(bins - bins // merged_bins, dtype='int64')
+            ])
+        upper_bound *= merged_bins
+    new_hist, _ = np.histogram(
+        var_tensor_abs, bins=bins, range=(0, upper_bound))
+    return [hist + new_hist, upper_bound, max(abs_max, abs_max_value)]
+
+
+def _rebin_histogram(hist, upper_bound, abs_max, bins):
+    '''
+    Rebin the histogram of the range [0, upper_bound] to the given bins of
+    the range [0, abs_max], assuming the values are uniformly distributed in
+    every bin. Return the float counts of the new bins.
+    '''
+    edges = np.linspace(0, upper_bound, len(hist) + 1)
+    cumsum = np.concatenate([[0.], np.cumsum(hist, dtype='float64')])
+    new_cumsum = np.interp(np.linspace(0, abs_max, bins + 1), edges, cumsum)
+    return np.diff(new_cumsum)
+
+
+def _search_kl_threshold_index(hist, num_quantized_bins=255, chunk_size=128):
+    '''
+    Search the index of the bin, below which the quantized distribution
+    has the min KL-divergence to the reference distribution.
+
+    It computes the same KL-divergence as the reference method from TensorRT
+    for all the candidate indexes at once by numpy, chunk_size candidates a
+    time to bound the memory. Return 0 if no candidate is found.
+    '''
+    hist = np.asarray(hist, dtype='float64').ravel()
+    bins = hist.size
+    ending_iter = bins - 1
+    starting_iter = int(ending_iter * 0.7)
+    candidates = np.arange(starting_iter, ending_iter + 1)
+    # the candidate whose last reference bin is empty is skipped
+    candidates = candidates[hist[candidates - 1] != 0]
+    candidates = candidates[candidates >= num_quantized_bins]
+    if candidates.size == 0:
+        return 0
+
+    P_sum = np.sum(hist)
+    outliers_counts = P_sum - np.cumsum(hist)
+    positions = np.arange(bins)
+    nonzero = hist != 0
+    min_kl_divergence = None
+    min_kl_index = 0
+    for begin in range(0, candidates.size, chunk_size):
+        cand = candidates[begin:begin + chunk_size]
+        rows = np.arange(cand.size)[:, np.newaxis]
+        in_range = positions[np.newaxis, :] < cand[:, np.newaxis]
+        # the id of the quantized bin for each reference bin, and the last
+        # quantized bin holds all the remaining reference bins.
+        num_merged_bins = cand // num_quantized_bins
+        quantized_ids = np.minimum(
+            positions[np.newaxis, :] // num_merged_bins[:, np.newaxis],
+            num_quantized_bins - 1)
+        flat_ids = (rows * num_quantized_bins + quantized_ids).ravel()
+        minlength = cand.size * num_quantized_bins
+
+        P = np.where(in_range, hist[np.newaxis, :], 0.)
+        P[rows[:, 0], cand - 1] += outliers_counts[cand - 1]
+        P_nonzero = in_range & nonzero[np.newaxis, :]
+
+        quantized_sums = np.bincount(
+            flat_ids, weights=P_nonzero.ravel() * np.tile(hist, cand.size),
+            minlength=minlength).reshape(-1, num_quantized_bins)
+        nonzero_counts = np.bincount(
+            flat_ids, weights=P_nonzero.ravel(),
+            minlength=minlength).reshape(-1, num_quantized_bins)
+        avg_bin_ele = quantized_sums / np.maximum(nonzero_counts, 1)
+        Q = np.where(P_nonzero, avg_bin_ele[rows, quantized_ids], 0.)
+        Q_sum = np.sum(Q, axis=1)
+
+        # sum(p * log(Q_sum * p) - p * log(P_sum * q)) / P_sum, for p != 0
+        safe_P = np.where(P_nonzero, P, 1.)
+        safe_Q = np.where(P_nonzero, Q, 1.)
+        kl_divergence = (np.sum(
+            P * (np.log(safe_P) - np.log(safe_Q)), axis=1) + np.sum(
+                P, axis=1) * (np.log(Q_sum) - np.log(P_sum))) / P_sum
+
+        idx = int(np.argmin(kl_divergence))
+        if min_kl_divergence is None or \
+                kl_divergence[idx] < min_kl_divergence:
+            min_kl_divergence = kl_divergence[idx]
+            min_kl_index = int(cand[idx])
+    return min_kl_index
+
+
+def _get_kl_threshold(histogram, bins=2048):
+    '''
+    Get the KL threshold from the streaming histogram [hist, upper_bound,
+    abs_max], which is rebinned to the given bins of the range [0, abs_max]
+    first, so the candidates searched are relative to the abs max value as
+    the histogram computed with the range directly. It's a module level
+    function to be called by the process pool.
+    '''
+    hist, upper_bound, abs_max = histogram
+    if abs_max > 0:
+        hist = _rebin_histogram(hist, upper_bound, abs_max, bins)
+        upper_bound = abs_max
+    bins = len(hist)
+    bin_width = upper_bound / bins
+    min_kl_index = _search_kl_threshold_index(hist)
+    if min_kl_index == 0:
+        starting_iter = int((bins - 1) * 0.7)
+        while starting_iter > 0:
+            if hist[starting_iter] == 0:
+                starting_iter -= 1
+                continue
+            else:
+                break
+        min_kl_index = starting_iter
+    return (min_kl_index + 0.5) * bin_width
+
+
 class PostTrainingQuantization(object):
     """
     Utilizing post training quantization methon to quantize the FP32 model,
@@ -143,7 +292,8 @@ class PostTrainingQuantization(object):
                  weight_quantize_type='channel_wise_abs_max',
                  optimize_model=False,
                  is_use_cache_file=False,
-                 cache_dir=None):
+                 cache_dir=None,
+                 kl_num_workers=1):
         '''
         Constructor.
 
@@ -208,6 +358,10 @@ class PostTrainingQuantization(object):
                 quantization. Default False.
             is_use_cache_file(bool, optional): This param is deprecated.
             cache_dir(str, optional): This param is deprecated.
+            kl_num_workers(int, optional): When algo='KL', the number of
+                processes to calculate the KL thresholds of activations in
+                parallel. If it is 1, calculate them in the current process.
+                Default is 1.
         Returns:
             None
 
@@ -264,6 +418,8 @@ class PostTrainingQuantization(object):
             batch_generator]), "The sample_generator and batch_generator " \
             "cannot be None in the same time."
         assert batch_size > 0, "The batch_size should be greater than 0."
+        assert kl_num_workers > 0, \
+            "The kl_num_workers should be greater than 0."
         assert algo in self._support_algo_type, \
             "The algo should be KL, abs_max or min_max."
         assert activation_quantize_type in self._support_activation_quantize_type, \
@@ -297,6 +453,7 @@ class PostTrainingQuantization(object):
                 assert op_type in self._support_quantize_op_type, \
                     op_type + " is not supported for quantization."
         self._optimize_model = optimize_model
+        self._kl_num_workers = kl_num_workers
 
         # Define variables
         self._place = self._executor.place
@@ -310,7 +467,6 @@ class PostTrainingQuantization(object):
         self._quantized_act_var_name = set()
         self._weight_op_pairs = {}
         # The vars for alog = KL
-        self._sampling_act_abs_min_max = {}
         self._sampling_act_histogram = {}
         self._sampling_data = {}
         self._quantized_var_kl_threshold = {}
@@ -336,24 +492,6 @@ class PostTrainingQuantization(object):
         self._collect_target_varnames()
         self._set_activation_persistable()
 
-        if self._algo == "KL":
-            _logger.info("Preparation stage ...")
-            batch_id = 0
-            for data in self._data_loader():
-                self._executor.run(program=self._program,
-                                   feed=data,
-                                   fetch_list=self._fetch_list,
-                                   return_numpy=False,
-                                   scope=self._scope)
-                self._collect_activation_abs_min_max()
-                if batch_id % 5 == 0:
-                    _logger.info("Run batch: " + str(batch_id))
-                batch_id += 1
-                if self._batch_nums and batch_id >= self._batch_nums:
-                    break
-            _logger.info("Finish preparation stage, all batch:" + str(batch_id))
-            self._init_sampling_act_histogram()
-
         _logger.info("Sampling stage ...")
         batch_id = 0
         for data in self._data_loader():
@@ -579,12 +717,17 @@ class PostTrainingQuantization(object):
                 self._quantized_var_max[var_name] = max_value
 
     def _sample_histogram(self):
+        '''
+        Accumulate the histogram of abs values for all activation. The range
+        of histogram grows with the abs_max value, so the calibrate data is
+        only run once.
+        '''
         for var_name in self._quantized_act_var_name:
             var_tensor = _load_variable_data(self._scope, var_name)
             var_tensor_abs = np.abs(var_tensor)
-            bins = self._sampling_act_histogram[var_name][1]
-            hist, _ = np.histogram(var_tensor_abs, bins=bins)
-            self._sampling_act_histogram[var_name][0] += hist
+            self._sampling_act_histogram[var_name] = _update_abs_histogram(
+                self._sampling_act_histogram.get(var_name), var_tensor_abs,
+                self._histogram_bins * _HISTOGRAM_OVERSAMPLING)
 
     def _save_input_threhold(self):
         '''
@@ -602,37 +745,6 @@ class PostTrainingQuantization(object):
                     op._set_attr(var_name + ".max",
                                  self._quantized_var_max[var_name])
 
-    def _collect_activation_abs_min_max(self):
-        '''
-        Collect the abs_min and abs_max for all activation. When algo = KL,
-        get the min and max value, and then calculate the threshold.
-        '''
-        for var_name in self._quantized_act_var_name:
-            var_tensor = _load_variable_data(self._scope, var_name)
-            var_tensor = np.abs(var_tensor)
-            min_value = float(np.min(var_tensor))
-            max_value = float(np.max(var_tensor))
-            if var_name not in self._sampling_act_abs_min_max:
-                self._sampling_act_abs_min_max[
-                    var_name] = [min_value, max_value]
-            else:
-                if min_value < self._sampling_act_abs_min_max[var_name][0]:
-                    self._sampling_act_abs_min_max[var_name][0] = min_value
-                if max_value > self._sampling_act_abs_min_max[var_name][1]:
-                    self._sampling_act_abs_min_max[var_name][1] = max_value
-
-    def _init_sampling_act_histogram(self):
-        '''
-        Based on the min/max value, init the sampling_act_histogram.
-        '''
-        for var_name in self._quantized_act_var_name:
-            if var_name not in self._sampling_act_histogram:
-                min_val = self._sampling_act_abs_min_max[var_name][0]
-                max_val = self._sampling_act_abs_min_max[var_name][1]
-                hist, hist_edeges = np.histogram(
-                    [], bins=self._histogram_bins, range=(min_val, max_val))
-                self._sampling_act_histogram[var_name] = [hist, hist_edeges]
-
     def _calculate_kl_threshold(self):
         '''
         Calculate the KL threshold of quantized variables.
@@ -658,10 +770,25 @@ class PostTrainingQuantization(object):
                             float(np.max(np.abs(weight_data[i]))))
             self._quantized_var_kl_threshold[var_name] = weight_threshold
 
-        for var_name in self._quantized_act_var_name:
-            hist, hist_edeges = self._sampling_act_histogram[var_name]
-            self._quantized_var_kl_threshold[var_name] = \
-                self._get_kl_scaling_factor(hist, hist_edeges)
+        act_var_names = sorted(self._quantized_act_var_name)
+        histograms = [
+            self._sampling_act_histogram[var_name]
+            for var_name in act_var_names
+        ]
+        get_kl_threshold = functools.partial(
+            _get_kl_threshold, bins=self._histogram_bins)
+        num_workers = min(self._kl_num_workers, len(histograms))
+        if num_workers > 1:
+            pool = multiprocessing.Pool(num_workers)
+            try:
+                thresholds = pool.map(get_kl_threshold, histograms)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            thresholds = [get_kl_threshold(h) for h in histograms]
+        for var_name, threshold in zip(act_var_names, thresholds):
+            self._quantized_var_kl_threshold[var_name] = threshold
 
     def _update_program(self):
         '''
@@ -776,106 +903,6 @@ class PostTrainingQuantization(object):
                 for var_name in out_var_names:
                     analysis_and_save_info(op, var_name)
 
-    def _get_kl_scaling_factor(self, hist, hist_edeges, num_quantized_bins=255):
-        '''
-        Using the KL-divergenc method to get the more precise scaling factor.
-        '''
-        ending_iter = self._histogram_bins - 1
-        starting_iter = int(ending_iter * 0.7)
-        bin_width = hist_edeges[1] - hist_edeges[0]
-
-        P_sum = np.sum(np.array(hist).ravel())
-        min_kl_divergence = 0
-        min_kl_index = 0
-        kl_inited = False
-        for i in range(starting_iter, ending_iter + 1):
-            reference_distr_P = hist[0:i].tolist()
-            outliers_count = sum(hist[i:2048])
-            if reference_distr_P[i - 1] == 0:
-                continue
-            reference_distr_P[i - 1] += outliers_count
-            reference_distr_bins = reference_distr_P[:]
-            candidate_distr_Q = hist[0:i].tolist()
-            num_merged_bins = int(i / num_quantized_bins)
-            candidate_distr_Q_quantized = [0] * num_quantized_bins
-            j_start = 0
-            j_end = num_merged_bins
-            for idx in range(num_quantized_bins):
-                candidate_distr_Q_quantized[idx] = sum(candidate_distr_Q[
-                    j_start:j_end])
-                j_start += num_merged_bins
-                j_end += num_merged_bins
-                if (idx + 1) == num_quantized_bins - 1:
-                    j_end = i
-            candidate_distr_Q = self._expand_quantized_bins(
-                candidate_distr_Q_quantized, reference_distr_bins)
-            Q_sum = sum(candidate_distr_Q)
-            kl_divergence = self._safe_entropy(reference_distr_P, P_sum,
-                                               candidate_distr_Q, Q_sum)
-            if not kl_inited:
-                min_kl_divergence = kl_divergence
-                min_kl_index = i
-                kl_inited = True
-            elif kl_divergence < min_kl_divergence:
-                min_kl_divergence = kl_divergence
-                min_kl_index = i
-            else:
-                pass
-        if min_kl_index == 0:
-            while starting_iter > 0:
-                if hist[starting_iter] == 0:
-                    starting_iter -= 1
-                    continue
-                else:
-                    break
-            min_kl_index = starting_iter
-        return (min_kl_index + 0.5) * bin_width
-
-    def _expand_quantized_bins(self, quantized_bins, reference_bins):
-        '''
-        '''
-        expanded_quantized_bins = [0] * len(reference_bins)
-        num_merged_bins = int(len(reference_bins) / len(quantized_bins))
-        j_start = 0
-        j_end = num_merged_bins
-        for idx in range(len(quantized_bins)):
-            zero_count = reference_bins[j_start:j_end].count(0)
-            num_merged_bins = j_end - j_start
-            if zero_count == num_merged_bins:
-                avg_bin_ele = 0
-            else:
-                avg_bin_ele = quantized_bins[idx] / (
-                    num_merged_bins - zero_count + 0.0)
-            for idx1 in range(j_start, j_end):
-                expanded_quantized_bins[idx1] = (0 if reference_bins[idx1] == 0
-                                                 else avg_bin_ele)
-            j_start += num_merged_bins
-            j_end += num_merged_bins
-            if (idx + 1) == len(quantized_bins) - 1:
-                j_end = len(reference_bins)
-        return expanded_quantized_bins
-
-    def _safe_entropy(self, reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
-        '''
-        Calculate the entropy.
-        '''
-        assert len(reference_distr_P) == len(candidate_distr_Q)
-        tmp_sum1 = 0
-        tmp_sum2 = 0
-        for idx in range(len(reference_distr_P)):
-            p_idx = reference_distr_P[idx]
-            q_idx = candidate_distr_Q[idx]
-            if p_idx == 0:
-                tmp_sum1 += 0
-                tmp_sum2 += 0
-            else:
-                if q_idx == 0:
-                    _logger.error("Fatal error!, idx = " + str(idx) +
-                                  " qindex = 0! p_idx = " + str(p_idx))
-                tmp_sum1 += p_idx * (math.log(Q_sum * p_idx))
-                tmp_sum2 += p_idx * (math.log(P_sum * q_idx))
-        return (tmp_sum1 - tmp_sum2) / P_sum
-
 
 class WeightQuantization(object):
     _supported_quantizable_op_type = ['conv2d', 'depthwise_conv2d', 'mul']
@@ -0,0 +1,191 @@
+#   copyright (c) 2020 paddlepaddle authors. all rights reserved.
+#
+# licensed under the apache license, version 2.0 (the "license");
+# you may not use this file except in compliance with the license.
+# you may obtain a copy of the license at
+#
+#     http://www.apache.org/licenses/license-2.0
+#
+# unless required by applicable law or agreed to in writing, software
+# distributed under the license is distributed on an "as is" basis,
+# without warranties or conditions of any kind, either express or implied.
+# see the license for the specific language governing permissions and
+# limitations under the license.
+import unittest
+import math
+import multiprocessing
+import numpy as np
+from paddle.fluid.contrib.slim.quantization.post_training_quantization import _update_abs_histogram
+from paddle.fluid.contrib.slim.quantization.post_training_quantization import _search_kl_threshold_index
+from paddle.fluid.contrib.slim.quantization.post_training_quantization import _get_kl_threshold
+from paddle.fluid.contrib.slim.quantization.post_training_quantization import _HISTOGRAM_OVERSAMPLING
+
+
+def expand_quantized_bins(quantized_bins, reference_bins):
+    expanded_quantized_bins = [0] * len(reference_bins)
+    num_merged_bins = int(len(reference_bins) / len(quantized_bins))
+    j_start = 0
+    j_end = num_merged_bins
+    for idx in range(len(quantized_bins)):
+        zero_count = reference_bins[j_start:j_end].count(0)
+        num_merged_bins = j_end - j_start
+        if zero_count == num_merged_bins:
+            avg_bin_ele = 0
+        else:
+            avg_bin_ele = quantized_bins[idx] / (
+                num_merged_bins - zero_count + 0.0)
+        for idx1 in range(j_start, j_end):
+            expanded_quantized_bins[idx1] = (0 if reference_bins[idx1] == 0
+                                             else avg_bin_ele)
+        j_start += num_merged_bins
+        j_end += num_merged_bins
+        if (idx + 1) == len(quantized_bins) - 1:
+            j_end = len(reference_bins)
+    return expanded_quantized_bins
+
+
+def safe_entropy(reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
+    tmp_sum1 = 0
+    tmp_sum2 = 0
+    for p_idx, q_idx in zip(reference_distr_P, candidate_distr_Q):
+        if p_idx != 0:
+            tmp_sum1 += p_idx * (math.log(Q_sum * p_idx))
+            tmp_sum2 += p_idx * (math.log(P_sum * q_idx))
+    return (tmp_sum1 - tmp_sum2) / P_sum
+
+
+def search_kl_threshold_index(hist, num_quantized_bins=255):
+    # The python implementation of KL threshold search before vectorization.
+    bins = len(hist)
+    ending_iter = bins - 1
+    starting_iter = int(ending_iter * 0.7)
+    P_sum = np.sum(np.array(hist).ravel())
+    min_kl_divergence = 0
+    min_kl_index = 0
+    kl_inited = False
+    for i in range(starting_iter, ending_iter + 1):
+        reference_distr_P = hist[0:i].tolist()
+        outliers_count = sum(hist[i:bins])
+        if reference_distr_P[i - 1] == 0:
+            continue
+        reference_distr_P[i - 1] += outliers_count
+        reference_distr_bins = reference_distr_P[:]
+        candidate_distr_Q = hist[0:i].tolist()
+        num_merged_bins = int(i / num_quantized_bins)
+        candidate_distr_Q_quantized = [0] * num_quantized_bins
+        j_start = 0
+        j_end = num_merged_bins
+        for idx in range(num_quantized_bins):
+            candidate_distr_Q_quantized[idx] = sum(candidate_distr_Q[j_start:
+                                                                     j_end])
+            j_start += num_merged_bins
+            j_end += num_merged_bins
+            if (idx + 1) == num_quantized_bins - 1:
+                j_end = i
+        candidate_distr_Q = expand_quantized_bins(candidate_distr_Q_quantized,
+                                                  reference_distr_bins)
+        Q_sum = sum(candidate_distr_Q)
+        kl_divergence = safe_entropy(reference_distr_P, P_sum,
+                                     candidate_distr_Q, Q_sum)
+        if not kl_inited or kl_divergence < min_kl_divergence:
+            min_kl_divergence = kl_divergence
+            min_kl_index = i
+            kl_inited = True
+    return min_kl_index
+
+
+class TestKLThresholdSearch(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.RandomState(0)
+
+    def test_same_as_loop(self):
+        datas = [
+            self.rng.exponential(1.0, 100000),
+            np.abs(self.rng.standard_normal(100000)) * 3,
+            np.maximum(self.rng.standard_normal(100000), 0),
+        ]
+        for data in datas:
+            hist, _ = np.histogram(data, bins=2048)
+            self.assertEqual(
+                _search_kl_threshold_index(hist),
+                search_kl_threshold_index(hist))
+
+    def test_empty_tail(self):
+        hist = np.zeros(2048, dtype='int64')
+        hist[:100] = 10
+        self.assertEqual(_search_kl_threshold_index(hist), 0)
+        self.assertAlmostEqual(_get_kl_threshold([hist, 2048., 2048.]), 99.5)
+
+
+class TestStreamingHistogram(unittest.TestCase):
+    def test_rebin(self):
+        bins = 2048
+        width = 1. / 1024
+        datas = [
+            (np.arange(512) + 0.5) * width,
+            (np.arange(2048) + 0.5) * width,
+            (np.arange(100) + 0.5) * width * 32,
+        ]
+        histogram = None
+        for data in datas:
+            histogram = _update_abs_histogram(histogram, data, bins)
+        hist, upper_bound, abs_max = histogram
+        # the range of first batch is doubled 3 times to cover the second one
+        self.assertEqual(upper_bound, np.max(datas[0]) * 8)
+        self.assertEqual(abs_max, np.max(datas[2]))
+        expected, _ = np.histogram(
+            np.concatenate(datas), bins=bins, range=(0, upper_bound))
+        self.assertEqual(np.sum(hist), np.sum(expected))
+        # only the max value of first batch, which is on the upper edge of
+        # the first range, falls into a different bin.
+        self.assertEqual(np.sum(np.abs(hist - expected)), 2)
+
+    def test_all_zeros_first(self):
+        histogram = _update_abs_histogram(None, np.zeros([4, 4]), 2048)
+        histogram = _update_abs_histogram(histogram, np.ones([4, 4]), 2048)
+        hist, upper_bound, abs_max = histogram
+        self.assertGreaterEqual(upper_bound, 1.)
+        self.assertEqual(abs_max, 1.)
+        self.assertEqual(hist[0], 16)
+        self.assertEqual(np.sum(hist), 32)
+
+    def test_same_as_exact_range(self):
+        # the range of the streaming histogram ends up almost twice the abs
+        # max value, the threshold should still be searched relative to the
+        # abs max value as the histogram of the exact range.
+        bins = 2048
+        for seed in range(3):
+            rng = np.random.RandomState(seed)
+            datas = [np.abs(rng.standard_normal(100000)) for _ in range(10)]
+            histogram = None
+            for data in datas:
+                histogram = _update_abs_histogram(
+                    histogram, data, bins * _HISTOGRAM_OVERSAMPLING)
+            abs_max = np.max(np.concatenate(datas))
+            self.assertGreater(histogram[1], abs_max * 1.5)
+
+            exact_hist, _ = np.histogram(
+                np.concatenate(datas), bins=bins, range=(0, abs_max))
+            expected = _get_kl_threshold([exact_hist, abs_max, abs_max])
+            threshold = _get_kl_threshold(histogram, bins)
+            self.assertAlmostEqual(threshold, expected, delta=expected * 2e-3)
+            self.assertLess(threshold, abs_max)
+
+    def test_process_pool(self):
+        rng = np.random.RandomState(1)
+        histograms = []
+        for scale in [1., 2., 4.]:
+            histograms.append(
+                _update_abs_histogram(None,
+                                      rng.exponential(scale, 10000), 2048))
+        pool = multiprocessing.Pool(2)
+        try:
+            thresholds = pool.map(_get_kl_threshold, histograms)
+        finally:
+            pool.close()
+            pool.join()
+        self.assertEqual(thresholds, [_get_kl_threshold(h) for h in histograms])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,7 @@ import math
 from .sampler import Sampler, SequenceSampler, RandomSampler
 from .dataset import Dataset, IterableDataset
 
-__all__ = ["BatchSampler", "DistributedBatchSampler"]
+__all__ = ["BatchSampler", "DistributedBatchSampler", "BucketBatchSampler"]
 
 
 class BatchSampler(Sampler):
@@ -162,6 +162,45 @@ class _InfiniteIterableSampler(object):
             yield [None] * self.batch_size
 
 
+_FEISTEL_ROUNDS = 4
+
+
+def _feistel_permute(positions, size, seed):
+    """
+    Map `positions` in [0, size) to their places in a pseudo-random
+    permutation of [0, size) decided by `seed`, without materializing
+    the permutation.
+
+    A balanced Feistel network is a bijection on [0, 4**half_bits), the
+    values out of [0, size) are mapped again until they fall into it
+    (cycle walking), which keeps the mapping a bijection on [0, size).
+    """
+    half_bits = max(1, (int(size - 1).bit_length() + 1) // 2)
+    mask = np.uint64((1 << half_bits) - 1)
+    shift = np.uint64(half_bits)
+    keys = np.random.RandomState(seed).randint(
+        0, 2**32, size=_FEISTEL_ROUNDS).astype(np.uint64)
+
+    def _encrypt(x):
+        left, right = x >> shift, x & mask
+        with np.errstate(over='ignore'):
+            for key in keys:
+                h = (right ^ key) * np.uint64(0x9E3779B97F4A7C15)
+                h ^= h >> np.uint64(29)
+                h *= np.uint64(0xBF58476D1CE4E5B9)
+                h ^= h >> np.uint64(32)
+                left, right = right, left ^ (h & mask)
+        return (left << shift) | right
+
+    x = np.asarray(positions, dtype=np.uint64)
+    out = _encrypt(x)
+    walking = out >= np.uint64(size)
+    while walking.any():
+        out[walking] = _encrypt(out[walking])
+        walking = out >= np.uint64(size)
+    return out.astype(np.int64)
+
+
 class DistributedBatchSampler(BatchSampler):
     """Sampler that restricts data loading to a subset of the dataset.
 
@@ -189,6 +228,14 @@ class DistributedBatchSampler(BatchSampler):
             batch indices. Default False.
         drop_last(bool): whether drop the last incomplete batch dataset size
             is not divisible by the batch size. Default False
+        lazy(bool): whether to compute the indices of each mini-batch only
+            when it is yielded, the memory cost is O(batch_size) instead of
+            O(dataset size), which is required by datasets with billions of
+            samples. In this mode, the shuffled order is a pseudo-random
+            permutation seeded by the epoch number, which is different from
+            the order of :attr:`lazy=False`, the mini-batches are yielded
+            as numpy int64 arrays, and the iteration can be resumed from
+            any step by :code:`set_step`. Default False
 
     Examples:
         .. code-block:: python
@@ -224,7 +271,8 @@ class DistributedBatchSampler(BatchSampler):
                  num_replicas=None,
                  rank=None,
                  shuffle=False,
-                 drop_last=False):
+                 drop_last=False,
+                 lazy=False):
         self.dataset = dataset
 
         assert isinstance(batch_size, int) and batch_size > 0, \
@@ -252,12 +300,22 @@ class DistributedBatchSampler(BatchSampler):
         else:
             self.local_rank = ParallelEnv().local_rank
 
+        assert isinstance(lazy, bool), \
+                "lazy should be a boolean value"
+        self.lazy = lazy
+
         self.drop_last = drop_last
         self.epoch = 0
+        self.start_step = 0
         self.num_samples = int(math.ceil(len(self.dataset) * 1.0 / self.nranks))
         self.total_size = self.num_samples * self.nranks
 
     def __iter__(self):
+        if self.lazy:
+            for batch_indices in self._lazy_iter():
+                yield batch_indices
+            return
+
         num_samples = len(self.dataset)
         indices = np.arange(num_samples).tolist()
         indices += indices[:(self.total_size - len(indices))]
@@ -299,11 +357,94 @@ class DistributedBatchSampler(BatchSampler):
         if not self.drop_last and len(batch_indices) > 0:
             yield batch_indices
 
+    def _lazy_iter(self):
+        num_samples = len(self.dataset)
+        epoch = self.epoch
+        start_step = self.start_step
+        self.start_step = 0
+        if self.shuffle:
+            self.epoch += 1
+
+        # the padded and shuffled indices are split as the eager mode:
+        # each full global batch of batch_size * nranks gives rank i its
+        # i-th batch_size part, the tail is split by nranks equally.
+        last_batch_size = self.total_size % (self.batch_size * self.nranks)
+        last_local_batch_size = last_batch_size // self.nranks
+        full_local_size = (self.total_size - last_batch_size) // self.nranks
+
+        num_batches = len(self)
+        for step in range(start_step, num_batches):
+            local_pos = np.arange(
+                step * self.batch_size,
+                min((step + 1) * self.batch_size, self.num_samples),
+                dtype=np.int64)
+            is_full = local_pos < full_local_size
+            full_pos = local_pos[is_full]
+            tail_pos = local_pos[~is_full] - full_local_size
+            pos = np.concatenate([
+                (full_pos // self.batch_size) * self.batch_size * self.nranks
+                + self.local_rank * self.batch_size +
+                full_pos % self.batch_size,
+                self.total_size - last_batch_size + self.local_rank *
+                last_local_batch_size + tail_pos
+            ])
+            if self.shuffle:
+                pos = _feistel_permute(pos, self.total_size, epoch)
+            # positions beyond the dataset are the padding samples, which
+            # repeat the head of the dataset
+            yield np.where(pos < num_samples, pos, pos - num_samples)
+
     def __len__(self):
         num_samples = self.num_samples
         num_samples += int(not self.drop_last) * (self.batch_size - 1)
         return num_samples // self.batch_size
 
+    def set_step(self, step):
+        """
+        Sets the number of mini-batches already consumed in the current
+        epoch, the next iteration starts from the mini-batch :attr:`step`,
+        which is used to resume the training exactly in the middle of an
+        epoch. It only works with :attr:`lazy=True`, and is cleared when
+        the next iteration starts.
+
+        Arguments:
+            step (int): the number of mini-batches to skip.
+
+        Examples:
+            .. code-block:: python
+
+                import numpy as np
+
+                from paddle.io import Dataset, DistributedBatchSampler
+
+                class RandomDataset(Dataset):
+                    def __init__(self, num_samples):
+                        self.num_samples = num_samples
+
+                    def __getitem__(self, idx):
+                        image = np.random.random([784]).astype('float32')
+                        label = np.random.randint(0, 9, (1, )).astype('int64')
+                        return image, label
+
+                    def __len__(self):
+                        return self.num_samples
+
+                dataset = RandomDataset(100)
+                sampler = DistributedBatchSampler(
+                    dataset, batch_size=16, shuffle=True, lazy=True)
+
+                # resume from the 3rd mini-batch of epoch 2
+                sampler.set_epoch(2)
+                sampler.set_step(3)
+                for batch_indices in sampler:
+                    # do something
+                    break
+        """
+        assert self.lazy, "set_step only works with lazy=True"
+        assert isinstance(step, int) and 0 <= step <= len(self), \
+                "step should be an integer in [0, {}]".format(len(self))
+        self.start_step = step
+
     def set_epoch(self, epoch):
         """
         Sets the epoch number. When :attr:`shuffle=True`, this number is used
@@ -342,3 +483,199 @@ class DistributedBatchSampler(BatchSampler):
                     sampler.set_epoch(epoch)
         """
         self.epoch = epoch
+
+
+class BucketBatchSampler(BatchSampler):
+    """
+    Sampler that groups samples of similar lengths into mini-batches, to
+    reduce the padding of variable-length data such as text.
+
+    The samples are grouped into buckets by :attr:`boundaries`, and sorted
+    by length in each bucket. The mini-batches are cut from each bucket by
+    :attr:`batch_size` samples, or by :attr:`max_tokens`, which bounds the
+    padded token number of a mini-batch, i.e. the max length of its samples
+    multiplied by its sample number. Both can be set together.
+
+    In distributed training, every :attr:`num_replicas` adjacent mini-batches
+    in length order form a global step, rank i takes the i-th mini-batch of
+    each step, so all the ranks get the same number of mini-batches with
+    close token numbers in each step. If the mini-batch number is not
+    divisible by :attr:`num_replicas`, the last step is padded by the
+    mini-batches from the beginning.
+
+    Args:
+        lengths(list|numpy.ndarray): the length of each sample of the dataset.
+        batch_size(int, optional): the max sample number in a mini-batch.
+            Default None, limited by :attr:`max_tokens` only.
+        max_tokens(int, optional): the max padded token number in a
+            mini-batch, a sample longer than it forms a mini-batch by itself.
+            Default None, limited by :attr:`batch_size` only.
+        boundaries(list, optional): the increasing length boundaries of the
+            buckets, the samples with length in [boundaries[i-1],
+            boundaries[i]) are in bucket i. Default None, all the samples
+            are in one bucket.
+        num_replicas(int, optional): porcess number in distributed training.
+            If :attr:`num_replicas` is None, :attr:`num_replicas` will be
+            retrieved from :code:`paddle.distributed.ParallenEnv`.
+            Default None.
+        rank(int, optional): the rank of the current process among :attr:`num_replicas`
+            processes. If :attr:`rank` is None, :attr:`rank` is retrieved from
+            :code:`paddle.distributed.ParallenEnv`. Default None.
+        shuffle(bool): whether to shuffle the samples of the same length and
+            the order of the global steps. Default False.
+        drop_last(bool): whether to drop the last global step which has less
+            than :attr:`num_replicas` mini-batches, and the mini-batches with
+            less than :attr:`batch_size` samples if :attr:`max_tokens` is
+            None. Default False.
+        seed(int): the random seed to shuffle, which should be the same on
+            all the ranks. Default 0.
+
+    Examples:
+        .. code-block:: python
+
+            import numpy as np
+
+            from paddle.io import BucketBatchSampler
+
+            lengths = np.random.randint(1, 100, [1000])
+            sampler = BucketBatchSampler(
+                lengths, max_tokens=1024, boundaries=[10, 50], shuffle=True)
+
+            for batch_indices in sampler:
+                # do something
+                break
+    """
+
+    def __init__(self,
+                 lengths,
+                 batch_size=None,
+                 max_tokens=None,
+                 boundaries=None,
+                 num_replicas=None,
+                 rank=None,
+                 shuffle=False,
+                 drop_last=False,
+                 seed=0):
+        self.lengths = np.maximum(
+            np.asarray(
+                lengths, dtype='int64').reshape([-1]), 1)
+
+        assert batch_size is not None or max_tokens is not None, \
+                "either batch_size or max_tokens should be set"
+        assert batch_size is None or (isinstance(batch_size, int) and
+                                      batch_size > 0), \
+                "batch_size should be a positive integer"
+        self.batch_size = batch_size
+        assert max_tokens is None or (isinstance(max_tokens, int) and
+                                      max_tokens > 0), \
+                "max_tokens should be a positive integer"
+        self.max_tokens = max_tokens
+        if boundaries is not None:
+            boundaries = np.asarray(boundaries, dtype='int64')
+            assert np.all(np.diff(boundaries) > 0), \
+                    "boundaries should be increasing"
+        self.boundaries = boundaries
+        assert isinstance(shuffle, bool), \
+                "shuffle should be a boolean value"
+        self.shuffle = shuffle
+        assert isinstance(drop_last, bool), \
+                "drop_last should be a boolean number"
+        self.drop_last = drop_last
+
+        from paddle.fluid.dygraph.parallel import ParallelEnv
+
+        if num_replicas is not None:
+            assert isinstance(num_replicas, int) and num_replicas > 0, \
+                    "num_replicas should be a positive integer"
+            self.nranks = num_replicas
+        else:
+            self.nranks = ParallelEnv().nranks
+
+        if rank is not None:
+            assert isinstance(rank, int) and rank >= 0, \
+                    "rank should be a non-negative integer"
+            self.local_rank = rank
+        else:
+            self.local_rank = ParallelEnv().local_rank
+
+        self.seed = seed
+        self.epoch = 0
+        # the batches only depend on the lengths, shuffling just permutes
+        # the samples of the same length and the steps
+        self.num_batches = len(self._get_steps(None))
+
+    def _get_batches(self, random_state):
+        num_samples = len(self.lengths)
+        if random_state is not None:
+            ties = random_state.permutation(num_samples)
+        else:
+            ties = np.arange(num_samples)
+        if self.boundaries is not None:
+            bucket_ids = np.searchsorted(
+                self.boundaries, self.lengths, side='right')
+        else:
+            bucket_ids = np.zeros([num_samples], dtype='int64')
+        order = np.lexsort((ties, self.lengths, bucket_ids))
+        sorted_lengths = self.lengths[order]
+        bucket_ends = np.flatnonzero(np.diff(bucket_ids[order])) + 1
+        bucket_ends = np.append(bucket_ends, num_samples)
+
+        batches = []
+        start = 0
+        for end in bucket_ends:
+            while start < end:
+                size = end - start
+                if self.batch_size is not None:
+                    size = min(size, self.batch_size)
+                if self.max_tokens is not None:
+                    # the lengths are increasing in a bucket, thus the
+                    # padded token number grows with the sample number
+                    size = min(size, max(
+                        self.max_tokens // sorted_lengths[start], 1))
+                    padded = sorted_lengths[start:start + size] * np.arange(
+                        1, size + 1)
+                    size = max(
+                        int(np.searchsorted(
+                            padded, self.max_tokens, side='right')), 1)
+                if not self.drop_last or self.max_tokens is not None or \
+                        size == self.batch_size:
+                    batches.append(order[start:start + size])
+                start += size
+        return batches
+
+    def _get_steps(self, random_state):
+        batches = self._get_batches(random_state)
+        num_steps = len(batches) // self.nranks
+        if not self.drop_last and len(batches) % self.nranks != 0:
+            num_steps += 1
+            pad_num = num_steps * self.nranks - len(batches)
+            batches += [batches[i % len(batches)] for i in range(pad_num)]
+        steps = [
+            batches[i * self.nranks:(i + 1) * self.nranks]
+            for i in range(num_steps)
+        ]
+        if random_state is not None:
+            random_state.shuffle(steps)
+        return steps
+
+    def __iter__(self):
+        random_state = None
+        if self.shuffle:
+            random_state = np.random.RandomState(self.seed + self.epoch)
+            self.epoch += 1
+        for step in self._get_steps(random_state):
+            yield step[self.local_rank].tolist()
+
+    def __len__(self):
+        return self.num_batches
+
+    def set_epoch(self, epoch):
+        """
+        Sets the epoch number. When :attr:`shuffle=True`, this number is added
+        to :attr:`seed` as the seed of random numbers, so all the ranks shuffle
+        in the same way at each epoch.
+
+        Arguments:
+            epoch (int): Epoch number.
+        """
+        self.epoch = epoch
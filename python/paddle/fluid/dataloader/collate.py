@@ -0,0 +1,69 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numbers
+import numpy as np
+
+import paddle
+from .. import layers
+
+__all__ = ['default_collate_fn']
+
+
+def default_collate_fn(batch):
+    """
+    Default batch collating function for :code:`fluid.io.DataLoader`,
+    batch should be a list of samples, and each sample should be a list
+    of fields as follows:
+    
+    [[filed1, filed2, ...], [filed1, filed2, ...], ...]
+    
+    This default collate function zipped each filed together and stack
+    each filed as the batch field as follows:
+
+    [batch_filed1, batch_filed2, ...]
+
+    Args:  
+        batch(list of list of numpy array): the batch data, each fields
+              should be a numpy array, each sample should be a list of
+              fileds, and batch should be a list of sample.
+    
+    Returns:
+        a list of numpy array: collated batch
+    """
+    sample = batch[0]
+    # dataset has only 1 field
+    if isinstance(sample, np.ndarray):
+        return [np.stack(batch, axis=0)]
+
+    # batch each field
+    slots = []
+    for items in batch:
+        for i, item in enumerate(items):
+            if len(slots) < len(items):
+                slots.append([item])
+            else:
+                slots[i].append(item)
+
+    outputs = []
+    for slot in slots:
+        if isinstance(slot[0], (np.ndarray, np.bool, numbers.Number)):
+            tmp = np.stack(slot, axis=0)
+            outputs.append(tmp)
+        elif isinstance(slot[0], paddle.Tensor):
+            tmp = layers.stack(slot, axis=0)
+            outputs.append(tmp)
+        else:
+            raise RuntimeError("Unknown data type {}".format(type(slot[0])))
+    return outputs
@@ -14,6 +14,9 @@
 
 from __future__ import print_function
 
+import numpy as np
+
+import paddle
 from .. import framework
 import paddle.dataset.common
 
@@ -37,6 +40,19 @@ class Dataset(object):
     :code:`__len__`: return dataset sample number. This method is required
     by some implements of :code:`paddle.io.BatchSampler`
 
+    Subclasses can optionally implement following method:
+
+    :code:`__getitems__`: get the collated mini-batch from dataset with a
+    list of indices, which should be the same as collating the samples
+    of these indices by :code:`paddle.io.DataLoader` default
+    :attr:`collate_fn`, i.e. a list of fields stacked in batch. If it
+    is implemented, :code:`paddle.io.DataLoader` fetches mini-batch by
+    it instead of :code:`__getitem__` when :attr:`collate_fn` is not set,
+    so datasets which can slice a mini-batch at once, e.g. datasets
+    backed by numpy arrays, save the per-sample overhead. It is not used
+    if a subclass overrides :code:`__getitem__` without overriding
+    :code:`__getitems__`.
+
     see :code:`paddle.io.DataLoader`.
 
     Examples:
@@ -271,6 +287,10 @@ class TensorDataset(Dataset):
     def __getitem__(self, index):
         return tuple(tensor[index] for tensor in self.tensors)
 
+    def __getitems__(self, indices):
+        index = paddle.to_tensor(np.asarray(indices, dtype='int64'))
+        return [paddle.gather(tensor, index) for tensor in self.tensors]
+
     def __len__(self):
         return self.tensors[0].shape[0]
 
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .collate import default_collate_fn
+
 
 class _DatasetFetcher(object):
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
@@ -51,11 +53,42 @@ class _IterableDatasetFetcher(_DatasetFetcher):
         return data
 
 
+def _get_getitems(dataset):
+    """
+    Return dataset.__getitems__ if it is defined on the class defining the
+    effective __getitem__ or on its subclasses, otherwise return None, as
+    __getitems__ of a base class would bypass the __getitem__ overridden
+    by a subclass.
+    """
+
+    def _owner(name):
+        for cls in type(dataset).__mro__:
+            if name in vars(cls):
+                return cls
+        return None
+
+    getitems_owner = _owner('__getitems__')
+    getitem_owner = _owner('__getitem__')
+    if getitems_owner is None or getitem_owner is None or \
+            not issubclass(getitems_owner, getitem_owner):
+        return None
+    return dataset.__getitems__
+
+
 class _MapDatasetFetcher(_DatasetFetcher):
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
         super(_MapDatasetFetcher, self).__init__(dataset, auto_collate_batch, collate_fn, drop_last)
+        # If the samples are collated by default_collate_fn, get the collated
+        # batch from Dataset.__getitems__ directly when it's implemented,
+        # which avoids getting and stacking samples one by one.
+        self._getitems = None
+        if auto_collate_batch and collate_fn is default_collate_fn:
+            self._getitems = _get_getitems(dataset)
 
     def fetch(self, batch_indices):
+        if self._getitems is not None:
+            return self._getitems(batch_indices)
+
         if self.auto_collate_batch:
             data = [self.dataset[idx] for idx in batch_indices]
         else:
@@ -52,6 +52,34 @@ def _parse_load_config(configs):
     return inner_config
 
 
+def _build_saved_dygraph_dict(state_dict):
+    """
+    Convert the tensors in state_dict to numpy arrays, return the file
+    suffix and the dict to be pickled by save_dygraph.
+    """
+    suffix = ".pdparams"
+    assert len(state_dict) > 0, "state_dict is empty, no need to save"
+
+    param_num = 0
+    for k, v in state_dict.items():
+        if isinstance(v, ParamBase):
+            param_num += 1
+
+    if param_num == 0:
+        suffix = ".pdopt"
+
+    model_dict = {}
+    name_table = {}
+    for k, v in state_dict.items():
+        if isinstance(v, (Variable, core.VarBase)):
+            model_dict[k] = v.numpy()
+            name_table[k] = v.name
+        else:
+            model_dict[k] = v
+    model_dict["StructuredToParameterName@@"] = name_table
+    return suffix, model_dict
+
+
 @dygraph_only
 def save_dygraph(state_dict, model_path):
     '''
@@ -90,26 +118,7 @@ def save_dygraph(state_dict, model_path):
     base_name = os.path.basename(model_path)
     assert base_name != "", "The input model_path MUST be format of dirname/filename [dirname\\filename in Windows system], but received filename is empty string."
 
-    suffix = ".pdparams"
-    assert len(state_dict) > 0, "state_dict is empty, no need to save"
-
-    param_num = 0
-    for k, v in state_dict.items():
-        if isinstance(v, ParamBase):
-            param_num += 1
-
-    if param_num == 0:
-        suffix = ".pdopt"
-
-    model_dict = {}
-    name_table = {}
-    for k, v in state_dict.items():
-        if isinstance(v, (Variable, core.VarBase)):
-            model_dict[k] = v.numpy()
-            name_table[k] = v.name
-        else:
-            model_dict[k] = v
-    model_dict["StructuredToParameterName@@"] = name_table
+    suffix, model_dict = _build_saved_dygraph_dict(state_dict)
 
     file_name = model_path + suffix
     dir_name = os.path.dirname(file_name)
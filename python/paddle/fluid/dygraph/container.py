@@ -14,7 +14,7 @@
 
 from collections import OrderedDict
 from ..framework import Parameter
-from .layers import Layer
+from .layers import Layer, _update_structure_version
 
 __all__ = [
     'Sequential',
@@ -76,6 +76,7 @@ class Sequential(Layer):
     def __delitem__(self, name):
         name = str(name)
         assert name in self._sub_layers
+        _update_structure_version()
         del self._sub_layers[name]
 
     def __len__(self):
@@ -270,6 +271,7 @@ class LayerList(Layer):
         assert isinstance(index, int) and \
                0 <= index < len(self._sub_layers), \
             "index should be an integer in range [0, len(self))"
+        _update_structure_version()
         for i in range(len(self._sub_layers), index, -1):
             self._sub_layers[str(i)] = self._sub_layers[str(i - 1)]
         self._sub_layers[str(index)] = sublayer
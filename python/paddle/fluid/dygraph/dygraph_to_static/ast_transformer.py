@@ -42,6 +42,23 @@ __all__ = ['DygraphToStaticAst']
 
 DECORATOR_NAMES = ['declarative', 'to_static', 'dygraph_to_static_func']
 
+# The transformers applied in order, after the generic transformation.
+TRANSFORMERS = [
+    BasicApiTransformer,  # Basic Api
+    TensorShapeTransformer,  # Tensor.shape -> layers.shape(Tensor)
+    ListTransformer,  # List used in control flow
+    BreakTransformOptimizer,  # optimize transfromation of break in loops
+    BreakContinueTransformer,  # break/continue in loops
+    ReturnTransformer,  # return in functions
+    LogicalTransformer,  # logical and/or/not
+    LoopTransformer,  # for/while -> while_op
+    IfElseTransformer,  # if/else -> cond_op
+    AssertTransformer,  # assert statement
+    PrintTransformer,  # print statement
+    CallTransformer,  # transform call recursively
+    CastTransformer,  # type casting statement
+]
+
 
 class DygraphToStaticAst(gast.NodeTransformer):
     """
@@ -72,23 +89,7 @@ class DygraphToStaticAst(gast.NodeTransformer):
         # Generic transformation
         self.visit(node_wrapper.node)
 
-        transformers = [
-            BasicApiTransformer,  # Basic Api
-            TensorShapeTransformer,  # Tensor.shape -> layers.shape(Tensor)
-            ListTransformer,  # List used in control flow
-            BreakTransformOptimizer,  # optimize transfromation of break in loops
-            BreakContinueTransformer,  # break/continue in loops
-            ReturnTransformer,  # return in functions
-            LogicalTransformer,  # logical and/or/not
-            LoopTransformer,  # for/while -> while_op
-            IfElseTransformer,  # if/else -> cond_op
-            AssertTransformer,  # assert statement
-            PrintTransformer,  # print statement
-            CallTransformer,  # transform call recursively
-            CastTransformer,  # type casting statement
-        ]
-
-        for index, transformer in enumerate(transformers):
+        for index, transformer in enumerate(TRANSFORMERS):
             self._apply(transformer, node_wrapper, log_level=index + 1)
 
         self.translator_logger.log_transformed_code(
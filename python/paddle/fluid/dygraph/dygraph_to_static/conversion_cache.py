@@ -0,0 +1,205 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import collections
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+import astor
+import gast
+import six
+
+from paddle.fluid.dygraph.dygraph_to_static import logging_utils
+from paddle.fluid.dygraph.dygraph_to_static.ast_transformer import TRANSFORMERS
+from paddle.fluid.dygraph.dygraph_to_static.origin_info import Location, OriginInfo
+from paddle.fluid.dygraph.dygraph_to_static.utils import unwrap
+
+__all__ = []
+
+CACHE_DIR_ENV_NAME = 'TRANSLATOR_CACHE_DIR'
+
+# Bump it when the content of cache file is changed.
+_CACHE_FORMAT_VERSION = 1
+
+ConversionCacheInfo = collections.namedtuple(
+    'ConversionCacheInfo',
+    ['hits', 'misses', 'errors', 'conversion_time', 'saved_time'])
+
+
+def _get_paddle_version():
+    try:
+        from paddle.version import full_version, commit
+        return "{}-{}".format(full_version, commit)
+    except ImportError:
+        return "unknown"
+
+
+def _get_transformer_config():
+    """
+    Everything except the source code which the transformed code depends on.
+    """
+    return "|".join([
+        str(_CACHE_FORMAT_VERSION),
+        _get_paddle_version(),
+        "python-{}.{}".format(*sys.version_info[:2]),
+        "gast-{}".format(getattr(gast, '__version__', '')),
+        "astor-{}".format(getattr(astor, '__version__', '')),
+        ",".join(t.__name__ for t in TRANSFORMERS),
+    ])
+
+
+class ConversionCache(object):
+    """
+    A persistent cache of the transformed source code of dygraph functions,
+    stored as one json file per function in `cache_dir`.
+
+    The key of a function is the hash of its dedented source code, Paddle
+    version and the transformer config, so the same function converted in
+    other processes or by the restarted process reuses the cached result
+    without running the transformers. The original information of the source
+    code is stored relative to the function, thus it's right even if the
+    function is moved in its file.
+    """
+
+    def __init__(self, cache_dir):
+        self._cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self._config = _get_transformer_config()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._conversion_time = 0.
+        self._saved_time = 0.
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def _key(self, source_code):
+        md5 = hashlib.md5()
+        md5.update(self._config.encode('utf-8'))
+        md5.update(source_code.encode('utf-8'))
+        return md5.hexdigest()
+
+    def _path(self, source_code):
+        return os.path.join(self._cache_dir,
+                            "{}.json".format(self._key(source_code)))
+
+    def load(self, source_code):
+        """
+        Returns the cache entry of `source_code`, or None if not found.
+        """
+        path = self._path(source_code)
+        if not os.path.exists(path):
+            self._misses += 1
+            return None
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            if entry['source_code'] != source_code:
+                raise ValueError("hash collision with other function.")
+        except Exception as e:
+            logging_utils.warn(
+                "Failed to load the dygraph to static cache file {}: {}".
+                format(path, e))
+            self._errors += 1
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry
+
+    def save(self, source_code, static_code, origin_info_map, func,
+             conversion_time):
+        """
+        Saves the transformed code and the origin info map of `func`.
+        """
+        self._conversion_time += conversion_time
+        entry = {
+            'source_code': source_code,
+            'static_code': static_code,
+            'origin_info': _relative_origin_info(origin_info_map, func),
+            'conversion_time': conversion_time,
+        }
+        path = self._path(source_code)
+        try:
+            if not os.path.exists(self._cache_dir):
+                os.makedirs(self._cache_dir)
+            # write to a temporary file and rename it, so the processes
+            # converting the same function never read a partial file.
+            fd, tmp_path = tempfile.mkstemp(
+                suffix='.tmp', dir=self._cache_dir)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.rename(tmp_path, path)
+        except Exception as e:
+            logging_utils.warn(
+                "Failed to write the dygraph to static cache file {}: {}".
+                format(path, e))
+            self._errors += 1
+
+    def add_saved_time(self, saved_time):
+        self._saved_time += max(saved_time, 0.)
+
+    def info(self):
+        return ConversionCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            errors=self._errors,
+            conversion_time=self._conversion_time,
+            saved_time=self._saved_time)
+
+
+def _func_offsets(func):
+    func = unwrap(func)
+    source_lines, begin_lineno = inspect.getsourcelines(func)
+    begin_line = source_lines[0]
+    col_offset = len(begin_line) - len(begin_line.lstrip())
+    return inspect.getsourcefile(func), begin_lineno - 1, col_offset
+
+
+def _relative_origin_info(origin_info_map, func):
+    """
+    Converts the origin info map of `func` to a list of
+    [static_lineno, lineno, col_offset, function_name, source_code], the
+    lineno and col_offset are relative to the beginning of `func`.
+    """
+    _, lineno_offset, col_offset = _func_offsets(func)
+    infos = []
+    for (_, static_lineno), info in six.iteritems(origin_info_map):
+        infos.append([
+            static_lineno, info.location.lineno - lineno_offset,
+            info.location.col_offset - col_offset, info.function_name,
+            info.source_code
+        ])
+    return infos
+
+
+def restore_origin_info_map(entry, func, static_filepath):
+    """
+    Restores the origin info map saved in cache `entry` for `func`, whose
+    static function is in file `static_filepath`.
+    """
+    filepath, lineno_offset, col_offset = _func_offsets(func)
+    origin_info_map = {}
+    for static_lineno, lineno, col, function_name, source_code in entry[
+            'origin_info']:
+        loc = Location(filepath, lineno + lineno_offset, col + col_offset)
+        origin_info_map[(static_filepath, static_lineno)] = OriginInfo(
+            loc, function_name, source_code)
+    return origin_info_map
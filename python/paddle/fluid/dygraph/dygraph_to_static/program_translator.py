@@ -17,9 +17,11 @@ from __future__ import print_function
 import collections
 import gast
 import inspect
+import os
 import six
 import textwrap
 import threading
+import time
 import warnings
 import weakref
 
@@ -31,15 +33,18 @@ from paddle.fluid.layers.utils import flatten
 from paddle.fluid.dygraph.base import param_guard
 from paddle.fluid.dygraph.base import switch_to_static_graph
 from paddle.fluid.dygraph.dygraph_to_static import DygraphToStaticAst
+from paddle.fluid.dygraph.dygraph_to_static import conversion_cache
 from paddle.fluid.dygraph.dygraph_to_static import error
 from paddle.fluid.dygraph.dygraph_to_static import logging_utils
 from paddle.fluid.dygraph.dygraph_to_static.origin_info import attach_origin_info
 from paddle.fluid.dygraph.dygraph_to_static.origin_info import create_and_update_origin_info_map
+from paddle.fluid.dygraph.dygraph_to_static.origin_info import global_origin_info_map
 from paddle.fluid.dygraph.dygraph_to_static.origin_info import update_op_callstack_with_origin_info
 from paddle.fluid.dygraph.dygraph_to_static.partial_program import partial_program_from
 from paddle.fluid.dygraph.dygraph_to_static.utils import ast_to_func
 from paddle.fluid.dygraph.dygraph_to_static.utils import ast_to_source_code
 from paddle.fluid.dygraph.dygraph_to_static.utils import func_to_source_code
+from paddle.fluid.dygraph.dygraph_to_static.utils import source_to_func
 from paddle.fluid.dygraph.dygraph_to_static.utils import type_name
 from paddle.fluid.dygraph.dygraph_to_static.utils import unwrap
 from paddle.fluid.dygraph.dygraph_to_static.utils import make_hashable
@@ -65,6 +70,30 @@ class FunctionCache(object):
         # Caches the converted ast node for same source code. {source_code: ast_root}
         self._code_to_ast_caches = dict()
         self._dygraph_to_static = DygraphToStaticAst()
+        # Persistent cache of the transformed code, enabled by setting cache dir.
+        self._persistent_cache = None
+        cache_dir = os.getenv(conversion_cache.CACHE_DIR_ENV_NAME)
+        if cache_dir:
+            self.set_cache_dir(cache_dir)
+
+    def set_cache_dir(self, cache_dir):
+        """
+        Enables the persistent cache of the transformed code in `cache_dir`,
+        or disables it if `cache_dir` is None.
+        """
+        if cache_dir is None:
+            self._persistent_cache = None
+        else:
+            self._persistent_cache = conversion_cache.ConversionCache(cache_dir)
+
+    def cache_info(self):
+        """
+        Returns the ConversionCacheInfo of the persistent cache, or None if
+        the persistent cache is disabled.
+        """
+        if self._persistent_cache is None:
+            return None
+        return self._persistent_cache.info()
 
     def convert_with_cache(self, func):
         """
@@ -110,17 +139,51 @@ class FunctionCache(object):
         if source_code in self._code_to_ast_caches:
             root_wrapper = self._code_to_ast_caches[source_code]
         else:
+            if self._persistent_cache is not None:
+                static_func = self._convert_from_persistent_cache(func,
+                                                                  source_code)
+                if static_func is not None:
+                    return static_func
+
+            start = time.time()
             root = gast.parse(source_code)
             root = attach_origin_info(root, func)
             root_wrapper = self._dygraph_to_static.get_static_ast(root)
             self._code_to_ast_caches[source_code] = root_wrapper
 
+            if self._persistent_cache is not None:
+                static_code = ast_to_source_code(root_wrapper.node)
+                static_func, file_name = source_to_func(static_code, func)
+                origin_info_map = create_and_update_origin_info_map(
+                    root_wrapper.node, static_func, is_global=False)
+                global_origin_info_map.update(origin_info_map)
+                self._persistent_cache.save(source_code, static_code,
+                                            origin_info_map, func,
+                                            time.time() - start)
+                return static_func
+
         # Get static function from AST
         static_func, file_name = ast_to_func(root_wrapper.node, func)
 
         create_and_update_origin_info_map(root_wrapper.node, static_func)
         return static_func
 
+    def _convert_from_persistent_cache(self, func, source_code):
+        """
+        Returns the static function built from the transformed code in the
+        persistent cache, or None if not cached.
+        """
+        start = time.time()
+        entry = self._persistent_cache.load(source_code)
+        if entry is None:
+            return None
+        static_func, file_name = source_to_func(entry['static_code'], func)
+        global_origin_info_map.update(
+            conversion_cache.restore_origin_info_map(entry, func, file_name))
+        self._persistent_cache.add_saved_time(entry['conversion_time'] -
+                                              (time.time() - start))
+        return static_func
+
     def exist(self, func):
         return func in self._converted_static_func_caches
 
@@ -1084,3 +1147,54 @@ class ProgramTranslator(object):
 
         """
         return self._program_cache
+
+    def set_conversion_cache_dir(self, cache_dir):
+        """
+        Enables the persistent cache of the transformed code of dygraph
+        functions in `cache_dir`, or disables it if `cache_dir` is None. The
+        processes sharing the same cache dir skip the transformation of the
+        functions converted by each other, even after restarting. It can also
+        be enabled by environment variable `TRANSLATOR_CACHE_DIR`.
+
+        Args:
+            cache_dir (str|None): The directory to store the cache files.
+
+        Returns:
+            None.
+
+        Examples:
+            .. code-block:: python
+
+                import paddle
+
+                prog_trans = paddle.jit.ProgramTranslator()
+                prog_trans.set_conversion_cache_dir('./dy2static_cache')
+
+        """
+        check_type(cache_dir, "cache_dir", (str, type(None)),
+                   "ProgramTranslator.set_conversion_cache_dir")
+        with _CACHE_LOCK:
+            _FUNCTION_CACHE.set_cache_dir(cache_dir)
+
+    def get_conversion_cache_info(self):
+        """
+        Returns the statistics of the persistent cache set by
+        `set_conversion_cache_dir`, or None if it's disabled.
+
+        Returns:
+            ConversionCacheInfo: a namedtuple of `hits`, `misses`, `errors`,
+                `conversion_time` (seconds spent to transform the missed
+                functions) and `saved_time` (seconds saved by the hits).
+
+        Examples:
+            .. code-block:: python
+
+                import paddle
+
+                prog_trans = paddle.jit.ProgramTranslator()
+                prog_trans.set_conversion_cache_dir('./dy2static_cache')
+                print(prog_trans.get_conversion_cache_info())
+
+        """
+        with _CACHE_LOCK:
+            return _FUNCTION_CACHE.cache_info()
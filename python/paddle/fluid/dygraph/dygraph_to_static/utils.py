@@ -461,11 +461,20 @@ def ast_to_func(ast_root, dyfunc, delete_on_exit=True):
     function, the other inner functions are invisible for the decorated function.
     """
 
+    source = ast_to_source_code(ast_root)
+    return source_to_func(source, dyfunc, delete_on_exit)
+
+
+def source_to_func(source, dyfunc, delete_on_exit=True):
+    """
+    Transform the source code of transformed dygraph function into python
+    callable object.
+    """
+
     def remove_if_exit(filepath):
         if os.path.exists(filepath):
             os.remove(filepath)
 
-    source = ast_to_source_code(ast_root)
     import_fluid = "import paddle\nimport paddle.fluid as fluid\n"
     source = import_fluid + source
 
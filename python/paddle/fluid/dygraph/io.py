@@ -656,7 +656,76 @@ def _construct_params_and_buffers(model_path,
     return var_dict
 
 
-def _run_dygraph(instance, input, program_holder):
+class _CallPlan(object):
+    """
+    The resolved inputs, outputs and attributes of the run_program op of a
+    method of TranslatedLayer, built once when the layer is loaded and reused
+    by every call in dygraph mode.
+    """
+
+    def __init__(self, instance, program_holder):
+        self.input_names = [
+            var_desc.name() for var_desc in program_holder.input_descs
+        ]
+
+        self.persistable_vars = []
+        for var_name in program_holder.persistable_names:
+            dy_var_name = instance._persistable_var_name_dict[var_name]
+            if dy_var_name in instance._parameters:
+                self.persistable_vars.append(instance._parameters[
+                    dy_var_name])
+            elif dy_var_name in instance._buffers:
+                self.persistable_vars.append(instance._buffers[dy_var_name])
+            else:
+                raise ValueError(
+                    "The persistable variable %s does not exist in current TranslatedLayer."
+                    % var_name)
+
+        # the output VarBases are returned to the user, so only the arguments
+        # to create them are kept
+        self.output_specs = [(var_desc.dtype(), var_desc.shape(),
+                              var_desc.name(), var_desc.type())
+                             for var_desc in program_holder.output_descs]
+
+        # hold forward variables, all the calls run in the same inner scope
+        self.scope_vec = core.VarBase(core.VarDesc.VarType.FP32, [],
+                                      "program_out_scope",
+                                      core.VarDesc.VarType.STEP_SCOPES, True)
+        self.scope_vec.value().set_scope(program_holder.scope)
+
+        end_op_index = program_holder.infer_program.block(0).op_size()
+        self.infer_attrs = {
+            'global_block': program_holder.infer_program.block(0),
+            'start_op_index': 0,
+            'end_op_index': end_op_index,
+            'is_test': True
+        }
+        self.train_attrs = {
+            'global_block': program_holder.train_program.block(0),
+            'start_op_index': 0,
+            'end_op_index': end_op_index,
+            'is_test': False
+        }
+
+        # NOTE: [ why need set param's gradient type here ]
+        # if user set sparse gradient mode, the param's gradient
+        # will be SelectedRows, not LoDTensor. But tracer will just
+        # set param grad VarBase by forward VarBase(LoDTensor)
+        # If we don't change grad_var type here, RunProgramOp need
+        # transform SelectedRows to LoDTensor forcibly, it may not
+        # be user wanted result.
+        train_block = program_holder.train_program.block(0)
+        for persistable_var in self.persistable_vars:
+            grad_var_name = persistable_var.name + core.grad_var_suffix()
+            grad_var = train_block.find_var(cpt.to_bytes(grad_var_name))
+            # NOTE: cannot find var desc maybe not problem, 
+            # such as in batch_norm
+            if grad_var is None:
+                continue
+            persistable_var._set_grad_type(grad_var.type())
+
+
+def _run_dygraph(instance, input, call_plan):
 
     # 1. prepare inputs, outputs, attrs
     input_vars = []
@@ -669,7 +738,7 @@ def _run_dygraph(instance, input, program_holder):
         if isinstance(value, np.ndarray):
             var = core.VarBase(
                 value=value,
-                name=program_holder.input_descs[i].name(),
+                name=call_plan.input_names[i],
                 persistable=False,
                 place=framework._current_expected_place(),
                 zero_copy=True)
@@ -677,68 +746,25 @@ def _run_dygraph(instance, input, program_holder):
             var = value
             # NOTE: we changed var name here, 
             # but it may be an important name set by user
-            var.name = program_holder.input_descs[i].name()
+            var.name = call_plan.input_names[i]
         input_vars.append(var)
     if instance._input_args_names is None:
-        instance._input_args_names = [
-            ins.name() for ins in program_holder.input_descs
-        ]
+        instance._input_args_names = list(call_plan.input_names)
 
-    persistable_vars = []
-    for var_name in program_holder.persistable_names:
-        dy_var_name = instance._persistable_var_name_dict[var_name]
-        if dy_var_name in instance._parameters:
-            persistable_vars.append(instance._parameters[dy_var_name])
-        elif dy_var_name in instance._buffers:
-            persistable_vars.append(instance._buffers[dy_var_name])
-        else:
-            raise ValueError(
-                "The persistable variable %s does not exist in current TranslatedLayer."
-                % var_name)
-
-    output_vars = []
-    for var_desc in program_holder.output_descs:
-        var = core.VarBase(var_desc.dtype(),
-                           var_desc.shape(),
-                           var_desc.name(), var_desc.type(), False)
-        output_vars.append(var)
-
-    # hold forward variables
-    tmp_scope_vec = core.VarBase(core.VarDesc.VarType.FP32, [],
-                                 "program_out_scope",
-                                 core.VarDesc.VarType.STEP_SCOPES, True)
-    tmp_scope_vec.value().set_scope(program_holder.scope)
+    output_vars = [
+        core.VarBase(dtype, shape, name, var_type, False)
+        for dtype, shape, name, var_type in call_plan.output_specs
+    ]
 
     # 2. run program by op
-    trace_program = program_holder.infer_program if instance._is_test else program_holder.train_program
-    end_op_index = program_holder.infer_program.block(0).op_size()
+    attrs = call_plan.infer_attrs if instance._is_test else call_plan.train_attrs
     framework._dygraph_tracer().trace_op(
         type='run_program',
         inputs={'X': input_vars,
-                'Params': persistable_vars},
+                'Params': call_plan.persistable_vars},
         outputs={'Out': output_vars,
-                 'OutScope': tmp_scope_vec},
-        attrs={
-            'global_block': trace_program.block(0),
-            'start_op_index': 0,
-            'end_op_index': end_op_index,
-            'is_test': instance._is_test
-        })
-    # NOTE: [ why need set param's gradient type here ]
-    # if user set sparse gradient mode, the param's gradient
-    # will be SelectedRows, not LoDTensor. But tracer will just
-    # set param grad VarBase by forward VarBase(LoDTensor)
-    # If we don't change grad_var type here, RunProgramOp need
-    # transform SelectedRows to LoDTensor forcibly, it may not
-    # be user wanted result.
-    for persistable_var in persistable_vars:
-        grad_var_name = var.name + core.grad_var_suffix()
-        grad_var = trace_program.block(0).find_var(cpt.to_bytes(grad_var_name))
-        # NOTE: cannot find var desc maybe not problem, 
-        # such as in batch_norm
-        if grad_var is None:
-            continue
-        persistable_var._set_grad_type(grad_var.type())
+                 'OutScope': call_plan.scope_vec},
+        attrs=attrs)
 
     # 3. prepare output, keep same form with inputs
     outs = output_vars
@@ -1114,6 +1140,11 @@ class TranslatedLayer(layers.Layer):
         self._is_test = True
         self._input_args_names = None
 
+        # the call plans of the methods in dygraph mode
+        self._call_plans = dict()
+        for method_name, program_holder in programs.items():
+            self._call_plans[method_name] = _CallPlan(self, program_holder)
+
     @staticmethod
     @framework.dygraph_only
     def _construct(model_path, configs=None):
@@ -1155,7 +1186,8 @@ class TranslatedLayer(layers.Layer):
             # When using jit.save, it runs in static graph mode.
             # Run in dynamic graph mode when the model is inferring.
             if in_dygraph_mode():
-                return _run_dygraph(self, input, program_holder)
+                return _run_dygraph(self, input,
+                                    self._call_plans[__i_m_p_l__.__name__])
             else:
                 # NOTE(weixin): [ why not use 'program_holder.infer_program' directly? ]
                 # When use '_run_static_graph(input, program_holder, program_holder.infer_program)',
@@ -274,6 +274,8 @@ class _SaveLoadConfig(object):
         self._separate_params = False
         # used for `paddle.load`
         self._keep_name_table = False
+        # used for `paddle.save` and `paddle.load`
+        self._use_mmap = False
 
         # NOTE: Users rarely use following configs, so these configs are not open to users,
         # reducing user learning costs, but we retain the configuration capabilities
@@ -351,6 +353,20 @@ class _SaveLoadConfig(object):
                 % type(value))
         self._keep_name_table = value
 
+    @property
+    def use_mmap(self):
+        return self._use_mmap
+
+    @use_mmap.setter
+    def use_mmap(self, value):
+        if value is None:
+            return
+        if not isinstance(value, bool):
+            raise TypeError(
+                "The config `use_mmap` should be bool value, but received input's type is %s."
+                % type(value))
+        self._use_mmap = value
+
 
 def _parse_save_configs(configs):
     supported_configs = ['output_spec']
@@ -46,6 +46,16 @@ def _convert_camel_to_snake(name):
     return _all_cap_re.sub(r'\1_\2', s1).lower()
 
 
+# Bumped when the parameters, buffers or sublayers of any Layer change, a
+# cached state index of a Layer is valid only at the version it is built.
+_structure_version = 0
+
+
+def _update_structure_version():
+    global _structure_version
+    _structure_version += 1
+
+
 class HookRemoveHelper(object):
     """ A HookRemoveHelper that can be used to remove hook. """
 
@@ -97,6 +107,7 @@ class Layer(core.Layer):
         self._non_persistable_buffer_names_set = set()
         self._sub_layers = collections.OrderedDict()
         self._loaddict_holder = collections.OrderedDict()
+        self._state_index = None
 
         self._forward_pre_hooks = collections.OrderedDict()
         self._forward_post_hooks = collections.OrderedDict()
@@ -498,11 +509,12 @@ class Layer(core.Layer):
             dtype=dtype,
             type=core.VarDesc.VarType.LOD_TENSOR)
 
-    def parameters(self, include_sublayers=True):
+    def parameters(self, include_sublayers=True, use_cache=False):
         """Returns a list of all Parameters from current layer and its sub-layers.
 
         Parameters:
             include_sublayers(bool, optional): Whether include the parameters of sublayers. If True, also include the parameters from sublayers. Default: True
+            use_cache(bool, optional): Whether reuse the parameters cached by the last call with use_cache=True, the cache is rebuilt after any parameter, buffer or sublayer is added, removed or reassigned. Default: False
 
         Returns:
             list of Tensor : a list of Parameters.
@@ -516,6 +528,8 @@ class Layer(core.Layer):
             print(linear.parameters())  # print linear_0.w_0 and linear_0.b_0
 
         """
+        if use_cache and include_sublayers:
+            return list(self._get_state_index()[1])
         ret = [
             param
             for _, param in self.named_parameters(
@@ -679,20 +693,20 @@ class Layer(core.Layer):
         """
         if layers_set is None:
             layers_set = set()
-        if include_self and self not in layers_set:
-            layers_set.add(self)
-            yield prefix, self
-        if include_sublayers:
-            for key, layer in self._sub_layers.items():
-                if layer is None:
-                    continue
-                layer_prefix = prefix + ('.' if prefix else '') + key
-                for p, l in layer.named_sublayers(
-                        prefix=layer_prefix,
-                        include_sublayers=include_sublayers,
-                        include_self=True,
-                        layers_set=layers_set):
-                    yield p, l
+        # traverse in preorder with a stack instead of the nested generators,
+        # which cost O(depth) for every yielded layer
+        stack = [(prefix, self, include_self)]
+        while stack:
+            layer_prefix, layer, yield_layer = stack.pop()
+            if yield_layer and layer not in layers_set:
+                layers_set.add(layer)
+                yield layer_prefix, layer
+            if include_sublayers:
+                sep = '.' if layer_prefix else ''
+                stack.extend(
+                    reversed([(layer_prefix + sep + key, sublayer, True)
+                              for key, sublayer in layer._sub_layers.items()
+                              if sublayer is not None]))
 
     def register_buffer(self, name, tensor, persistable=True):
         """
@@ -753,6 +767,7 @@ class Layer(core.Layer):
                 "The registered buffer should be a core.VarBase, but received {}.".
                 format(type(tensor).__name__))
         else:
+            _update_structure_version()
             self._buffers[name] = tensor
             if persistable:
                 self._non_persistable_buffer_names_set.discard(name)
@@ -950,6 +965,7 @@ class Layer(core.Layer):
         """
         assert isinstance(sublayer, core.Layer)
 
+        _update_structure_version()
         self._sub_layers[name] = sublayer
         return sublayer
 
@@ -1005,6 +1021,7 @@ class Layer(core.Layer):
                 "The parameter to be added should be a Parameter, but received {}.".
                 format(type(parameter).__name__))
         else:
+            _update_structure_version()
             if parameter is None:
                 self._parameters[name] = None
 
@@ -1018,7 +1035,9 @@ class Layer(core.Layer):
         return parameter
 
     def __getstate__(self):
-        return self.__dict__
+        state = self.__dict__.copy()
+        state['_state_index'] = None
+        return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
@@ -1057,6 +1076,7 @@ class Layer(core.Layer):
 
                 value.set_value(self._loaddict_holder[value.name])
 
+            _update_structure_version()
             _remove_if_exist(self.__dict__, self._buffers, self._sub_layers)
             params[name] = value
         elif params is not None and name in params:
@@ -1064,6 +1084,7 @@ class Layer(core.Layer):
                 raise TypeError(
                     "assignment to parameter '{}' should be of type Parameter or None, but got '{}'"
                     .format(name, type(value).__name__))
+            _update_structure_version()
             params[name] = None
         else:
             layers = self.__dict__.get('_sub_layers', None)
@@ -1073,6 +1094,7 @@ class Layer(core.Layer):
                         "super(YourLayer, self).__init__() should be called first"
                     )
 
+                _update_structure_version()
                 _remove_if_exist(self.__dict__, self._parameters, self._buffers)
                 layers[name] = value
             elif layers is not None and name in layers:
@@ -1080,6 +1102,7 @@ class Layer(core.Layer):
                     raise TypeError(
                         "assignment to sublayer '{}' should be of type Layer or None, but got '{}'"
                         .format(name, type(value).__name__))
+                _update_structure_version()
                 layers[name] = None
             else:
                 _buffers = self.__dict__.get('_buffers', None)
@@ -1088,6 +1111,7 @@ class Layer(core.Layer):
                         raise ValueError(
                             "super(YourLayer, self).__init__() should be called first"
                         )
+                    _update_structure_version()
                     _remove_if_exist(self.__dict__, self._parameters,
                                      self._sub_layers)
                     # Set persistable=False by default. Only `register_buffer` can
@@ -1096,6 +1120,7 @@ class Layer(core.Layer):
                         self._non_persistable_buffer_names_set.add(name)
                     _buffers[name] = value
                 elif _buffers is not None and name in _buffers:
+                    _update_structure_version()
                     # Note(Aurelius84): In Dy2stat, the value of the Buffer may be modified in 
                     # decorated function, such as `self.buffer = new_tensor`. So we update its
                     # value via `assign`.
@@ -1122,6 +1147,9 @@ class Layer(core.Layer):
                     object.__setattr__(self, name, value)
 
     def __delattr__(self, name):
+        if name in self._parameters or name in self._sub_layers or \
+                name in self._buffers:
+            _update_structure_version()
         if name in self._parameters:
             del self._parameters[name]
         elif name in self._sub_layers:
@@ -1169,13 +1197,16 @@ class Layer(core.Layer):
     def state_dict(self,
                    destination=None,
                    include_sublayers=True,
-                   structured_name_prefix=""):
+                   structured_name_prefix="",
+                   use_cache=False):
         '''
         Get all parameters and persistable buffers of current layer and its sub-layers. And set them into a dict
 
         Parameters:
             destination(dict, optional) : If provide, all the parameters and persistable buffers will be set to this dict . Default: None
             include_sublayers(bool, optional) : If true, also include the parameters and persistable buffers from sublayers. Default: True
+            use_cache(bool, optional) : If true, copy the entries from the flat index cached by the last call with use_cache=True,
+                                        the cache is rebuilt after any parameter, buffer or sublayer is added, removed or reassigned. Default: False
 
         Retruns:
             dict: a dict contains all the parameters and persistable buffers.
@@ -1194,24 +1225,53 @@ class Layer(core.Layer):
 
         if destination is None:
             destination = collections.OrderedDict()
-        for name, data in self._parameters.items():
-            if data is not None:
+        if use_cache and include_sublayers:
+            for name, data in self._get_state_index()[0].items():
                 destination[structured_name_prefix + name] = data
-        for name, buffer in self._buffers.items():
-            if buffer is not None and name not in self._non_persistable_buffer_names_set:
-                destination[structured_name_prefix + name] = buffer
-
-        if include_sublayers:
-            for layer_name, layer_item in self._sub_layers.items():
-                if layer_item is not None:
-                    destination_temp = destination.copy()
-                    destination_temp.update(
-                        layer_item.state_dict(
-                            destination_temp, include_sublayers,
-                            structured_name_prefix + layer_name + "."))
-                    destination = destination_temp
+            return destination
+
+        # fill the single destination in preorder with a stack, the sublayers
+        # overriding state_dict are still called to fill their entries
+        stack = [(structured_name_prefix, self)]
+        while stack:
+            prefix, layer = stack.pop()
+            if layer is not self and \
+                    type(layer).state_dict != Layer.state_dict:
+                sub_destination = layer.state_dict(destination,
+                                                   include_sublayers, prefix)
+                if sub_destination is not destination:
+                    destination.update(sub_destination)
+                continue
+            for name, data in layer._parameters.items():
+                if data is not None:
+                    destination[prefix + name] = data
+            non_persistable_names = layer._non_persistable_buffer_names_set
+            for name, buffer in layer._buffers.items():
+                if buffer is not None and name not in non_persistable_names:
+                    destination[prefix + name] = buffer
+            if include_sublayers:
+                stack.extend(
+                    reversed([(prefix + layer_name + ".", layer_item)
+                              for layer_name, layer_item in
+                              layer._sub_layers.items()
+                              if layer_item is not None]))
         return destination
 
+    def _get_state_index(self):
+        """
+        Return the flat index of the structured names to the parameters and
+        persistable buffers, and the list of the parameters, of this layer
+        and its sublayers. They are cached until the structure of any Layer
+        changes.
+        """
+        cache = self.__dict__.get('_state_index', None)
+        if cache is None or cache[0] != _structure_version:
+            version = _structure_version
+            cache = (version, self.state_dict(),
+                     [param for _, param in self.named_parameters()])
+            self.__dict__['_state_index'] = cache
+        return cache[1], cache[2]
+
     @framework.deprecate_stat_dict
     def set_state_dict(self,
                        state_dict,
@@ -474,13 +474,15 @@ class DataParallel(layers.Layer):
     def state_dict(self,
                    destination=None,
                    include_sublayers=True,
-                   structured_name_prefix=""):
+                   structured_name_prefix="",
+                   use_cache=False):
         '''
         Get all parameters and persistable buffers of current layer and its sub-layers. And set them into a dict
 
         Parameters:
             destination(dict, optional) : If provide, all the parameters and persistable buffers will be set to this dict . Default: None
             include_sublayers(bool, optional) : If true, also include the parameters and persistable buffers from sublayers. Default: True
+            use_cache(bool, optional) : If true, copy the entries from the flat index cached by the wrapped layer. Default: False
 
         Retruns:
             dict: a dict contains all the parameters and persistable buffers.
@@ -504,7 +506,8 @@ class DataParallel(layers.Layer):
         return self._layers.state_dict(
             destination=destination,
             include_sublayers=include_sublayers,
-            structured_name_prefix=structured_name_prefix)
+            structured_name_prefix=structured_name_prefix,
+            use_cache=use_cache)
 
     @framework.deprecate_stat_dict
     def set_state_dict(self,
@@ -16,6 +16,8 @@ from __future__ import print_function
 
 import logging
 import os
+import collections
+import itertools
 import multiprocessing
 import sys
 import warnings
@@ -383,8 +385,23 @@ def _to_name_str(var):
         return _to_str(var)
 
 
+_program_fingerprint_counter = itertools.count()
+
+
+def _get_program_fingerprint(program):
+    # NOTE: id(program) may be reused by another program once the original
+    # one is garbage collected, so a process-unique serial number is attached
+    # to the program the first time it is seen by an executor.
+    fingerprint = getattr(program, '_executor_cache_fingerprint', None)
+    if fingerprint is None:
+        fingerprint = "program_%d" % next(_program_fingerprint_counter)
+        program._executor_cache_fingerprint = fingerprint
+    return fingerprint
+
+
 def _get_strong_program_cache_key(program, feed, fetch_list):
-    return str(id(program)) + _get_program_cache_key(feed, fetch_list)
+    return _get_program_fingerprint(program) + _get_program_cache_key(
+        feed, fetch_list)
 
 
 def _get_program_cache_key(feed, fetch_list):
@@ -446,6 +463,83 @@ def _as_lodtensor(data, place, dtype=None):
     return tensor
 
 
+ProgramCacheInfo = collections.namedtuple(
+    'ProgramCacheInfo', ['hits', 'misses', 'evictions', 'size', 'capacity'])
+
+_ProgramCacheEntry = collections.namedtuple(
+    '_ProgramCacheEntry', ['program', 'ctx', 'scope', 'parent_scope'])
+
+# The default number of entries kept in each cache of an Executor,
+# 0 means the caches are unbounded.
+_DEFAULT_PROGRAM_CACHE_CAPACITY = int(
+    os.getenv('FLAGS_executor_program_cache_capacity', '128'))
+
+
+class _LRUCache(object):
+    """
+    A bounded cache which evicts the least recently used entry when it is
+    full. The optional `on_evict` callback is invoked with the key and value
+    of every evicted entry so that the resources held by it can be released.
+    """
+
+    def __init__(self, capacity=0, on_evict=None):
+        self._capacity = capacity
+        self._on_evict = on_evict
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def set_capacity(self, capacity):
+        self._capacity = capacity
+        self._shrink()
+
+    def get(self, key):
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # move the entry to the most recently used end
+        value = self._entries.pop(key)
+        self._entries[key] = value
+        return value
+
+    def put(self, key, value):
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        self._shrink()
+
+    def clear(self):
+        while self._entries:
+            self._evict()
+
+    def _shrink(self):
+        if self._capacity <= 0:
+            return
+        while len(self._entries) > self._capacity:
+            self._evict()
+
+    def _evict(self):
+        key, value = self._entries.popitem(last=False)
+        self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def info(self):
+        return ProgramCacheInfo(self.hits, self.misses, self.evictions,
+                                len(self._entries), self._capacity)
+
+
 class FetchHandler(object):
     def __init__(self, var_dict=None, period_secs=60):
         assert var_dict != None
@@ -551,50 +645,103 @@ class Executor(object):
             self.place = expected_place
         else:
             self.place = place
-        self.program_caches = dict()
-        self.ctx_caches = dict()
-        self.scope_caches = dict()
-        self.var_caches = dict()
-        self.pruned_program_caches = dict()
+        capacity = _DEFAULT_PROGRAM_CACHE_CAPACITY
+        self.program_caches = _LRUCache(
+            capacity, on_evict=self._release_program_cache)
+        self.pruned_program_caches = _LRUCache(capacity)
         p = core.Place()
         p.set_place(self.place)
         self._default_executor = core.Executor(p)
         self._closed = False
-        self.pruned_program_scope_caches = dict()
+        self.pruned_program_scope_caches = _LRUCache(capacity)
         self._prepare_to_run_called = False
 
         self._auto_checkpoint_name = unique_name.generate(
             "__auto_checkpoint_executor__")
 
-    def _get_scope_cache(self, program_cache_key):
-        return self.scope_caches.get(program_cache_key, None)
-
-    def _get_ctx_cache(self, program_cache_key):
-        return self.ctx_caches.get(program_cache_key, None)
-
     def _get_program_cache(self, program_cache_key):
-        return self.program_caches.get(program_cache_key, None)
+        return self.program_caches.get(program_cache_key)
+
+    def _add_program_cache(self, program_cache_key, entry):
+        self.program_caches.put(program_cache_key, entry)
 
-    def _add_program_cache(self, program_cache_key, program):
-        self.program_caches[program_cache_key] = program
+    def _release_program_cache(self, program_cache_key, entry):
+        # drop the sub-scope created for the evicted program, so that the
+        # variables and memory held by it are released.
+        if entry.scope is not None and entry.parent_scope is not None:
+            entry.parent_scope._drop_kid(entry.scope)
 
     def _get_pruned_program_cache(self, program_cache_key):
-        return self.pruned_program_caches.get(program_cache_key, None)
+        return self.pruned_program_caches.get(program_cache_key)
 
     def _add_pruned_program_cache(self, program_cache_key, program):
-        self.pruned_program_caches[program_cache_key] = program
+        self.pruned_program_caches.put(program_cache_key, program)
 
     def _get_pruned_program_scope_cache(self, program_cache_key):
-        return self.pruned_program_scope_caches.get(program_cache_key, None)
+        return self.pruned_program_scope_caches.get(program_cache_key)
 
     def _add_pruned_program_scope_cache(self, program_cache_key, program):
-        self.pruned_program_scope_caches[program_cache_key] = program
+        self.pruned_program_scope_caches.put(program_cache_key, program)
 
-    def _add_ctx_cache(self, ctx_cache_key, ctx):
-        self.ctx_caches[ctx_cache_key] = ctx
+    def set_program_cache_capacity(self, capacity):
+        """
+        Set the max number of programs cached by this executor when
+        :code:`use_program_cache` or :code:`use_prune` is True. Once the
+        capacity is exceeded, the least recently used program is evicted
+        and the scope created for it is released.
 
-    def _add_scope_cache(self, scope_cache_key, scope):
-        self.scope_caches[scope_cache_key] = scope
+        The default capacity is 128, and it can also be changed by the
+        environment variable :code:`FLAGS_executor_program_cache_capacity`.
+
+        Args:
+            capacity(int): the max number of cached programs, 0 means unbounded.
+
+        Returns:
+            None
+
+        Examples:
+            .. code-block:: python
+
+              import paddle
+
+              paddle.enable_static()
+              exe = paddle.static.Executor(paddle.CPUPlace())
+              exe.set_program_cache_capacity(16)
+        """
+        if not isinstance(capacity, six.integer_types) or capacity < 0:
+            raise ValueError(
+                "The capacity of program cache should be a non-negative "
+                "integer, but received {}".format(capacity))
+        for cache in (self.program_caches, self.pruned_program_caches,
+                      self.pruned_program_scope_caches):
+            cache.set_capacity(capacity)
+
+    def program_cache_info(self):
+        """
+        Get the statistics of the program cache of this executor, which can
+        be used to tune :code:`use_program_cache` and the cache capacity.
+
+        Returns:
+            ProgramCacheInfo: a namedtuple of (hits, misses, evictions, size, capacity).
+
+        Examples:
+            .. code-block:: python
+
+              import numpy
+              import paddle
+
+              paddle.enable_static()
+              exe = paddle.static.Executor(paddle.CPUPlace())
+              x = paddle.static.data(name='x', shape=[None, 1], dtype='float32')
+              y = paddle.mean(x)
+
+              for i in range(3):
+                  exe.run(feed={'x': numpy.ones((2, 1), 'float32')},
+                          fetch_list=[y], use_program_cache=True)
+              print(exe.program_cache_info())
+              # ProgramCacheInfo(hits=2, misses=1, evictions=0, size=1, capacity=128)
+        """
+        return self.program_caches.info()
 
     def _add_feed_fetch_ops(self, program, feed, fetch_list, feed_var_name,
                             fetch_var_name):
@@ -1163,16 +1310,17 @@ class Executor(object):
             cached_pruned_program = self._get_pruned_program_cache(cache_key)
             if cached_pruned_program is None:
                 if isinstance(program, compiler.CompiledProgram):
+                    origin_fingerprint = _get_program_fingerprint(
+                        _origin_program)
                     program_scope_cache = self._get_pruned_program_scope_cache(
-                        str(id(_origin_program)))
+                        origin_fingerprint)
                     # copy the original program, so it can be cached.
                     program = copy.copy(program)
                     # share the local scopes for same original CompiledProgram.
                     program._share_vars_from = program_scope_cache
-                    if self._get_pruned_program_scope_cache(
-                            str(id(_origin_program))) is None:
-                        self._add_pruned_program_scope_cache(
-                            str(id(_origin_program)), program)
+                    if program_scope_cache is None:
+                        self._add_pruned_program_scope_cache(origin_fingerprint,
+                                                             program)
                 pruned_program = self._prune_program(program, feed, fetch_list,
                                                      optimize_ops)
                 self._add_pruned_program_cache(cache_key, pruned_program)
@@ -1275,33 +1423,30 @@ class Executor(object):
 
         if use_program_cache:
             cache_key = _get_strong_program_cache_key(program, feed, fetch_list)
-            cached_program = self._get_program_cache(cache_key)
-            cached_ctx = self._get_ctx_cache(cache_key)
-            cached_scope = self._get_scope_cache(cache_key)
-            if cached_program is None:
+            cached = self._get_program_cache(cache_key)
+            if cached is None:
                 cached_program = self._add_feed_fetch_ops(
                     program=program,
                     feed=feed,
                     fetch_list=fetch_list,
                     feed_var_name=feed_var_name,
                     fetch_var_name=fetch_var_name)
-                self._add_program_cache(cache_key, cached_program)
                 fetch_list_str = list(map(_to_name_str, fetch_list))
                 cached_ctx = self._default_executor.prepare(
                     cached_program.desc, 0, fetch_list_str, False)
-                # currently, we cache program, vars, sub_scope here
-                # we suppose that in a life cycle of training, a user
-                # will not create many programs. So, here the basic
-                # rule of caching is to cache all unseen (program, var, scope)
-                # when a user use use_program_cache.
+                # currently, we cache program, ctx and sub_scope here. The
+                # basic rule of caching is to cache all unseen (program, ctx,
+                # scope) when a user use use_program_cache, and the least
+                # recently used one is evicted once the capacity is exceeded.
                 cached_scope = scope.new_scope()
                 self._default_executor.create_variables(cached_program.desc,
                                                         cached_scope, 0)
-                self._add_ctx_cache(cache_key, cached_ctx)
-                self._add_scope_cache(cache_key, cached_scope)
-            program = cached_program
-            ctx = cached_ctx
-            scope = cached_scope
+                cached = _ProgramCacheEntry(cached_program, cached_ctx,
+                                            cached_scope, scope)
+                self._add_program_cache(cache_key, cached)
+            program = cached.program
+            ctx = cached.ctx
+            scope = cached.scope
         else:
             program = self._add_feed_fetch_ops(
                 program=program,
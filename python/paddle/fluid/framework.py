@@ -22,6 +22,7 @@ from .wrapped_decorator import signature_safe_contextmanager, wrap_decorator
 import os
 import re
 import traceback
+import linecache
 import six
 import copy
 
@@ -69,6 +70,12 @@ _dygraph_tracer_ = None
 _global_expected_place_ = None
 _current_device = None
 global_prog_seed = 0
+# The way to record the creation callstack of operators in static mode,
+# see _op_callstack_guard for the supported modes.
+_op_callstack_mode_ = os.getenv('FLAGS_op_callstack_mode', 'full')
+_OP_CALLSTACK_MODES = ['full', 'user', 'none']
+_paddle_package_dir_ = os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))
 
 
 def require_version(min_version, max_version=None):
@@ -997,6 +1004,7 @@ class Variable(object):
 
         is_new_var = False
         name = cpt.to_text(name)
+        pre_var_revision = self.block.desc._var_revision()
         self.desc = self.block.desc.find_var(cpt.to_bytes(name))
 
         if self.desc is None:
@@ -1067,6 +1075,7 @@ class Variable(object):
                 pass
 
         self.block.vars[name] = self
+        self.block._update_synced_var_revision(pre_var_revision)
         self.op = None
         self._stop_gradient = stop_gradient
         self.is_data = is_data
@@ -1836,6 +1845,44 @@ class OpProtoHolder(object):
         }
 
 
+def _format_callstack_frame(filename, lineno, name, line):
+    return [
+        '  File "{}", line {}, in {}'.format(filename, lineno, name),
+        '    {}'.format(line)
+    ]
+
+
+def _get_op_creation_callstack():
+    """
+    Get the callstack recorded in the `op_callstack` attribute of a newly
+    created Operator according to the current op callstack mode.
+    """
+    if _op_callstack_mode_ == 'none':
+        return []
+
+    callstack = []
+    if _op_callstack_mode_ == 'user':
+        # Only record the nearest frame outside of paddle, which is cheap
+        # since only one source line is read. If all the frames are inside
+        # paddle, the outermost one is recorded.
+        frame = sys._getframe(1)
+        while frame.f_back is not None and frame.f_code.co_filename.startswith(
+                _paddle_package_dir_):
+            frame = frame.f_back
+        filename = frame.f_code.co_filename
+        lineno = frame.f_lineno
+        line = linecache.getline(filename, lineno).strip()
+        callstack.extend(
+            _format_callstack_frame(filename, lineno, frame.f_code.co_name,
+                                    line))
+        return callstack
+
+    for frame in traceback.extract_stack():
+        callstack.extend(
+            _format_callstack_frame(frame[0], frame[1], frame[2], frame[3]))
+    return callstack
+
+
 class Operator(object):
     """
     In Fluid, all the operation are represented by Operator, and Operator
@@ -1931,13 +1978,7 @@ class Operator(object):
                     "`type` to initialized an Operator can not be None.")
             else:
                 callstack_var_name = op_maker.kOpCreationCallstackAttrName()
-                op_attrs[callstack_var_name] = []
-                for frame in traceback.extract_stack():
-                    op_attrs[callstack_var_name].append(
-                        '  File "{}", line {}, in {}'.format(frame[0], frame[1],
-                                                             frame[2]))
-                    op_attrs[callstack_var_name].append('    {}'.format(frame[
-                        3]))
+                op_attrs[callstack_var_name] = _get_op_creation_callstack()
 
             self.desc.set_type(type)
             proto = OpProtoHolder.instance().get_op_proto(type)
@@ -2471,6 +2512,10 @@ class Block(object):
         self.ops = list()  # operator list
         self.program = program
         self.removed_vars = collections.OrderedDict()
+        # The revisions of the c++ desc when vars/ops are synchronized last
+        # time, see _sync_with_cpp for details.
+        self._synced_var_revision = None
+        self._synced_op_revision = None
 
     def __str__(self):
         return self._to_readable_code()
@@ -2767,8 +2812,10 @@ class Block(object):
     def _remove_var(self, name, sync=True):
         if sync == True:
             self._sync_with_cpp()
+        pre_var_revision = self.desc._var_revision()
         self.desc._remove_var(cpt.to_bytes(name))
         del self.vars[name]
+        self._update_synced_var_revision(pre_var_revision)
 
     def create_parameter(self, *args, **kwargs):
         global_block = self.program.global_block()
@@ -2840,6 +2887,7 @@ class Block(object):
                                        if attrs else {},
                                        kwargs.get("stop_gradient", False))
         else:
+            pre_op_revision = self.desc._op_revision()
             op_desc = self.desc.append_op()
             op = Operator(
                 block=self,
@@ -2850,6 +2898,7 @@ class Block(object):
                 attrs=kwargs.get("attrs", None))
 
             self.ops.append(op)
+            self._update_synced_op_revision(pre_op_revision)
 
         return op
 
@@ -2864,10 +2913,7 @@ class Block(object):
             Operator: the insert Operator.
         """
         self._sync_with_cpp()
-        op_desc = self.desc._insert_op(index)
-        op = Operator(block=self, desc=op_desc, *args, **kwargs)
-        self.ops.insert(index, op)
-        return op
+        return self._insert_op_without_sync(index, *args, **kwargs)
 
     def _insert_op_without_sync(self, index, *args, **kwargs):
         """
@@ -2880,9 +2926,11 @@ class Block(object):
         Returns:
             Operator: the insert Operator.
         """
+        pre_op_revision = self.desc._op_revision()
         op_desc = self.desc._insert_op(index)
         op = Operator(block=self, desc=op_desc, *args, **kwargs)
         self.ops.insert(index, op)
+        self._update_synced_op_revision(pre_op_revision)
         return op
 
     def _remove_op(self, index, sync=True):
@@ -2897,8 +2945,10 @@ class Block(object):
         """
         if sync == True:
             self._sync_with_cpp()
+        pre_op_revision = self.desc._op_revision()
         self.desc._remove_op(index, index + 1)
         del self.ops[index]
+        self._update_synced_op_revision(pre_op_revision)
 
     def _slice_ops(self, start, end):
         """
@@ -2926,6 +2976,7 @@ class Block(object):
                                        if attrs else {},
                                        kwargs.get("stop_gradient", False))
         else:
+            pre_op_revision = self.desc._op_revision()
             op_desc = self.desc._prepend_op()
             op = Operator(
                 self,
@@ -2935,74 +2986,58 @@ class Block(object):
                 outputs=kwargs.get("outputs", None),
                 attrs=kwargs.get("attrs", None))
             self.ops.insert(0, op)
+            self._update_synced_op_revision(pre_op_revision)
 
         return op
 
+    def _update_synced_var_revision(self, pre_var_revision):
+        # The vars are added/removed on both the python and c++ end by the
+        # caller. If they were in sync before, they are still in sync.
+        if self._synced_var_revision == pre_var_revision:
+            self._synced_var_revision = self.desc._var_revision()
+
+    def _update_synced_op_revision(self, pre_op_revision):
+        # The ops are added/removed on both the python and c++ end by the
+        # caller. If they were in sync before, they are still in sync.
+        if self._synced_op_revision == pre_op_revision:
+            self._synced_op_revision = self.desc._op_revision()
+
     def _sync_with_cpp(self):
         """
         Sync from the desc on the c++ end. This method is used to synchronize
         the c++ desc instance generated by backward.
-        """
-        # sync variables from cpp
-        for var in self.desc.all_vars():
-            if not self.has_var(var.name()):
-                self.create_var(name=var.name(), desc=var, type=var.type())
-
-        # sync variables removed from c++ end
-        for var in list(self.vars.keys()):
-            if not self.desc.find_var(cpt.to_bytes(var)):
-                self.vars.pop(var)
-
-        # sync operators from cpp
-        ops_in_cpp = []
-        for op_idx in range(0, self.desc.op_size()):
-            ops_in_cpp.append(self.desc.op(op_idx))
-
-        if len(self.ops) != 0:
-            first_op_in_python = self.ops[0].desc
-            last_op_in_python = self.ops[len(self.ops) - 1].desc
-            start_index = None
-            end_index = None
-            for index in range(len(ops_in_cpp)):
-                if first_op_in_python == ops_in_cpp[index]:
-                    start_index = index
-                if last_op_in_python == ops_in_cpp[index]:
-                    end_index = index
-            assert start_index is not None
-            assert end_index is not None
-            assert start_index <= end_index
-        else:
-            start_index = 0
-            end_index = -1
-
-        # sync ops append to the head of cpp_ops
-        for index in range((start_index - 1 - 1), -1, -1):
-            op_desc = ops_in_cpp[index]
-            op = Operator(self, op_desc)
-            self.ops.insert(0, op)
-
-        # sync ops append to the end of cpp_ops
-        for index in range((end_index + 1), len(ops_in_cpp)):
-            op_desc = ops_in_cpp[index]
-            op = Operator(self, op_desc)
-            self.ops.append(op)
-
-        # sync ops removed from c++ end
-        if end_index != -1 and end_index < len(self.ops):
-            ops_in_cpp_index = 0
-            ops_in_python_index = 0
-            while ops_in_python_index < len(
-                    self.ops) and ops_in_cpp_index < len(ops_in_cpp):
-                if self.ops[ops_in_python_index].desc != ops_in_cpp[
-                        ops_in_cpp_index]:
-                    del self.ops[ops_in_python_index]
-                else:
-                    ops_in_cpp_index += 1
-                    ops_in_python_index += 1
 
-        assert len(self.ops) == len(ops_in_cpp)
-        for index in range(len(self.ops)):
-            assert self.ops[index].desc == ops_in_cpp[index]
+        The c++ desc records a revision of its vars and ops, which changes
+        whenever they are added or removed, so the vars/ops are only
+        reconciled when they have been changed since the last sync.
+        """
+        var_revision = self.desc._var_revision()
+        if var_revision != self._synced_var_revision:
+            # sync variables from cpp
+            for var in self.desc.all_vars():
+                if not self.has_var(var.name()):
+                    self.create_var(name=var.name(), desc=var, type=var.type())
+
+            # sync variables removed from c++ end
+            for var in list(self.vars.keys()):
+                if not self.desc.find_var(cpt.to_bytes(var)):
+                    self.vars.pop(var)
+            self._synced_var_revision = self.desc._var_revision()
+
+        op_revision = self.desc._op_revision()
+        if op_revision != self._synced_op_revision:
+            # sync operators from cpp, the python Operator of an op desc is
+            # kept if it exists, and ops removed from c++ end are dropped.
+            ops_in_python = dict((id(op.desc), op) for op in self.ops)
+            ops = []
+            for op_idx in six.moves.range(self.desc.op_size()):
+                op_desc = self.desc.op(op_idx)
+                op = ops_in_python.get(id(op_desc), None)
+                if op is None:
+                    op = Operator(self, op_desc)
+                ops.append(op)
+            self.ops[:] = ops
+            self._synced_op_revision = self.desc._op_revision()
 
     def _copy_param_info_from(self, other):
         """
@@ -5545,6 +5580,52 @@ def switch_device(device):
     return pre_device
 
 
+def _set_op_callstack_mode(mode):
+    global _op_callstack_mode_
+    if mode not in _OP_CALLSTACK_MODES:
+        raise ValueError(
+            "The op callstack mode should be one of {}, but received {}".format(
+                _OP_CALLSTACK_MODES, mode))
+    pre_mode = _op_callstack_mode_
+    _op_callstack_mode_ = mode
+    return pre_mode
+
+
+@signature_safe_contextmanager
+def _op_callstack_guard(mode):
+    """
+    A context manager that specifies how the creation callstack of the
+    operators appended in static mode is recorded in their `op_callstack`
+    attribute, which is shown in the error message when an operator fails.
+
+    Recording the full callstack is expensive for programs with a large
+    number of operators, so it can be reduced in the context. The default
+    mode can also be set by the environment variable `FLAGS_op_callstack_mode`.
+
+    Args:
+        mode(str): One of 'full', 'user' and 'none'. 'full' records every
+            frame of the callstack. 'user' only records the nearest frame
+            outside of paddle, i.e. the user code which creates the operator.
+            'none' does not record the callstack.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+            from paddle.fluid.framework import _op_callstack_guard
+
+            paddle.enable_static()
+            with _op_callstack_guard('user'):
+                x = paddle.static.data(name='x', shape=[None, 10])
+                y = paddle.static.nn.fc(x, 10)
+    """
+    pre_mode = _set_op_callstack_mode(mode)
+    try:
+        yield
+    finally:
+        _set_op_callstack_mode(pre_mode)
+
+
 @signature_safe_contextmanager
 def device_guard(device=None):
     """
@@ -0,0 +1,182 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import collections
+import sys
+import threading
+import time
+import weakref
+
+__all__ = ['AsyncSaver', 'AsyncSaveStatus']
+
+AsyncSaveStatus = collections.namedtuple(
+    'AsyncSaveStatus',
+    ['in_flight', 'finished', 'failed', 'last_finish_time', 'last_error'])
+
+_live_savers = weakref.WeakSet()
+
+
+def _wait_live_savers():
+    # make sure the last checkpoint is written before the process exits,
+    # the worker threads are daemon threads and would be killed silently.
+    for saver in list(_live_savers):
+        try:
+            saver.wait()
+        except Exception as e:
+            sys.stderr.write("async save failed at exit: {}\n".format(e))
+
+
+atexit.register(_wait_live_savers)
+
+
+class AsyncSaver(object):
+    """
+    Run save tasks on a background thread, in the order they are submitted.
+
+    A save task is split into two steps: `snapshot_fn` copies the state to be
+    saved into host memory, and it is called on the caller's thread, so the
+    training can modify the state as soon as `submit` returns; `save_fn`
+    serializes and uploads the snapshot, and it is called on the background
+    thread. At most `max_in_flight` snapshots are held at the same time,
+    `submit` blocks before taking a new snapshot until a slot is released.
+
+    The exception raised by a save task is re-raised by the next `submit` or
+    `wait`, so a failed checkpoint is never lost silently.
+
+    Args:
+        max_in_flight(int, optional): the max number of snapshots submitted
+            but not finished. Default: 1.
+        name(str, optional): the name of the background thread.
+    """
+
+    def __init__(self, max_in_flight=1, name="async_saver"):
+        if max_in_flight < 1:
+            raise ValueError(
+                "max_in_flight should be a positive integer, but received %s."
+                % max_in_flight)
+        self._max_in_flight = max_in_flight
+        self._name = name
+        self._cond = threading.Condition()
+        self._tasks = collections.deque()
+        self._in_flight = 0
+        self._finished = 0
+        self._failed = 0
+        self._last_finish_time = None
+        self._last_error = None
+        self._unraised_error = None
+        self._thread = None
+        _live_savers.add(self)
+
+    def submit(self, save_fn, snapshot_fn=None):
+        """
+        Take a snapshot by `snapshot_fn()` and call `save_fn(snapshot)` on
+        the background thread. If `snapshot_fn` is None, `save_fn()` is
+        called without arguments.
+        """
+        self._raise_unraised_error()
+        with self._cond:
+            while self._in_flight >= self._max_in_flight:
+                self._cond.wait()
+            self._in_flight += 1
+
+        try:
+            if snapshot_fn is not None:
+                snapshot = snapshot_fn()
+                task = lambda: save_fn(snapshot)
+            else:
+                task = save_fn
+        except:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            self._tasks.append(task)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name=self._name)
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._tasks:
+                    self._cond.wait()
+                task = self._tasks.popleft()
+
+            error = None
+            try:
+                task()
+            except Exception as e:
+                error = e
+            # release the snapshot before waking up the waiting submit
+            task = None
+
+            with self._cond:
+                self._in_flight -= 1
+                self._last_finish_time = time.time()
+                if error is None:
+                    self._finished += 1
+                else:
+                    self._failed += 1
+                    self._last_error = error
+                    self._unraised_error = error
+                self._cond.notify_all()
+
+    def _raise_unraised_error(self):
+        with self._cond:
+            error = self._unraised_error
+            self._unraised_error = None
+        if error is not None:
+            raise RuntimeError("async save failed: {}".format(error))
+
+    def wait(self, timeout=None):
+        """
+        Block until all the submitted save tasks are finished.
+
+        Args:
+            timeout(float, optional): the max seconds to wait. Default: None,
+                wait forever.
+
+        Returns:
+            bool: False if the tasks are not finished when timeout.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while self._in_flight > 0:
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+        self._raise_unraised_error()
+        return True
+
+    def status(self):
+        """
+        Return the AsyncSaveStatus of this saver.
+        """
+        with self._cond:
+            return AsyncSaveStatus(
+                in_flight=self._in_flight,
+                finished=self._finished,
+                failed=self._failed,
+                last_finish_time=self._last_finish_time,
+                last_error=self._last_error)
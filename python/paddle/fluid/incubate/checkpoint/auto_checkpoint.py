@@ -24,7 +24,7 @@ from threading import Thread, current_thread
 from contextlib import contextmanager
 
 from paddle.fluid import unique_name, compiler
-from .checkpoint_saver import SerializableBase, CheckpointSaver, PaddleModel
+from .checkpoint_saver import SerializableBase, CheckpointSaver, PaddleModel, SerializedState
 from paddle.fluid.framework import in_dygraph_mode, Program
 
 g_train_epoch_range = None
@@ -79,6 +79,7 @@ class AutoCheckpointChecker(object):
         self._hdfs_checkpoint_path = None
         self._trainer_id = None
         self._ce_test = None
+        self._async_save = False
 
         self._run_env = os.getenv("PADDLE_RUNNING_ENV")
         if self._run_env != "PADDLE_EDL_AUTO_CHECKPOINT":
@@ -99,6 +100,8 @@ class AutoCheckpointChecker(object):
 
             self._save_checkpoint_inter = int(
                 os.getenv("PADDLE_EDL_SAVE_CHECKPOINT_INTER", "900"))  # s
+            self._async_save = bool(
+                int(os.getenv("PADDLE_EDL_ASYNC_CHECKPOINT", "0")))
 
             if not self._ce_test:
                 assert len(self._hdfs_home) > 3 and \
@@ -128,6 +131,10 @@ class AutoCheckpointChecker(object):
     def save_checkpoint_inter(self):
         return self._save_checkpoint_inter
 
+    @property
+    def async_save(self):
+        return self._async_save
+
     def valid(self):
         if in_dygraph_mode():
             return False
@@ -224,11 +231,17 @@ class ExeTrainStatus(SerializableBase):
             f.write(s)
 
     def _serialize(self, pop_keys=["restored_from"]):
-        d = self._to_dict()
+        return self._dumps(self._to_dict(), pop_keys)
+
+    @staticmethod
+    def _dumps(d, pop_keys=["restored_from"]):
         for k in pop_keys:
             d.pop(k, None)
         return json.dumps(d)
 
+    def snapshot(self):
+        return SerializedState(self._file_name, self._serialize())
+
     def deserialize(self, path):
         d = None
         file_name = "{}/{}".format(path, self._file_name)
@@ -267,7 +280,8 @@ class TrainEpochRange(SerializableBase):
                  max_epoch_num,
                  name,
                  checkpoint_inter=None,
-                 restored=True):
+                 restored=True,
+                 async_save=None):
         self._max_epoch_num = max_epoch_num
         self._epoch_no = -1  # current epoch_no
         self._name = name
@@ -283,6 +297,10 @@ class TrainEpochRange(SerializableBase):
         assert self._save_checkpoint_inter >= 0, "checkpointer:{} must >=0".format(
             self._save_checkpoint_inter)
         self._last_checkpoint_time = time.time()
+        if async_save is not None:
+            self._async_save = async_save
+        else:
+            self._async_save = self._checker.async_save
 
         self._load_cp_nos = None
         self._checkpoint_epoch_no = None
@@ -397,18 +415,29 @@ class TrainEpochRange(SerializableBase):
             f.write(s)
 
     def _serialize(self, pop_keys=["restored_from", "checkpoint_epoch_no"]):
+        exe_status = {}
+        for k, t in six.iteritems(self._exe_status):
+            exe_status[t._key] = t._to_dict()
+        return self._dumps(self._to_dict(), exe_status, pop_keys)
+
+    @staticmethod
+    def _dumps(d,
+               exe_status,
+               pop_keys=["restored_from", "checkpoint_epoch_no"]):
         # self
-        d = self._to_dict()
         for k in pop_keys:
             d.pop(k, None)
 
         # registerd exes
         d["exe_status"] = {}
         e = d["exe_status"]
-        for k, t in six.iteritems(self._exe_status):
-            e[t._key] = t._serialize()
+        for k, v in six.iteritems(exe_status):
+            e[k] = ExeTrainStatus._dumps(v)
         return json.dumps(d)
 
+    def snapshot(self):
+        return SerializedState(self._file_name, self._serialize())
+
     @property
     def restored_from(self):
         return self._restored_from
@@ -452,6 +481,9 @@ class TrainEpochRange(SerializableBase):
 
             self.save_checkpoint()
 
+        # don't lose the last checkpoint saved asynchronously
+        self.wait()
+
     def get(self):
         return self._epoch_no
 
@@ -479,6 +511,10 @@ class TrainEpochRange(SerializableBase):
         if not self._checker.valid():
             return
 
+        if self._async_save:
+            self._async_save_checkpoint()
+            return
+
         e = self._exe_status
         for k, t in six.iteritems(self._exe_status):
             m = PaddleModel(t._exe, t._program)
@@ -505,6 +541,64 @@ class TrainEpochRange(SerializableBase):
 
             self._generate_flag()
 
+    def _async_save_checkpoint(self):
+        """
+        Snapshot the executors' persistables and the status to host memory
+        on the training thread, and save them as _save_checkpoint does on a
+        background thread.
+        """
+
+        def _snapshot():
+            exes = []
+            for k, t in six.iteritems(self._exe_status):
+                t._epoch_no = self.get()
+                m = PaddleModel(t._exe, t._program).snapshot()
+                exes.append((t, t._to_dict(), m))
+            return self._to_dict(), exes
+
+        def _save(snapshot):
+            d, exes = snapshot
+            exe_status = {}
+            for t, t_dict, m in exes:
+                p = self._checker.get_exe_checkpoint_path(t._hash_key)
+                path, checkpoint_no = self._cper.save_checkpoint(
+                    p, [m],
+                    self._checker.trainer_id,
+                    local_cache_path=self._checker._fs_cache)
+                # index info
+                t._checkpoint_path = t_dict["checkpoint_path"] = path
+                t._checkpoint_no = t_dict["checkpoint_no"] = checkpoint_no
+                exe_status[t_dict["key"]] = t_dict
+
+                logger.debug("save executor checkpoint:{}".format(t_dict))
+
+            if len(exes) > 0:
+                s = self._dumps(d, exe_status)
+                self._cper.save_checkpoint(
+                    self._checkpoint_path,
+                    [SerializedState(self._file_name, s)],
+                    local_cache_path=self._checker._fs_cache)
+                logger.info("save train_epoch_range checkpoint:{}".format(s))
+
+                self._generate_flag()
+
+        self._cper.async_saver.submit(_save, _snapshot)
+
+    def wait(self, timeout=None):
+        """
+        Wait for the checkpoints saved asynchronously.
+        Return False if timeout.
+        """
+        if not self._checker.valid() or not hasattr(self, "_cper"):
+            return True
+        return self._cper.wait(timeout)
+
+    def save_status(self):
+        """
+        Return the AsyncSaveStatus of the checkpoints saved asynchronously.
+        """
+        return self._cper.status()
+
     def _generate_flag(self):
         if self._flag_generated:
             return
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from ...compiler import CompiledProgram
+from .async_saver import AsyncSaver
 
 
 class SerializableBase(object):
@@ -22,6 +23,32 @@ class SerializableBase(object):
     def deserialize(self, path):
         raise NotImplementedError
 
+    def snapshot(self):
+        """
+        Return a SerializableBase holding a host memory copy of the current
+        state, whose serialize can run on another thread.
+        """
+        raise NotImplementedError
+
+
+class SerializedState(SerializableBase):
+    """
+    The state already serialized to `content`, which is written to file
+    `file_name` under the path when serialized.
+    """
+
+    def __init__(self, file_name, content):
+        self._file_name = file_name
+        self._content = content
+
+    def serialize(self, path):
+        if self._content is None:
+            return
+        file_name = "{}/{}".format(path, self._file_name)
+        mode = 'w' if isinstance(self._content, str) else 'wb'
+        with open(file_name, mode) as f:
+            f.write(self._content)
+
 
 class PaddleModel(SerializableBase):
     def __init__(self, exe, program):
@@ -41,6 +68,16 @@ class PaddleModel(SerializableBase):
             main_program=self._program,
             filename=self._file_name)
 
+    def snapshot(self):
+        from ...io import save_persistables
+        # save_combine to memory writes the same content as to the file
+        content = save_persistables(
+            executor=self._exe,
+            dirname=None,
+            main_program=self._program,
+            filename=None)
+        return SerializedState(self._file_name, content)
+
     def deserialize(self, path):
         from ...io import load_persistables
         load_persistables(
@@ -51,9 +88,58 @@ class PaddleModel(SerializableBase):
 
 
 class CheckpointSaver(object):
-    def __init__(self, fs):
+    def __init__(self, fs, max_in_flight=1):
         self._fs = fs
         self._checkpoint_prefix = "__paddle_checkpoint__"
+        self._max_in_flight = max_in_flight
+        self._async_saver = None
+
+    @property
+    def async_saver(self):
+        if self._async_saver is None:
+            self._async_saver = AsyncSaver(
+                self._max_in_flight, name="checkpoint_saver")
+        return self._async_saver
+
+    def async_save_checkpoint(self,
+                              path,
+                              slists,
+                              trainer_id=None,
+                              local_cache_path=".cache",
+                              callback=None):
+        """
+        Snapshot objects in slists to host memory and return, the snapshots
+        are serialized to path on a background thread. At most max_in_flight
+        checkpoints are pending, this call blocks until one is finished if
+        the limit is reached. callback(real_path, checkpoint_no) is called
+        on the background thread after the checkpoint is saved.
+        """
+
+        def _snapshot():
+            return [s.snapshot() for s in slists]
+
+        def _save(snapshots):
+            real_path, checkpoint_no = self.save_checkpoint(
+                path,
+                snapshots,
+                trainer_id=trainer_id,
+                local_cache_path=local_cache_path)
+            if callback is not None:
+                callback(real_path, checkpoint_no)
+
+        self.async_saver.submit(_save, _snapshot)
+
+    def wait(self, timeout=None):
+        """
+        Wait for the checkpoints saved by async_save_checkpoint.
+        Return False if timeout.
+        """
+        if self._async_saver is None:
+            return True
+        return self._async_saver.wait(timeout)
+
+    def status(self):
+        return self.async_saver.status()
 
     def save_checkpoint(self,
                         path,
@@ -120,6 +206,9 @@ class CheckpointSaver(object):
         Deserialize objects in slists from path
         Return really load path
         """
+        # the checkpoints being saved asynchronously should be visible
+        self.wait()
+
         if checkpoint_no is None:
             max_no = self._get_last_checkpoint_no(path)
 
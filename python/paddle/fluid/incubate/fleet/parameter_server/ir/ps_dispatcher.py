@@ -14,6 +14,9 @@
 
 from __future__ import print_function
 
+from paddle.fluid.transpiler.ps_dispatcher import SizeBalanced, ConsistentHash, DispatchReport, dispatch_report
+from paddle.fluid.transpiler.ps_dispatcher import _block_key, _stable_hash
+
 
 class PSDispatcher(object):
     """
@@ -48,8 +51,9 @@ class PSDispatcher(object):
 
 class HashName(PSDispatcher):
     """
-    Hash variable names to several endpoints using python
-    "hash()" function.
+    Hash variable names to several endpoints using md5, so the result
+    is the same in all the processes. The suffixes "@GRAD" and ".trainer_N"
+    are ignored, thus a gradient is dispatched with its parameter.
 
     Args:
         pserver_endpoints (list): list of endpoint(ip:port).
@@ -60,8 +64,8 @@ class HashName(PSDispatcher):
         pserver_endpoints = ["127.0.0.1:6007", "127.0.0.1:6008"]
         vars = ["var1","var2","var3","var4","var5"]
 
-        rr = RoundRobin(pserver_endpoints)
-        rr.dispatch(vars)
+        hn = HashName(pserver_endpoints)
+        hn.dispatch(vars)
 
     """
 
@@ -69,7 +73,7 @@ class HashName(PSDispatcher):
         super(self.__class__, self).__init__(pserver_endpoints)
 
     def _hash_block(self, block_str, total):
-        return hash(block_str) % total
+        return _stable_hash(block_str) % total
 
     def dispatch(self, varlist):
         """
@@ -80,7 +84,7 @@ class HashName(PSDispatcher):
         """
         eplist = []
         for var in varlist:
-            server_id = self._hash_block(var.name(), len(self._eps))
+            server_id = self._hash_block(_block_key(var), len(self._eps))
             server_for_param = self._eps[server_id]
             eplist.append(server_for_param)
         return eplist
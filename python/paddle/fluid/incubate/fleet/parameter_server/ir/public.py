@@ -27,7 +27,7 @@ from paddle.fluid.core import CommContext
 import paddle.fluid.framework as framework
 from paddle.fluid.incubate.fleet.parameter_server.mode import DistributedMode
 from paddle.fluid.incubate.fleet.parameter_server.ir import vars_metatools
-from paddle.fluid.incubate.fleet.parameter_server.ir.ps_dispatcher import RoundRobin, PSDispatcher
+from paddle.fluid.incubate.fleet.parameter_server.ir.ps_dispatcher import RoundRobin, PSDispatcher, dispatch_report
 from paddle.fluid.transpiler.details.program_utils import delete_ops
 
 OP_NAME_SCOPE = "op_namescope"
@@ -602,8 +602,15 @@ class CompileTimeStrategy(object):
 
         return var_mapping
 
+    def _get_split_method(self):
+        get_program_config = getattr(self.strategy, "get_program_config", None)
+        split_method = None
+        if get_program_config is not None:
+            split_method = get_program_config().split_method
+        return split_method if split_method is not None else RoundRobin
+
     def _dispatcher(self):
-        ps_dispatcher = RoundRobin(self.get_ps_endpoints())
+        ps_dispatcher = self._get_split_method()(self.get_ps_endpoints())
         ps_dispatcher.reset()
         grad_var_mapping_items = list(six.iteritems(self.grad_var_mapping))
 
@@ -647,6 +654,13 @@ class CompileTimeStrategy(object):
                 self.param_grad_ep_mapping[ep]["params"].append(recv_vars[i])
                 self.param_grad_ep_mapping[ep]["grads"].append(send_vars[i])
 
+        varlist, eplist = [], []
+        for ep, mapping in six.iteritems(self.param_grad_ep_mapping):
+            varlist.extend(mapping["params"])
+            eplist.extend([ep] * len(mapping["params"]))
+        self.dispatch_report = dispatch_report(self.get_ps_endpoints(), varlist,
+                                               eplist)
+
     def _slice_variable(self,
                         var_list,
                         slice_count,
@@ -16,6 +16,7 @@ from __future__ import print_function
 
 import os
 import errno
+import collections
 import warnings
 import six
 import logging
@@ -45,6 +46,7 @@ from . import core
 from .. import compat as cpt
 from paddle.utils import deprecated
 from paddle.fluid.framework import static_only
+from paddle.fluid.mmap_state_dict import is_mmap_state_dict_file, save_mmap_state_dict, load_mmap_state_dict
 
 batch = paddle.batch
 
@@ -1710,8 +1712,18 @@ def _load_persistable_nodes(executor, dirname, graph):
     load_vars(executor=executor, dirname=dirname, vars=var_list)
 
 
+def _load_state_dict_file(file_name, keys=None):
+    # The file may be saved by pickle or in the memory-mappable format. For
+    # the latter, only the tensors of the given keys are read.
+    if is_mmap_state_dict_file(file_name):
+        return load_mmap_state_dict(file_name, keys=keys)
+    with open(file_name, 'rb') as f:
+        return pickle.load(f) if six.PY2 else pickle.load(
+            f, encoding='latin1')
+
+
 @static_only
-def save(program, model_path):
+def save(program, model_path, use_mmap=False):
     """
     :api_attr: Static Graph
 
@@ -1724,6 +1736,9 @@ def save(program, model_path):
     Args:
         program(Program) : The program to saved.
         model_path(str): the file prefix to save the program. The format is "dirname/file_prefix". If file_prefix is empty str. A exception will be raised
+        use_mmap(bool, optional): If True, the parameters and optimizer information are saved in a memory-mappable
+            format, which writes the Tensors one by one without pickling them, and can be loaded partially by
+            `load` and `load_program_state`. Default: False.
 
     Returns:
         None
@@ -1760,17 +1775,22 @@ def save(program, model_path):
         t = global_scope().find_var(var.name).get_tensor()
         return np.array(t)
 
+    def save_vars_to_file(var_list, file_name):
+        if use_mmap:
+            # the Tensors are fetched and written one by one
+            var_dict = collections.OrderedDict((v.name, v) for v in var_list)
+            save_mmap_state_dict(var_dict, file_name, to_ndarray=get_tensor)
+        else:
+            var_dict = {v.name: get_tensor(v) for v in var_list}
+            with open(file_name, 'wb') as f:
+                pickle.dump(var_dict, f, protocol=2)
+
     parameter_list = list(filter(is_parameter, program.list_vars()))
-    param_dict = {p.name: get_tensor(p) for p in parameter_list}
-    with open(model_path + ".pdparams", 'wb') as f:
-        pickle.dump(param_dict, f, protocol=2)
+    save_vars_to_file(parameter_list, model_path + ".pdparams")
 
     optimizer_var_list = list(
         filter(is_belong_to_optimizer, program.list_vars()))
-
-    opt_dict = {p.name: get_tensor(p) for p in optimizer_var_list}
-    with open(model_path + ".pdopt", 'wb') as f:
-        pickle.dump(opt_dict, f, protocol=2)
+    save_vars_to_file(optimizer_var_list, model_path + ".pdopt")
 
     main_program = program.clone()
     program.desc.flush()
@@ -1932,9 +1952,8 @@ def load(program, model_path, executor=None, var_list=None):
         paddle.fluid.core._create_loaded_parameter(parameter_list,
                                                    global_scope(),
                                                    executor._default_executor)
-    with open(parameter_file_name, 'rb') as f:
-        load_dict = pickle.load(f) if six.PY2 else pickle.load(
-            f, encoding='latin1')
+    load_dict = _load_state_dict_file(
+        parameter_file_name, keys=[v.name for v in parameter_list])
     for v in parameter_list:
         assert v.name in load_dict, \
             "Can not find [{}] in model file [{}]".format(
@@ -1953,9 +1972,8 @@ def load(program, model_path, executor=None, var_list=None):
             paddle.fluid.core._create_loaded_parameter(
                 optimizer_var_list, global_scope(), executor._default_executor)
 
-        with open(opt_file_name, 'rb') as f:
-            load_dict = pickle.load(f) if six.PY2 else pickle.load(
-                f, encoding='latin1')
+        load_dict = _load_state_dict_file(
+            opt_file_name, keys=[v.name for v in optimizer_var_list])
         for v in optimizer_var_list:
             assert v.name in load_dict, \
                 "Can not find [{}] in model file [{}]".format(
@@ -1975,7 +1993,9 @@ def load_program_state(model_path, var_list=None):
                                   [ save_params, save_persistables, save_vars ].
                                   Default: None.
                                   The var_list is only used to get name,
-                                  will not be modified.
+                                  will not be modified. If the file is saved
+                                  by `save` with use_mmap=True, only the
+                                  Tensors in var_list are loaded.
     Returns:
         state_dict(dict): the dict store Parameter and optimizer information
 
@@ -2111,15 +2131,14 @@ def load_program_state(model_path, var_list=None):
     assert os.path.exists(parameter_file_name), \
         "Parameter file [{}] not exits".format(parameter_file_name)
 
-    with open(parameter_file_name, 'rb') as f:
-        para_dict = pickle.load(f) if six.PY2 else pickle.load(
-            f, encoding='latin1')
+    # NOTE: var_list only takes effect for the files saved in the
+    # memory-mappable format, only the given variables are read from them.
+    keys = None if var_list is None else [var.name for var in var_list]
+    para_dict = _load_state_dict_file(parameter_file_name, keys=keys)
 
     opt_file_name = model_prefix + ".pdopt"
     if os.path.exists(opt_file_name):
-        with open(opt_file_name, 'rb') as f:
-            opti_dict = pickle.load(f) if six.PY2 else pickle.load(
-                f, encoding='latin1')
+        opti_dict = _load_state_dict_file(opt_file_name, keys=keys)
 
         para_dict.update(opti_dict)
 
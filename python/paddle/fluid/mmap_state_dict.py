@@ -0,0 +1,210 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A memory-mappable file format for state dicts.
+
+The file is laid out as:
+
+    | MAGIC | tensor data ... | pickled objects | header | header size | MAGIC |
+
+Every tensor is stored as raw bytes aligned to `_ALIGNMENT`, so it can be
+memory-mapped or read alone without touching the rest of the file. The
+values which are not tensors are pickled together into one small blob. The
+header is a json document recording the keys in order and the dtype, shape
+and offset of each tensor; it is written at the end of the file so that the
+tensors can be streamed to the file one by one while saving.
+"""
+
+from __future__ import print_function
+
+import json
+import pickle
+import struct
+
+import numpy as np
+import six
+
+__all__ = []
+
+_MAGIC = b'PDMMAPV1'
+_ALIGNMENT = 64
+_HEADER_SIZE_FORMAT = '<Q'
+_FOOTER_SIZE = struct.calcsize(_HEADER_SIZE_FORMAT) + len(_MAGIC)
+_FORMAT_VERSION = 1
+
+_TENSOR = 'tensor'
+_OBJECT = 'object'
+
+
+def is_mmap_state_dict_file(path):
+    """
+    Whether the file at `path` is saved in the memory-mappable format.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(_MAGIC)) == _MAGIC
+    except IOError:
+        return False
+
+
+def _write_padding(f, offset):
+    padding = (_ALIGNMENT - offset % _ALIGNMENT) % _ALIGNMENT
+    if padding:
+        f.write(b'\0' * padding)
+    return offset + padding
+
+
+def save_mmap_state_dict(state_dict, path, to_ndarray=None):
+    """
+    Save `state_dict` to `path` in the memory-mappable format.
+
+    Args:
+        state_dict(dict): the dict to save, whose keys are str.
+        path(str): the file path to save.
+        to_ndarray(callable, optional): called with each value of the dict,
+            and it returns the numpy.ndarray of the value if the value is a
+            tensor, otherwise None. It is called right before the value is
+            written, so only one tensor is materialized at a time. By
+            default, only the numpy.ndarray values are saved as tensors.
+    """
+    keys = []
+    tensors = {}
+    objects = {}
+    with open(path, 'wb') as f:
+        f.write(_MAGIC)
+        offset = len(_MAGIC)
+        for key, value in six.iteritems(state_dict):
+            if not isinstance(key, six.string_types):
+                raise TypeError(
+                    "The key of state dict saved in mmap format should be "
+                    "str, but received %s." % type(key))
+            array = to_ndarray(value) if to_ndarray is not None else None
+            if array is None and isinstance(value, np.ndarray):
+                array = value
+            if array is None:
+                keys.append([key, _OBJECT])
+                objects[key] = value
+                continue
+
+            if not array.flags['C_CONTIGUOUS']:
+                array = np.ascontiguousarray(array)
+            if array.dtype.hasobject:
+                raise TypeError(
+                    "The tensor %s of object dtype can not be saved in mmap "
+                    "format." % key)
+            offset = _write_padding(f, offset)
+            f.write(array.tobytes() if array.ndim == 0 else memoryview(
+                array.reshape(-1).view(np.uint8)))
+            keys.append([key, _TENSOR])
+            tensors[key] = {
+                'dtype': array.dtype.str,
+                'shape': list(array.shape),
+                'offset': offset,
+                'nbytes': array.nbytes,
+            }
+            offset += array.nbytes
+            del array
+
+        objects_bytes = pickle.dumps(objects, protocol=2)
+        f.write(objects_bytes)
+        header = {
+            'version': _FORMAT_VERSION,
+            'keys': keys,
+            'tensors': tensors,
+            'objects': {
+                'offset': offset,
+                'nbytes': len(objects_bytes)
+            },
+        }
+        header_bytes = json.dumps(header).encode('utf-8')
+        f.write(header_bytes)
+        f.write(struct.pack(_HEADER_SIZE_FORMAT, len(header_bytes)))
+        f.write(_MAGIC)
+
+
+def _read_header(f, path):
+    f.seek(0, 2)
+    file_size = f.tell()
+    if file_size < len(_MAGIC) + _FOOTER_SIZE:
+        raise ValueError("The file %s is not a valid mmap state dict file." %
+                         path)
+    f.seek(file_size - _FOOTER_SIZE)
+    footer = f.read(_FOOTER_SIZE)
+    header_size, = struct.unpack(_HEADER_SIZE_FORMAT, footer[:-len(_MAGIC)])
+    if footer[-len(_MAGIC):] != _MAGIC:
+        raise ValueError("The file %s is not a valid mmap state dict file, "
+                         "it may be truncated." % path)
+    f.seek(file_size - _FOOTER_SIZE - header_size)
+    header = json.loads(f.read(header_size).decode('utf-8'))
+    if header['version'] > _FORMAT_VERSION:
+        raise ValueError(
+            "The version (%d) of mmap state dict file %s is not supported, "
+            "the max supported version is %d." %
+            (header['version'], path, _FORMAT_VERSION))
+    return header
+
+
+def load_mmap_state_dict(path, keys=None, use_mmap=False):
+    """
+    Load the state dict saved by `save_mmap_state_dict` from `path`.
+
+    Args:
+        path(str): the file path to load.
+        keys(list|set, optional): only the values of these keys are loaded,
+            and the data of other tensors is never read. The keys which do
+            not exist in the file are ignored. Default: None, load all.
+        use_mmap(bool, optional): If True, the tensors are returned as
+            read-only numpy.memmap, whose data is only read from disk when
+            it is accessed, and shared among the processes mapping the same
+            file. Otherwise the tensors are read into memory. Default: False.
+
+    Returns:
+        dict: the loaded state dict, tensors are numpy.ndarray.
+    """
+    if keys is not None:
+        keys = set(keys)
+    result = {}
+    with open(path, 'rb') as f:
+        header = _read_header(f, path)
+        objects = None
+        for key, kind in header['keys']:
+            if keys is not None and key not in keys:
+                continue
+            if kind == _OBJECT:
+                if objects is None:
+                    f.seek(header['objects']['offset'])
+                    data = f.read(header['objects']['nbytes'])
+                    objects = pickle.loads(data) if six.PY2 else pickle.loads(
+                        data, encoding='latin1')
+                result[key] = objects[key]
+                continue
+
+            meta = header['tensors'][key]
+            dtype = np.dtype(meta['dtype'])
+            shape = tuple(meta['shape'])
+            if meta['nbytes'] == 0:
+                result[key] = np.empty(shape, dtype=dtype)
+            elif use_mmap:
+                result[key] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode='r',
+                    offset=meta['offset'],
+                    shape=shape)
+            else:
+                f.seek(meta['offset'])
+                count = meta['nbytes'] // dtype.itemsize
+                result[key] = np.fromfile(
+                    f, dtype=dtype, count=count).reshape(shape)
+    return result
@@ -0,0 +1,68 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import time
+
+import paddle
+import paddle.fluid as fluid
+
+# Measure the time of append_backward on deep programs. With the indexed
+# renaming in backward.py, the time per layer should stay roughly constant
+# as the depth grows.
+
+
+def build_forward(num_layers, share_weight):
+    main_program = fluid.Program()
+    startup_program = fluid.Program()
+    with fluid.program_guard(main_program, startup_program):
+        x = fluid.data(name='x', shape=[None, 16], dtype='float32')
+        shared_w = fluid.layers.create_parameter(
+            shape=[16, 16], dtype='float32')
+        out = x
+        for _ in range(num_layers):
+            if share_weight:
+                hidden = fluid.layers.matmul(out, shared_w)
+            else:
+                hidden = fluid.layers.fc(out, 16)
+            # every output is used twice, so its gradient is accumulated
+            out = fluid.layers.elementwise_add(hidden, fluid.layers.relu(out))
+        loss = fluid.layers.mean(out)
+    return main_program, startup_program, loss
+
+
+def benchmark(num_layers, share_weight):
+    main_program, startup_program, loss = build_forward(num_layers,
+                                                        share_weight)
+    with fluid.program_guard(main_program, startup_program):
+        start = time.time()
+        fluid.backward.append_backward(loss)
+        elapse = time.time() - start
+    return elapse, len(main_program.global_block().ops)
+
+
+def main():
+    paddle.enable_static()
+    for share_weight in [False, True]:
+        for num_layers in [250, 500, 1000, 2000]:
+            elapse, op_num = benchmark(num_layers, share_weight)
+            print("share_weight={:<5} layers={:<5} ops={:<6} "
+                  "append_backward={:.3f}s per_layer={:.3f}ms".format(
+                      str(share_weight), num_layers, op_num, elapse,
+                      elapse * 1000.0 / num_layers))
+
+
+if __name__ == '__main__':
+    main()
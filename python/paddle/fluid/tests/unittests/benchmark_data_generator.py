@@ -0,0 +1,78 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import io
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+import paddle.distributed.fleet as fleet
+
+# Measure the lines/sec of MultiSlotDataGenerator.run_from_stdin on CTR-like
+# lines of 1 label, 13 dense and 26 sparse features, in the serial text mode
+# and the chunked multi-process text and binary modes.
+
+LINE_NUM = 200000
+
+
+class CTRDataGenerator(fleet.MultiSlotDataGenerator):
+    def generate_sample(self, line):
+        def data_iter():
+            fields = line.split()
+            yield ("click", [int(fields[0])]), \
+                ("dense", [float(x) for x in fields[1:14]]), \
+                ("sparse", [int(x) for x in fields[14:]])
+
+        return data_iter
+
+
+def make_lines():
+    rng = np.random.RandomState(0)
+    return "".join("{} {} {}\n".format(
+        rng.randint(2), " ".join("%.4f" % x for x in rng.rand(13)), " ".join(
+            str(x) for x in rng.randint(0, 2**40, 26)))
+                   for _ in range(LINE_NUM))
+
+
+def benchmark(text, **kwargs):
+    stdin, stdout = sys.stdin, sys.stdout
+    out = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    try:
+        sys.stdin = io.StringIO(text)
+        sys.stdout = out
+        start = time.time()
+        CTRDataGenerator().run_from_stdin(**kwargs)
+        out.flush()
+        elapsed = time.time() - start
+    finally:
+        sys.stdin, sys.stdout = stdin, stdout
+    return LINE_NUM / elapsed
+
+
+def main():
+    text = make_lines()
+    num_workers = multiprocessing.cpu_count()
+    print("serial text:            {:>10.0f} lines/s".format(benchmark(text)))
+    for binary in [False, True]:
+        print("{} workers {:<11}{:>10.0f} lines/s".format(
+            num_workers, "binary:" if binary else "text:",
+            benchmark(
+                text, num_workers=num_workers, binary=binary)))
+
+
+if __name__ == '__main__':
+    main()
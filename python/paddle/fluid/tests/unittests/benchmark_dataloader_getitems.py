@@ -0,0 +1,70 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import time
+
+import numpy as np
+import paddle
+from paddle.io import DataLoader, TensorDataset
+from paddle.fluid.dataloader.collate import default_collate_fn
+
+# Compare the samples/sec of DataLoader on TensorDataset, fetching
+# mini-batch by Dataset.__getitems__ or by __getitem__ per sample. A
+# collate_fn wrapping default_collate_fn disables __getitems__.
+
+SAMPLE_NUM = 8192
+FEATURE_SIZE = 256
+
+
+def per_sample_collate_fn(batch):
+    return default_collate_fn(batch)
+
+
+def benchmark(dataset, batch_size, collate_fn):
+    loader = DataLoader(
+        dataset,
+        batch_size=batch_size,
+        shuffle=True,
+        drop_last=True,
+        collate_fn=collate_fn)
+    # warm up
+    for _ in loader:
+        break
+    start = time.time()
+    sample_num = 0
+    for data in loader:
+        sample_num += data[0].shape[0]
+    return sample_num / (time.time() - start)
+
+
+def main():
+    paddle.disable_static(paddle.CPUPlace())
+    features = paddle.to_tensor(
+        np.random.random([SAMPLE_NUM, FEATURE_SIZE]).astype('float32'))
+    labels = paddle.to_tensor(
+        np.random.randint(0, 10, [SAMPLE_NUM, 1]).astype('int64'))
+    dataset = TensorDataset([features, labels])
+
+    for batch_size in [32, 128, 512]:
+        batched = benchmark(dataset, batch_size, None)
+        per_sample = benchmark(dataset, batch_size, per_sample_collate_fn)
+        print("batch_size={:<4} __getitems__={:>10.1f} samples/s "
+              "__getitem__={:>10.1f} samples/s speedup={:.2f}x".format(
+                  batch_size, batched, per_sample, batched / per_sample))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import time
+
+import paddle
+
+# Time Layer.state_dict and Layer.parameters on a model of 1000 blocks,
+# walking the sublayers or reusing the cached flat index (use_cache=True).
+
+BLOCK_NUM = 1000
+REPEAT = 10
+
+
+class Block(paddle.nn.Layer):
+    def __init__(self):
+        super(Block, self).__init__()
+        self.linear = paddle.nn.Linear(4, 4)
+        self.norm = paddle.nn.BatchNorm1D(4)
+
+    def forward(self, x):
+        return self.norm(self.linear(x))
+
+
+def timeit(fn):
+    fn()
+    start = time.time()
+    for _ in range(REPEAT):
+        fn()
+    return (time.time() - start) / REPEAT * 1000
+
+
+def main():
+    paddle.disable_static(paddle.CPUPlace())
+    model = paddle.nn.Sequential(*[Block() for _ in range(BLOCK_NUM)])
+    print("blocks={} state_dict entries={} parameters={}".format(
+        BLOCK_NUM, len(model.state_dict()), len(model.parameters())))
+
+    for name, fn in [
+        ("state_dict", lambda: model.state_dict()),
+        ("state_dict(use_cache=True)",
+         lambda: model.state_dict(use_cache=True)),
+        ("parameters", lambda: model.parameters()),
+        ("parameters(use_cache=True)",
+         lambda: model.parameters(use_cache=True)),
+    ]:
+        print("{:<28} {:>8.2f} ms".format(name, timeit(fn)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import time
+
+import numpy as np
+import paddle
+
+# Measure the cost of one `update` of the streaming metrics in
+# paddle.metric on numpy inputs, for batch sizes up to 1M samples.
+
+BATCH_SIZES = [128, 4096, 131072, 1048576]
+REPEAT = 5
+
+
+def benchmark(metric, pred, label):
+    metric.update(pred, label)
+    start = time.time()
+    for _ in range(REPEAT):
+        metric.update(pred, label)
+    return (time.time() - start) / REPEAT * 1000
+
+
+def main():
+    np.random.seed(2020)
+    for batch_size in BATCH_SIZES:
+        prob = np.random.random([batch_size, 1])
+        label = (np.random.random([batch_size, 1]) < prob).astype('int64')
+        auc_pred = np.concatenate([1 - prob, prob], axis=1)
+        cost = [
+            benchmark(paddle.metric.Precision(), prob, label),
+            benchmark(paddle.metric.Recall(), prob, label),
+            benchmark(paddle.metric.Auc(), auc_pred, label),
+        ]
+        print("batch_size={:<8} Precision={:>9.3f} ms Recall={:>9.3f} ms "
+              "Auc={:>9.3f} ms".format(batch_size, *cost))
+
+
+if __name__ == '__main__':
+    main()
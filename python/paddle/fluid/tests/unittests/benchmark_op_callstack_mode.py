@@ -0,0 +1,65 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import time
+
+import paddle
+import paddle.fluid as fluid
+from paddle.fluid.framework import _op_callstack_guard
+from paddle.vision.models import resnet50, mobilenet_v1, mobilenet_v2
+
+# Measure the time and the ProgramDesc size of building the training program
+# of vision models under different op callstack modes.
+
+
+def build_program(model_fn):
+    main_program = fluid.Program()
+    startup_program = fluid.Program()
+    with fluid.program_guard(main_program, startup_program):
+        with fluid.unique_name.guard():
+            image = paddle.static.data(
+                name='image', shape=[None, 3, 224, 224], dtype='float32')
+            label = paddle.static.data(
+                name='label', shape=[None, 1], dtype='int64')
+            out = model_fn()(image)
+            loss = paddle.mean(paddle.nn.functional.cross_entropy(out, label))
+            paddle.optimizer.Momentum(learning_rate=0.1).minimize(loss)
+    return main_program
+
+
+def benchmark(model_fn, mode, repeat=3):
+    with _op_callstack_guard(mode):
+        start = time.time()
+        for _ in range(repeat):
+            program = build_program(model_fn)
+        elapse = (time.time() - start) / repeat
+    size = len(program.desc.serialize_to_string())
+    return elapse, size, len(program.global_block().ops)
+
+
+def main():
+    paddle.enable_static()
+    for name, model_fn in [('resnet50', resnet50),
+                           ('mobilenet_v1', mobilenet_v1),
+                           ('mobilenet_v2', mobilenet_v2)]:
+        for mode in ['full', 'user', 'none']:
+            elapse, size, op_num = benchmark(model_fn, mode)
+            print("{:<14} mode={:<5} ops={:<6} build={:.3f}s desc={:.2f}MB".
+                  format(name, mode, op_num, elapse, size / 1024.0 / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
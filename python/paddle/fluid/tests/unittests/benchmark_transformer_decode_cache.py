@@ -0,0 +1,65 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import time
+
+import numpy as np
+import paddle
+from paddle.nn import MultiHeadAttention, TransformerDecoderLayer, TransformerDecoder
+
+# Compare the tokens/sec of step by step decoding on CPU with
+# TransformerDecoder, caching the self attention keys and values by
+# MultiHeadAttention.Cache, which concatenates the history on every step,
+# or by MultiHeadAttention.PreallocatedCache, which writes in place on CPU.
+
+BATCH_SIZE = 4
+D_MODEL = 256
+N_HEAD = 8
+NUM_LAYERS = 4
+SOURCE_LENGTH = 32
+
+
+def benchmark(decoder, memory, steps, cache_type):
+    if cache_type == MultiHeadAttention.PreallocatedCache:
+        cache = decoder.gen_cache(memory, type=cache_type, max_length=steps)
+    else:
+        cache = decoder.gen_cache(memory)
+    step_input = paddle.rand([BATCH_SIZE, 1, D_MODEL])
+    start = time.time()
+    for _ in range(steps):
+        step_input, cache = decoder(step_input, memory, cache=cache)
+    return BATCH_SIZE * steps / (time.time() - start)
+
+
+def main():
+    paddle.disable_static(paddle.CPUPlace())
+    decoder_layer = TransformerDecoderLayer(
+        D_MODEL, N_HEAD, 4 * D_MODEL, dropout=0.)
+    decoder = TransformerDecoder(decoder_layer, NUM_LAYERS)
+    decoder.eval()
+    memory = paddle.rand([BATCH_SIZE, SOURCE_LENGTH, D_MODEL])
+
+    for steps in [256, 1024]:
+        concat = benchmark(decoder, memory, steps, MultiHeadAttention.Cache)
+        preallocated = benchmark(decoder, memory, steps,
+                                 MultiHeadAttention.PreallocatedCache)
+        print("steps={:<5} Cache={:>10.1f} tokens/s "
+              "PreallocatedCache={:>10.1f} tokens/s speedup={:.2f}x".format(
+                  steps, concat, preallocated, preallocated / concat))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import paddle
+import paddle.nn as nn
+
+# Measure the per call latency of the TranslatedLayer loaded by
+# paddle.jit.load for small models in eval mode, where the python overhead
+# of the call is a large part of the latency.
+
+CALL_NUM = 2000
+WARMUP_NUM = 100
+
+
+class MLP(nn.Layer):
+    def __init__(self, in_size, hidden_size, layer_num):
+        super(MLP, self).__init__()
+        sizes = [in_size] + [hidden_size] * layer_num
+        self._linears = nn.LayerList([
+            nn.Linear(sizes[i], sizes[i + 1]) for i in range(layer_num)
+        ])
+
+    def forward(self, x):
+        for linear in self._linears:
+            x = paddle.nn.functional.relu(linear(x))
+        return x
+
+
+def benchmark(layer, x):
+    for _ in range(WARMUP_NUM):
+        layer(x)
+    costs = []
+    for _ in range(CALL_NUM):
+        start = time.time()
+        layer(x)
+        costs.append(time.time() - start)
+    return np.percentile(costs, [50, 99]) * 1e6
+
+
+def main():
+    paddle.disable_static(paddle.CPUPlace())
+    model_dir = tempfile.mkdtemp()
+    try:
+        for layer_num in [1, 4, 16]:
+            layer = MLP(16, 16, layer_num)
+            layer = paddle.jit.to_static(
+                layer,
+                input_spec=[
+                    paddle.static.InputSpec(
+                        shape=[None, 16], dtype='float32')
+                ])
+            model_path = "{}/mlp_{}".format(model_dir, layer_num)
+            paddle.jit.save(layer, model_path)
+            translated_layer = paddle.jit.load(model_path)
+            translated_layer.eval()
+
+            x = paddle.randn([1, 16], 'float32')
+            p50, p99 = benchmark(translated_layer, x)
+            print("layer_num={:<3} p50={:>8.1f} us p99={:>8.1f} us".format(
+                layer_num, p50, p99))
+    finally:
+        shutil.rmtree(model_dir)
+
+
+if __name__ == '__main__':
+    main()
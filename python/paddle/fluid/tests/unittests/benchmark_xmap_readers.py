@@ -0,0 +1,70 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import time
+
+import numpy as np
+import paddle
+
+# Compare the samples/sec of paddle.reader.xmap_readers mapping samples by
+# threads and by processes, with a CPU bound mapper holding the GIL and
+# returning a 3x224x224 float32 image.
+
+SAMPLE_NUM = 512
+IMAGE_SHAPE = [3, 224, 224]
+
+
+def reader():
+    for i in range(SAMPLE_NUM):
+        yield i
+
+
+def mapper(i):
+    # a pure python loop as the decoding and augmentation
+    s = 0
+    for j in range(20000):
+        s += j * i
+    return np.full(IMAGE_SHAPE, s % 255, dtype='float32'), i
+
+
+def benchmark(process_num, order, use_process):
+    xreader = paddle.reader.xmap_readers(
+        mapper,
+        reader,
+        process_num,
+        4 * process_num,
+        order=order,
+        use_process=use_process)
+    start = time.time()
+    sample_num = 0
+    for _ in xreader():
+        sample_num += 1
+    return sample_num / (time.time() - start)
+
+
+def main():
+    for order in [False, True]:
+        for process_num in [1, 2, 4, 8]:
+            threads = benchmark(process_num, order, False)
+            processes = benchmark(process_num, order, True)
+            print("order={:<5} workers={:<2} threads={:>8.1f} samples/s "
+                  "processes={:>8.1f} samples/s speedup={:.2f}x".format(
+                      str(order), process_num, threads, processes, processes /
+                      threads))
+
+
+if __name__ == '__main__':
+    main()
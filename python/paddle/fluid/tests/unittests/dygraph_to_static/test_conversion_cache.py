@@ -0,0 +1,113 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import inspect
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import paddle
+import paddle.fluid as fluid
+from paddle.fluid.dygraph.dygraph_to_static import ProgramTranslator
+from paddle.fluid.dygraph.dygraph_to_static.origin_info import global_origin_info_map
+from paddle.fluid.dygraph.dygraph_to_static.program_translator import FunctionCache
+
+
+def dyfunc_with_if(x):
+    x = fluid.dygraph.to_variable(x)
+    if fluid.layers.mean(x) > 0:
+        y = x + 1
+    else:
+        y = x - 1
+    return y
+
+
+class TestConversionCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def origin_infos(self, static_func):
+        filepath = inspect.getsourcefile(static_func)
+        return sorted((loc[1], str(info))
+                      for loc, info in global_origin_info_map.items()
+                      if loc[0] == filepath)
+
+    def test_reuse_across_function_caches(self):
+        # Each FunctionCache acts as a new process sharing the cache dir.
+        first = FunctionCache()
+        first.set_cache_dir(self.cache_dir)
+        first_func = first.convert_with_cache(dyfunc_with_if)
+        info = first.cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.misses, 1)
+        self.assertGreater(info.conversion_time, 0)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        second = FunctionCache()
+        second.set_cache_dir(self.cache_dir)
+        second_func = second.convert_with_cache(dyfunc_with_if)
+        info = second.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 0)
+        self.assertEqual(info.errors, 0)
+        self.assertEqual(second._code_to_ast_caches, {})
+
+        self.assertEqual(
+            inspect.getsource(first_func), inspect.getsource(second_func))
+        self.assertEqual(
+            self.origin_infos(first_func), self.origin_infos(second_func))
+
+    def test_corrupted_cache_file(self):
+        first = FunctionCache()
+        first.set_cache_dir(self.cache_dir)
+        first.convert_with_cache(dyfunc_with_if)
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'w') as f:
+                f.write("{")
+
+        second = FunctionCache()
+        second.set_cache_dir(self.cache_dir)
+        second.convert_with_cache(dyfunc_with_if)
+        info = second.cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.errors, 1)
+
+    def test_disabled(self):
+        cache = FunctionCache()
+        cache.set_cache_dir(None)
+        self.assertIsNone(cache.cache_info())
+
+    def test_program_translator(self):
+        program_translator = ProgramTranslator()
+        program_translator.set_conversion_cache_dir(self.cache_dir)
+        try:
+            x = np.ones([2, 2]).astype('float32')
+            with fluid.dygraph.guard():
+                static_out = program_translator.get_output(dyfunc_with_if, x)
+            self.assertIsNotNone(program_translator.get_conversion_cache_info())
+            np.testing.assert_allclose(static_out.numpy(), x + 1)
+        finally:
+            program_translator.set_conversion_cache_dir(None)
+        self.assertIsNone(program_translator.get_conversion_cache_info())
+
+
+if __name__ == '__main__':
+    unittest.main()
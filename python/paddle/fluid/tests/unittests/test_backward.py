@@ -327,6 +327,45 @@ class TestAppendBackwardWithError(unittest.TestCase):
                 loss=self.avg_loss, callbacks=callback)
 
 
+class TestAddupRepetitiveOutputs(unittest.TestCase):
+    def test_shared_parameter(self):
+        main_program = fluid.Program()
+        startup_program = fluid.Program()
+        num_layers = 20
+        with fluid.program_guard(main_program, startup_program):
+            x = fluid.data(name='x', shape=[None, 8], dtype='float32')
+            weight = fluid.layers.create_parameter(
+                shape=[8, 8], dtype='float32', name='shared_w')
+            out = x
+            for _ in range(num_layers):
+                out = fluid.layers.matmul(out, weight)
+            loss = fluid.layers.mean(out)
+            fluid.backward.append_backward(loss)
+
+        ops = main_program.global_block().ops
+        weight_grad = 'shared_w@GRAD'
+        # all the renamed gradients of the shared weight are accumulated
+        # into its gradient by the last accumulation op.
+        renamed_grads = set()
+        for op in ops:
+            if op.type == 'matmul_grad':
+                renamed_grads.update(
+                    name for name in op.output_arg_names
+                    if name.startswith(weight_grad + '@RENAME@'))
+        self.assertEqual(len(renamed_grads), num_layers)
+        writers = [op for op in ops if weight_grad in op.output_arg_names]
+        self.assertEqual(len(writers), 1)
+        self.assertIn(writers[0].type, ['sum', 'grad_add'])
+
+        place = fluid.CPUPlace()
+        exe = fluid.Executor(place)
+        exe.run(startup_program)
+        grad, = exe.run(main_program,
+                        feed={'x': np.ones([2, 8], dtype='float32')},
+                        fetch_list=[weight_grad])
+        self.assertEqual(grad.shape, (8, 8))
+
+
 # TODO(Aurelius84): add conditional network test
 class ConditionalNet(BackwardNet):
     def __init__(self):
@@ -20,7 +20,7 @@ import numpy as np
 import paddle.fluid as fluid
 from paddle.io import BatchSampler, Dataset, Sampler, SequenceSampler, \
                         RandomSampler, WeightedRandomSampler
-from paddle.io import DistributedBatchSampler
+from paddle.io import DistributedBatchSampler, BucketBatchSampler
 
 
 class RandomDataset(Dataset):
@@ -279,5 +279,127 @@ class TestWeightedRandomSampler(unittest.TestCase):
             self.assertTrue(True)
 
 
+class TestDistributedBatchSamplerLazy(unittest.TestCase):
+    def setUp(self):
+        self.num_samples = 103
+        self.batch_size = 8
+        self.nranks = 3
+        self.dataset = RandomDataset(self.num_samples, 10)
+
+    def samplers(self, **kwargs):
+        return [
+            DistributedBatchSampler(
+                self.dataset,
+                batch_size=self.batch_size,
+                num_replicas=self.nranks,
+                rank=rank,
+                **kwargs) for rank in range(self.nranks)
+        ]
+
+    def test_same_as_eager(self):
+        for drop_last in [False, True]:
+            lazy_samplers = self.samplers(drop_last=drop_last, lazy=True)
+            eager_samplers = self.samplers(drop_last=drop_last)
+            for lazy_sampler, eager_sampler in zip(lazy_samplers,
+                                                   eager_samplers):
+                batches = list(lazy_sampler)
+                self.assertEqual(len(batches), len(lazy_sampler))
+                for batch in batches:
+                    self.assertTrue(isinstance(batch, np.ndarray))
+                self.assertEqual([batch.tolist() for batch in batches],
+                                 list(eager_sampler))
+
+    def test_shuffle(self):
+        indices = []
+        for sampler in self.samplers(shuffle=True, lazy=True):
+            for batch in sampler:
+                indices.extend(batch.tolist())
+        self.assertEqual(sorted(set(indices)), list(range(self.num_samples)))
+        self.assertNotEqual(indices[:self.batch_size],
+                            list(range(self.batch_size)))
+
+    def test_resume(self):
+        sampler = self.samplers(shuffle=True, lazy=True)[1]
+        sampler.set_epoch(3)
+        batches = list(sampler)
+        self.assertEqual(sampler.epoch, 4)
+
+        sampler.set_epoch(3)
+        sampler.set_step(2)
+        resumed = list(sampler)
+        self.assertEqual(len(resumed), len(batches) - 2)
+        for batch, resumed_batch in zip(batches[2:], resumed):
+            self.assertTrue(np.array_equal(batch, resumed_batch))
+
+        # the step is only skipped once
+        sampler.set_epoch(3)
+        self.assertEqual(len(list(sampler)), len(batches))
+
+
+class TestBucketBatchSampler(unittest.TestCase):
+    def setUp(self):
+        self.lengths = np.random.RandomState(0).randint(1, 100, [1000])
+        self.nranks = 2
+
+    def samplers(self, **kwargs):
+        return [
+            BucketBatchSampler(
+                self.lengths, num_replicas=self.nranks, rank=rank, **kwargs)
+            for rank in range(self.nranks)
+        ]
+
+    def check_samplers(self, samplers):
+        indices = []
+        rank_batches = []
+        for sampler in samplers:
+            batches = list(sampler)
+            self.assertEqual(len(batches), len(sampler))
+            rank_batches.append(batches)
+            for batch in batches:
+                indices.extend(batch)
+        self.assertEqual(sorted(set(indices)), list(range(len(self.lengths))))
+        self.assertEqual(len(rank_batches[0]), len(rank_batches[1]))
+        return rank_batches
+
+    def test_batch_size(self):
+        for batches in self.check_samplers(
+                self.samplers(
+                    batch_size=16, boundaries=[20, 50], shuffle=True)):
+            for batch in batches:
+                self.assertLessEqual(len(batch), 16)
+                bucket_ids = np.searchsorted(
+                    [20, 50], self.lengths[batch], side='right')
+                self.assertEqual(len(set(bucket_ids)), 1)
+
+    def test_max_tokens(self):
+        rank_batches = self.check_samplers(
+            self.samplers(
+                max_tokens=512, shuffle=True))
+        for batches in rank_batches:
+            for batch in batches:
+                self.assertLessEqual(
+                    self.lengths[batch].max() * len(batch), 512)
+        # the ranks get close token numbers
+        tokens = [
+            sum(self.lengths[batch].max() * len(batch) for batch in batches)
+            for batches in rank_batches
+        ]
+        self.assertLess(abs(tokens[0] - tokens[1]), 0.05 * max(tokens))
+
+    def test_shuffle(self):
+        sampler = BucketBatchSampler(
+            self.lengths, batch_size=16, num_replicas=1, rank=0, shuffle=True)
+        sampler.set_epoch(1)
+        epoch1 = list(sampler)
+        self.assertNotEqual(epoch1, list(sampler))
+        sampler.set_epoch(1)
+        self.assertEqual(epoch1, list(sampler))
+
+    def test_drop_last(self):
+        for sampler in self.samplers(batch_size=16, drop_last=True):
+            for batch in sampler:
+                self.assertEqual(len(batch), 16)
+
+
 if __name__ == '__main__':
     unittest.main()
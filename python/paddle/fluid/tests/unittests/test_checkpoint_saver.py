@@ -22,7 +22,7 @@ import os
 import sys
 
 from paddle.distributed.fleet.utils.fs import LocalFS, HDFSClient
-from paddle.fluid.incubate.checkpoint.checkpoint_saver import CheckpointSaver
+from paddle.fluid.incubate.checkpoint.checkpoint_saver import CheckpointSaver, SerializedState
 
 
 class CheckpointerSaverTest(unittest.TestCase):
@@ -51,6 +51,28 @@ class CheckpointerSaverTest(unittest.TestCase):
 
         fs.delete(dir_path)
 
+    def test_async_save(self):
+        fs = LocalFS()
+        dir_path = "./checkpointsaver_async_test"
+        fs.delete(dir_path)
+
+        s = CheckpointSaver(fs, max_in_flight=2)
+        saved = []
+        for i in range(4):
+            s.async_save_checkpoint(
+                dir_path, [SerializedState("status", str(i))],
+                callback=lambda path, no: saved.append(no))
+        self.assertTrue(s.wait())
+        self.assertEqual(saved, [0, 1, 2, 3])
+        status = s.status()
+        self.assertEqual(status.finished, 4)
+        self.assertEqual(status.in_flight, 0)
+
+        with open("{}/__paddle_checkpoint__.3/status".format(dir_path)) as f:
+            self.assertEqual(f.read(), "3")
+
+        fs.delete(dir_path)
+
 
 if __name__ == '__main__':
     unittest.main()
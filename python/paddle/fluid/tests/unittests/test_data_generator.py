@@ -13,9 +13,12 @@
 import paddle
 import unittest
 import paddle.distributed.fleet as fleet
+import io
 import os
+import struct
 import sys
 import platform
+import numpy as np
 
 
 class MyMultiSlotDataGenerator(fleet.MultiSlotDataGenerator):
@@ -149,5 +152,108 @@ class TestMultiSlotDataGenerator_error_5(unittest.TestCase):
             my_ms_dg.run_from_memory()
 
 
+class MyStdinDataGenerator(fleet.MultiSlotDataGenerator):
+    def generate_sample(self, line):
+        def data_iter():
+            fields = line.split()
+            yield ("label", [int(fields[0])]), \
+                ("dense", [float(x) for x in fields[1:3]]), \
+                ("sparse", [int(x) for x in fields[3:]])
+
+        return data_iter
+
+
+class MyTypeChangeDataGenerator(fleet.MultiSlotDataGenerator):
+    # the slot "value" is int in the first lines, and float since line 50
+    def generate_sample(self, line):
+        def data_iter():
+            i = int(float(line.split()[1]) * 2)
+            yield ("value", [i if i < 50 else i + 0.5]),
+
+        return data_iter
+
+
+def read_binary_records(output):
+    records = []
+    offset = 0
+    while offset < len(output):
+        record_bytes, = struct.unpack_from("<I", output, offset)
+        offset += 4
+        end = offset + record_bytes
+        slots = []
+        while offset < end:
+            slot_type, num = struct.unpack_from("<BI", output, offset)
+            offset += 5
+            dtype = "<f4" if slot_type == 1 else "<u8"
+            slots.append(
+                np.frombuffer(
+                    output, dtype=dtype, count=num, offset=offset))
+            offset += num * np.dtype(dtype).itemsize
+        assert offset == end
+        records.append(slots)
+    return records
+
+
+class TestRunFromStdin(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            "{} {} {} {}\n".format(i % 2, i * 0.5, i + 0.25, " ".join(
+                str(i * j) for j in range(i % 5 + 1))) for i in range(100)
+        ]
+
+    def run_from_stdin(self, generator=MyStdinDataGenerator, **kwargs):
+        stdin, stdout = sys.stdin, sys.stdout
+        buf = io.BytesIO()
+        out = io.TextIOWrapper(buf, write_through=True)
+        try:
+            sys.stdin = io.StringIO(u"".join(self.lines))
+            sys.stdout = out
+            generator().run_from_stdin(**kwargs)
+            out.flush()
+        finally:
+            sys.stdin, sys.stdout = stdin, stdout
+        out.detach()
+        return buf.getvalue()
+
+    @unittest.skipIf(sys.version_info[0] < 3, "io.TextIOWrapper in python3")
+    def test_parallel(self):
+        expected = self.run_from_stdin()
+        self.assertEqual(len(expected.splitlines()), len(self.lines))
+        self.assertEqual(
+            self.run_from_stdin(
+                num_workers=2, chunk_size=7), expected)
+        self.assertEqual(
+            self.run_from_stdin(
+                num_workers=1, chunk_size=7), expected)
+
+    @unittest.skipIf(sys.version_info[0] < 3, "io.TextIOWrapper in python3")
+    def test_binary(self):
+        output = self.run_from_stdin(num_workers=2, chunk_size=7, binary=True)
+        records = read_binary_records(output)
+        self.assertEqual(len(records), len(self.lines))
+        for i, slots in enumerate(records):
+            self.assertEqual([s.dtype.kind for s in slots], ['u', 'f', 'u'])
+            self.assertEqual(slots[0].tolist(), [i % 2])
+            np.testing.assert_allclose(slots[1], [i * 0.5, i + 0.25])
+            self.assertEqual(slots[2].tolist(),
+                             [i * j for j in range(i % 5 + 1)])
+
+    @unittest.skipIf(sys.version_info[0] < 3, "io.TextIOWrapper in python3")
+    def test_binary_type_change(self):
+        # the type of the slot changes in the middle of the stream, and
+        # differs between the worker processes
+        for num_workers in [1, 3]:
+            output = self.run_from_stdin(
+                MyTypeChangeDataGenerator,
+                num_workers=num_workers,
+                chunk_size=7,
+                binary=True)
+            records = read_binary_records(output)
+            self.assertEqual(len(records), len(self.lines))
+            for i, slots in enumerate(records):
+                expected = i if i < 50 else i + 0.5
+                self.assertEqual(slots[0].tolist(), [expected])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,132 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import unittest
+
+import numpy as np
+import paddle
+import paddle.fluid as fluid
+from paddle.fluid.executor import _LRUCache, _get_strong_program_cache_key
+
+paddle.enable_static()
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evict_least_recently_used(self):
+        evicted = []
+        cache = _LRUCache(2, on_evict=lambda k, v: evicted.append(k))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertEqual(evicted, ['b'])
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertIsNone(cache.get('b'))
+
+        info = cache.info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.size, 2)
+
+        cache.set_capacity(1)
+        self.assertEqual(evicted, ['b', 'a'])
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(evicted, ['b', 'a', 'c'])
+
+    def test_unbounded(self):
+        cache = _LRUCache(0)
+        for i in range(100):
+            cache.put(i, i)
+        self.assertEqual(len(cache), 100)
+        self.assertEqual(cache.info().evictions, 0)
+
+
+class TestExecutorProgramCache(unittest.TestCase):
+    def build_program(self):
+        main_program = fluid.Program()
+        startup_program = fluid.Program()
+        with fluid.program_guard(main_program, startup_program):
+            x = fluid.data(name='x', shape=[None, 4], dtype='float32')
+            y = fluid.layers.fc(x, 2)
+            loss = fluid.layers.mean(y)
+        return main_program, startup_program, loss
+
+    def test_cache_key_not_aliased(self):
+        main_program, _, loss = self.build_program()
+        other_program, _, _ = self.build_program()
+        self.assertNotEqual(
+            _get_strong_program_cache_key(main_program, {'x': None}, [loss]),
+            _get_strong_program_cache_key(other_program, {'x': None}, [loss]))
+        self.assertEqual(
+            _get_strong_program_cache_key(main_program, {'x': None}, [loss]),
+            _get_strong_program_cache_key(main_program, {'x': None}, [loss]))
+
+    def test_hit_and_evict(self):
+        exe = fluid.Executor(fluid.CPUPlace())
+        exe.set_program_cache_capacity(2)
+        x_np = np.random.random((3, 4)).astype('float32')
+        scope = fluid.Scope()
+        with fluid.scope_guard(scope):
+            programs = []
+            for _ in range(3):
+                main_program, startup_program, loss = self.build_program()
+                exe.run(startup_program)
+                programs.append((main_program, loss))
+
+            for main_program, loss in programs:
+                for _ in range(2):
+                    out, = exe.run(main_program,
+                                   feed={'x': x_np},
+                                   fetch_list=[loss],
+                                   use_program_cache=True)
+                    self.assertEqual(out.shape, (1, ))
+
+        info = exe.program_cache_info()
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.hits, 3)
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.size, 2)
+        self.assertEqual(info.capacity, 2)
+        # the sub-scope of the evicted program is released
+        self.assertEqual(len(scope._kids()), 2)
+
+    def test_evict_after_drop_kids(self):
+        exe = fluid.Executor(fluid.CPUPlace())
+        exe.set_program_cache_capacity(1)
+        x_np = np.random.random((3, 4)).astype('float32')
+        scope = fluid.Scope()
+        with fluid.scope_guard(scope):
+            for i in range(2):
+                main_program, startup_program, loss = self.build_program()
+                exe.run(startup_program)
+                exe.run(main_program,
+                        feed={'x': x_np},
+                        fetch_list=[loss],
+                        use_program_cache=True)
+                # the sub-scopes are cleared by the user before the eviction
+                scope.drop_kids()
+        self.assertEqual(exe.program_cache_info().evictions, 1)
+
+    def test_invalid_capacity(self):
+        exe = fluid.Executor(fluid.CPUPlace())
+        self.assertRaises(ValueError, exe.set_program_cache_capacity, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -113,6 +113,49 @@ class TestFleetUtil(unittest.TestCase):
         files = fleet.util.get_file_shard(["1", "2", "3"])
         self.assertTrue(len(files) == 2 and "1" in files and "2" in files)
 
+    def test_get_file_shard_by_size(self):
+        import paddle.distributed.fleet as fleet
+        from paddle.distributed.fleet.utils.http_server import KVServer
+
+        role = role_maker.UserDefinedRoleMaker(
+            is_collective=False,
+            init_gloo=False,
+            current_id=1,
+            role=role_maker.Role.WORKER,
+            worker_endpoints=["127.0.0.1:6003", "127.0.0.1:6004"],
+            server_endpoints=["127.0.0.1:6001", "127.0.0.1:6002"])
+        fleet.init(role)
+
+        data_dir = tempfile.mkdtemp()
+        files = []
+        for i, size in enumerate([5, 4, 3, 3]):
+            path = os.path.join(data_dir, str(i))
+            with open(path, "wb") as f:
+                f.write(b"x" * size)
+            files.append(path)
+
+        shard = fleet.util.get_file_shard(files, balance_by_size=True)
+        self.assertEqual(shard, [files[1], files[2]])
+        report = fleet.util.get_file_shard_report()
+        self.assertEqual(report.bytes, [8, 7])
+        self.assertEqual(report.num_files, [2, 2])
+        self.assertAlmostEqual(report.imbalance, 16. / 15.)
+
+        server = KVServer(18090)
+        server.start()
+        try:
+            shard = list(
+                fleet.util.get_file_shard_dynamic(files, "127.0.0.1:18090"))
+            self.assertEqual(shard, files)
+            self.assertEqual(fleet.util.get_file_shard_report().bytes,
+                             [0, 15])
+            # the queue of epoch 0 is empty
+            shard = list(
+                fleet.util.get_file_shard_dynamic(files, "127.0.0.1:18090"))
+            self.assertEqual(shard, [])
+        finally:
+            server.stop()
+
     def test_program_type_trans(self):
         import paddle.distributed.fleet as fleet
         data_dir = self.download_files()
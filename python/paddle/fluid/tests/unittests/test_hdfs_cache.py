@@ -0,0 +1,195 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+import unittest
+
+from paddle.distributed.fleet.utils.fs import HDFSClient, FSFileExistsError, \
+    FSFileNotExistsError
+
+# A fake `hadoop fs` on the local file system, every call is logged into
+# the file calls.log, so the tests can count the invocations.
+FAKE_HADOOP = '''#!{python}
+import os, shutil, sys
+root = {root!r}
+with open(os.path.join(root, '..', 'calls.log'), 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\\n')
+args = [a for a in sys.argv[2:] if not a.startswith('-D')]
+cmd, args = args[0][1:], args[1:]
+
+def local(p):
+    if ':' in p.split('/')[0]:
+        p = p.split(':', 1)[1].lstrip('/')
+    return os.path.join(root, p.lstrip('/'))
+
+def ls_line(p, name):
+    kind = 'd' if os.path.isdir(p) else '-'
+    print('{{}}rwxr-xr-x - u g {{}} 2020-01-01 00:00 {{}}'.format(
+        kind, os.path.getsize(p), name))
+
+ret = 0
+if cmd == 'ls':
+    only_dir = args[:1] == ['-d']
+    for p in args[1:] if only_dir else args:
+        if not os.path.exists(local(p)):
+            print("ls: `{{}}': No such file or directory".format(p))
+            ret = 1
+        elif only_dir or not os.path.isdir(local(p)):
+            ls_line(local(p), p)
+        else:
+            for n in sorted(os.listdir(local(p))):
+                ls_line(os.path.join(local(p), n), p.rstrip('/') + '/' + n)
+elif cmd == 'test':
+    ret = 0 if os.path.isdir(local(args[1])) else 1
+elif cmd == 'mkdir':
+    for p in args:
+        if p == '-p':
+            continue
+        if not os.path.exists(local(p)):
+            os.makedirs(local(p))
+elif cmd == 'put':
+    shutil.copy(args[0], local(args[1]))
+elif cmd == 'get':
+    shutil.copy(local(args[0]), args[1])
+elif cmd == 'touchz':
+    open(local(args[0]), 'w').close()
+elif cmd in ('rm', 'rmr'):
+    p = local(args[0])
+    shutil.rmtree(p) if os.path.isdir(p) else os.remove(p)
+elif cmd == 'mv':
+    shutil.move(local(args[0]), local(args[1]))
+else:
+    ret = 1
+sys.exit(ret)
+'''
+
+
+class TestHDFSClientCache(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("JAVA_HOME", "/usr")
+        self.tmp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.tmp_dir, "root")
+        os.makedirs(self.root)
+        self.hadoop_home = os.path.join(self.tmp_dir, "hadoop")
+        os.makedirs(os.path.join(self.hadoop_home, "bin"))
+        hadoop_bin = os.path.join(self.hadoop_home, "bin", "hadoop")
+        with open(hadoop_bin, "w") as f:
+            f.write(FAKE_HADOOP.format(python=sys.executable, root=self.root))
+        os.chmod(hadoop_bin, os.stat(hadoop_bin).st_mode | stat.S_IEXEC)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def num_calls(self):
+        log = os.path.join(self.tmp_dir, "calls.log")
+        if not os.path.exists(log):
+            return 0
+        with open(log) as f:
+            return len(f.readlines())
+
+    def client(self, **kwargs):
+        return HDFSClient(
+            self.hadoop_home, None, time_out=2000, sleep_inter=100, **kwargs)
+
+    def test_path_types(self):
+        os.makedirs(os.path.join(self.root, "a", "b"))
+        open(os.path.join(self.root, "a", "c"), "w").close()
+        fs = self.client(cache_ttl=60)
+
+        calls = self.num_calls()
+        types = fs.path_types(["hdfs:/a", "hdfs:/a/b", "hdfs:/a/c", "/a/d"])
+        self.assertEqual(types, ['dir', 'dir', 'file', None])
+        self.assertEqual(self.num_calls(), calls + 1)
+
+        self.assertTrue(fs.is_dir("hdfs:/a/b"))
+        self.assertTrue(fs.is_file("/a/c"))
+        self.assertFalse(fs.is_exist("/a/d"))
+        self.assertEqual(self.num_calls(), calls + 1)
+
+    def test_ls_dir_cache(self):
+        os.makedirs(os.path.join(self.root, "ckpt", "0"))
+        os.makedirs(os.path.join(self.root, "ckpt", "1"))
+        open(os.path.join(self.root, "ckpt", "meta"), "w").close()
+        fs = self.client(cache_ttl=60)
+
+        self.assertEqual(fs.ls_dir("/ckpt"), (["0", "1"], ["meta"]))
+        calls = self.num_calls()
+        self.assertEqual(fs.ls_dir("/ckpt"), (["0", "1"], ["meta"]))
+        self.assertTrue(fs.is_dir("/ckpt/1"))
+        self.assertTrue(fs.is_file("/ckpt/meta"))
+        self.assertEqual(self.num_calls(), calls)
+
+        # the writes of this client invalidate the cache
+        fs.mkdirs("/ckpt/2")
+        fs.delete("/ckpt/0")
+        self.assertEqual(fs.ls_dir("/ckpt"), (["1", "2"], ["meta"]))
+        self.assertFalse(fs.is_exist("/ckpt/0"))
+
+    def test_cache_ttl(self):
+        fs = self.client(cache_ttl=0.2)
+        self.assertFalse(fs.is_exist("/a"))
+        # written by others
+        os.makedirs(os.path.join(self.root, "a"))
+        self.assertFalse(fs.is_exist("/a"))
+        time.sleep(0.3)
+        self.assertTrue(fs.is_exist("/a"))
+
+    def test_no_cache(self):
+        fs = self.client()
+        fs.mkdirs("/a")
+        calls = self.num_calls()
+        self.assertTrue(fs.is_exist("/a"))
+        self.assertTrue(fs.is_exist("/a"))
+        self.assertEqual(self.num_calls(), calls + 2)
+
+    def test_upload_dir_and_download_files(self):
+        local_dir = os.path.join(self.tmp_dir, "local")
+        os.makedirs(os.path.join(local_dir, "sub"))
+        names = ["sub/x", "y", "z"]
+        for name in names:
+            with open(os.path.join(local_dir, name), "w") as f:
+                f.write(name)
+
+        fs = self.client(cache_ttl=60, num_workers=3)
+        fs.upload_dir(local_dir, "/model")
+        self.assertEqual(fs.ls_dir("/model"), (["sub"], ["y", "z"]))
+        self.assertEqual(fs.ls_dir("/model/sub"), ([], ["x"]))
+
+        download_dir = os.path.join(self.tmp_dir, "download")
+        paths = fs.download_files(["/model/" + n for n in names], download_dir)
+        for name, path in zip(names, paths):
+            with open(path) as f:
+                self.assertEqual(f.read(), name)
+
+        self.assertRaises(FSFileNotExistsError, fs.download_files,
+                          ["/model/none"], download_dir)
+
+        # the remote files are not overwritten, as upload
+        with open(os.path.join(local_dir, "y"), "w") as f:
+            f.write("new")
+        self.assertRaises(FSFileExistsError, fs.upload_dir, local_dir,
+                          "/model")
+        with open(os.path.join(self.root, "model", "y")) as f:
+            self.assertEqual(f.read(), "y")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,35 @@ class TestImperativeNamedParameters(unittest.TestCase):
 
             self.assertListEqual(expected_named_parameters, named_parameters)
 
+    def test_state_dict_cache(self):
+        with fluid.dygraph.guard():
+            custom = MyLayer(3, 10)
+            model = paddle.nn.Sequential(
+                fluid.Linear(10, 3), paddle.nn.BatchNorm1D(3), custom)
+
+            def check():
+                self.assertListEqual(
+                    list(model.state_dict().items()),
+                    list(model.state_dict(use_cache=True).items()))
+                self.assertListEqual(model.parameters(),
+                                     model.parameters(use_cache=True))
+
+            check()
+            custom.extra = paddle.nn.Linear(3, 3)
+            check()
+            custom.fc.weight = None
+            check()
+            model.add_sublayer('3', paddle.nn.Linear(3, 3))
+            check()
+            del model[1]
+            check()
+            self.assertNotIn('1._mean', model.state_dict(use_cache=True))
+
+            destination = {}
+            self.assertIs(model.state_dict(destination), destination)
+            self.assertListEqual(
+                list(destination), list(model.state_dict().keys()))
+
     def test_dir_layer(self):
         with fluid.dygraph.guard():
 
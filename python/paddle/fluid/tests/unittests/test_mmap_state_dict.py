@@ -0,0 +1,150 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import paddle
+import paddle.fluid as fluid
+from paddle.fluid.mmap_state_dict import is_mmap_state_dict_file, save_mmap_state_dict, load_mmap_state_dict
+
+
+class TestMmapStateDict(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'state.pdparams')
+        self.state_dict = {
+            'w': np.random.random([3, 5]).astype('float32'),
+            'b': np.arange(7).astype('int64'),
+            'scalar': np.array(1.5, dtype='float64'),
+            'empty': np.zeros([0, 4], dtype='float32'),
+            'flag': np.array([True, False]),
+            'lr': {
+                'last_epoch': 3,
+                'last_lr': 0.1
+            },
+            'name': 'linear',
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def check_result(self, result, keys):
+        self.assertEqual(sorted(result.keys()), sorted(keys))
+        for key in keys:
+            expected = self.state_dict[key]
+            if isinstance(expected, np.ndarray):
+                self.assertEqual(result[key].dtype, expected.dtype)
+                self.assertEqual(result[key].shape, expected.shape)
+                self.assertTrue(np.array_equal(result[key], expected))
+            else:
+                self.assertEqual(result[key], expected)
+
+    def test_save_load(self):
+        save_mmap_state_dict(self.state_dict, self.path)
+        self.assertTrue(is_mmap_state_dict_file(self.path))
+        for use_mmap in [False, True]:
+            result = load_mmap_state_dict(self.path, use_mmap=use_mmap)
+            self.check_result(result, list(self.state_dict.keys()))
+
+    def test_load_keys(self):
+        save_mmap_state_dict(self.state_dict, self.path)
+        result = load_mmap_state_dict(
+            self.path, keys=['w', 'lr', 'not_exist'], use_mmap=True)
+        self.check_result(result, ['w', 'lr'])
+        self.assertTrue(isinstance(result['w'], np.memmap))
+
+    def test_to_ndarray(self):
+        state_dict = {'w': [1.0, 2.0], 'other': [3]}
+        save_mmap_state_dict(
+            state_dict,
+            self.path,
+            to_ndarray=lambda v: np.array(v, 'float32') if len(v) == 2 else None)
+        result = load_mmap_state_dict(self.path)
+        self.assertTrue(np.array_equal(result['w'], np.array([1.0, 2.0])))
+        self.assertEqual(result['other'], [3])
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a mmap state dict file')
+        self.assertFalse(is_mmap_state_dict_file(self.path))
+
+        save_mmap_state_dict(self.state_dict, self.path)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        with open(self.path, 'wb') as f:
+            f.write(data[:-4])
+        self.assertRaises(ValueError, load_mmap_state_dict, self.path)
+
+    def test_invalid_key(self):
+        self.assertRaises(TypeError, save_mmap_state_dict, {1: np.zeros([1])},
+                          self.path)
+
+
+class TestStaticSaveLoadMmap(unittest.TestCase):
+    def test_save_load_program_state(self):
+        paddle.enable_static()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            main_program = fluid.Program()
+            startup_program = fluid.Program()
+            scope = fluid.Scope()
+            with fluid.scope_guard(scope):
+                with fluid.program_guard(main_program, startup_program):
+                    x = fluid.data(name='x', shape=[None, 4], dtype='float32')
+                    y = fluid.layers.fc(x, 3)
+                    loss = fluid.layers.mean(y)
+                    fluid.optimizer.Adam(learning_rate=0.01).minimize(loss)
+                exe = fluid.Executor(fluid.CPUPlace())
+                exe.run(startup_program)
+                model_path = os.path.join(temp_dir, 'model')
+                fluid.save(main_program, model_path, use_mmap=True)
+                self.assertTrue(
+                    is_mmap_state_dict_file(model_path + '.pdparams'))
+
+                params = main_program.all_parameters()
+                expected = dict((p.name, np.array(scope.find_var(p.name)
+                                                  .get_tensor()))
+                                for p in params)
+
+                state = fluid.io.load_program_state(model_path)
+                for name, value in expected.items():
+                    self.assertTrue(np.array_equal(state[name], value))
+                self.assertGreater(len(state), len(expected))
+
+                state = fluid.io.load_program_state(
+                    model_path, var_list=params[:1])
+                self.assertEqual(list(state.keys()), [params[0].name])
+
+                for p in params:
+                    scope.find_var(p.name).get_tensor().set(
+                        np.zeros_like(expected[p.name]), fluid.CPUPlace())
+                fluid.load(main_program, model_path, exe)
+                for name, value in expected.items():
+                    self.assertTrue(
+                        np.array_equal(
+                            np.array(scope.find_var(name).get_tensor()),
+                            value))
+        finally:
+            shutil.rmtree(temp_dir)
+            paddle.disable_static()
+
+
+if __name__ == '__main__':
+    unittest.main()
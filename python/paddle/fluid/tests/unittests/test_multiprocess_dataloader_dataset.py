@@ -89,6 +89,93 @@ class TestTensorDataset(unittest.TestCase):
             self.run_main(num_workers=0, places=p)
 
 
+class NumpyBatchDataset(Dataset):
+    def __init__(self, sample_num):
+        np.random.seed(0)
+        self.images = np.random.random(
+            [sample_num, IMAGE_SIZE]).astype('float32')
+        self.labels = np.random.randint(0, 9, (sample_num, 1)).astype('int64')
+        self.getitems_called = False
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __getitem__(self, idx):
+        return self.images[idx], self.labels[idx]
+
+    def __getitems__(self, indices):
+        self.getitems_called = True
+        return [self.images[indices], self.labels[indices]]
+
+
+class ScaledNumpyBatchDataset(NumpyBatchDataset):
+    # only overrides __getitem__, the inherited __getitems__ is not used
+    def __getitem__(self, idx):
+        return self.images[idx] * 2, self.labels[idx]
+
+
+class TestGetItemsDataset(unittest.TestCase):
+    def run_main(self, num_workers, collate_fn=None):
+        place = paddle.CPUPlace()
+        with fluid.dygraph.guard(place):
+            dataset = NumpyBatchDataset(20)
+            dataloader = DataLoader(
+                dataset,
+                places=place,
+                num_workers=num_workers,
+                batch_size=4,
+                shuffle=False,
+                collate_fn=collate_fn,
+                drop_last=True)
+
+            for i, (image, label) in enumerate(dataloader()):
+                assert image.shape == [4, IMAGE_SIZE]
+                assert label.shape == [4, 1]
+                assert np.allclose(image.numpy(),
+                                   dataset.images[i * 4:(i + 1) * 4])
+                assert np.allclose(label.numpy(),
+                                   dataset.labels[i * 4:(i + 1) * 4])
+            return dataset
+
+    def test_main(self):
+        for num_workers in [0, 2]:
+            self.run_main(num_workers)
+
+        # __getitems__ is called in main process with single process
+        dataset = self.run_main(num_workers=0)
+        self.assertTrue(dataset.getitems_called)
+
+    def test_with_collate_fn(self):
+        def collate_fn(batch):
+            images = np.stack([b[0] for b in batch])
+            labels = np.stack([b[1] for b in batch])
+            return [images, labels]
+
+        dataset = self.run_main(num_workers=0, collate_fn=collate_fn)
+        self.assertFalse(dataset.getitems_called)
+
+    def test_getitem_only_subclass(self):
+        place = paddle.CPUPlace()
+        with fluid.dygraph.guard(place):
+            dataset = ScaledNumpyBatchDataset(20)
+            dataloader = DataLoader(
+                dataset, places=place, batch_size=4, shuffle=False)
+            for i, (image, label) in enumerate(dataloader()):
+                assert np.allclose(image.numpy(),
+                                   dataset.images[i * 4:(i + 1) * 4] * 2)
+            self.assertFalse(dataset.getitems_called)
+
+    def test_tensor_dataset(self):
+        with fluid.dygraph.guard(paddle.CPUPlace()):
+            input_np = np.random.random([16, 3, 4]).astype('float32')
+            label_np = np.random.random([16, 1]).astype('int32')
+            dataset = TensorDataset(
+                [paddle.to_tensor(input_np), paddle.to_tensor(label_np)])
+            input, label = dataset.__getitems__([3, 0, 5])
+            assert np.allclose(input.numpy(), input_np[[3, 0, 5]])
+            assert np.allclose(label.numpy(), label_np[[3, 0, 5]])
+
+
 class TestComposeDataset(unittest.TestCase):
     def test_main(self):
         paddle.static.default_startup_program().random_seed = 1
@@ -0,0 +1,69 @@
+#   Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import unittest
+
+import paddle
+import paddle.fluid as fluid
+import paddle.fluid.core as core
+from paddle.fluid.framework import _op_callstack_guard
+
+paddle.enable_static()
+
+
+class TestOpCallstackMode(unittest.TestCase):
+    def get_callstack(self, mode):
+        main_program = fluid.Program()
+        with fluid.program_guard(main_program, fluid.Program()):
+            with _op_callstack_guard(mode):
+                x = fluid.data(name='x', shape=[None, 4], dtype='float32')
+                y = fluid.layers.relu(x)
+        op = main_program.global_block().ops[-1]
+        callstack_var_name = \
+            core.op_proto_and_checker_maker.kOpCreationCallstackAttrName()
+        return op.attr(callstack_var_name)
+
+    def test_full(self):
+        callstack = self.get_callstack('full')
+        self.assertEqual(len(callstack) % 2, 0)
+        self.assertGreater(len(callstack), 2)
+        self.assertTrue(any('get_callstack' in line for line in callstack))
+
+    def test_user(self):
+        callstack = self.get_callstack('user')
+        self.assertEqual(len(callstack), 2)
+        self.assertTrue(callstack[0].startswith('  File "'))
+
+    def test_none(self):
+        self.assertEqual(self.get_callstack('none'), [])
+
+    def test_guard_restore(self):
+        from paddle.fluid import framework
+        pre_mode = framework._op_callstack_mode_
+        with _op_callstack_guard('none'):
+            self.assertEqual(framework._op_callstack_mode_, 'none')
+        self.assertEqual(framework._op_callstack_mode_, pre_mode)
+
+    def test_invalid_mode(self):
+        def set_invalid_mode():
+            with _op_callstack_guard('lazy'):
+                pass
+
+        self.assertRaises(ValueError, set_invalid_mode)
+
+
+if __name__ == '__main__':
+    unittest.main()
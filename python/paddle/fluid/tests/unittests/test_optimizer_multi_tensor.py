@@ -0,0 +1,122 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import paddle
+import numpy as np
+from paddle.fluid import unique_name
+
+
+class TestMultiTensorOptimizer(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static(paddle.CPUPlace())
+        self.inputs = [
+            np.random.random([4, 8]).astype('float32') for _ in range(4)
+        ]
+
+    def tearDown(self):
+        paddle.enable_static()
+
+    def build_model(self, state_dict=None):
+        paddle.seed(2020)
+        model = paddle.nn.Sequential(
+            paddle.nn.Linear(8, 16),
+            paddle.nn.ReLU(),
+            paddle.nn.Linear(16, 16), paddle.nn.ReLU(),
+            paddle.nn.Linear(16, 1))
+        if state_dict is not None:
+            model.set_state_dict(state_dict)
+        return model
+
+    def train(self, model, opt, inputs):
+        for x in inputs:
+            loss = paddle.mean(model(paddle.to_tensor(x)))
+            loss.backward()
+            opt.step()
+            opt.clear_grad()
+
+    def check_optimizer(self, opt_class, **kwargs):
+        # build each model and optimizer by a new unique name generator, so
+        # their tensors have the same names.
+        with unique_name.guard():
+            model = self.build_model()
+            opt = opt_class(parameters=model.parameters(), **kwargs)
+            self.train(model, opt, self.inputs[:2])
+        with unique_name.guard():
+            fused_model = self.build_model()
+            fused_opt = opt_class(
+                parameters=fused_model.parameters(),
+                multi_tensor=True,
+                **kwargs)
+            self.train(fused_model, fused_opt, self.inputs[:2])
+        self.assertEqual(len(fused_opt._fused_groups), 1)
+        self.assertTrue(fused_opt._fused_groups[0].valid)
+        self.check_state_dict(model.state_dict(), fused_model.state_dict())
+        self.check_state_dict(opt.state_dict(), fused_opt.state_dict())
+        opt_state_dict = dict((key, value.numpy())
+                              for key, value in opt.state_dict().items())
+
+        # resume the multi tensor optimizer from the state dict
+        self.train(model, opt, self.inputs[2:])
+        with unique_name.guard():
+            resumed_model = self.build_model(fused_model.state_dict())
+            resumed_opt = opt_class(
+                parameters=resumed_model.parameters(),
+                multi_tensor=True,
+                **kwargs)
+            resumed_opt.set_state_dict(opt_state_dict)
+            self.train(resumed_model, resumed_opt, self.inputs[2:])
+        self.check_state_dict(model.state_dict(), resumed_model.state_dict())
+        self.check_state_dict(opt.state_dict(), resumed_opt.state_dict())
+
+    def check_state_dict(self, expected, actual):
+        self.assertEqual(sorted(expected.keys()), sorted(actual.keys()))
+        for key, value in expected.items():
+            if isinstance(value, dict):
+                continue
+            np.testing.assert_allclose(
+                actual[key].numpy(), value.numpy(), rtol=1e-5, atol=1e-6)
+
+    def test_adam(self):
+        self.check_optimizer(paddle.optimizer.Adam, learning_rate=0.01)
+
+    def test_adamw(self):
+        self.check_optimizer(
+            paddle.optimizer.AdamW, learning_rate=0.01, weight_decay=0.01)
+
+    def test_momentum(self):
+        self.check_optimizer(
+            paddle.optimizer.Momentum, learning_rate=0.01, momentum=0.9)
+
+    def test_sgd(self):
+        self.check_optimizer(paddle.optimizer.SGD, learning_rate=0.01)
+
+    def test_partial_gradients(self):
+        model = self.build_model()
+        opt = paddle.optimizer.Adam(
+            learning_rate=0.01,
+            parameters=model.parameters(),
+            multi_tensor=True)
+        # only the last layer has gradients
+        for param in model.parameters()[:-2]:
+            param.stop_gradient = True
+        self.train(model, opt, self.inputs[:1])
+        self.assertFalse(opt._fused_groups[0].valid)
+        for param in model.parameters():
+            param.stop_gradient = False
+        self.train(model, opt, self.inputs[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -140,6 +140,42 @@ class TestSaveLoad(unittest.TestCase):
         with self.assertRaises(ValueError):
             paddle.load("test_paddle_save_load.linear")
 
+    def test_save_load_mmap(self):
+        layer, opt = self.build_and_train_model()
+
+        layer_save_path = "test_paddle_save_load_mmap.linear.pdparams"
+        opt_save_path = "test_paddle_save_load_mmap.linear.pdopt"
+        layer_state_dict = layer.state_dict()
+        opt_state_dict = opt.state_dict()
+
+        paddle.save(layer_state_dict, layer_save_path, use_mmap=True)
+        paddle.save(opt_state_dict, opt_save_path, use_mmap=True)
+
+        for use_mmap in [False, True]:
+            load_layer_state_dict = paddle.load(
+                layer_save_path, use_mmap=use_mmap)
+            load_opt_state_dict = paddle.load(opt_save_path, use_mmap=use_mmap)
+            self.check_load_state_dict(layer_state_dict, load_layer_state_dict)
+            self.check_load_state_dict(opt_state_dict, load_opt_state_dict)
+            self.assertEqual(
+                isinstance(load_layer_state_dict['_linear.weight'], np.memmap),
+                use_mmap)
+
+        load_layer_state_dict = paddle.load(
+            layer_save_path, keep_name_table=True)
+        self.assertEqual(
+            load_layer_state_dict["StructuredToParameterName@@"][
+                '_linear.weight'], layer_state_dict['_linear.weight'].name)
+
+        new_layer = LinearNet()
+        new_layer.set_state_dict(paddle.load(layer_save_path, use_mmap=True))
+        self.check_load_state_dict(layer_state_dict, new_layer.state_dict())
+
+        with self.assertRaises(ValueError):
+            paddle.save(layer_state_dict, layer_save_path, mmap=True)
+        with self.assertRaises(TypeError):
+            paddle.save(layer_state_dict, layer_save_path, use_mmap=1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -163,5 +163,56 @@ class TestProgram(unittest.TestCase):
                           "program")
 
 
+class TestBlockSyncWithCpp(unittest.TestCase):
+    def build_program(self):
+        program = Program()
+        with program_guard(program, Program()):
+            x = fluid.data(name='x', shape=[None, 4], dtype='float32')
+            y = layers.relu(x)
+            z = layers.scale(y, scale=2.0)
+        return program
+
+    def test_sync_ops_changed_in_cpp(self):
+        program = self.build_program()
+        block = program.global_block()
+        origin_ops = list(block.ops)
+
+        # append, prepend and remove ops on the c++ end only
+        block.desc.append_op().set_type('relu')
+        block.desc._prepend_op().set_type('relu')
+        block.desc._remove_op(1, 2)
+        block._sync_with_cpp()
+
+        self.assertEqual(len(block.ops), block.desc.op_size())
+        for idx, op in enumerate(block.ops):
+            self.assertTrue(op.desc == block.desc.op(idx))
+        # the python Operator of unchanged op is kept
+        self.assertTrue(block.ops[1] is origin_ops[1])
+
+    def test_sync_vars_changed_in_cpp(self):
+        program = self.build_program()
+        block = program.global_block()
+        block.desc.var(b'cpp_var')
+        block.desc._remove_var(b'x')
+        block._sync_with_cpp()
+        self.assertTrue(block.has_var('cpp_var'))
+        self.assertFalse(block.has_var('x'))
+
+    def test_revision_updated_by_python_ops(self):
+        program = self.build_program()
+        block = program.global_block()
+        block._sync_with_cpp()
+        synced_op_revision = block._synced_op_revision
+        self.assertEqual(synced_op_revision, block.desc._op_revision())
+
+        # ops added/removed by the python API keep the block in sync
+        block._insert_op(0, type='relu', inputs={'X': ['x']},
+                         outputs={'Out': ['x']})
+        block._remove_op(0)
+        self.assertNotEqual(block._synced_op_revision, synced_op_revision)
+        self.assertEqual(block._synced_op_revision, block.desc._op_revision())
+        self.assertEqual(len(block.ops), block.desc.op_size())
+
+
 if __name__ == '__main__':
     unittest.main()
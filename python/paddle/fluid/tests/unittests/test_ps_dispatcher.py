@@ -15,7 +15,16 @@
 from __future__ import print_function
 
 import unittest
+import paddle.fluid.core as core
 from paddle.fluid.incubate.fleet.parameter_server.ir.ps_dispatcher import RoundRobin, HashName, PSDispatcher
+from paddle.fluid.incubate.fleet.parameter_server.ir.ps_dispatcher import SizeBalanced, ConsistentHash, dispatch_report
+
+
+class SizedVar(object):
+    def __init__(self, name, numel):
+        self.name = name
+        self.shape = [numel]
+        self.dtype = core.VarDesc.VarType.FP32
 
 
 class TestPsDispatcher(unittest.TestCase):
@@ -69,6 +78,66 @@ class TestPsDispatcher(unittest.TestCase):
         eplist = xx.dispatch(vars)
         self.assertEqual(len(eplist), 4)
 
+    def test_hash_grad_with_param(self):
+        xx = HashName(self.points)
+        params = [SizedVar("w_{}.block0".format(i), 8) for i in range(16)]
+        grads = [
+            SizedVar("w_{}@GRAD.trainer_0.block0".format(i), 8)
+            for i in range(16)
+        ]
+        self.assertEqual(xx.dispatch(params), xx.dispatch(grads))
+
+    def test_size_balanced(self):
+        sizes = [1000, 10, 900, 20, 800, 30, 700, 40, 600, 50, 500, 60]
+        grads = [
+            SizedVar("w_{}@GRAD.block0".format(i), size)
+            for i, size in enumerate(sizes)
+        ]
+        params = [
+            SizedVar("w_{}.block0".format(i), size)
+            for i, size in enumerate(sizes)
+        ]
+
+        xx = SizeBalanced(self.points)
+        send_eplist = []
+        for grad in grads:
+            send_eplist.extend(xx.dispatch([grad]))
+        # the params are placed with their grads after reset
+        xx.reset()
+        self.assertEqual(xx.dispatch(params), send_eplist)
+
+        report = xx.load_report()
+        self.assertEqual(sum(report.num_vars.values()), len(sizes))
+        self.assertEqual(sum(report.bytes.values()), sum(sizes) * 4)
+        self.assertLess(report.imbalance, 1.2)
+
+        rr_eplist = RoundRobin(self.points).dispatch(params)
+        rr_report = dispatch_report(self.points, params, rr_eplist)
+        self.assertLess(report.imbalance, rr_report.imbalance)
+
+        # the same vars are placed the same way by another dispatcher
+        yy = SizeBalanced(self.points)
+        self.assertEqual(yy.dispatch(params), send_eplist)
+
+    def test_consistent_hash(self):
+        params = [SizedVar("w_{}.block0".format(i), 8) for i in range(200)]
+        xx = ConsistentHash(self.points)
+        eplist = xx.dispatch(params)
+        self.assertEqual(set(eplist), set(self.points))
+
+        grads = [SizedVar("w_{}@GRAD.block0".format(i), 8) for i in range(200)]
+        self.assertEqual(ConsistentHash(self.points).dispatch(grads), eplist)
+
+        # only the vars moved to the new pserver change their places
+        new_point = "127.0.0.1:1005"
+        yy = ConsistentHash(self.points + [new_point])
+        moved = [(x, y) for x, y in zip(eplist, yy.dispatch(params)) if x != y]
+        self.assertTrue(all(y == new_point for _, y in moved))
+        self.assertLess(len(moved), len(params) / 2)
+
+        with self.assertRaises(ValueError):
+            ConsistentHash(self.points, virtual_nodes=0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -609,6 +609,63 @@ class TestTransformer(unittest.TestCase):
             trans_output = transformer(src, tgt, src_mask, tgt_mask,
                                        memory_mask)
 
+    def test_decoder_preallocated_cache(self):
+        places = [fluid.CPUPlace()]
+        if fluid.core.is_compiled_with_cuda():
+            # the buffers are rebuilt by concat on the device
+            places.append(fluid.CUDAPlace(0))
+        for place in places:
+            self.run_decoder_preallocated_cache(place)
+
+    def run_decoder_preallocated_cache(self, place):
+        batch_size, d_model, n_head, dim_feedforward, _, _, _, source_length, target_length = generate_basic_params(
+            mode="decoder_layer")
+        tgt = np.random.rand(batch_size, target_length,
+                             d_model).astype("float32")
+        memory = np.random.rand(batch_size, source_length,
+                                d_model).astype("float32")
+        with fluid.dygraph.guard(place):
+            decoder_layer = TransformerDecoderLayer(
+                d_model, n_head, dim_feedforward, dropout=0.)
+            decoder = TransformerDecoder(decoder_layer, 2)
+            decoder.eval()
+            memory = paddle.to_tensor(memory)
+            cache = decoder.gen_cache(memory)
+            preallocated_cache = decoder.gen_cache(
+                memory,
+                type=MultiHeadAttention.PreallocatedCache,
+                max_length=target_length)
+            for i in range(target_length):
+                step_input = paddle.to_tensor(tgt[:, i:i + 1, :])
+                output, cache = decoder(step_input, memory, cache=cache)
+                preallocated_output, preallocated_cache = decoder(
+                    step_input, memory, cache=preallocated_cache)
+                np.testing.assert_allclose(
+                    preallocated_output.numpy(),
+                    output.numpy(),
+                    rtol=1e-5,
+                    atol=1e-6)
+                for incremental_cache, _ in preallocated_cache:
+                    self.assertEqual(incremental_cache.length, i + 1)
+
+            # the cache is full
+            self.assertRaises(
+                ValueError,
+                decoder,
+                paddle.to_tensor(tgt[:, :1, :]),
+                memory,
+                cache=preallocated_cache)
+
+            index = paddle.to_tensor(
+                np.arange(batch_size)[::-1].astype("int64"))
+            reordered_cache = preallocated_cache[0][0].reorder(index)
+            self.assertEqual(reordered_cache.length, target_length)
+            np.testing.assert_array_equal(
+                reordered_cache.k.numpy(),
+                preallocated_cache[0][0].k.numpy()[::-1])
+            np.testing.assert_array_equal(
+                reordered_cache.k.numpy(), cache[0][0].k.numpy()[::-1])
+
     def test_generate_square_subsequent_mask(self):
         length = 5
         d_model, n_head, dim_feedforward = 8, 4, 64
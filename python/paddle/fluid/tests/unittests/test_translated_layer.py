@@ -141,6 +141,25 @@ class TestTranslatedLayer(unittest.TestCase):
             msg="original loss:\n{}\nnew loss:\n{}\n".format(orig_loss.numpy(),
                                                              loss.numpy()))
 
+    def test_call_plan_reuse(self):
+        translated_layer = paddle.jit.load(self.model_path)
+        call_plan = translated_layer._call_plans['forward']
+        self.assertEqual(
+            len(call_plan.persistable_vars),
+            len(translated_layer.parameters()))
+
+        translated_layer.eval()
+        x = paddle.randn([2, IMAGE_SIZE], 'float32')
+        y = paddle.randn([2, IMAGE_SIZE], 'float32')
+        pred_x = translated_layer(x)
+        pred_y = translated_layer(y)
+        # the outputs of the calls are different VarBases
+        self.assertIsNot(pred_x, pred_y)
+        self.assertTrue(
+            np.array_equal(pred_x.numpy(), translated_layer(x).numpy()))
+        self.assertFalse(np.array_equal(pred_x.numpy(), pred_y.numpy()))
+        self.assertIs(translated_layer._call_plans['forward'], call_plan)
+
     def test_get_program(self):
         # load
         translated_layer = paddle.jit.load(self.model_path)
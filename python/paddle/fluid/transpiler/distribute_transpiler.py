@@ -41,7 +41,7 @@ import logging
 
 import numpy as np
 
-from .ps_dispatcher import RoundRobin, PSDispatcher
+from .ps_dispatcher import RoundRobin, PSDispatcher, dispatch_report
 from .. import core, framework, unique_name, initializer
 from ..framework import Program, default_main_program, \
     default_startup_program, Block, Parameter, grad_var_name
@@ -153,9 +153,13 @@ class DistributeTranspilerConfig(object):
     .. py:attribute:: split_method (PSDispatcher)
 
           Methods of dispatching parameters for server,
-          :ref:`api_fluid_transpiler_RoundRobin` or
-          :ref:`api_fluid_transpiler_HashName` can be used and default is RoundRobin.
-          Try to choose the best method to balance loads for parameter servers.
+          :ref:`api_fluid_transpiler_RoundRobin`,
+          :ref:`api_fluid_transpiler_HashName`,
+          :ref:`api_fluid_transpiler_SizeBalanced` or
+          :ref:`api_fluid_transpiler_ConsistentHash` can be used and default is RoundRobin.
+          Try to choose the best method to balance loads for parameter servers,
+          the placement is summarized by `DistributeTranspiler.dispatch_report`
+          after `transpile`.
 
     .. py:attribute:: min_block_size (int)
 
@@ -840,6 +844,8 @@ WIKI: https://github.com/PaddlePaddle/Fleet/blob/develop/markdown_doc/transpiler
             recv_vars.append(self.grad_param_mapping[var])
         ps_dispatcher.reset()
         eplist = ps_dispatcher.dispatch(recv_vars)
+        self.dispatch_report = dispatch_report(self.pserver_endpoints,
+                                               recv_vars, eplist)
 
         for i, ep in enumerate(eplist):
             self.param_grad_ep_mapping[ep]["params"].append(recv_vars[i])
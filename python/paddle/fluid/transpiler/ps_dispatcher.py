@@ -14,6 +14,84 @@
 
 from __future__ import print_function
 
+import bisect
+import collections
+import hashlib
+import re
+
+import six
+
+__all__ = [
+    "PSDispatcher", "HashName", "RoundRobin", "SizeBalanced",
+    "ConsistentHash", "DispatchReport", "dispatch_report"
+]
+
+DispatchReport = collections.namedtuple('DispatchReport',
+                                        ['bytes', 'num_vars', 'imbalance'])
+
+# The blocks of a gradient and its parameter share the same key, e.g.
+# fc_0.w_0@GRAD.trainer_0.block1 and fc_0.w_0.block1
+_BLOCK_KEY_PATTERN = re.compile(r"@GRAD|\.trainer_\d+")
+
+
+def _var_name(var):
+    if isinstance(var, six.string_types):
+        return var
+    name = var.name
+    return name() if callable(name) else name
+
+
+def _block_key(var):
+    return _BLOCK_KEY_PATTERN.sub("", _var_name(var))
+
+
+def _block_bytes(var):
+    """
+    The memory size of `var`, the unknown dims count as 1. The vars without
+    shape or dtype, such as names, count as 1 byte.
+    """
+    shape = getattr(var, "shape", None)
+    dtype = getattr(var, "dtype", None)
+    if shape is None or dtype is None:
+        return 1
+    from .. import core
+    numel = 1
+    for dim in shape:
+        numel *= max(int(dim), 1)
+    return numel * core.size_of_dtype(dtype)
+
+
+def _stable_hash(key):
+    # builtin hash() of str is salted per process since python 3.3, so the
+    # trainers and pservers would compute different placements.
+    return int(hashlib.md5(key.encode('utf-8')).hexdigest()[:16], 16)
+
+
+def dispatch_report(pserver_endpoints, varlist, eplist):
+    """
+    Summarize the placement of `varlist` on `eplist`.
+
+    Args:
+        pserver_endpoints (list): list of endpoint(ip:port).
+        varlist (list): a list of Variables.
+        eplist (list): the endpoint of each var in `varlist`.
+
+    Returns:
+        DispatchReport: `bytes` and `num_vars` are OrderedDicts of pserver
+        endpoint -> the bytes and number of the vars placed on it,
+        `imbalance` is the max bytes divided by the mean bytes of the
+        pservers, 1.0 means the load is perfectly balanced.
+    """
+    loads = collections.OrderedDict((ep, 0) for ep in pserver_endpoints)
+    counts = collections.OrderedDict((ep, 0) for ep in pserver_endpoints)
+    for var, ep in zip(varlist, eplist):
+        loads[ep] += _block_bytes(var)
+        counts[ep] += 1
+    total = sum(loads.values())
+    imbalance = max(loads.values()) * len(loads) / float(
+        total) if total > 0 else 1.0
+    return DispatchReport(bytes=loads, num_vars=counts, imbalance=imbalance)
+
 
 class PSDispatcher(object):
     """
@@ -25,6 +103,8 @@ class PSDispatcher(object):
     def __init__(self, pserver_endpoints):
         self._eps = pserver_endpoints
         self._step = 0
+        # block key -> (var, endpoint) of the dispatched vars
+        self._placements = collections.OrderedDict()
 
     @property
     def eps(self):
@@ -43,15 +123,29 @@ class PSDispatcher(object):
         Returns:
             a map of pserver endpoint -> varname
         """
-        AssertionError("Interface has not been implemented.")
+        raise NotImplementedError("Interface has not been implemented.")
+
+    def _record(self, var, ep):
+        self._placements[_block_key(var)] = (var, ep)
+
+    def load_report(self):
+        """
+        Return the DispatchReport of the vars dispatched by this dispatcher,
+        the vars dispatched more than once, such as a gradient and its
+        parameter, are counted once.
+        """
+        varlist = [var for var, _ in self._placements.values()]
+        eplist = [ep for _, ep in self._placements.values()]
+        return dispatch_report(self._eps, varlist, eplist)
 
 
 class HashName(PSDispatcher):
     """
-	:api_attr: Static Graph
+	:api_attr: Static Graph
 
-    Hash variable names to several endpoints using python
-    "hash()" function.
+    Hash variable names to several endpoints using md5, so the result
+    is the same in all the processes. The suffixes "@GRAD" and ".trainer_N"
+    are ignored, thus a gradient is dispatched with its parameter.
 
     Args:
         pserver_endpoints (list): list of endpoint(ip:port).
@@ -62,8 +156,8 @@ class HashName(PSDispatcher):
         pserver_endpoints = ["127.0.0.1:6007", "127.0.0.1:6008"]
         vars = ["var1","var2","var3","var4","var5"]
 
-        rr = RoundRobin(pserver_endpoints)
-        rr.dispatch(vars)
+        hn = HashName(pserver_endpoints)
+        hn.dispatch(vars)
 
     """
 
@@ -71,7 +165,7 @@ class HashName(PSDispatcher):
         super(self.__class__, self).__init__(pserver_endpoints)
 
     def _hash_block(self, block_str, total):
-        return hash(block_str) % total
+        return _stable_hash(block_str) % total
 
     def dispatch(self, varlist):
         """
@@ -82,15 +176,16 @@ class HashName(PSDispatcher):
         """
         eplist = []
         for var in varlist:
-            server_id = self._hash_block(var.name(), len(self._eps))
+            server_id = self._hash_block(_block_key(var), len(self._eps))
             server_for_param = self._eps[server_id]
             eplist.append(server_for_param)
+            self._record(var, server_for_param)
         return eplist
 
 
 class RoundRobin(PSDispatcher):
     """
-	:api_attr: Static Graph
+	:api_attr: Static Graph
 
     Distribute variables to several endpoints using
     RondRobin<https://en.wikipedia.org/wiki/Round-robin_scheduling> method.
@@ -123,7 +218,121 @@ class RoundRobin(PSDispatcher):
         for var in varlist:
             server_for_param = self._eps[self._step]
             eplist.append(server_for_param)
+            self._record(var, server_for_param)
             self._step += 1
             if self._step >= len(self._eps):
                 self._step = 0
         return eplist
+
+
+class SizeBalanced(PSDispatcher):
+    """
+	:api_attr: Static Graph
+
+    Distribute variables to several endpoints by their memory size, so the
+    pservers hold about the same bytes. The vars of one `dispatch` call are
+    placed from the largest to the smallest, each on the pserver with the
+    least bytes so far, ties are broken by the order of the endpoints.
+
+    The placement of a var is remembered even after `reset`, so a gradient
+    and its parameter dispatched by different calls are placed on the same
+    pserver, and the result only depends on the vars, which is the same in
+    all the processes.
+
+    Args:
+        pserver_endpoints (list): list of endpoint(ip:port).
+
+    Examples:
+        .. code-block:: python
+
+        pserver_endpoints = ["127.0.0.1:6007", "127.0.0.1:6008"]
+        vars = ["var1","var2","var3","var4","var5"]
+
+        sb = SizeBalanced(pserver_endpoints)
+        sb.dispatch(vars)
+        print(sb.load_report())
+
+    """
+
+    def __init__(self, pserver_endpoints):
+        super(self.__class__, self).__init__(pserver_endpoints)
+        self._loads = [0] * len(pserver_endpoints)
+
+    def dispatch(self, varlist):
+        """
+        use `SizeBalanced` method to dispatch variables with each parameter server.
+        Args:
+            varlist (list): a list of Variables
+
+        """
+        sizes = [_block_bytes(var) for var in varlist]
+        order = sorted(
+            range(len(varlist)),
+            key=lambda i: (-sizes[i], _block_key(varlist[i])))
+        eplist = [None] * len(varlist)
+        for i in order:
+            key = _block_key(varlist[i])
+            if key in self._placements:
+                eplist[i] = self._placements[key][1]
+                continue
+            ep_id = min(
+                range(len(self._eps)), key=lambda j: (self._loads[j], j))
+            self._loads[ep_id] += sizes[i]
+            eplist[i] = self._eps[ep_id]
+            self._record(varlist[i], eplist[i])
+        return eplist
+
+
+class ConsistentHash(PSDispatcher):
+    """
+	:api_attr: Static Graph
+
+    Distribute variables to several endpoints by consistent hashing. Each
+    endpoint is hashed to `virtual_nodes` points on a ring, and a var is
+    placed on the first point after the md5 hash of its name. When
+    pservers are added or removed, only the vars on the changed ring
+    segments move, about 1/N of them, instead of almost all the vars with
+    `HashName` or `RoundRobin`.
+
+    Args:
+        pserver_endpoints (list): list of endpoint(ip:port).
+        virtual_nodes (int, optional): the number of points of each endpoint
+            on the ring, more points balance the load better. Default: 160.
+
+    Examples:
+        .. code-block:: python
+
+        pserver_endpoints = ["127.0.0.1:6007", "127.0.0.1:6008"]
+        vars = ["var1","var2","var3","var4","var5"]
+
+        ch = ConsistentHash(pserver_endpoints)
+        ch.dispatch(vars)
+
+    """
+
+    def __init__(self, pserver_endpoints, virtual_nodes=160):
+        super(self.__class__, self).__init__(pserver_endpoints)
+        if virtual_nodes < 1:
+            raise ValueError(
+                "virtual_nodes should be a positive integer, but received %s."
+                % virtual_nodes)
+        ring = sorted((_stable_hash("{}#{}".format(ep, i)), ep)
+                      for ep in pserver_endpoints for i in range(virtual_nodes))
+        self._ring_hashes = [h for h, _ in ring]
+        self._ring_eps = [ep for _, ep in ring]
+
+    def dispatch(self, varlist):
+        """
+        use `ConsistentHash` method to dispatch variables with each parameter server.
+        Args:
+            varlist (list): a list of Variables
+
+        """
+        eplist = []
+        for var in varlist:
+            pos = bisect.bisect(self._ring_hashes,
+                                _stable_hash(_block_key(var)))
+            server_for_param = self._ring_eps[pos % len(self._ring_eps)]
+            eplist.append(server_for_param)
+            self._record(var, server_for_param)
+        return eplist
@@ -26,6 +26,7 @@ import paddle
 from paddle import fluid
 from paddle.fluid import core
 from paddle.fluid.framework import Variable, _varbase_creator, _dygraph_tracer
+from paddle.fluid.mmap_state_dict import is_mmap_state_dict_file, save_mmap_state_dict, load_mmap_state_dict
 from paddle.fluid.dygraph.jit import _SaveLoadConfig
 from paddle.fluid.dygraph.io import _construct_program_holders, _construct_params_and_buffers
 from paddle.fluid.dygraph.io import INFER_MODEL_SUFFIX, INFER_PARAMS_SUFFIX, INFER_PARAMS_INFO_SUFFIX
@@ -50,6 +51,25 @@ def _build_saved_state_dict(state_dict):
     return save_dict
 
 
+def _save_mmap_state_dict(state_dict, path):
+    # NOTE: Tensors are converted to numpy and written one by one, rather
+    # than materializing the whole state dict before saving.
+    save_dict = collections.OrderedDict()
+    name_table = {}
+    for key, value in state_dict.items():
+        if isinstance(value, (Variable, core.VarBase)):
+            name_table[key] = value.name
+        save_dict[key] = value
+    save_dict["StructuredToParameterName@@"] = name_table
+
+    def _to_ndarray(value):
+        if isinstance(value, (Variable, core.VarBase)):
+            return value.numpy()
+        return None
+
+    save_mmap_state_dict(save_dict, path, to_ndarray=_to_ndarray)
+
+
 def _load_state_dict_from_save_inference_model(model_path, config):
     # 1. load program desc & construct _ProgramHolder
     programs = _construct_program_holders(model_path, config.model_filename)
@@ -177,8 +197,27 @@ def _build_load_path_and_config(path, config):
     return model_path, config
 
 
+def _parse_save_config(configs):
+    supported_configs = ['use_mmap']
+
+    # input check
+    for key in configs:
+        if key not in supported_configs:
+            raise ValueError(
+                "The additional config (%s) of `paddle.save` is not supported."
+                % key)
+
+    # construct inner config
+    inner_config = _SaveLoadConfig()
+    inner_config.use_mmap = configs.get('use_mmap', None)
+
+    return inner_config
+
+
 def _parse_load_config(configs):
-    supported_configs = ['model_filename', 'params_filename', 'keep_name_table']
+    supported_configs = [
+        'model_filename', 'params_filename', 'keep_name_table', 'use_mmap'
+    ]
 
     # input check
     for key in configs:
@@ -192,11 +231,12 @@ def _parse_load_config(configs):
     inner_config.model_filename = configs.get('model_filename', None)
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
+    inner_config.use_mmap = configs.get('use_mmap', None)
 
     return inner_config
 
 
-def save(obj, path):
+def save(obj, path, **configs):
     '''
     Save an object to the specified path.
     
@@ -216,6 +256,12 @@ def save(obj, path):
         obj(Object) : The object to be saved.
         path(str) : The path of the object to be saved. 
           If saved in the current directory, the input path string will be used as the file name. 
+        **configs (dict, optional): other save configuration options. Default None.
+            The following options are currently supported:
+            (1) use_mmap (bool): If True, save the object in a memory-mappable format,
+            which writes the tensors one by one as raw data, so that ``paddle.load`` can
+            memory-map them, and load them without reading the whole file. Default False,
+            the object is saved by pickle.
 
     Returns:
         None
@@ -235,7 +281,11 @@ def save(obj, path):
                 parameters=emb.parameters())
             opt_state_dict = adam.state_dict()
             paddle.save(opt_state_dict, "adam.pdopt")
+
+            # save in the memory-mappable format
+            paddle.save(layer_state_dict, "emb_mmap.pdparams", use_mmap=True)
     '''
+    config = _parse_save_config(configs)
 
     # 1. input check
     if not isinstance(obj, dict):
@@ -257,6 +307,10 @@ def save(obj, path):
     if dirname and not os.path.exists(dirname):
         os.makedirs(dirname)
 
+    if config.use_mmap:
+        _save_mmap_state_dict(obj, path)
+        return
+
     # TODO(chenweihang): supports save other object
     saved_obj = _build_saved_state_dict(obj)
 
@@ -307,6 +361,10 @@ def load(path, **configs):
             (2) params_filename (str): The persistable variables file name of the paddle 1.x 
             ``save_inference_model`` save format. No default file name, save variables separately 
             by default.
+            (3) use_mmap (bool): If True and the file is saved by ``paddle.save`` with 
+            ``use_mmap=True`` , the tensors are returned as read-only ``numpy.memmap`` , 
+            whose data is read from disk lazily when accessed and shared among processes. 
+            Default False.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -335,9 +393,12 @@ def load(path, **configs):
 
     if os.path.isfile(path):
         # we think path is file means this file is created by paddle.save
-        with open(path, 'rb') as f:
-            load_result = pickle.load(f) if six.PY2 else pickle.load(
-                f, encoding='latin1')
+        if is_mmap_state_dict_file(path):
+            load_result = load_mmap_state_dict(path, use_mmap=config.use_mmap)
+        else:
+            with open(path, 'rb') as f:
+                load_result = pickle.load(f) if six.PY2 else pickle.load(
+                    f, encoding='latin1')
 
         if not config.keep_name_table and "StructuredToParameterName@@" in load_result:
             del load_result["StructuredToParameterName@@"]
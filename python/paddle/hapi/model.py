@@ -36,6 +36,7 @@ from paddle.fluid.framework import _current_expected_place as _get_device
 from paddle.fluid.executor import global_scope
 from paddle.fluid.io import is_belong_to_optimizer
 from paddle.fluid.dygraph.base import to_variable
+from paddle.fluid.dygraph.checkpoint import _build_saved_dygraph_dict
 from paddle.fluid.dygraph.parallel import ParallelEnv
 from paddle.fluid.dygraph.dygraph_to_static.program_translator import ProgramTranslator, FunctionSpec
 from paddle.fluid.dygraph.io import INFER_MODEL_SUFFIX, INFER_PARAMS_SUFFIX
@@ -43,6 +44,7 @@ from paddle.fluid.layers.utils import flatten
 from paddle.fluid.layers import collective
 from paddle.fluid.incubate.fleet.collective import fleet, DistributedStrategy
 from paddle.fluid.incubate.fleet.base import role_maker
+from paddle.fluid.incubate.checkpoint.async_saver import AsyncSaver
 
 from paddle.io import DataLoader, Dataset, DistributedBatchSampler
 from paddle.fluid.executor import scope_guard, Executor
@@ -75,6 +77,24 @@ def to_numpy(var):
     return np.array(t)
 
 
+def _save_state_files(states):
+    """
+    Pickle each state of (file_name, state) pairs in states to file_name.
+    The state is written to a temporary file first and then renamed, so the
+    file is never left half written.
+    """
+    for file_name, state in states:
+        dir_name = os.path.dirname(file_name)
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+        tmp_file_name = file_name + ".tmp"
+        with open(tmp_file_name, 'wb') as f:
+            pickle.dump(state, f, protocol=2)
+        if os.path.exists(file_name):
+            os.remove(file_name)
+        os.rename(tmp_file_name, file_name)
+
+
 def flatten_list(l):
     assert isinstance(l, list), "not a list"
     outl = []
@@ -277,26 +297,31 @@ class StaticGraphAdapter(object):
         return self.model.network.parameters(*args, **kwargs)
 
     def save(self, path):
-        def _save(state, path):
+        _save_state_files(self.snapshot(path))
+
+    def snapshot(self, path):
+        """
+        Copy the states to be saved to host memory, return a list of
+        (file_name, state) pairs.
+        """
+
+        def _snapshot(state, path):
             if not state:
                 return
             state = {
                 k: to_numpy(v) if isinstance(v, Variable) else v
                 for k, v in state.items()
             }
-            with open(path, 'wb') as f:
-                pickle.dump(state, f)
+            states.append((path, state))
 
         base = os.path.basename(path)
         assert base != "", "path should be of 'dirname/filename' format"
-        dir_name = os.path.dirname(path)
-        if dir_name and not os.path.exists(dir_name):
-            os.makedirs(dir_name)
+        states = []
         param_path = path + ".pdparams"
-        _save(self.model.network.state_dict(), param_path)
+        _snapshot(self.model.network.state_dict(), param_path)
         prog = self._progs.get('train', None)
         if prog is None or self.model._optimizer is None:
-            return
+            return states
         # XXX `optimizer.state_dict()` only work in dygraph mode
         optim_path = path + ".pdopt"
         optim = {
@@ -304,9 +329,10 @@ class StaticGraphAdapter(object):
             for p in filter(is_belong_to_optimizer, prog.list_vars())
         }
         if not optim:
-            return
+            return states
 
-        _save(optim, optim_path)
+        _snapshot(optim, optim_path)
+        return states
 
     def load(self, param_state_pairs, optim_state):
         if self._executor is None:
@@ -742,6 +768,25 @@ class DynamicGraphAdapter(object):
             optim = self.model._optimizer.state_dict()
             fluid.save_dygraph(optim, path)
 
+    def snapshot(self, path):
+        """
+        Copy the states to be saved to host memory, return a list of
+        (file_name, state) pairs in the same format as `save`.
+        """
+        base = os.path.basename(path)
+        assert base != "", "path should be of 'dirname/filename' format"
+        states = []
+        suffix, params = _build_saved_dygraph_dict(
+            self.model.network.state_dict())
+        states.append((path + suffix, params))
+        if self.model._optimizer is None:
+            return states
+        if self.model._optimizer.state_dict():
+            suffix, optim = _build_saved_dygraph_dict(
+                self.model._optimizer.state_dict())
+            states.append((path + suffix, optim))
+        return states
+
     def load(self, param_state_pairs, optim_state):
         # restore parameter states
         for param, state in param_state_pairs:
@@ -874,6 +919,7 @@ class Model(object):
         self._is_shape_inferred = False
         self._test_dataloader = None
         self.stop_training = False
+        self._async_saver = None
 
         if not in_dygraph_mode():
             if not isinstance(inputs, (list, dict, Input)):
@@ -1037,7 +1083,7 @@ class Model(object):
             self._update_inputs()
         return loss
 
-    def save(self, path, training=True):
+    def save(self, path, training=True, async_save=False):
         """  
         This function saves parameters, optimizer information or model and 
         paramters only for inference to path. It depends on the parameter
@@ -1059,6 +1105,13 @@ class Model(object):
                 A exception will be raised.
             training (bool, optional): Whether to save for training. If not, save
                 for inference only. Default: True.
+            async_save (bool, optional): Whether to save asynchronously. If True,
+                the states are copied to host memory and this function returns
+                immediately, the files are written by a background thread. If
+                the last asynchronous save is not finished, it waits for that
+                before copying the states. Use `wait_save` to wait for the
+                files being written. Only works when `training` is True.
+                Default: False.
 
         Returns:
             None
@@ -1111,9 +1164,55 @@ class Model(object):
         if ParallelEnv().local_rank == 0:
             if not training:
                 self._save_inference_model(path)
+            elif async_save:
+                if self._async_saver is None:
+                    self._async_saver = AsyncSaver(name="model_saver")
+                self._async_saver.submit(_save_state_files,
+                                         lambda: self._adapter.snapshot(path))
             else:
+                # the pending asynchronous save may overwrite the same files
+                self.wait_save()
                 self._adapter.save(path)
 
+    def wait_save(self, timeout=None):
+        """
+        Wait for the files saved by `save` with `async_save=True` being
+        written. The error raised when writing files is raised here.
+
+        Args:
+            timeout (float, optional): The max seconds to wait. Default: None,
+                wait until finished.
+
+        Returns:
+            bool: False if the saving is not finished when timeout.
+
+        Examples:
+
+            .. code-block:: python
+
+              import paddle
+              import paddle.nn as nn
+
+              model = paddle.Model(nn.Linear(784, 10))
+              model.save('checkpoint/test', async_save=True)
+              # continue training ...
+              model.wait_save()
+        """
+        if self._async_saver is None:
+            return True
+        return self._async_saver.wait(timeout)
+
+    def save_status(self):
+        """
+        Return the status of asynchronous saving, a namedtuple of
+        `in_flight` (the number of saves not finished), `finished`, `failed`,
+        `last_finish_time` and `last_error`, or None if `save` has never been
+        called with `async_save=True`.
+        """
+        if self._async_saver is None:
+            return None
+        return self._async_saver.status()
+
     def load(self, path, skip_mismatch=False, reset_optimizer=False):
         """
         Load from files storing the model states and optimizer states. The file
@@ -1165,6 +1264,8 @@ class Model(object):
               model.load('checkpoint/test')
         """
 
+        self.wait_save()
+
         def _load_state_from_path(path):
             if not os.path.exists(path):
                 return
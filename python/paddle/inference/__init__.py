@@ -14,3 +14,5 @@
 
 from ..fluid.inference import Config, DataType, PlaceType, PrecisionType, Tensor, \
     Predictor, create_predictor, get_version, get_num_bytes_of_data_type, PredictorPool
+
+from .batching import BatchingRunner, BatchingStats
@@ -0,0 +1,365 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import sys
+import threading
+import time
+
+import numpy as np
+import six
+
+__all__ = ['BatchingRunner', 'BatchingStats']
+
+BatchingStats = collections.namedtuple('BatchingStats', [
+    'num_requests', 'num_batches', 'queue_depth', 'batch_size_hist',
+    'queue_depth_hist'
+])
+
+
+def _hist_bucket(value):
+    # the upper bound of the power of 2 bucket of value
+    bucket = 1
+    while bucket < value:
+        bucket *= 2
+    return bucket
+
+
+class _Request(object):
+    def __init__(self, inputs, batch_size):
+        self.inputs = inputs
+        self.batch_size = batch_size
+        # only the requests of the same signature are batched together
+        self.signature = tuple((x.ndim, x.dtype) for x in inputs)
+        self.enqueue_time = time.time()
+        self._event = threading.Event()
+        self._outputs = None
+        self._exc_info = None
+
+    def _set_result(self, outputs=None, exc_info=None):
+        self._outputs = outputs
+        self._exc_info = exc_info
+        self._event.set()
+
+    def done(self):
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """
+        Block until the request is run, and return its outputs.
+
+        Args:
+            timeout(float, optional): the max seconds to wait. Default: None,
+                wait forever.
+
+        Returns:
+            list: the outputs of the request, numpy arrays split from the
+            outputs of the batch.
+        """
+        if not self._event.wait(timeout):
+            raise RuntimeError("The request is not finished in %s seconds." %
+                               timeout)
+        if self._exc_info is not None:
+            six.reraise(*self._exc_info)
+        return self._outputs
+
+
+def _pad_concat(arrays, pad_value):
+    """
+    Concatenate `arrays` along axis 0, the other axes are padded by
+    `pad_value` to the max shape if the shapes are different.
+    """
+    shapes = set(a.shape[1:] for a in arrays)
+    if len(shapes) == 1:
+        return np.concatenate(arrays, axis=0)
+    if len(set(len(s) for s in shapes)) != 1:
+        raise ValueError("The inputs to batch have different ranks: %s" %
+                         sorted(shapes))
+    max_shape = np.max([list(s) for s in shapes], axis=0).tolist()
+    batch_size = sum(a.shape[0] for a in arrays)
+    out = np.full(
+        [batch_size] + max_shape,
+        pad_value,
+        dtype=np.result_type(*[a.dtype for a in arrays]))
+    begin = 0
+    for a in arrays:
+        out[tuple([slice(begin, begin + a.shape[0])] + [
+            slice(0, d) for d in a.shape[1:]
+        ])] = a
+        begin += a.shape[0]
+    return out
+
+
+class BatchingRunner(object):
+    """
+    Run the inference of the concurrent requests in batches. The requests
+    submitted by any threads are queued, and a background thread coalesces
+    them into a batch of up to `max_batch_size` samples, or less if the
+    oldest request has waited for `max_latency` seconds, runs `predict_fn`
+    once for the batch and splits the outputs back to the requests.
+
+    Each input of a request is a numpy array whose axis 0 is the batch axis,
+    a request can hold more than one sample. The inputs of the requests are
+    concatenated along axis 0, the other axes are padded by `pad_value` to
+    the max shape of the batch if they are different, so the outputs of such
+    requests keep the padded shape. Only the requests with the same number,
+    ranks and dtypes of inputs are batched together, so a malformed request
+    runs in another batch and fails alone.
+
+    Args:
+        predict_fn(callable): run the inference of a batch, it takes a list of
+            the batched numpy arrays and returns a list of numpy arrays, whose
+            axis 0 is the batch axis. It is always called on the background
+            thread.
+        max_batch_size(int, optional): the max number of samples of a batch,
+            a larger request runs in a batch alone. Default: 32.
+        max_latency(float, optional): the max seconds a request waits for
+            more requests to batch with. Default: 0.005.
+        max_queue_size(int, optional): the max number of queued requests,
+            `submit` blocks when the queue is full. Default: 0, no limit.
+        pad_value(int|float, optional): the value to pad the inputs with.
+            Default: 0.
+        name(str, optional): the name of the background thread.
+
+    Examples:
+        .. code-block:: python
+
+            import numpy as np
+            import paddle
+            from paddle.inference import BatchingRunner
+
+            paddle.disable_static()
+            layer = paddle.nn.Linear(4, 2)
+            runner = BatchingRunner.from_layer(layer, max_batch_size=8)
+
+            # called by the serving threads concurrently
+            outputs = runner.run(np.random.random([1, 4]).astype('float32'))
+            print(outputs[0].shape)  # (1, 2)
+
+            runner.close()
+    """
+
+    def __init__(self,
+                 predict_fn,
+                 max_batch_size=32,
+                 max_latency=0.005,
+                 max_queue_size=0,
+                 pad_value=0,
+                 name="batching_runner"):
+        if max_batch_size < 1:
+            raise ValueError(
+                "max_batch_size should be a positive integer, but received %s."
+                % max_batch_size)
+        if max_latency < 0:
+            raise ValueError(
+                "max_latency should not be negative, but received %s." %
+                max_latency)
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency
+        self._max_queue_size = max_queue_size
+        self._pad_value = pad_value
+        self._cond = threading.Condition()
+        self._queue = collections.deque()
+        self._queued_samples = 0
+        self._closed = False
+        self._num_requests = 0
+        self._num_batches = 0
+        self._batch_size_hist = collections.Counter()
+        self._queue_depth_hist = collections.Counter()
+        self._thread = threading.Thread(target=self._worker, name=name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @classmethod
+    def from_layer(cls, layer, **kwargs):
+        """
+        Create a BatchingRunner running a dygraph Layer, such as the
+        TranslatedLayer loaded by `paddle.jit.load`, in eval mode.
+
+        Args:
+            layer(Layer): the layer to run, its outputs are Tensors or a list
+                of Tensors.
+            **kwargs: the arguments of BatchingRunner except `predict_fn`.
+        """
+        import paddle
+
+        layer.eval()
+
+        def predict_fn(inputs):
+            with paddle.no_grad():
+                outputs = layer(*[paddle.to_tensor(x) for x in inputs])
+            if not isinstance(outputs, (list, tuple)):
+                outputs = [outputs]
+            return [output.numpy() for output in outputs]
+
+        return cls(predict_fn, **kwargs)
+
+    @classmethod
+    def from_inference_model(cls, program, feed_target_names, fetch_targets,
+                             executor, **kwargs):
+        """
+        Create a BatchingRunner running the inference program returned by
+        `paddle.static.load_inference_model`.
+
+        Args:
+            program(Program): the inference program.
+            feed_target_names(list): the names of the inputs of the program.
+            fetch_targets(list): the outputs of the program.
+            executor(Executor): the executor to run the program.
+            **kwargs: the arguments of BatchingRunner except `predict_fn`.
+        """
+
+        def predict_fn(inputs):
+            return executor.run(program,
+                                feed=dict(zip(feed_target_names, inputs)),
+                                fetch_list=fetch_targets)
+
+        return cls(predict_fn, **kwargs)
+
+    def submit(self, *inputs):
+        """
+        Queue a request of `inputs`, numpy arrays in the same order as the
+        inputs of `predict_fn`, and return immediately.
+
+        Returns:
+            object: a handle of the request, its `result(timeout=None)`
+            returns the outputs.
+        """
+        if len(inputs) == 0:
+            raise ValueError("The request should have at least one input.")
+        inputs = [np.asarray(x) for x in inputs]
+        batch_size = inputs[0].shape[0] if inputs[0].ndim > 0 else 0
+        for x in inputs:
+            if x.ndim == 0 or x.shape[0] != batch_size:
+                raise ValueError(
+                    "The inputs of a request should have the same size of "
+                    "axis 0, but received shapes %s." %
+                    [list(x.shape) for x in inputs])
+        if batch_size == 0:
+            raise ValueError("The request should have at least one sample.")
+
+        request = _Request(inputs, batch_size)
+        with self._cond:
+            while self._max_queue_size > 0 and not self._closed and \
+                    len(self._queue) >= self._max_queue_size:
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("The BatchingRunner is closed.")
+            self._queue.append(request)
+            self._queued_samples += batch_size
+            self._num_requests += 1
+            self._cond.notify_all()
+        return request
+
+    def run(self, *inputs):
+        """
+        Run a request of `inputs` in a batch, and return its outputs.
+        """
+        return self.submit(*inputs).result()
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._queue and not self._closed:
+                self._cond.wait()
+            if not self._queue:
+                return None
+            deadline = self._queue[0].enqueue_time + self._max_latency
+            while not self._closed and \
+                    self._queued_samples < self._max_batch_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            self._queue_depth_hist[_hist_bucket(len(self._queue))] += 1
+            batch = [self._queue.popleft()]
+            batch_size = batch[0].batch_size
+            # the requests of other signatures are kept in the queue in order
+            skipped = []
+            while self._queue:
+                request = self._queue[0]
+                if request.signature != batch[0].signature:
+                    skipped.append(self._queue.popleft())
+                    continue
+                if batch_size + request.batch_size > self._max_batch_size:
+                    break
+                batch.append(self._queue.popleft())
+                batch_size += request.batch_size
+            self._queue.extendleft(reversed(skipped))
+            self._queued_samples -= batch_size
+            self._num_batches += 1
+            self._batch_size_hist[_hist_bucket(batch_size)] += 1
+            # wake up the blocked submit
+            self._cond.notify_all()
+        return batch
+
+    def _run_batch(self, batch):
+        try:
+            inputs = [
+                _pad_concat([request.inputs[i] for request in batch],
+                            self._pad_value)
+                for i in range(len(batch[0].inputs))
+            ]
+            outputs = [np.asarray(out) for out in self._predict_fn(inputs)]
+            batch_size = sum(request.batch_size for request in batch)
+            for out in outputs:
+                if out.ndim == 0 or out.shape[0] != batch_size:
+                    raise ValueError(
+                        "The outputs of predict_fn should have %d samples, "
+                        "but received shape %s." % (batch_size, out.shape))
+        except Exception:
+            exc_info = sys.exc_info()
+            for request in batch:
+                request._set_result(exc_info=exc_info)
+            return
+
+        begin = 0
+        for request in batch:
+            end = begin + request.batch_size
+            request._set_result(outputs=[out[begin:end] for out in outputs])
+            begin = end
+
+    def _worker(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._run_batch(batch)
+
+    def close(self):
+        """
+        Stop accepting requests, run the queued requests and stop the
+        background thread.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def stats(self):
+        """
+        Return the BatchingStats of this runner: the number of requests and
+        batches, the current queue depth, and the histograms of the batch
+        sizes in samples and the queue depths in requests when a batch is
+        taken, as dicts from the upper bound of the power of 2 buckets to
+        the counts.
+        """
+        with self._cond:
+            return BatchingStats(
+                num_requests=self._num_requests,
+                num_batches=self._num_batches,
+                queue_depth=len(self._queue),
+                batch_size_hist=dict(self._batch_size_hist),
+                queue_depth_hist=dict(self._queue_depth_hist))
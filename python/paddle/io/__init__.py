@@ -21,6 +21,7 @@ __all__ = [
     'ChainDataset',
     'BatchSampler',
     'DistributedBatchSampler',
+    'BucketBatchSampler',
     #            'Transform',
     'DataLoader',
     'get_worker_info',
@@ -35,4 +36,5 @@ __all__ = [
 from ..fluid.io import DataLoader
 from ..fluid.dataloader import Dataset, IterableDataset, BatchSampler, get_worker_info, \
         TensorDataset, Sampler, SequenceSampler, RandomSampler, DistributedBatchSampler, \
-        ComposeDataset, ChainDataset, WeightedRandomSampler, Subset, random_split
+        ComposeDataset, ChainDataset, WeightedRandomSampler, Subset, random_split, \
+        BucketBatchSampler
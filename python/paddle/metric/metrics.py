@@ -18,6 +18,7 @@ from __future__ import print_function
 
 import six
 import abc
+import collections
 import numpy as np
 
 from ..fluid.data_feeder import check_variable_and_dtype
@@ -33,6 +34,26 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _auc_from_stats(stat_pos, stat_neg):
+    """
+    Compute the area under the ROC curve given by the positive and negative
+    sample counts of the prediction buckets, from the highest bucket to the
+    lowest one, by the trapezoidal rule.
+
+    Returns:
+        tuple: the area, total positive and total negative sample count,
+            the AUC is area / tot_pos / tot_neg.
+    """
+    if len(stat_pos) == 0:
+        return 0.0, 0.0, 0.0
+    tot_pos = np.cumsum(stat_pos[::-1], dtype='float64')
+    tot_neg = np.cumsum(stat_neg[::-1], dtype='float64')
+    tot_pos_prev = np.concatenate([[0.0], tot_pos[:-1]])
+    tot_neg_prev = np.concatenate([[0.0], tot_neg[:-1]])
+    area = np.sum((tot_neg - tot_neg_prev) * (tot_pos + tot_pos_prev)) / 2.0
+    return float(area), float(tot_pos[-1]), float(tot_neg[-1])
+
+
 @six.add_metaclass(abc.ABCMeta)
 class Metric(object):
     r"""
@@ -155,6 +176,50 @@ class Metric(object):
         raise NotImplementedError("function 'name' not implemented in {}.".
                                   format(self.__class__.__name__))
 
+    def state_dict(self):
+        """
+        Returns the states of the metric, an OrderedDict of numpy arrays in
+        float64, which can be summed up element-wisely to merge the states
+        of the metrics of the same configuration, e.g. on different workers.
+        """
+        raise NotImplementedError(
+            "function 'state_dict' not implemented in {}.".format(
+                self.__class__.__name__))
+
+    def set_state_dict(self, state_dict):
+        """
+        Sets the states of the metric returned by :code:`state_dict`.
+        """
+        raise NotImplementedError(
+            "function 'set_state_dict' not implemented in {}.".format(
+                self.__class__.__name__))
+
+    def merge(self, other):
+        """
+        Merges the states of metric `other` into this metric, as if all the
+        inputs of `other.update` were also passed to `self.update`.
+
+        Args:
+            other (Metric): a metric of the same class and configuration.
+        """
+        if type(other) is not type(self):
+            raise TypeError("Can not merge {} into {}.".format(
+                type(other).__name__, type(self).__name__))
+        state_dict = self.state_dict()
+        other_state_dict = other.state_dict()
+        for key, value in six.iteritems(state_dict):
+            if np.shape(value) != np.shape(other_state_dict[key]):
+                raise ValueError(
+                    "The shape of state {} of the metrics to merge are "
+                    "different: {} vs {}.".format(key,
+                                                  np.shape(value),
+                                                  np.shape(other_state_dict[
+                                                      key])))
+        self.set_state_dict(
+            collections.OrderedDict((key, value + other_state_dict[key])
+                                    for key, value in six.iteritems(
+                                        state_dict)))
+
     def compute(self, *args):
         """
         This API is advanced usage to accelerate metric calculating, calulations
@@ -301,6 +366,23 @@ class Accuracy(Metric):
         self.total = [0.] * len(self.topk)
         self.count = [0] * len(self.topk)
 
+    def state_dict(self):
+        """
+        Returns the states: the correct counts `total` and the sample
+        counts `count` of each k in `topk`.
+        """
+        return collections.OrderedDict(
+            [('total', np.array(
+                self.total, dtype='float64')), ('count', np.array(
+                    self.count, dtype='float64'))])
+
+    def set_state_dict(self, state_dict):
+        """
+        Sets the states returned by :code:`state_dict`.
+        """
+        self.total = [float(t) for t in state_dict['total']]
+        self.count = [int(c) for c in state_dict['count']]
+
     def accumulate(self):
         """
         Computes and returns the accumulated metric.
@@ -420,17 +502,13 @@ class Precision(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
+        preds = np.floor(preds + 0.5).astype("int32").reshape(-1)
+        labels = labels.reshape(-1)
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+        pred_pos = preds == 1
+        tp = int(np.count_nonzero(labels[pred_pos] == 1))
+        self.tp += tp
+        self.fp += int(np.count_nonzero(pred_pos)) - tp
 
     def reset(self):
         """
@@ -439,6 +517,23 @@ class Precision(Metric):
         self.tp = 0
         self.fp = 0
 
+    def state_dict(self):
+        """
+        Returns the states: the true positive count `tp` and the false
+        positive count `fp`.
+        """
+        return collections.OrderedDict(
+            [('tp', np.array(
+                [self.tp], dtype='float64')), ('fp', np.array(
+                    [self.fp], dtype='float64'))])
+
+    def set_state_dict(self, state_dict):
+        """
+        Sets the states returned by :code:`state_dict`.
+        """
+        self.tp = int(state_dict['tp'][0])
+        self.fp = int(state_dict['fp'][0])
+
     def accumulate(self):
         """
         Calculate the final precision.
@@ -553,17 +648,13 @@ class Recall(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
+        preds = np.rint(preds).astype("int32").reshape(-1)
+        labels = labels.reshape(-1)
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        label_pos = labels == 1
+        tp = int(np.count_nonzero(preds[label_pos] == 1))
+        self.tp += tp
+        self.fn += int(np.count_nonzero(label_pos)) - tp
 
     def accumulate(self):
         """
@@ -582,6 +673,23 @@ class Recall(Metric):
         self.tp = 0
         self.fn = 0
 
+    def state_dict(self):
+        """
+        Returns the states: the true positive count `tp` and the false
+        negative count `fn`.
+        """
+        return collections.OrderedDict(
+            [('tp', np.array(
+                [self.tp], dtype='float64')), ('fn', np.array(
+                    [self.fn], dtype='float64'))])
+
+    def set_state_dict(self, state_dict):
+        """
+        Sets the states returned by :code:`state_dict`.
+        """
+        self.tp = int(state_dict['tp'][0])
+        self.fn = int(state_dict['fn'][0])
+
     def name(self):
         """
         Returns metric name
@@ -593,7 +701,6 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -708,14 +815,15 @@ class Auc(Metric):
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        labels = labels.reshape(-1) != 0
+        bin_idx = (preds[:len(labels), 1] * self._num_thresholds).astype(
+            'int64')
+        assert np.all(bin_idx <= self._num_thresholds)
+        num_pred_buckets = self._num_thresholds + 1
+        self._stat_pos += np.bincount(
+            bin_idx[labels], minlength=num_pred_buckets)
+        self._stat_neg += np.bincount(
+            bin_idx[~labels], minlength=num_pred_buckets)
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -728,20 +836,7 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(tot_neg, tot_neg_prev, tot_pos,
-                                       tot_pos_prev)
-            idx -= 1
-
+        auc, tot_pos, tot_neg = _auc_from_stats(self._stat_pos, self._stat_neg)
         return auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
 
     def reset(self):
@@ -752,6 +847,21 @@ class Auc(Metric):
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
 
+    def state_dict(self):
+        """
+        Returns the states: the positive and negative sample counts
+        `stat_pos` and `stat_neg` of the prediction buckets.
+        """
+        return collections.OrderedDict([('stat_pos', self._stat_pos.copy()),
+                                        ('stat_neg', self._stat_neg.copy())])
+
+    def set_state_dict(self, state_dict):
+        """
+        Sets the states returned by :code:`state_dict`.
+        """
+        self._stat_pos = np.array(state_dict['stat_pos'], dtype='float64')
+        self._stat_neg = np.array(state_dict['stat_neg'], dtype='float64')
+
     def name(self):
         """
         Returns metric name
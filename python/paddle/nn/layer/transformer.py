@@ -33,6 +33,7 @@ from .. import functional as F
 from ... import tensor
 from ...fluid import layers
 from ...fluid.dygraph import Layer, LayerList
+from ...fluid.framework import in_dygraph_mode
 from ...fluid.param_attr import ParamAttr
 
 
@@ -127,6 +128,86 @@ class MultiHeadAttention(Layer):
     Cache = collections.namedtuple("Cache", ["k", "v"])
     StaticCache = collections.namedtuple("StaticCache", ["k", "v"])
 
+    class PreallocatedCache(
+            collections.namedtuple("PreallocatedCache", ["k", "v", "length"])):
+        """
+        A cache for decoder self attention in dygraph mode, whose `k` and `v`
+        fields are tensors preallocated with shape `[batch_size, num_heads,
+        max_length, embed_dim // num_heads]`, and `length` is the number of
+        positions already written.
+
+        Unlike `Cache` concatenating the whole history on every decoding step,
+        the keys and values of new positions are written into the buffers,
+        and positions after `length` are masked out in attention.
+
+        The write is in place only for the buffers on CPU. On other places,
+        writing a slice in place would copy the whole buffers between the
+        device and the host, so the buffers are rebuilt on the device by
+        concatenating the slices around the new positions instead, which
+        costs a copy of the buffers on the device for every write, and a
+        new cache with the new buffers is returned.
+        """
+
+        @property
+        def max_length(self):
+            return self.k.shape[2]
+
+        def reorder(self, index):
+            """
+            Gathers the buffers on batch axis by `index`, mostly used to
+            reorder the cache by the parent beams in beam search.
+
+            Parameters:
+                index (Tensor): A 1-D int32 or int64 tensor with shape
+                    `[batch_size]`.
+
+            Returns:
+                PreallocatedCache: the reordered cache with the same `length`.
+            """
+            return self._replace(
+                k=paddle.gather(self.k, index), v=paddle.gather(self.v, index))
+
+        def _write(self, k, v):
+            length = self.length + k.shape[2]
+            if length > self.max_length:
+                raise ValueError(
+                    "The PreallocatedCache with max_length %d is full, "
+                    "can not append %d positions after %d positions." %
+                    (self.max_length, k.shape[2], self.length))
+            if self.k.place.is_cpu_place():
+                self.k[:, :, self.length:length, :] = k
+                self.v[:, :, self.length:length, :] = v
+                return self._replace(length=length)
+
+            # VarBase.__setitem__ goes through numpy, concatenate the slices
+            # on the device instead.
+            def _concat_write(buffer, value):
+                parts = [value]
+                if self.length > 0:
+                    parts.insert(0, buffer[:, :, :self.length, :])
+                if length < self.max_length:
+                    parts.append(buffer[:, :, length:, :])
+                return parts[0] if len(parts) == 1 else tensor.concat(
+                    parts, axis=2)
+
+            return self._replace(
+                k=_concat_write(self.k, k),
+                v=_concat_write(self.v, v),
+                length=length)
+
+        def _pad_mask(self, attn_mask):
+            # mask out the positions not written yet
+            pad_length = self.max_length - self.length
+            if pad_length == 0 or (attn_mask is not None and
+                                   attn_mask.shape[-1] == self.max_length):
+                return attn_mask
+            if attn_mask is None:
+                attn_mask = paddle.zeros(
+                    [1, 1, 1, self.length], dtype=self.k.dtype)
+            pad_mask = paddle.full(
+                attn_mask.shape[:-1] + [pad_length], -1e9, dtype=attn_mask.dtype)
+            return tensor.concat([attn_mask, pad_mask], axis=-1)
+
     def __init__(self,
                  embed_dim,
                  num_heads,
@@ -174,7 +255,7 @@ class MultiHeadAttention(Layer):
                 is a tensor with shape `[batch_size, value_length, vdim]`.
                 The data type should be float32 or float64. If None, use `query` as
                 `value`.
-            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache, optional):
+            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache|MultiHeadAttention.PreallocatedCache, optional):
                 It is a namedtuple with `k` and `v` as fields, and stores tensors
                 shaped `[batch_size, num_heads, length, embed_dim]` which are results
                 of linear projection, reshape and transpose calculations in
@@ -184,6 +265,8 @@ class MultiHeadAttention(Layer):
                 `StaticCache`, `key` and `value` args would be ignored, `k` and
                 `v` fields would be used as calculated results on `key` and
                 `value`, which mostly used for decoder-encoder cross attention.
+                If it is an instance of `PreallocatedCache`, the results of
+                current positions are written into `k` and `v`, in place on CPU.
                 It is only used for inference and should be None for training.
                 Default None.
 
@@ -191,7 +274,8 @@ class MultiHeadAttention(Layer):
             tuple: A tuple including linear projected keys and values. These two \
                 tensors have shapes `[batch_size, n_head, sequence_length, d_key]` \
                 and `[batch_size, n_head, sequence_length, d_value]` separately, \
-                and their data types are same as inputs.
+                and their data types are same as inputs. If `cache` is a \
+                `PreallocatedCache`, `sequence_length` is its `max_length`.
         """
         q = self.q_proj(query)
         q = tensor.reshape(x=q, shape=[0, 0, self.num_heads, self.head_dim])
@@ -208,6 +292,10 @@ class MultiHeadAttention(Layer):
             k = tensor.concat([cache.k, k], axis=2)
             v = tensor.concat([cache.v, v], axis=2)
             cache = self.Cache(k, v)
+        elif isinstance(cache, self.PreallocatedCache):
+            # for decoder self-attention in inference, write into the buffers
+            cache = cache._write(k, v)
+            k, v = cache.k, cache.v
 
         return (q, k, v) if cache is None else (q, k, v, cache)
 
@@ -243,11 +331,12 @@ class MultiHeadAttention(Layer):
         v = tensor.transpose(x=v, perm=[0, 2, 1, 3])
         return k, v
 
-    def gen_cache(self, key, value=None, type=Cache):
+    def gen_cache(self, key, value=None, type=Cache, max_length=None):
         """
         Generates cache for `forward` usage in inference accroding to arguments.
-        The generated cache is an instance of `MultiHeadAttention.Cache` or an
-        instance of `MultiHeadAttention.StaticCache`.
+        The generated cache is an instance of `MultiHeadAttention.Cache`, an
+        instance of `MultiHeadAttention.StaticCache` or an instance of
+        `MultiHeadAttention.PreallocatedCache`.
 
         `Cache` or `StaticCache` is namedtuple with `k` and `v` as fields,
         and it stores tensors shaped `[batch_size, num_heads, length, embed_dim]`
@@ -277,6 +366,13 @@ class MultiHeadAttention(Layer):
         3. If `type` is `Cache` and `value` is not None, use `key`, `value` to create
         an instance of `Cache`.
 
+        4. If `type` is `PreallocatedCache`, generate zero tensors shaped
+        `[batch_size, num_heads, max_length, embed_dim // num_heads]` and use
+        them to create an instance of `PreallocatedCache` with `length` 0,
+        where `batch_size` is from the first dimension of `key`. If `value` is
+        not None, `key`, `value` are written into it as the initial positions.
+        It is only supported in dygraph mode.
+
         Parameters:
             key (Tensor): The keys for multi-head attention. It is
                 a tensor with shape `[batch_size, key_length, kdim]`. The
@@ -286,15 +382,30 @@ class MultiHeadAttention(Layer):
                 is a tensor with shape `[batch_size, value_length, vdim]`.
                 The data type should be float32 or float64. If None, `key` is only
                 for batch size reference. Default None.
-            type (type): It should be `MultiHeadAttention.StaticCache` or
-                `MultiHeadAttention.Cache` to indicate the cache type to generate.
+            type (type): It should be `MultiHeadAttention.StaticCache`,
+                `MultiHeadAttention.Cache` or `MultiHeadAttention.PreallocatedCache`
+                to indicate the cache type to generate.
+            max_length (int, optional): The max number of positions could be
+                written into `PreallocatedCache`. It is required when `type`
+                is `PreallocatedCache`. Default None.
         
         Returns:
-            namedtuple: an instance of `Cache` or `StaticCache` accordingly.
+            namedtuple: an instance of `Cache`, `StaticCache` or `PreallocatedCache` \
+                accordingly.
         """
         if type == MultiHeadAttention.StaticCache:  # static_kv
             k, v = self.compute_kv(key, value)
             return self.StaticCache(k, v)
+        elif type == MultiHeadAttention.PreallocatedCache:
+            assert in_dygraph_mode(), \
+                "PreallocatedCache is only supported in dygraph mode."
+            assert max_length is not None and max_length > 0, \
+                "max_length should be a positive integer for PreallocatedCache."
+            shape = [key.shape[0], self.num_heads, max_length, self.head_dim]
+            cache = self.PreallocatedCache(
+                paddle.zeros(shape, dtype=key.dtype),
+                paddle.zeros(shape, dtype=key.dtype), 0)
+            return cache if value is None else cache._write(key, value)
         elif value is None:  # incremental_state
             k = layers.fill_constant_batch_size_like(
                 input=key,
@@ -336,7 +447,7 @@ class MultiHeadAttention(Layer):
                 have 0 values. The data type should be float32 or float64. It can
                 be None when nothing wanted or needed to be prevented attention to.
                 Default None
-            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache, optional):
+            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache|MultiHeadAttention.PreallocatedCache, optional):
                 It is a namedtuple with `k` and `v` as fields, and stores tensors
                 shaped `[batch_size, num_heads, length, embed_dim]` which are results
                 of linear projection, reshape and transpose calculations in
@@ -346,7 +457,13 @@ class MultiHeadAttention(Layer):
                 `StaticCache`, `key` and `value` args would be ignored, `k` and
                 `v` fields would be used as calculated results on `key` and
                 `value`, which mostly used for decoder-encoder cross attention.
-                It is only used for inference and should be None for training.
+                If it is an instance of `PreallocatedCache`, it is used as `Cache`
+                but the results of current positions are written into its
+                preallocated buffers (in place on CPU only, see
+                `PreallocatedCache`), and
+                the last dimension of `attn_mask` should be the length of previous
+                and current positions, the positions not written yet are masked
+                out. It is only used for inference and should be None for training.
                 Default None.
 
         Returns:
@@ -359,7 +476,9 @@ class MultiHeadAttention(Layer):
                 having the same type as `cache`, and if it is `StaticCache`, it \
                 is same as the input `cache`, if it is `Cache`, the new cache \
                 reserves tensors concatanating raw tensors with intermediate \
-                results of current query.
+                results of current query, if it is `PreallocatedCache`, the new \
+                cache shares the tensors with input `cache` and has an incremental \
+                `length`.
         """
         key = query if key is None else key
         value = query if value is None else value
@@ -368,6 +487,8 @@ class MultiHeadAttention(Layer):
             q, k, v = self._prepare_qkv(query, key, value, cache)
         else:
             q, k, v, cache = self._prepare_qkv(query, key, value, cache)
+            if isinstance(cache, self.PreallocatedCache):
+                attn_mask = cache._pad_mask(attn_mask)
 
         # scale dot product attention
         # TODO(guosheng): use tensor.matmul, however it doesn't support `alpha`
@@ -800,7 +921,8 @@ class TransformerDecoderLayer(Layer):
         return tgt if cache is None else (tgt, (incremental_cache,
                                                 static_cache))
 
-    def gen_cache(self, memory):
+    def gen_cache(self, memory, type=MultiHeadAttention.Cache,
+                  max_length=None):
         r"""
         Generates cache for `forward` usage. The generated cache is a tuple
         composed of an instance of `MultiHeadAttention.Cache` and an instance
@@ -810,12 +932,19 @@ class TransformerDecoderLayer(Layer):
             memory (Tensor): The output of Transformer encoder. It is a tensor
                 with shape `[batch_size, source_length, d_model]`. The data type
                 should be float32 or float64.
+            type (type, optional): The type of `incremental_cache`, it should be
+                `MultiHeadAttention.Cache` or `MultiHeadAttention.PreallocatedCache`.
+                Default `MultiHeadAttention.Cache`.
+            max_length (int, optional): The max decoding length, it is required
+                when `type` is `MultiHeadAttention.PreallocatedCache`. Default None.
 
         Returns:
             tuple: It is a tuple( :code:`(incremental_cache, static_cache)` ). \
                 `incremental_cache` is an instance of `MultiHeadAttention.Cache` \
                 produced by `self_attn.gen_cache(memory, MultiHeadAttention.Cache)`, \
-                it reserves two tensors shaped `[batch_size, nhead, 0, d_model // nhead]`. \
+                it reserves two tensors shaped `[batch_size, nhead, 0, d_model // nhead]`, \
+                or it is an instance of `MultiHeadAttention.PreallocatedCache` reserving \
+                two tensors shaped `[batch_size, nhead, max_length, d_model // nhead]`. \
                 `static_cache` is an instance of `MultiHeadAttention.StaticCache` \
                 produced by `cross_attn.gen_cache(memory, MultiHeadAttention.StaticCache)`, \
                 it reserves two tensors shaped `[batch_size, nhead, source_length, d_model // nhead]`.
@@ -823,7 +952,7 @@ class TransformerDecoderLayer(Layer):
                 for more details.
         """
         incremental_cache = self.self_attn.gen_cache(
-            memory, type=self.self_attn.Cache)
+            memory, type=type, max_length=max_length)
         static_cache = self.cross_attn.gen_cache(
             memory, memory, type=self.cross_attn.StaticCache)
         return incremental_cache, static_cache
@@ -936,7 +1065,11 @@ class TransformerDecoder(Layer):
 
         return output if cache is None else (output, new_caches)
 
-    def gen_cache(self, memory, do_zip=False):
+    def gen_cache(self,
+                  memory,
+                  do_zip=False,
+                  type=MultiHeadAttention.Cache,
+                  max_length=None):
         r"""
         Generates cache for `forward` usage. The generated cache is a list, and
         each element in it is a tuple( :code:`(incremental_cache, static_cache)` )
@@ -951,6 +1084,11 @@ class TransformerDecoder(Layer):
                 should be float32 or float64.
             do_zip (bool, optional): Indicate whether to apply `zip` on the tuples.
                 If True, return a list with two elements. Default False
+            type (type, optional): The type of incremental caches, it should be
+                `MultiHeadAttention.Cache` or `MultiHeadAttention.PreallocatedCache`.
+                Default `MultiHeadAttention.Cache`.
+            max_length (int, optional): The max decoding length, it is required
+                when `type` is `MultiHeadAttention.PreallocatedCache`. Default None.
 
         Returns:
             list: It is a list, and each element in the list is a tuple produced \
@@ -958,7 +1096,11 @@ class TransformerDecoder(Layer):
                 for more details. If `do_zip` is True, apply `zip` on these tuples \
                 and return a list with two elements.
         """
-        cache = [layer.gen_cache(memory) for layer in self.layers]
+        cache = [
+            layer.gen_cache(
+                memory, type=type, max_length=max_length)
+            for layer in self.layers
+        ]
         if do_zip:
             cache = list(zip(*cache))
         return cache
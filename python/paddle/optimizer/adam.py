@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .optimizer import Optimizer
+from .optimizer import Optimizer, _scale_inplace
 from ..fluid import core
 from ..fluid import framework
 from ..fluid.framework import Variable
@@ -78,6 +78,11 @@ class Adam(Optimizer):
             gradient in current mini-batch, so it will be much more faster. But this mode has
             different semantics with the original Adam algorithm and may lead to different result.
             The default value is False.
+        multi_tensor (bool, optional): Whether to update the parameters with the same dtype and
+            learning rate by one op in dygraph mode. If True, these parameters, their moments
+            and gradients are copied into flat tensors, and the parameters and moments become
+            the views of the flat tensors. It reduces the overhead of launching ops when there
+            are lots of small parameters. The default value is False.
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
@@ -134,6 +139,7 @@ class Adam(Optimizer):
                  weight_decay=None,
                  grad_clip=None,
                  lazy_mode=False,
+                 multi_tensor=False,
                  name=None):
         assert learning_rate is not None
         assert beta1 is not None
@@ -156,6 +162,7 @@ class Adam(Optimizer):
         self._beta2 = beta2
         self._epsilon = epsilon
         self._lazy_mode = lazy_mode
+        self._multi_tensor = multi_tensor
 
     def _create_accumulators(self, block, parameters):
         assert isinstance(block, framework.Block)
@@ -247,6 +254,35 @@ class Adam(Optimizer):
 
         return adam_op
 
+    def _append_fused_optimize_op(self, block, group, flat_grad):
+        param = group.params[0]
+        moment1 = self._get_fused_accumulator(self._moment1_acc_str, group)
+        moment2 = self._get_fused_accumulator(self._moment2_acc_str, group)
+        beta1_pow_accs = self._get_fused_accumulator(self._beta1_pow_acc_str,
+                                                     group)
+        beta2_pow_accs = self._get_fused_accumulator(self._beta2_pow_acc_str,
+                                                     group)
+        # the parameters in group always have the same beta pow
+        beta1_pow_acc = self._get_accumulator(self._beta1_pow_acc_str, param)
+        beta2_pow_acc = self._get_accumulator(self._beta2_pow_acc_str, param)
+        lr = self._create_param_lr((param, flat_grad))
+
+        _beta1 = self._beta1 if not isinstance(
+            self._beta1, Variable) else self._beta1.numpy().item(0)
+        _beta2 = self._beta2 if not isinstance(
+            self._beta2, Variable) else self._beta2.numpy().item(0)
+        beta1_pow_out = framework._varbase_creator(dtype=beta1_pow_acc.dtype)
+        beta2_pow_out = framework._varbase_creator(dtype=beta2_pow_acc.dtype)
+        _, _, _, _, _ = core.ops.adam(
+            group.flat_param, flat_grad, lr, moment1, moment2, beta1_pow_acc,
+            beta2_pow_acc, group.flat_param, moment1, moment2, beta1_pow_out,
+            beta2_pow_out, 'epsilon', self._epsilon, 'lazy_mode',
+            self._lazy_mode, 'min_row_size_to_use_multithread', 1000, 'beta1',
+            _beta1, 'beta2', _beta2)
+        # update the beta pow of all the parameters by one op
+        _scale_inplace(beta1_pow_accs, _beta1)
+        _scale_inplace(beta2_pow_accs, _beta2)
+
     @framework.dygraph_only
     def step(self):
         """
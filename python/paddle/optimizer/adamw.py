@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .optimizer import Optimizer
+from .optimizer import Optimizer, _scale_inplace
 from .adam import Adam
 from ..fluid import framework
 from ..fluid.dygraph import base as imperative_base
@@ -71,6 +71,9 @@ class AdamW(Adam):
             gradient in current mini-batch, so it will be much more faster. But this mode has
             different semantics with the original Adam algorithm and may lead to different result.
             The default value is False.
+        multi_tensor (bool, optional): Whether to update the parameters with the same dtype,
+            learning rate and weight decay by one op in dygraph mode. See ``Adam`` for more
+            details. The default value is False.
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
@@ -110,6 +113,7 @@ class AdamW(Adam):
                  apply_decay_param_fun=None,
                  grad_clip=None,
                  lazy_mode=False,
+                 multi_tensor=False,
                  name=None):
         assert learning_rate is not None
         assert beta1 is not None
@@ -136,7 +140,15 @@ class AdamW(Adam):
             epsilon=epsilon,
             grad_clip=grad_clip,
             name=name,
-            lazy_mode=lazy_mode)
+            lazy_mode=lazy_mode,
+            multi_tensor=multi_tensor)
+
+    def _need_decay(self, param):
+        return self._apply_decay_param_fun is None or \
+            self._apply_decay_param_fun(param.name)
+
+    def _fused_group_key(self, param):
+        return self._need_decay(param)
 
     def _scale_parameters(self, params_and_grads):
         """
@@ -155,8 +167,7 @@ class AdamW(Adam):
             # If no gradient then we don't need to do anything
             if grad is None:
                 continue
-            if self._apply_decay_param_fun is not None \
-                    and not self._apply_decay_param_fun(param.name):
+            if not self._need_decay(param):
                 continue
 
             if isinstance(self._coeff, float):
@@ -207,6 +218,25 @@ class AdamW(Adam):
             startup_program=startup_program)
         return optimize_ops, params_grads
 
+    def _scale_fused_parameters(self, params_grads):
+        """
+        Decays the parameters of fused groups by one op per group in multi
+        tensor mode, and returns the (param, grad) pairs not decayed yet.
+        """
+        fused_groups, params_grads = self._split_fused_params_grads(
+            params_grads)
+        if isinstance(self._learning_rate, float):
+            learning_rate = self._learning_rate
+        else:
+            learning_rate = self._learning_rate()
+        coeff = self._coeff if isinstance(
+            self._coeff, float) else self._coeff.numpy().item(0)
+        for group, _ in fused_groups:
+            if self._need_decay(group.params[0]):
+                _scale_inplace(group.flat_param, 1.0 - coeff * learning_rate)
+                self._params_name.update(param.name for param in group.params)
+        return params_grads
+
     @framework.dygraph_only
     @imperative_base.no_grad
     def step(self):
@@ -219,7 +249,11 @@ class AdamW(Adam):
                 grad_var = param._grad_ivar()
                 params_grads.append((param, grad_var))
 
-        scaled_params = self._scale_parameters(params_grads)
+        if self._multi_tensor:
+            scaled_params = self._scale_parameters(
+                self._scale_fused_parameters(params_grads))
+        else:
+            scaled_params = self._scale_parameters(params_grads)
         for p_grad_sgrad in scaled_params:
             param, grad, scaled_param = p_grad_sgrad
             with param.block.program._optimized_guard(
@@ -62,6 +62,11 @@ class Momentum(Optimizer):
             some derived class of ``GradientClipBase`` . There are three cliping strategies
             ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
             :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        multi_tensor (bool, optional): Whether to update the parameters with the same dtype and
+            learning rate by one op in dygraph mode. If True, these parameters, their velocities
+            and gradients are copied into flat tensors, and the parameters and velocities become
+            the views of the flat tensors. It reduces the overhead of launching ops when there
+            are lots of small parameters. The default value is False.
         name (str, optional): The default value is None. Normally there is no need for user
                 to set this property. For more information, please refer to
                 :ref:`api_guide_Name` .
@@ -92,6 +97,7 @@ class Momentum(Optimizer):
                  use_nesterov=False,
                  weight_decay=None,
                  grad_clip=None,
+                 multi_tensor=False,
                  name=None):
         if learning_rate is None:
             raise ValueError("learning_rate is not set")
@@ -106,6 +112,7 @@ class Momentum(Optimizer):
         self.type = "momentum"
         self._momentum = momentum
         self._use_nesterov = bool(use_nesterov)
+        self._multi_tensor = multi_tensor
         if framework.in_dygraph_mode():
             self.helper = LayerHelper(self.__class__.__name__)
             for p in parameters:
@@ -156,3 +163,12 @@ class Momentum(Optimizer):
             stop_gradient=True)
 
         return momentum_op
+
+    def _append_fused_optimize_op(self, block, group, flat_grad):
+        velocity_acc = self._get_fused_accumulator(self._velocity_acc_str,
+                                                   group)
+        lr = self._create_param_lr((group.params[0], flat_grad))
+        _, _ = core.ops.momentum(group.flat_param, flat_grad, velocity_acc, lr,
+                                 group.flat_param, velocity_acc, 'mu',
+                                 self._momentum, 'use_nesterov',
+                                 self._use_nesterov)
@@ -17,7 +17,7 @@ from __future__ import print_function
 import numpy as np
 import six
 import logging
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import paddle
 from paddle.fluid.distribute_lookup_table import find_distributed_lookup_table
@@ -45,6 +45,51 @@ from .lr import LRScheduler
 __all__ = ['Optimizer']
 
 
+@framework.dygraph_only
+def _fuse_tensors(tensors, dtype):
+    """
+    Copy `tensors` into a flat tensor, and make them the views of it.
+    """
+    fused_tensor = framework._varbase_creator(dtype=dtype)
+    framework._dygraph_tracer().trace_op(
+        type="coalesce_tensor",
+        inputs={"Input": tensors},
+        outputs={"Output": tensors,
+                 "FusedOutput": fused_tensor},
+        attrs={"copy_data": True,
+               "use_align": False,
+               "dtype": dtype},
+        stop_gradient=True)
+    return fused_tensor
+
+
+@framework.dygraph_only
+def _scale_inplace(x, scale):
+    framework._dygraph_tracer().trace_op(
+        type="scale",
+        inputs={"X": x},
+        outputs={"Out": x},
+        attrs={"scale": float(scale)},
+        stop_gradient=True)
+
+
+class _FusedParamGroup(object):
+    """
+    The parameters with the same dtype and optimize attributes in multi
+    tensor mode. The parameters and their accumulators are views of flat
+    tensors, so all of them are updated by one optimizer op.
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self.dtype = params[0].dtype
+        self.flat_param = _fuse_tensors(params, self.dtype)
+        self.flat_accumulators = {}
+        # False if some parameters were updated without the others, their
+        # accumulators like beta pow of Adam would be different since then.
+        self.valid = True
+
+
 class Optimizer(object):
     r"""Optimizer Base class.
 
@@ -147,6 +192,10 @@ class Optimizer(object):
         self._accumulators_holder = {}
         self._param_device_map = dict()
         self.clear_gradients = self.clear_grad
+        # Update the parameters in groups by one op per group in dygraph
+        # mode, it's turned on by the subclasses supporting it.
+        self._multi_tensor = False
+        self._fused_groups = None
 
     @framework.dygraph_only
     def state_dict(self):
@@ -536,6 +585,81 @@ class Optimizer(object):
                             format(name, param.name))
         return self._accumulators[name][param.name]
 
+    def _fused_group_key(self, param):
+        """
+        The key to group the parameter in multi tensor mode besides dtype
+        and learning rate, the parameters in a group share all the attributes
+        of the optimizer op.
+        """
+        return None
+
+    def _create_fused_groups(self):
+        groups = OrderedDict()
+        for param in self._parameter_list:
+            if not param.trainable:
+                continue
+            param_lr = param.optimize_attr['learning_rate']
+            if isinstance(param_lr, Variable):
+                continue
+            key = (param.dtype, param_lr, self._fused_group_key(param))
+            groups.setdefault(key, []).append(param)
+        # a single parameter gains nothing from fusion
+        return [
+            _FusedParamGroup(params) for params in groups.values()
+            if len(params) > 1
+        ]
+
+    def _split_fused_params_grads(self, parameters_and_grads):
+        """
+        Split `parameters_and_grads` into the fused groups whose parameters
+        all have dense gradients, and the remaining (param, grad) pairs
+        to be updated one by one.
+
+        Returns:
+            tuple: ([(group, grads), ...], [(param, grad), ...])
+        """
+        if self._fused_groups is None:
+            self._fused_groups = self._create_fused_groups()
+        grads = dict((param.name, grad)
+                     for param, grad in parameters_and_grads
+                     if grad is not None and param.trainable)
+        fused_groups = []
+        fused_names = set()
+        for group in self._fused_groups:
+            if not group.valid:
+                continue
+            group_grads = [grads.get(param.name) for param in group.params]
+            if all(grad is not None and not (hasattr(grad, "_is_sparse") and
+                                             grad._is_sparse())
+                   for grad in group_grads):
+                fused_groups.append((group, group_grads))
+                fused_names.update(param.name for param in group.params)
+            else:
+                group.valid = False
+        remaining = [(param, grad) for param, grad in parameters_and_grads
+                     if param.name not in fused_names]
+        return fused_groups, remaining
+
+    def _get_fused_accumulator(self, name, group):
+        """
+        Get the flat tensor of accumulator `name` for all the parameters in
+        `group`, the accumulators become the views of it.
+        """
+        if name not in group.flat_accumulators:
+            accumulators = [
+                self._get_accumulator(name, param) for param in group.params
+            ]
+            group.flat_accumulators[name] = _fuse_tensors(
+                accumulators, accumulators[0].dtype)
+        return group.flat_accumulators[name]
+
+    def _append_fused_optimize_op(self, block, group, flat_grad):
+        """ update all the parameters in the fused `group` by one op
+        """
+        raise NotImplementedError(
+            "Multi tensor mode is not supported by optimizer %s." %
+            self.__class__.__name__)
+
     def _update_param_device_map(self, parameters_and_grads, target_block):
         for param_and_grad in parameters_and_grads:
             if param_and_grad[0].trainable is True:
@@ -598,7 +722,15 @@ class Optimizer(object):
         self._create_global_learning_rate()
 
         if framework.in_dygraph_mode():
-            for param_and_grad in parameters_and_grads:
+            remaining_params_grads = parameters_and_grads
+            if self._multi_tensor:
+                fused_groups, remaining_params_grads = \
+                    self._split_fused_params_grads(parameters_and_grads)
+                for group, grads in fused_groups:
+                    flat_grad = _fuse_tensors(grads, group.dtype)
+                    self._append_fused_optimize_op(target_block, group,
+                                                   flat_grad)
+            for param_and_grad in remaining_params_grads:
                 if param_and_grad[1] is None:
                     continue
                 if param_and_grad[0].trainable is True:
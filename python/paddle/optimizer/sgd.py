@@ -45,6 +45,11 @@ class SGD(Optimizer):
             some derived class of ``GradientClipBase`` . There are three cliping strategies
             ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
             :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        multi_tensor (bool, optional): Whether to update the parameters with the same dtype and
+            learning rate by one op in dygraph mode. If True, these parameters and gradients are
+            copied into flat tensors, and the parameters become the views of the flat tensor.
+            It reduces the overhead of launching ops when there are lots of small parameters.
+            The default value is False.
         name (str, optional): The default value is None. Normally there is no need for user
                 to set this property. For more information, please refer to
                 :ref:`api_guide_Name` . 
@@ -73,6 +78,7 @@ class SGD(Optimizer):
                  parameters=None,
                  weight_decay=None,
                  grad_clip=None,
+                 multi_tensor=False,
                  name=None):
         if learning_rate is None:
             raise ValueError("learning_rate is not set")
@@ -83,6 +89,7 @@ class SGD(Optimizer):
             grad_clip=grad_clip,
             name=name)
         self.type = "sgd"
+        self._multi_tensor = multi_tensor
 
     @no_grad
     def _append_optimize_op(self, block, param_and_grad):
@@ -105,3 +112,8 @@ class SGD(Optimizer):
             stop_gradient=True)
 
         return sgd_op
+
+    @no_grad
+    def _append_fused_optimize_op(self, block, group, flat_grad):
+        lr = self._create_param_lr((group.params[0], flat_grad))
+        core.ops.sgd(group.flat_param, lr, flat_grad, group.flat_param)
@@ -17,19 +17,27 @@ __all__ = [
     'ComposeNotAligned', 'firstn', 'xmap_readers', 'multiprocess_reader'
 ]
 
-from threading import Thread
+from threading import Thread, Condition, Event, Semaphore
 import subprocess
 import multiprocessing
 import six
 import sys
+import os
+import glob
+import mmap
+import tempfile
+import traceback
+import numpy as np
 
 from six.moves.queue import Queue
+from six.moves import queue
 from six.moves import zip_longest
 from six.moves import map
 from six.moves import zip
 import itertools
 import random
 import zlib
+from six.moves import cPickle as pickle
 import paddle.compat as cpt
 
 # On macOS, the 'spawn' start method is now the default in Python3.8 multiprocessing,
@@ -408,7 +416,142 @@ class XmapEndSignal():
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+# numpy arrays smaller than it are pickled through the queue directly
+_SHARED_MEMORY_MIN_BYTES = 1 << 16
+_SHARED_MEMORY_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+# seconds to check whether the worker processes are alive
+_WORKER_CHECK_INTERVAL = 5
+
+
+class _SharedArray(object):
+    """
+    The descriptor of a numpy array written into a shared memory file.
+    """
+
+    def __init__(self, path, dtype, shape):
+        self.path = path
+        self.dtype = dtype
+        self.shape = shape
+
+
+class _WorkerError(object):
+    def __init__(self, message):
+        self.message = message
+
+
+# the offsets of the arrays in a shared memory slot are aligned to it
+_SLOT_ALIGN = 64
+
+
+class _SlotArray(object):
+    """
+    The descriptor of a numpy array written into a shared memory slot.
+    """
+
+    def __init__(self, offset, dtype, shape):
+        self.offset = offset
+        self.dtype = dtype
+        self.shape = shape
+
+
+def _to_slot(data, arrays, offset=0):
+    """
+    Replace the numpy arrays in `data` by _SlotArray placed from `offset`,
+    and append the (array, _SlotArray) pairs to `arrays`.
+
+    Returns:
+        tuple: the data with _SlotArray, and the end offset of the arrays.
+    """
+    if isinstance(data, (list, tuple)):
+        metas = []
+        for d in data:
+            meta, offset = _to_slot(d, arrays, offset)
+            metas.append(meta)
+        return type(data)(metas), offset
+    if not isinstance(data, np.ndarray) or data.dtype.hasobject:
+        return data, offset
+    meta = _SlotArray(offset, data.dtype, data.shape)
+    arrays.append((data, meta))
+    end = offset + data.nbytes
+    return meta, (end + _SLOT_ALIGN - 1) // _SLOT_ALIGN * _SLOT_ALIGN
+
+
+def _from_slot(data, buf, begin):
+    """
+    Copy the _SlotArray in `data` out of the slot at `begin` of `buf`.
+    """
+    if isinstance(data, (list, tuple)):
+        return type(data)(_from_slot(d, buf, begin) for d in data)
+    if not isinstance(data, _SlotArray):
+        return data
+    return np.ndarray(
+        data.shape, data.dtype, buffer=buf, offset=begin + data.offset).copy()
+
+
+def _to_shared_memory(data, prefix):
+    """
+    Replace the large numpy arrays in `data` by _SharedArray.
+    """
+    if isinstance(data, (list, tuple)):
+        return type(data)(_to_shared_memory(d, prefix) for d in data)
+    if not isinstance(data, np.ndarray) or data.dtype.hasobject or \
+            data.nbytes < _SHARED_MEMORY_MIN_BYTES:
+        return data
+    fd, path = tempfile.mkstemp(prefix=prefix, dir=_SHARED_MEMORY_DIR)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(np.ascontiguousarray(data).data)
+    return _SharedArray(path, data.dtype, data.shape)
+
+
+def _from_shared_memory(data):
+    """
+    Map the _SharedArray in `data` back to numpy arrays without copy, the
+    shared memory file is removed and released with the array.
+    """
+    if isinstance(data, (list, tuple)):
+        return type(data)(_from_shared_memory(d) for d in data)
+    if not isinstance(data, _SharedArray):
+        return data
+    with open(data.path, 'r+b') as f:
+        buf = mmap.mmap(f.fileno(), 0)
+    os.remove(data.path)
+    return np.frombuffer(buf, dtype=data.dtype).reshape(data.shape)
+
+
+def _cleanup_shared_memory(prefix):
+    for path in glob.glob(
+            os.path.join(_SHARED_MEMORY_DIR or tempfile.gettempdir(), prefix +
+                         '*')):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _xmap_process_worker(mapper, in_queue, out_queue, shm_prefix):
+    while True:
+        ins = in_queue.get()
+        if ins is None:
+            break
+        idx, sample = ins
+        # pickle the output here rather than in the feeder thread of the
+        # queue, where an error drops the output and the reader waits forever
+        try:
+            out = pickle.dumps(
+                _to_shared_memory(mapper(sample), shm_prefix),
+                protocol=pickle.HIGHEST_PROTOCOL)
+        except:
+            out = _WorkerError(traceback.format_exc())
+        out_queue.put((idx, out))
+    out_queue.put(None)
+
+
+def xmap_readers(mapper,
+                 reader,
+                 process_num,
+                 buffer_size,
+                 order=False,
+                 use_process=False):
     """
     Use multi-threads to map samples from reader by a mapper defined by user.
 
@@ -419,6 +562,12 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         buffer_size (int): size of the queue to read data in. 
         order (bool): whether to keep the data order from original reader. 
             Default False.
+        use_process (bool): whether to map the samples in `process_num`
+            processes instead of threads, for the CPU bound mappers. The
+            samples are pickled to the processes, and the large numpy arrays
+            in the mapped samples are returned by shared memory. At most
+            `buffer_size` samples are being mapped or waiting to be
+            reordered. Not supported on windows. Default False.
 
     Returns:
         callable: a decorated reader with data mapping. 
@@ -452,15 +601,18 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
 
     # define a worker to handle samples from in_queue by mapper
     # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
+    def order_handle_worker(in_queue, out_queue, mapper, out_order,
+                            order_cond):
         ins = in_queue.get()
         while not isinstance(ins, XmapEndSignal):
             order, sample = ins
             r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
+            with order_cond:
+                while order != out_order[0]:
+                    order_cond.wait()
+                out_queue.put(r)
+                out_order[0] += 1
+                order_cond.notify_all()
             ins = in_queue.get()
         in_queue.put(end)
         out_queue.put(end)
@@ -476,8 +628,8 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         t.start()
         # start several handle_workers
         target = order_handle_worker if order else handle_worker
-        args = (in_queue, out_queue, mapper, out_order) if order else (
-            in_queue, out_queue, mapper)
+        args = (in_queue, out_queue, mapper, out_order,
+                Condition()) if order else (in_queue, out_queue, mapper)
         workers = []
         for i in range(process_num):
             worker = Thread(target=target, args=args)
@@ -498,10 +650,97 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
             else:
                 yield sample
 
+    def process_xreader():
+        # the queues are not bounded, the samples in flight are bounded by
+        # the semaphore, it's released when a sample is yielded
+        in_queue = fork_context.Queue()
+        out_queue = fork_context.Queue()
+        slots = Semaphore(buffer_size)
+        closed = Event()
+        reader_error = []
+        shm_prefix = "paddle_xmap_{}_{}_".format(os.getpid(), id(in_queue))
+
+        def feed_worker():
+            try:
+                for idx, sample in enumerate(reader()):
+                    slots.acquire()
+                    if closed.is_set():
+                        return
+                    in_queue.put((idx, sample))
+            except:
+                reader_error.append(sys.exc_info())
+            finally:
+                for _ in range(process_num):
+                    in_queue.put(None)
+
+        workers = []
+        for i in range(process_num):
+            worker = fork_context.Process(
+                target=_xmap_process_worker,
+                args=(mapper, in_queue, out_queue, shm_prefix))
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+        t = Thread(target=feed_worker)
+        t.daemon = True
+        t.start()
+
+        try:
+            finish = 0
+            next_idx = 0
+            pending = {}
+            while finish < process_num:
+                try:
+                    ret = out_queue.get(timeout=_WORKER_CHECK_INTERVAL)
+                except queue.Empty:
+                    if any(w.exitcode not in (None, 0) for w in workers):
+                        raise RuntimeError(
+                            "xmap_readers worker exits unexpectedly")
+                    continue
+                if ret is None:
+                    finish += 1
+                    continue
+                idx, sample = ret
+                if isinstance(sample, _WorkerError):
+                    raise RuntimeError("xmap_readers mapper raises an "
+                                       "exception:\n" + sample.message)
+                sample = _from_shared_memory(pickle.loads(sample))
+                if not order:
+                    slots.release()
+                    yield sample
+                    continue
+                # the reorder buffer
+                pending[idx] = sample
+                while next_idx in pending:
+                    slots.release()
+                    yield pending.pop(next_idx)
+                    next_idx += 1
+            if reader_error:
+                six.reraise(*reader_error[0])
+        finally:
+            closed.set()
+            slots.release()
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+            _cleanup_shared_memory(shm_prefix)
+
+    if use_process:
+        if sys.platform == 'win32':
+            raise NotImplementedError(
+                "The use_process mode of xmap_readers is not supported on "
+                "windows.")
+        return process_xreader
     return xreader
 
 
-def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
+def multiprocess_reader(readers,
+                        use_pipe=True,
+                        queue_size=1000,
+                        use_shared_memory=False,
+                        shared_memory_slot_num=8,
+                        shared_memory_slot_size=1 << 22):
     """
     This API use python ``multiprocessing`` to read data from ``readers`` parallelly,
     and then ``multiprocess.Queue`` or ``multiprocess.Pipe`` is used to merge 
@@ -521,6 +760,15 @@ def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
        queue_size (int, optional): only useful when ``use_pipe`` is False - ``multiprocess.Queue``
            is used, default 1000. Increase this value can speed up the data reading, and more memory
            will be consumed.
+       use_shared_memory (bool, optional): whether to pass the numpy arrays in the samples by
+           shared memory, ``use_pipe`` is ignored if it's True, default False. Each reader writes
+           its samples into a ring of ``shared_memory_slot_num`` slots, and only the descriptors
+           of the arrays are put into a ``multiprocess.Queue``, the reader waits when all its slots
+           are not read yet. The samples larger than a slot are pickled through the queue. If a
+           reader raises an exception, the other readers are terminated and an exception is raised.
+       shared_memory_slot_num (int, optional): the number of shared memory slots of each reader,
+           default 8.
+       shared_memory_slot_size (int, optional): the bytes of each shared memory slot, default 4MB.
 
     Returns:
         ``generator``: a new reader which can be run parallelly
@@ -666,7 +914,87 @@ def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
                 else:
                     yield sample
 
-    if use_pipe:
+    def _read_into_shared_memory(reader_id, reader, queue, buf, slot_sem):
+        ppid = os.getppid()
+        base = reader_id * shared_memory_slot_num * shared_memory_slot_size
+        slot = 0
+        try:
+            for sample in reader():
+                if sample is None:
+                    raise ValueError("sample has None")
+                arrays = []
+                meta, end = _to_slot(sample, arrays)
+                if not arrays or end > shared_memory_slot_size:
+                    queue.put((reader_id, None, sample))
+                    continue
+                # wait for the slot to be read, exit if the parent exits
+                while not slot_sem.acquire(
+                        timeout=_WORKER_CHECK_INTERVAL):
+                    if os.getppid() != ppid:
+                        return
+                begin = base + slot * shared_memory_slot_size
+                for array, m in arrays:
+                    np.ndarray(
+                        m.shape, m.dtype, buffer=buf,
+                        offset=begin + m.offset)[...] = array
+                queue.put((reader_id, slot, meta))
+                slot = (slot + 1) % shared_memory_slot_num
+            queue.put(None)
+        except:
+            queue.put((reader_id, None, _WorkerError(traceback.format_exc())))
+
+    def shared_memory_reader():
+        # anonymous shared memory created before fork is shared with the
+        # readers, and released when all the processes exit
+        buf = mmap.mmap(-1, len(readers) * shared_memory_slot_num *
+                        shared_memory_slot_size)
+        data_queue = fork_context.Queue(queue_size)
+        slot_sems = []
+        processes = []
+        for reader_id, reader in enumerate(readers):
+            slot_sem = fork_context.Semaphore(shared_memory_slot_num)
+            p = fork_context.Process(
+                target=_read_into_shared_memory,
+                args=(reader_id, reader, data_queue, buf, slot_sem))
+            p.daemon = True
+            p.start()
+            slot_sems.append(slot_sem)
+            processes.append(p)
+
+        try:
+            reader_num = len(readers)
+            finish_num = 0
+            while finish_num < reader_num:
+                try:
+                    ret = data_queue.get(timeout=_WORKER_CHECK_INTERVAL)
+                except queue.Empty:
+                    if any(p.exitcode not in (None, 0) for p in processes):
+                        raise ValueError(
+                            "multiprocess reader exits unexpectedly")
+                    continue
+                if ret is None:
+                    finish_num += 1
+                    continue
+                reader_id, slot, sample = ret
+                if isinstance(sample, _WorkerError):
+                    raise ValueError("multiprocess reader raises an "
+                                     "exception:\n" + sample.message)
+                if slot is not None:
+                    begin = (reader_id * shared_memory_slot_num + slot
+                             ) * shared_memory_slot_size
+                    sample = _from_slot(sample, buf, begin)
+                    slot_sems[reader_id].release()
+                yield sample
+        finally:
+            for p in processes:
+                if p.is_alive():
+                    p.terminate()
+                p.join()
+            buf.close()
+
+    if use_shared_memory:
+        return shared_memory_reader
+    elif use_pipe:
         return pipe_reader
     else:
         return queue_reader
@@ -17,6 +17,7 @@ import time
 import unittest
 import functools
 
+import numpy as np
 import paddle.reader
 
 
@@ -148,6 +149,62 @@ class TestXmap(unittest.TestCase):
                             self.assertEqual(e, mapper(idx))
 
 
+class TestXmapProcess(unittest.TestCase):
+    def test_xmap_process(self):
+        if sys.platform == 'win32':
+            return
+
+        def mapper(x):
+            # large enough to be returned by shared memory
+            return x, np.full([128, 128], x, dtype='float32')
+
+        for order in (True, False):
+            for process_num in (1, 4):
+                for size in (1, 8):
+                    reader = paddle.reader.xmap_readers(
+                        mapper,
+                        reader_creator_10(0),
+                        process_num,
+                        size,
+                        order,
+                        use_process=True)
+                    result = list(reader())
+                    indices = [r[0] for r in result]
+                    if not order:
+                        indices.sort()
+                    self.assertEqual(indices, list(range(10)))
+                    for i, array in result:
+                        self.assertTrue(np.all(array == i))
+
+    def test_mapper_exception(self):
+        if sys.platform == 'win32':
+            return
+
+        def mapper(x):
+            if x == 5:
+                raise ValueError("mapper error")
+            return x
+
+        reader = paddle.reader.xmap_readers(
+            mapper, reader_creator_10(0), 2, 4, True, use_process=True)
+        with self.assertRaises(RuntimeError):
+            for _ in reader():
+                pass
+
+    def test_unpicklable_output(self):
+        if sys.platform == 'win32':
+            return
+
+        def mapper(x):
+            return x, lambda: x
+
+        reader = paddle.reader.xmap_readers(
+            mapper, reader_creator_10(0), 2, 4, True, use_process=True)
+        with self.assertRaises(RuntimeError):
+            for _ in reader():
+                pass
+
+
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
         self.samples = []
@@ -176,6 +233,54 @@ class TestMultiProcessReader(unittest.TestCase):
             self.reader_test(use_pipe=False)
             self.reader_test(use_pipe=True)
 
+    def test_shared_memory(self):
+        if sys.platform == 'win32':
+            return
+
+        def reader(index):
+            for i in range(300):
+                if i % 3 == index:
+                    yield np.full([64, 64], i, dtype='float32'), [i]
+
+        readers = [functools.partial(reader, i) for i in range(3)]
+        # the samples larger than a slot are pickled through the queue
+        for slot_size in (1 << 22, 1024):
+            results = list(
+                paddle.reader.multiprocess_reader(
+                    readers,
+                    use_shared_memory=True,
+                    shared_memory_slot_num=2,
+                    shared_memory_slot_size=slot_size)())
+            self.assertEqual(
+                sorted(label[0] for _, label in results), list(range(300)))
+            for image, label in results:
+                self.assertTrue(np.all(image == label[0]))
+
+        self.setup()
+        results = list(
+            paddle.reader.multiprocess_reader(
+                [self.reader0, self.reader1, self.reader2],
+                use_shared_memory=True)())
+        self.assertEqual(sorted(self.samples), sorted(results))
+
+    def test_shared_memory_exception(self):
+        if sys.platform == 'win32':
+            return
+
+        def error_reader():
+            yield np.zeros([10]),
+            raise IOError("reader error")
+
+        def endless_reader():
+            while True:
+                yield np.zeros([10]),
+
+        reader = paddle.reader.multiprocess_reader(
+            [error_reader, endless_reader], use_shared_memory=True)
+        with self.assertRaises(ValueError):
+            for _ in reader():
+                pass
+
 
 if __name__ == '__main__':
     unittest.main()
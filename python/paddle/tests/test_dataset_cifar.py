@@ -69,6 +69,31 @@ class TestCifar10Test(unittest.TestCase):
             cifar = Cifar10(mode='test', backend=1)
 
 
+class TestCifar10Batch(unittest.TestCase):
+    def test_main(self):
+        cifar = Cifar10(mode='test', backend='cv2')
+        indices = np.random.randint(0, 10000, [8])
+        images, labels = cifar[indices]
+        self.assertTrue(images.shape == (8, 32, 32, 3))
+        self.assertTrue(labels.shape == (8, ))
+        for i, idx in enumerate(indices):
+            image, label = cifar[idx]
+            self.assertTrue(np.array_equal(images[i], image))
+            self.assertTrue(int(labels[i]) == int(label))
+
+    def test_data(self):
+        cifar = Cifar10(mode='test', backend='cv2')
+        image, label = cifar[5]
+        sample, sample_label = cifar.data[5]
+        self.assertTrue(sample.dtype == np.uint8)
+        self.assertTrue(sample.shape == (3072, ))
+        self.assertTrue(sample_label == int(label))
+
+        cifar.data = cifar.data[:6]
+        self.assertTrue(len(cifar) == 6)
+        self.assertTrue(np.array_equal(cifar[5][0], image))
+
+
 class TestCifar100Train(unittest.TestCase):
     def test_main(self):
         cifar = Cifar100(mode='train')
@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import os
+import shutil
+import tarfile
+import tempfile
 import unittest
 import numpy as np
 
@@ -46,5 +51,55 @@ class TestImdbTest(unittest.TestCase):
         self.assertTrue(int(label) in [0, 1])
 
 
+class TestImdbCache(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.data_dir, 'imdb.tar.gz')
+        docs = {
+            'pos': [b'good movie, good!\n', b'a good one\n'],
+            'neg': [b'bad movie.\n'],
+        }
+        with tarfile.open(self.data_file, 'w:gz') as f:
+            for mode in ['train', 'test']:
+                for label, label_docs in docs.items():
+                    for i, doc in enumerate(label_docs):
+                        info = tarfile.TarInfo('aclImdb/{}/{}/{}_1.txt'.format(
+                            mode, label, i))
+                        info.size = len(doc)
+                        f.addfile(info, io.BytesIO(doc))
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_main(self):
+        for num_workers in [1, 2]:
+            imdb = Imdb(
+                data_file=self.data_file,
+                mode='train',
+                cutoff=2,
+                num_workers=num_workers)
+            # only "good" and "movie" appear more than twice
+            self.assertEqual(imdb.word_idx, {
+                b'good': 0,
+                b'movie': 1,
+                '<unk>': 2
+            })
+            self.assertEqual(len(imdb), 3)
+            self.assertEqual(imdb[0][0].tolist(), [0, 1, 0])
+            self.assertEqual(imdb[1][0].tolist(), [2, 0, 2])
+            self.assertEqual(imdb[2][0].tolist(), [2, 1])
+            self.assertEqual([imdb[i][1][0] for i in range(3)], [0, 0, 1])
+            for name in os.listdir(self.data_dir):
+                if name.endswith('.npy'):
+                    os.remove(os.path.join(self.data_dir, name))
+
+        Imdb(data_file=self.data_file, mode='test', cutoff=2)
+        cache_files = set(os.listdir(self.data_dir))
+        # the cache is reused by the later constructions
+        imdb = Imdb(data_file=self.data_file, mode='test', cutoff=2)
+        self.assertEqual(set(os.listdir(self.data_dir)), cache_files)
+        self.assertEqual(imdb[2][0].tolist(), [2, 1])
+
+
 if __name__ == '__main__':
     unittest.main()
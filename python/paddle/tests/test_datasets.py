@@ -134,6 +134,46 @@ class TestMNISTTrain(unittest.TestCase):
             mnist = MNIST(mode='train', transform=transform, backend=1)
 
 
+class TestMNISTBatch(unittest.TestCase):
+    def test_main(self):
+        mnist = MNIST(mode='test', backend='cv2')
+        self.assertTrue(isinstance(mnist.image_array, np.memmap))
+        self.assertTrue(mnist.image_array.dtype == np.uint8)
+
+        indices = np.random.randint(0, 10000, [16])
+        images, labels = mnist[indices]
+        self.assertTrue(images.shape == (16, 28, 28))
+        self.assertTrue(labels.shape == (16, 1))
+        for i, idx in enumerate(indices):
+            image, label = mnist[idx]
+            self.assertTrue(np.array_equal(images[i], image))
+            self.assertTrue(np.array_equal(labels[i], label))
+
+        # the same samples are fetched one by one with transform
+        mnist = MNIST(mode='test', transform=T.Transpose(), backend='cv2')
+        images_t, labels_t = mnist[list(indices)]
+        self.assertTrue(images_t.shape == (16, 1, 28, 28))
+        self.assertTrue(np.array_equal(images_t[:, 0], images))
+        self.assertTrue(np.array_equal(labels_t, labels))
+
+    def test_images(self):
+        mnist = MNIST(mode='test', backend='cv2')
+        image, label = mnist[3]
+        # images keeps the list of float32 images, and the samples are
+        # taken from it once it is set
+        self.assertTrue(isinstance(mnist.images, list))
+        self.assertTrue(mnist.images[3].dtype == np.float32)
+        self.assertTrue(mnist.images[3].shape == (784, ))
+        self.assertTrue(np.array_equal(mnist.images[3].reshape([28, 28]), image))
+
+        mnist.images = mnist.images[:4]
+        mnist.images[3][:] = 1.
+        image, label = mnist[3]
+        self.assertTrue(np.all(image == 1.))
+        images, labels = mnist[[0, 3]]
+        self.assertTrue(np.all(images[1] == 1.))
+
+
 class TestFASHIONMNISTTest(unittest.TestCase):
     def test_main(self):
         transform = T.Transpose()
@@ -0,0 +1,180 @@
+# Copyright (c) 2020 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import threading
+import time
+import unittest
+
+import numpy as np
+import paddle
+from paddle.inference import BatchingRunner
+
+
+class RecordPredictor(object):
+    def __init__(self, delay=0):
+        self.batch_sizes = []
+        self.delay = delay
+
+    def __call__(self, inputs):
+        self.batch_sizes.append(inputs[0].shape[0])
+        time.sleep(self.delay)
+        x, y = inputs
+        return [x.sum(axis=1, keepdims=True) + y, x * 2]
+
+
+class TestBatchingRunner(unittest.TestCase):
+    def run_concurrently(self, runner, num_threads, num_requests):
+        results = {}
+
+        def client(tid):
+            for i in range(num_requests):
+                x = np.full([1, 3], tid * 100 + i, dtype='float32')
+                y = np.full([1, 1], i, dtype='float32')
+                results[(tid, i)] = (x, y, runner.run(x, y))
+
+        threads = [
+            threading.Thread(
+                target=client, args=(i, )) for i in range(num_threads)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_concurrent_requests(self):
+        predictor = RecordPredictor(delay=0.01)
+        runner = BatchingRunner(predictor, max_batch_size=4, max_latency=0.05)
+        results = self.run_concurrently(runner, 8, 5)
+        runner.close()
+
+        self.assertEqual(len(results), 40)
+        for x, y, (out0, out1) in results.values():
+            np.testing.assert_allclose(out0, x.sum(axis=1, keepdims=True) + y)
+            np.testing.assert_allclose(out1, x * 2)
+        self.assertEqual(sum(predictor.batch_sizes), 40)
+        self.assertLessEqual(max(predictor.batch_sizes), 4)
+        self.assertLess(len(predictor.batch_sizes), 40)
+
+        stats = runner.stats()
+        self.assertEqual(stats.num_requests, 40)
+        self.assertEqual(stats.num_batches, len(predictor.batch_sizes))
+        self.assertEqual(stats.queue_depth, 0)
+        self.assertEqual(sum(stats.batch_size_hist.values()), stats.num_batches)
+        self.assertEqual(
+            sum(stats.queue_depth_hist.values()), stats.num_batches)
+        self.assertTrue(set(stats.batch_size_hist) <= set([1, 2, 4]))
+
+    def test_max_latency(self):
+        predictor = RecordPredictor()
+        runner = BatchingRunner(predictor, max_batch_size=64, max_latency=0.01)
+        x = np.ones([2, 3], dtype='float32')
+        y = np.zeros([2, 1], dtype='float32')
+        out0, out1 = runner.submit(x, y).result(timeout=5)
+        runner.close()
+        np.testing.assert_allclose(out0, np.full([2, 1], 3))
+        self.assertEqual(predictor.batch_sizes, [2])
+
+    def test_large_request(self):
+        predictor = RecordPredictor()
+        runner = BatchingRunner(predictor, max_batch_size=4, max_latency=0)
+        x = np.ones([6, 3], dtype='float32')
+        y = np.zeros([6, 1], dtype='float32')
+        out0, out1 = runner.run(x, y)
+        runner.close()
+        self.assertEqual(out0.shape, (6, 1))
+        self.assertEqual(predictor.batch_sizes, [6])
+        self.assertEqual(runner.stats().batch_size_hist, {8: 1})
+
+    def test_padding(self):
+        runner = BatchingRunner(
+            lambda inputs: inputs,
+            max_batch_size=8,
+            max_latency=1,
+            pad_value=-1)
+        short = runner.submit(np.ones([1, 2], dtype='int64'))
+        long = runner.submit(np.ones([2, 4], dtype='int64'))
+        runner.close()
+        np.testing.assert_array_equal(short.result()[0], [[1, 1, -1, -1]])
+        np.testing.assert_array_equal(long.result()[0], np.ones([2, 4]))
+
+    def test_exception(self):
+        def predict_fn(inputs):
+            raise RuntimeError("predict failed")
+
+        runner = BatchingRunner(predict_fn)
+        request = runner.submit(np.ones([1, 3]))
+        with self.assertRaises(RuntimeError):
+            request.result(timeout=5)
+        runner.close()
+        with self.assertRaises(RuntimeError):
+            runner.submit(np.ones([1, 3]))
+
+    def test_incompatible_requests(self):
+        def predict_fn(inputs):
+            if inputs[0].ndim != 2:
+                raise ValueError("expect a 2-D input")
+            return inputs
+
+        runner = BatchingRunner(predict_fn, max_batch_size=8, max_latency=1)
+        good = runner.submit(np.ones([1, 3], dtype='float32'))
+        bad = runner.submit(np.ones([1, 3, 2], dtype='float32'))
+        other = runner.submit(np.ones([1, 3], dtype='float64'))
+        last = runner.submit(np.full([2, 3], 2, dtype='float32'))
+        runner.close()
+
+        np.testing.assert_array_equal(good.result()[0], np.ones([1, 3]))
+        with self.assertRaises(ValueError):
+            bad.result()
+        self.assertEqual(other.result()[0].dtype, np.float64)
+        np.testing.assert_array_equal(last.result()[0], np.full([2, 3], 2))
+        # the float32 2-D requests are batched together
+        self.assertEqual(runner.stats().num_batches, 3)
+
+    def test_invalid_request(self):
+        runner = BatchingRunner(lambda inputs: inputs)
+        with self.assertRaises(ValueError):
+            runner.submit(np.ones([1, 3]), np.ones([2, 3]))
+        with self.assertRaises(ValueError):
+            runner.submit(np.ones([0, 3]))
+        runner.close()
+
+    def test_from_layer(self):
+        paddle.disable_static()
+        layer = paddle.nn.Linear(3, 2)
+        runner = BatchingRunner.from_layer(
+            layer, max_batch_size=8, max_latency=0.01)
+        results = []
+
+        def client():
+            x = np.random.random([1, 3]).astype('float32')
+            results.append((x, runner.run(x)[0]))
+
+        threads = [threading.Thread(target=client) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        runner.close()
+
+        for x, out in results:
+            expected = layer(paddle.to_tensor(x)).numpy()
+            np.testing.assert_allclose(out, expected, rtol=1e-5)
+        paddle.enable_static()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -315,5 +315,70 @@ class TestAuc(unittest.TestCase):
         self.assertEqual(m.accumulate(), 0.0)
 
 
+class TestMetricMerge(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2020)
+        self.prob = np.random.random([1000, 1])
+        self.label = (np.random.random([1000, 1]) < self.prob).astype('int64')
+
+    def check_merge(self, make_metric, pred, label):
+        whole = make_metric()
+        whole.update(pred, label)
+
+        merged = make_metric()
+        merged.update(pred[:300], label[:300])
+        other = make_metric()
+        other.update(pred[300:], label[300:])
+        merged.merge(other)
+        self.assertAlmostEqual(merged.accumulate(), whole.accumulate())
+
+        restored = make_metric()
+        restored.set_state_dict(merged.state_dict())
+        self.assertAlmostEqual(restored.accumulate(), whole.accumulate())
+
+    def test_precision(self):
+        self.check_merge(paddle.metric.Precision, self.prob, self.label)
+
+    def test_recall(self):
+        self.check_merge(paddle.metric.Recall, self.prob, self.label)
+
+    def test_auc(self):
+        pred = np.concatenate([1 - self.prob, self.prob], axis=1)
+        self.check_merge(paddle.metric.Auc, pred, self.label)
+
+    def test_accuracy(self):
+        pred = np.random.random([1000, 10]).astype('float32')
+        label = np.random.randint(0, 10, [1000, 1]).astype('int64')
+        acc = paddle.metric.Accuracy(topk=(1, 5))
+        correct = acc.compute(paddle.to_tensor(pred), paddle.to_tensor(label))
+        acc.update(correct)
+        other = paddle.metric.Accuracy(topk=(1, 5))
+        other.update(correct)
+        expected = acc.accumulate()
+        acc.merge(other)
+        np.testing.assert_allclose(acc.accumulate(), expected)
+        self.assertEqual(acc.count, [2000, 2000])
+
+    def test_merge_different_metric(self):
+        m = paddle.metric.Precision()
+        self.assertRaises(TypeError, m.merge, paddle.metric.Recall())
+        m = paddle.metric.Auc(num_thresholds=15)
+        self.assertRaises(ValueError, m.merge, paddle.metric.Auc())
+
+    def test_auc_vectorized(self):
+        pred = np.concatenate([1 - self.prob, self.prob], axis=1)
+        m = paddle.metric.Auc(num_thresholds=255)
+        m.update(pred, self.label)
+        stat_pos = np.zeros(256)
+        stat_neg = np.zeros(256)
+        for p, l in zip(pred[:, 1], self.label[:, 0]):
+            if l:
+                stat_pos[int(p * 255)] += 1
+            else:
+                stat_neg[int(p * 255)] += 1
+        np.testing.assert_array_equal(m.state_dict()['stat_pos'], stat_pos)
+        np.testing.assert_array_equal(m.state_dict()['stat_neg'], stat_neg)
+
+
 if __name__ == '__main__':
     unittest.main()
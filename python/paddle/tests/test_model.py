@@ -18,6 +18,7 @@ from __future__ import print_function
 import unittest
 
 import os
+import pickle
 import numpy as np
 import shutil
 import tempfile
@@ -412,6 +413,42 @@ class TestModelFunction(unittest.TestCase):
             shutil.rmtree(path)
             fluid.disable_dygraph() if dynamic else None
 
+    def test_async_save_load(self):
+        for dynamic in [True, False]:
+            path = tempfile.mkdtemp()
+            device = paddle.set_device('cpu')
+            fluid.enable_dygraph(device) if dynamic else None
+            net = MyModel()
+            inputs = [InputSpec([None, 20], 'float32', 'x')]
+            labels = [InputSpec([None, 1], 'int64', 'label')]
+            optim = fluid.optimizer.Adam(
+                learning_rate=0.001, parameter_list=net.parameters())
+            model = Model(net, inputs, labels)
+            model.prepare(
+                optimizer=optim, loss=CrossEntropyLoss(reduction="sum"))
+            model.train_batch([np.random.random((4, 20)).astype('float32')],
+                              [np.random.randint(0, 10, (4, 1))])
+            model.save(path + '/sync')
+            model.save(path + '/async', async_save=True)
+            self.assertTrue(model.wait_save())
+            status = model.save_status()
+            self.assertEqual(status.in_flight, 0)
+            self.assertEqual(status.finished, 1)
+            self.assertEqual(status.failed, 0)
+            for suffix in ['.pdparams', '.pdopt']:
+                with open(path + '/sync' + suffix, 'rb') as f:
+                    sync_state = pickle.load(f)
+                with open(path + '/async' + suffix, 'rb') as f:
+                    async_state = pickle.load(f)
+                self.assertEqual(
+                    sorted(sync_state.keys()), sorted(async_state.keys()))
+                for k, v in sync_state.items():
+                    if isinstance(v, np.ndarray):
+                        np.testing.assert_array_equal(v, async_state[k])
+            model.load(path + '/async')
+            shutil.rmtree(path)
+            fluid.disable_dygraph() if dynamic else None
+
     def test_dynamic_load(self):
         mnist_data = MnistDataset(mode='train')
         for new_optimizer in [True, False]:
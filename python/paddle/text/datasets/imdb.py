@@ -19,16 +19,29 @@ import six
 import string
 import tarfile
 import numpy as np
-import collections
 
 from paddle.io import Dataset
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_array_cache
+from paddle.dataset.common import _map_in_pool, _TokenEncoder, _concat_id_arrays
 
 __all__ = ['Imdb']
 
 URL = 'https://dataset.bj.bcebos.com/imdb%2FaclImdb_v1.tar.gz'
 MD5 = '7c2ac02c03563afcf9b574c7e56c153a'
 
+_MODES = ['train', 'test']
+_CACHE_NAMES = ['vocab'] + [
+    '{}_{}'.format(mode, name)
+    for mode in _MODES for name in ['ids', 'offsets', 'labels']
+]
+
+
+def _tokenize(member):
+    mode, label, doc = member
+    # newline and punctuations removal and ad-hoc tokenization.
+    return mode, label, doc.rstrip(six.b("\n\r")).translate(
+        None, six.b(string.punctuation)).lower().split()
+
 
 class Imdb(Dataset):
     """
@@ -41,6 +54,13 @@ class Imdb(Dataset):
         cutoff(int): cutoff number for building word dictionary. Default 150.
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
+        num_workers(int, optional): the number of processes to tokenize the
+            documents when the cache is built. If it is 1, tokenize them in
+            the current process. It is ignored on windows. Default 1.
+
+    The documents are tokenized once, and the word ids of both modes are
+    cached in files next to :attr:`data_file`, which are memory-mapped by
+    the later constructions.
 
     Returns:
         Dataset: instance of IMDB dataset
@@ -73,7 +93,12 @@ class Imdb(Dataset):
 
     """
 
-    def __init__(self, data_file=None, mode='train', cutoff=150, download=True):
+    def __init__(self,
+                 data_file=None,
+                 mode='train',
+                 cutoff=150,
+                 download=True,
+                 num_workers=1):
         assert mode.lower() in ['train', 'test'], \
             "mode should be 'train', 'test', but got {}".format(mode)
         self.mode = mode.lower()
@@ -84,60 +109,64 @@ class Imdb(Dataset):
             self.data_file = _check_exists_and_download(data_file, URL, MD5,
                                                         'imdb', download)
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(cutoff)
+        arrays = _load_array_cache(
+            [self.data_file], 'cutoff{}'.format(cutoff), _CACHE_NAMES,
+            lambda: self._build_cache(cutoff, num_workers))
 
-        # read dataset into memory
-        self._load_anno()
-
-    def _build_work_dict(self, cutoff):
-        word_freq = collections.defaultdict(int)
-        pattern = re.compile(r"aclImdb/((train)|(test))/((pos)|(neg))/.*\.txt$")
-        for doc in self._tokenize(pattern):
-            for word in doc:
-                word_freq[word] += 1
-
-        # Not sure if we should prune less-frequent words here.
-        word_freq = [x for x in six.iteritems(word_freq) if x[1] > cutoff]
+        words = arrays['vocab'].tolist()
+        self.word_idx = dict(list(zip(words, six.moves.range(len(words)))))
+        self.word_idx['<unk>'] = len(words)
 
-        dictionary = sorted(word_freq, key=lambda x: (-x[1], x[0]))
-        words, _ = list(zip(*dictionary))
-        word_idx = dict(list(zip(words, six.moves.range(len(words)))))
-        word_idx['<unk>'] = len(words)
-        return word_idx
+        self.ids = arrays['{}_ids'.format(self.mode)]
+        self.offsets = arrays['{}_offsets'.format(self.mode)]
+        self.labels = arrays['{}_labels'.format(self.mode)]
 
-    def _tokenize(self, pattern):
-        data = []
+    def _iter_members(self):
+        pattern = re.compile(r"aclImdb/(train|test)/(pos|neg)/.*\.txt$")
         with tarfile.open(self.data_file) as tarf:
             tf = tarf.next()
             while tf != None:
-                if bool(pattern.match(tf.name)):
-                    # newline and punctuations removal and ad-hoc tokenization.
-                    data.append(
-                        tarf.extractfile(tf).read().rstrip(six.b("\n\r"))
-                        .translate(None, six.b(string.punctuation)).lower(
-                        ).split())
+                match = pattern.match(tf.name)
+                if match:
+                    label = 0 if match.group(2) == 'pos' else 1
+                    yield match.group(1), label, tarf.extractfile(tf).read()
                 tf = tarf.next()
 
-        return data
-
-    def _load_anno(self):
-        pos_pattern = re.compile(r"aclImdb/{}/pos/.*\.txt$".format(self.mode))
-        neg_pattern = re.compile(r"aclImdb/{}/neg/.*\.txt$".format(self.mode))
-
-        UNK = self.word_idx['<unk>']
+    def _build_cache(self, cutoff, num_workers):
+        # tokenize all the documents in one pass, the word ids are decided
+        # after the word frequency is counted.
+        encoder = _TokenEncoder()
+        docs = dict(((mode, label), []) for mode in _MODES for label in [0, 1])
+        for mode, label, doc in _map_in_pool(_tokenize,
+                                             self._iter_members(), num_workers):
+            docs[(mode, label)].append(encoder.encode(doc))
 
-        self.docs = []
-        self.labels = []
-        for doc in self._tokenize(pos_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(0)
-        for doc in self._tokenize(neg_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(1)
+        # Not sure if we should prune less-frequent words here.
+        word_freq = encoder.count(
+            ids for doc_list in docs.values() for ids in doc_list)
+        word_freq = [(word, freq)
+                     for word, freq in zip(encoder.tokens(), word_freq)
+                     if freq > cutoff]
+        dictionary = sorted(word_freq, key=lambda x: (-x[1], x[0]))
+        words = [word for word, _ in dictionary]
+        word_idx = dict(list(zip(words, six.moves.range(len(words)))))
+        id_map = encoder.id_map(word_idx, len(words))
+
+        arrays = {'vocab': np.array(words, dtype=bytes)}
+        for mode in _MODES:
+            # positive documents come first
+            mode_docs = docs[(mode, 0)] + docs[(mode, 1)]
+            ids, offsets = _concat_id_arrays(mode_docs, id_map)
+            arrays['{}_ids'.format(mode)] = ids
+            arrays['{}_offsets'.format(mode)] = offsets
+            arrays['{}_labels'.format(mode)] = np.array(
+                [0] * len(docs[(mode, 0)]) + [1] * len(docs[(mode, 1)]),
+                dtype='int64')
+        return arrays
 
     def __getitem__(self, idx):
-        return (np.array(self.docs[idx]), np.array([self.labels[idx]]))
+        return (np.array(self.ids[self.offsets[idx]:self.offsets[idx + 1]]),
+                np.array([self.labels[idx]]))
 
     def __len__(self):
-        return len(self.docs)
+        return len(self.labels)
@@ -20,13 +20,22 @@ import numpy as np
 import collections
 
 from paddle.io import Dataset
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_array_cache
+from paddle.dataset.common import _TokenEncoder, _concat_id_arrays
 
 __all__ = ['Imikolov']
 
 URL = 'https://dataset.bj.bcebos.com/imikolov%2Fsimple-examples.tgz'
 MD5 = '30177ea32e27c525793142b6bf2c8e2d'
 
+_MODES = ['train', 'test']
+_CACHE_NAMES = ['vocab'] + [
+    '{}_{}'.format(mode, name) for mode in _MODES
+    for name in ['ids', 'offsets']
+]
+# the words read from the tar file are bytes, except the marks
+_MARKS = dict((six.b(mark), mark) for mark in ['<s>', '<e>'])
+
 
 class Imikolov(Dataset):
     """
@@ -42,6 +51,9 @@ class Imikolov(Dataset):
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
 
+    The word ids of both modes are cached in files next to :attr:`data_file`,
+    which are memory-mapped by the later constructions.
+
     Returns:
         Dataset: instance of imikolov dataset
 
@@ -97,11 +109,16 @@ class Imikolov(Dataset):
             self.data_file = _check_exists_and_download(data_file, URL, MD5,
                                                         'imikolov', download)
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(min_word_freq)
+        arrays = _load_array_cache(
+            [self.data_file], 'min_freq{}'.format(min_word_freq),
+            _CACHE_NAMES, self._build_cache)
 
-        # read dataset into memory
-        self._load_anno()
+        words = [_MARKS.get(w, w) for w in arrays['vocab'].tolist()]
+        self.word_idx = dict(list(zip(words, six.moves.range(len(words)))))
+        self.word_idx['<unk>'] = len(words)
+
+        self._load_anno(arrays['{}_ids'.format(self.mode)],
+                        arrays['{}_offsets'.format(self.mode)])
 
     def word_count(self, f, word_freq=None):
         if word_freq is None:
@@ -115,53 +132,64 @@ class Imikolov(Dataset):
 
         return word_freq
 
-    def _build_work_dict(self, cutoff):
-        train_filename = './simple-examples/data/ptb.train.txt'
-        test_filename = './simple-examples/data/ptb.valid.txt'
-        with tarfile.open(self.data_file) as tf:
-            trainf = tf.extractfile(train_filename)
-            testf = tf.extractfile(test_filename)
-            word_freq = self.word_count(testf, self.word_count(trainf))
-            if '<unk>' in word_freq:
-                # remove <unk> for now, since we will set it as last index
-                del word_freq['<unk>']
-
-            word_freq = [
-                x for x in six.iteritems(word_freq) if x[1] > self.min_word_freq
-            ]
-
-            word_freq_sorted = sorted(word_freq, key=lambda x: (-x[1], x[0]))
-            words, _ = list(zip(*word_freq_sorted))
-            word_idx = dict(list(zip(words, six.moves.range(len(words)))))
-            word_idx['<unk>'] = len(words)
-
-        return word_idx
-
-    def _load_anno(self):
-        self.data = []
+    def _build_cache(self):
+        # encode the lines of all the files in one pass, the word ids are
+        # decided after the word frequency is counted.
+        encoder = _TokenEncoder()
+        lines = {}
         with tarfile.open(self.data_file) as tf:
-            filename = './simple-examples/data/ptb.{}.txt'.format(self.mode)
-            f = tf.extractfile(filename)
-
-            UNK = self.word_idx['<unk>']
-            for l in f:
-                if self.data_type == 'NGRAM':
-                    assert self.window_size > -1, 'Invalid gram length'
-                    l = ['<s>'] + l.strip().split() + ['<e>']
-                    if len(l) >= self.window_size:
-                        l = [self.word_idx.get(w, UNK) for w in l]
-                        for i in six.moves.range(self.window_size, len(l) + 1):
-                            self.data.append(tuple(l[i - self.window_size:i]))
-                elif self.data_type == 'SEQ':
-                    l = l.strip().split()
-                    l = [self.word_idx.get(w, UNK) for w in l]
-                    src_seq = [self.word_idx['<s>']] + l
-                    trg_seq = l + [self.word_idx['<e>']]
-                    if self.window_size > 0 and len(src_seq) > self.window_size:
-                        continue
-                    self.data.append((src_seq, trg_seq))
-                else:
-                    assert False, 'Unknow data type'
+            for name in ['train', 'valid', 'test']:
+                f = tf.extractfile('./simple-examples/data/ptb.{}.txt'.format(
+                    name))
+                lines[name] = [
+                    encoder.encode(['<s>'] + l.strip().split() + ['<e>'])
+                    for l in f
+                ]
+
+        # the word dictionary is built from the train and valid files,
+        # <unk> is removed for now, since we will set it as last index
+        word_freq = encoder.count(lines['train'] + lines['valid'])
+        word_freq = [(w, freq)
+                     for w, freq in zip(encoder.tokens(), word_freq)
+                     if freq > self.min_word_freq and w != '<unk>']
+        word_freq_sorted = sorted(word_freq, key=lambda x: (-x[1], x[0]))
+        words = [w for w, _ in word_freq_sorted]
+        word_idx = dict(list(zip(words, six.moves.range(len(words)))))
+        id_map = encoder.id_map(word_idx, len(words))
+
+        arrays = {
+            'vocab': np.array(
+                [w.encode('utf-8') if isinstance(w, six.text_type) else w
+                 for w in words],
+                dtype=bytes)
+        }
+        for mode in _MODES:
+            ids, offsets = _concat_id_arrays(lines[mode], id_map)
+            arrays['{}_ids'.format(mode)] = ids
+            arrays['{}_offsets'.format(mode)] = offsets
+        return arrays
+
+    def _load_anno(self, ids, offsets):
+        # each line is encoded as <s> words <e>
+        lengths = offsets[1:] - offsets[:-1]
+        if self.data_type == 'NGRAM':
+            assert self.window_size > -1, 'Invalid gram length'
+            counts = np.where(lengths >= self.window_size,
+                              lengths - self.window_size + 1, 0)
+            gram_starts = np.repeat(offsets[:-1], counts) + np.arange(
+                counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            self.data = ids[gram_starts[:, np.newaxis] + np.arange(
+                self.window_size)]
+        elif self.data_type == 'SEQ':
+            self.data = []
+            for start, end in zip(offsets[:-1], offsets[1:]):
+                src_seq = ids[start:end - 1]
+                trg_seq = ids[start + 1:end]
+                if self.window_size > 0 and len(src_seq) > self.window_size:
+                    continue
+                self.data.append((src_seq, trg_seq))
+        else:
+            assert False, 'Unknow data type'
 
     def __getitem__(self, idx):
         return tuple([np.array(d) for d in self.data[idx]])
@@ -25,7 +25,8 @@ from collections import defaultdict
 import paddle
 from paddle.io import Dataset
 import paddle.compat as cpt
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_array_cache
+from paddle.dataset.common import _TokenEncoder, _concat_id_arrays
 
 __all__ = ['WMT16']
 
@@ -70,6 +71,9 @@ class WMT16(Dataset):
         download(bool): whether to download dataset automatically if
             :attr:`data_file` is not set. Default True
 
+    The word ids are cached in files next to :attr:`data_file`, which are
+    memory-mapped by the later constructions with the same dictionaries.
+
     Returns:
         Dataset: instance of WMT16 dataset
 
@@ -128,22 +132,39 @@ class WMT16(Dataset):
         self.trg_dict_size = min(trg_dict_size, (TOTAL_DE_WORDS if lang == "en"
                                                  else TOTAL_EN_WORDS))
 
+        # build the missing source and target word dicts in one pass
+        trg_lang = "de" if lang == "en" else "en"
+        missing_dicts = [(path, dict_size, dict_lang)
+                         for dict_size, dict_lang in [(src_dict_size, lang), (
+                             trg_dict_size, trg_lang)]
+                         for path in [self._dict_path(dict_lang, dict_size)]
+                         if not self._dict_found(path, dict_size)]
+        if missing_dicts:
+            self._build_dicts(missing_dicts)
+
         # load source and target word dict
         self.src_dict = self._load_dict(lang, src_dict_size)
-        self.trg_dict = self._load_dict("de" if lang == "en" else "en",
-                                        trg_dict_size)
+        self.trg_dict = self._load_dict(trg_lang, trg_dict_size)
 
         # load data
-        self.data = self._load_data()
+        self._load_data([
+            self._dict_path(lang, src_dict_size),
+            self._dict_path(trg_lang, trg_dict_size)
+        ])
 
-    def _load_dict(self, lang, dict_size, reverse=False):
-        dict_path = os.path.join(paddle.dataset.common.DATA_HOME,
-                                 "wmt16/%s_%d.dict" % (lang, dict_size))
-        dict_found = False
+    def _dict_path(self, lang, dict_size):
+        return os.path.join(paddle.dataset.common.DATA_HOME,
+                            "wmt16/%s_%d.dict" % (lang, dict_size))
+
+    def _dict_found(self, dict_path, dict_size):
         if os.path.exists(dict_path):
             with open(dict_path, "rb") as d:
-                dict_found = len(d.readlines()) == dict_size
-        if not dict_found:
+                return len(d.readlines()) == dict_size
+        return False
+
+    def _load_dict(self, lang, dict_size, reverse=False):
+        dict_path = self._dict_path(lang, dict_size)
+        if not self._dict_found(dict_path, dict_size):
             self._build_dict(dict_path, dict_size, lang)
 
         word_dict = {}
@@ -156,29 +177,50 @@ class WMT16(Dataset):
         return word_dict
 
     def _build_dict(self, dict_path, dict_size, lang):
-        word_dict = defaultdict(int)
+        self._build_dicts([(dict_path, dict_size, lang)])
+
+    def _build_dicts(self, dicts):
+        """
+        Build the word dicts in one pass of the train data, `dicts` is a
+        list of (dict_path, dict_size, lang).
+        """
+        word_dicts = {"en": defaultdict(int), "de": defaultdict(int)}
         with tarfile.open(self.data_file, mode="r") as f:
             for line in f.extractfile("wmt16/train"):
                 line = cpt.to_text(line)
                 line_split = line.strip().split("\t")
                 if len(line_split) != 2: continue
-                sen = line_split[0] if self.lang == "en" else line_split[1]
-                for w in sen.split():
-                    word_dict[w] += 1
-
-        with open(dict_path, "wb") as fout:
-            fout.write(
-                cpt.to_bytes("%s\n%s\n%s\n" % (START_MARK, END_MARK, UNK_MARK)))
-            for idx, word in enumerate(
-                    sorted(
-                        six.iteritems(word_dict),
-                        key=lambda x: x[1],
-                        reverse=True)):
-                if idx + 3 == dict_size: break
-                fout.write(cpt.to_bytes(word[0]))
-                fout.write(cpt.to_bytes('\n'))
-
-    def _load_data(self):
+                for lang, sen in zip(["en", "de"], line_split):
+                    word_dict = word_dicts[lang]
+                    for w in sen.split():
+                        word_dict[w] += 1
+
+        for dict_path, dict_size, lang in dicts:
+            with open(dict_path, "wb") as fout:
+                fout.write(
+                    cpt.to_bytes("%s\n%s\n%s\n" % (START_MARK, END_MARK,
+                                                     UNK_MARK)))
+                for idx, word in enumerate(
+                        sorted(
+                            six.iteritems(word_dicts[lang]),
+                            key=lambda x: x[1],
+                            reverse=True)):
+                    if idx + 3 == dict_size: break
+                    fout.write(cpt.to_bytes(word[0]))
+                    fout.write(cpt.to_bytes('\n'))
+
+    def _load_data(self, dict_paths):
+        arrays = _load_array_cache(
+            [self.data_file] + dict_paths, "{}_{}".format(self.mode, self.lang),
+            ['src_ids', 'src_offsets', 'trg_ids', 'trg_offsets'],
+            self._build_data)
+        self.src_ids = arrays['src_ids']
+        self.src_offsets = arrays['src_offsets']
+        # the target word ids without the start and end mark
+        self.trg_ids = arrays['trg_ids']
+        self.trg_offsets = arrays['trg_offsets']
+
+    def _build_data(self):
         # the index for start mark, end mark, and unk are the same in source
         # language and target language. Here uses the source language
         # dictionary to determine their indices.
@@ -189,36 +231,41 @@ class WMT16(Dataset):
         src_col = 0 if self.lang == "en" else 1
         trg_col = 1 - src_col
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_encoder = _TokenEncoder()
+        trg_encoder = _TokenEncoder()
+        src_ids = []
+        trg_ids = []
         with tarfile.open(self.data_file, mode="r") as f:
             for line in f.extractfile("wmt16/{}".format(self.mode)):
                 line = cpt.to_text(line)
                 line_split = line.strip().split("\t")
                 if len(line_split) != 2:
                     continue
-                src_words = line_split[src_col].split()
-                src_ids = [start_id] + [
-                    self.src_dict.get(w, unk_id) for w in src_words
-                ] + [end_id]
-
-                trg_words = line_split[trg_col].split()
-                trg_ids = [self.trg_dict.get(w, unk_id) for w in trg_words]
-
-                trg_ids_next = trg_ids + [end_id]
-                trg_ids = [start_id] + trg_ids
-
-                self.src_ids.append(src_ids)
-                self.trg_ids.append(trg_ids)
-                self.trg_ids_next.append(trg_ids_next)
+                src_ids.append(
+                    src_encoder.encode([START_MARK] + line_split[src_col]
+                                       .split() + [END_MARK]))
+                trg_ids.append(trg_encoder.encode(line_split[trg_col].split()))
+
+        src_ids, src_offsets = _concat_id_arrays(
+            src_ids, src_encoder.id_map(self.src_dict, unk_id))
+        trg_ids, trg_offsets = _concat_id_arrays(
+            trg_ids, trg_encoder.id_map(self.trg_dict, unk_id))
+        return {
+            'src_ids': src_ids,
+            'src_offsets': src_offsets,
+            'trg_ids': trg_ids,
+            'trg_offsets': trg_offsets
+        }
 
     def __getitem__(self, idx):
-        return (np.array(self.src_ids[idx]), np.array(self.trg_ids[idx]),
-                np.array(self.trg_ids_next[idx]))
+        src_ids = self.src_ids[self.src_offsets[idx]:self.src_offsets[idx + 1]]
+        trg_ids = self.trg_ids[self.trg_offsets[idx]:self.trg_offsets[idx + 1]]
+        return (np.array(src_ids),
+                np.concatenate([[self.src_dict[START_MARK]], trg_ids]),
+                np.concatenate([trg_ids, [self.src_dict[END_MARK]]]))
 
     def __len__(self):
-        return len(self.src_ids)
+        return len(self.src_offsets) - 1
 
     def get_dict(self, lang, reverse=False):
         """
@@ -22,7 +22,8 @@ from six.moves import cPickle as pickle
 
 import paddle
 from paddle.io import Dataset
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_array_cache
+from paddle.fluid.dataloader.dataloader_iter import default_collate_fn
 
 __all__ = ['Cifar10', 'Cifar100']
 
@@ -57,6 +58,16 @@ class Cifar10(Dataset):
             If this option is not set, will get backend from ``paddle.vsion.get_image_backend`` ,
             default backend is 'pil'. Default: None.
 
+    The images are decoded once into a uint8 array cache file next to
+    :attr:`data_file`, which is memory-mapped as :attr:`images` and shared
+    by the processes loading the same dataset. :attr:`data`, the list of
+    (image, label) tuples, is built from it on the first access. Indexing by a list or numpy.ndarray of
+    indices returns the batch ``[images, labels]`` collated as
+    ``default_collate_fn``, which is also used by ``paddle.io.DataLoader``
+    to fetch mini-batch by ``__getitems__``. The images are sliced
+    together without per-sample overhead when :attr:`backend` is 'cv2'
+    and no :attr:`transform` is set.
+
     Returns:
         Dataset: instance of cifar-10 dataset
 
@@ -136,7 +147,29 @@ class Cifar10(Dataset):
         self.flag = MODE_FLAG_MAP[self.mode + '10']
 
     def _load_data(self):
-        self.data = []
+        arrays = _load_array_cache([self.data_file], self.flag,
+                                   ['images', 'labels'], self._decode_data)
+        # the memory-mapped uint8 images of shape [N, 3 * 32 * 32]
+        self.images = arrays['images']
+        self.labels = arrays['labels'].astype('int64')
+        self._data = None
+
+    @property
+    def data(self):
+        # the list of (image, label) tuples is built only for the users of
+        # this attribute, it holds the whole dataset in memory unlike images.
+        if self._data is None:
+            self._data = list(
+                six.moves.zip(np.array(self.images), self.labels.tolist()))
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+    def _decode_data(self):
+        images = []
+        labels = []
         with tarfile.open(self.data_file, mode='r') as f:
             names = (each_item.name for each_item in f
                      if self.flag in each_item.name)
@@ -148,14 +181,25 @@ class Cifar10(Dataset):
                     batch = pickle.load(f.extractfile(name), encoding='bytes')
 
                 data = batch[six.b('data')]
-                labels = batch.get(
+                batch_labels = batch.get(
                     six.b('labels'), batch.get(six.b('fine_labels'), None))
-                assert labels is not None
-                for sample, label in six.moves.zip(data, labels):
-                    self.data.append((sample, label))
+                assert batch_labels is not None
+                images.append(np.asarray(data, dtype='uint8'))
+                labels.append(np.asarray(batch_labels, dtype='int64'))
+        return {
+            'images': np.concatenate(images),
+            'labels': np.concatenate(labels)
+        }
 
     def __getitem__(self, idx):
-        image, label = self.data[idx]
+        if isinstance(idx, (list, np.ndarray)):
+            return self.__getitems__(idx)
+
+        # the data set or accessed by the users take precedence over images
+        if self._data is None:
+            image, label = self.images[idx], self.labels[idx]
+        else:
+            image, label = self._data[idx]
         image = np.reshape(image, [3, 32, 32])
         image = image.transpose([1, 2, 0])
 
@@ -169,8 +213,17 @@ class Cifar10(Dataset):
 
         return image.astype(self.dtype), np.array(label).astype('int64')
 
+    def __getitems__(self, indices):
+        if self.backend == 'pil' or self.transform is not None or \
+                self._data is not None:
+            return default_collate_fn([self[idx] for idx in indices])
+
+        images = self.images[indices].reshape([-1, 3, 32, 32])
+        images = images.transpose([0, 2, 3, 1])
+        return [images.astype(self.dtype), self.labels[indices]]
+
     def __len__(self):
-        return len(self.data)
+        return len(self.labels) if self._data is None else len(self._data)
 
 
 class Cifar100(Cifar10):
@@ -22,7 +22,8 @@ from PIL import Image
 
 import paddle
 from paddle.io import Dataset
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import _check_exists_and_download, _load_array_cache
+from paddle.fluid.dataloader.dataloader_iter import default_collate_fn
 
 __all__ = ["MNIST", "FashionMNIST"]
 
@@ -43,6 +44,16 @@ class MNIST(Dataset):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}. 
             If this option is not set, will get backend from ``paddle.vsion.get_image_backend`` ,
             default backend is 'pil'. Default: None.
+
+    The images are decoded once into a uint8 array cache file next to
+    :attr:`image_path`, which is memory-mapped as :attr:`image_array` and
+    shared by the processes loading the same dataset. :attr:`images`, the
+    list of float32 images, is built from it on the first access. Indexing by a list or numpy.ndarray of
+    indices returns the batch ``[images, labels]`` collated as
+    ``default_collate_fn``, which is also used by ``paddle.io.DataLoader``
+    to fetch mini-batch by ``__getitems__``. The images are sliced
+    together without per-sample overhead when :attr:`backend` is 'cv2'
+    and no :attr:`transform` is set.
             
     Returns:
         Dataset: MNIST Dataset.
@@ -59,6 +70,10 @@ class MNIST(Dataset):
                 sample = mnist[i]
                 print(sample[0].size, sample[1])
 
+            mnist = MNIST(mode='test', backend='cv2')
+            images, labels = mnist[[0, 1, 2, 3]]
+            print(images.shape, labels.shape) # (4, 28, 28) (4, 1)
+
     """
     NAME = 'mnist'
     URL_PREFIX = 'https://dataset.bj.bcebos.com/mnist/'
@@ -113,57 +128,73 @@ class MNIST(Dataset):
 
         self.dtype = paddle.get_default_dtype()
 
-    def _parse_dataset(self, buffer_size=100):
-        self.images = []
-        self.labels = []
+    def _parse_dataset(self):
+        arrays = _load_array_cache([self.image_path, self.label_path],
+                                   'uint8', ['images', 'labels'],
+                                   self._decode_dataset)
+        # the memory-mapped uint8 images of shape [N, rows * cols]
+        self.image_array = arrays['images']
+        self.labels = arrays['labels'].astype('int64').reshape([-1, 1])
+        self._images = None
+
+    @property
+    def images(self):
+        # the list of float32 images of shape [rows * cols] is built only
+        # for the users of this attribute, it holds the whole dataset in
+        # memory unlike image_array.
+        if self._images is None:
+            self._images = list(self.image_array.astype('float32'))
+        return self._images
+
+    @images.setter
+    def images(self, images):
+        self._images = images
+
+    def _decode_dataset(self):
         with gzip.GzipFile(self.image_path, 'rb') as image_file:
             img_buf = image_file.read()
-            with gzip.GzipFile(self.label_path, 'rb') as label_file:
-                lab_buf = label_file.read()
-
-                step_label = 0
-                offset_img = 0
-                # read from Big-endian
-                # get file info from magic byte
-                # image file : 16B
-                magic_byte_img = '>IIII'
-                magic_img, image_num, rows, cols = struct.unpack_from(
-                    magic_byte_img, img_buf, offset_img)
-                offset_img += struct.calcsize(magic_byte_img)
-
-                offset_lab = 0
-                # label file : 8B
-                magic_byte_lab = '>II'
-                magic_lab, label_num = struct.unpack_from(magic_byte_lab,
-                                                          lab_buf, offset_lab)
-                offset_lab += struct.calcsize(magic_byte_lab)
-
-                while True:
-                    if step_label >= label_num:
-                        break
-                    fmt_label = '>' + str(buffer_size) + 'B'
-                    labels = struct.unpack_from(fmt_label, lab_buf, offset_lab)
-                    offset_lab += struct.calcsize(fmt_label)
-                    step_label += buffer_size
-
-                    fmt_images = '>' + str(buffer_size * rows * cols) + 'B'
-                    images_temp = struct.unpack_from(fmt_images, img_buf,
-                                                     offset_img)
-                    images = np.reshape(images_temp, (buffer_size, rows *
-                                                      cols)).astype('float32')
-                    offset_img += struct.calcsize(fmt_images)
-
-                    for i in range(buffer_size):
-                        self.images.append(images[i, :])
-                        self.labels.append(
-                            np.array([labels[i]]).astype('int64'))
+        with gzip.GzipFile(self.label_path, 'rb') as label_file:
+            lab_buf = label_file.read()
+
+        # read from Big-endian
+        # get file info from magic byte
+        # image file : 16B
+        magic_byte_img = '>IIII'
+        magic_img, image_num, rows, cols = struct.unpack_from(magic_byte_img,
+                                                              img_buf, 0)
+        # label file : 8B
+        magic_byte_lab = '>II'
+        magic_lab, label_num = struct.unpack_from(magic_byte_lab, lab_buf, 0)
+
+        images = np.frombuffer(
+            img_buf,
+            dtype='uint8',
+            count=image_num * rows * cols,
+            offset=struct.calcsize(magic_byte_img))
+        labels = np.frombuffer(
+            lab_buf,
+            dtype='uint8',
+            count=label_num,
+            offset=struct.calcsize(magic_byte_lab))
+        return {
+            'images': images.reshape([image_num, rows * cols]),
+            'labels': labels
+        }
 
     def __getitem__(self, idx):
-        image, label = self.images[idx], self.labels[idx]
+        if isinstance(idx, (list, np.ndarray)):
+            return self.__getitems__(idx)
+
+        # the images set or accessed by the users, such as the subsets of
+        # the subclasses, take precedence over image_array
+        images = self.image_array if self._images is None else self._images
+        image, label = images[idx], self.labels[idx]
         image = np.reshape(image, [28, 28])
 
         if self.backend == 'pil':
             image = Image.fromarray(image.astype('uint8'), mode='L')
+        else:
+            image = image.astype('float32')
 
         if self.transform is not None:
             image = self.transform(image)
@@ -173,6 +204,14 @@ class MNIST(Dataset):
 
         return image.astype(self.dtype), label.astype('int64')
 
+    def __getitems__(self, indices):
+        if self.backend == 'pil' or self.transform is not None or \
+                self._images is not None:
+            return default_collate_fn([self[idx] for idx in indices])
+
+        images = self.image_array[indices].reshape([-1, 28, 28])
+        return [images.astype(self.dtype), self.labels[indices]]
+
     def __len__(self):
         return len(self.labels)
 